@@ -11,6 +11,7 @@ import os
 from pathlib import Path
 
 from core.client import create_client
+from core.plan_store import PLAN_READ_ERRORS, get_plan_store
 from linear_updater import (
     LinearTaskState,
     is_linear_enabled,
@@ -58,12 +59,11 @@ from ui import (
 
 from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
 from .memory_manager import debug_memory_system_status, get_graphiti_context
+from .scheduler import run_parallel_subtasks
 from .session import post_session_processing, run_agent_session
 from .utils import (
-    find_phase_for_subtask,
     get_commit_count,
     get_latest_commit,
-    load_implementation_plan,
     sync_spec_to_source,
 )
 
@@ -77,6 +77,7 @@ async def run_autonomous_agent(
     max_iterations: int | None = None,
     verbose: bool = False,
     source_spec_dir: Path | None = None,
+    max_parallel: int = 1,
 ) -> None:
     """
     Run the autonomous agent loop with automatic memory management.
@@ -91,6 +92,8 @@ async def run_autonomous_agent(
         max_iterations: Maximum number of iterations (None for unlimited)
         verbose: Whether to show detailed output
         source_spec_dir: Original spec directory in main project (for syncing from worktree)
+        max_parallel: Run up to this many independent subtasks at once, each in
+            its own worktree (1 = one subtask at a time)
     """
     # Set environment variable for security hooks to find the correct project directory
     # This is needed because os.getcwd() may return the wrong directory in worktree mode
@@ -215,6 +218,7 @@ async def run_autonomous_agent(
 
     # Main loop
     iteration = 0
+    parallel_pass_done = max_parallel <= 1
 
     while True:
         iteration += 1
@@ -339,6 +343,34 @@ async def run_autonomous_agent(
                 if sync_spec_to_source(spec_dir, source_spec_dir):
                     print_status("Phase transition synced to main project", "success")
 
+            if not parallel_pass_done:
+                # Run what the dependency graph allows concurrently; failures
+                # and anything it can't schedule continue sequentially
+                parallel_pass_done = True
+                linear_is_enabled = (
+                    linear_task is not None and linear_task.task_id is not None
+                )
+                sessions_run = await run_parallel_subtasks(
+                    project_dir=project_dir,
+                    spec_dir=spec_dir,
+                    model=model,
+                    recovery_manager=recovery_manager,
+                    status_manager=status_manager,
+                    max_parallel=max_parallel,
+                    verbose=verbose,
+                    source_spec_dir=source_spec_dir,
+                    linear_enabled=linear_is_enabled,
+                    first_session=iteration,
+                    max_sessions=(
+                        max_iterations - iteration + 1 if max_iterations else None
+                    ),
+                )
+                # Parallel sessions used numbers iteration .. iteration +
+                # sessions_run - 1; the next session continues after them
+                iteration += sessions_run - 1
+                print_progress_summary(spec_dir)
+                continue
+
             if not next_subtask:
                 # FIX for Issue #495: Race condition after planning phase
                 # The implementation_plan.json may not be fully flushed to disk yet,
@@ -370,7 +402,9 @@ async def run_autonomous_agent(
                     print("No pending subtasks found - build may be complete!")
                     break
 
-            # Get attempt count for recovery context
+            # Get attempt count for recovery context; the agent reads
+            # attempt_history.json itself, so bring it up to date first
+            recovery_manager.flush_attempt_history()
             attempt_count = recovery_manager.get_attempt_count(subtask_id)
             recovery_hints = (
                 recovery_manager.get_recovery_hints(subtask_id)
@@ -379,8 +413,10 @@ async def run_autonomous_agent(
             )
 
             # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+            try:
+                phase = get_plan_store(spec_dir).get_phase_for_subtask(subtask_id)
+            except PLAN_READ_ERRORS:
+                phase = None
 
             # Generate focused, minimal prompt for this subtask
             prompt = generate_subtask_prompt(
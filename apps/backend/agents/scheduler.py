@@ -0,0 +1,571 @@
+"""
+Parallel Subtask Scheduler
+==========================
+
+Runs independent subtasks of an implementation plan concurrently.
+
+The coder loop works through get_next_subtask() one subtask at a time, even
+when the plan's phases only depend on some of the earlier phases. This
+module builds the subtask dependency graph from the plan:
+
+- every subtask of a phase depends on every unfinished subtask of the phases
+  listed in its `depends_on`
+- subtasks of a phase run in plan order unless the phase is `parallel_safe`
+
+and runs ready subtasks concurrently, up to max_parallel at a time, longest
+remaining chain first. Each subtask gets its own worktree and branch
+(auto-claude/{spec-name}--{subtask-id}) forked from the build branch, and is
+merged back through WorktreeManager.merge_worktree() once it completes, so
+subtasks that depend on it start from its changes.
+
+Subtasks the graph can't schedule (their phases depend on an unknown phase,
+on a phase with failed or stuck subtasks, or on each other) are left to the
+sequential loop, exactly as get_next_subtask() would treat them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.client import create_client
+from core.git_executable import run_git
+from core.plan_normalization import normalize_subtask_aliases
+from core.plan_store import PLAN_READ_ERRORS, get_plan_store
+from core.worktree import WorktreeError, WorktreeInfo, WorktreeManager
+from phase_config import get_phase_model, get_phase_thinking_budget
+from prompt_generator import (
+    format_context_for_prompt,
+    generate_subtask_prompt,
+    load_subtask_context,
+)
+from recovery import RecoveryManager
+from task_logger import LogPhase
+from ui import StatusManager, highlight, muted, print_status
+
+from .memory_manager import get_graphiti_context
+from .session import post_session_processing, run_agent_session
+from .utils import get_commit_count, get_latest_commit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PARALLEL = 2
+
+# Statuses get_next_subtask() considers runnable
+PENDING_STATUSES = frozenset({"pending", "not_started", "not started"})
+
+
+@dataclass
+class SubtaskNode:
+    """A pending subtask and the subtasks it waits for."""
+
+    id: str
+    subtask: dict
+    index: int  # Position in plan order
+    depends_on: set[str] = field(default_factory=set)
+    dependents: set[str] = field(default_factory=set)
+
+
+def _phase_key(phase: dict, index: int) -> str:
+    # Same phase identity as get_next_subtask()
+    phase_id = phase.get("id")
+    if phase_id is None:
+        phase_id = phase.get("phase")
+    return str(phase_id) if phase_id is not None else f"unknown:{index}"
+
+
+def _phase_dependencies(phase: dict) -> list[str]:
+    depends_on = phase.get("depends_on", [])
+    if isinstance(depends_on, list):
+        return [str(d) for d in depends_on if d is not None]
+    if depends_on is None:
+        return []
+    return [str(depends_on)]
+
+
+class SubtaskGraph:
+    """Dependency graph of the pending subtasks of an implementation plan."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, SubtaskNode] = {}
+        self.blocked: list[str] = []  # Pending, but never runnable in this plan
+
+    @classmethod
+    def from_plan(cls, plan: dict) -> SubtaskGraph:
+        """
+        Build the graph from a parsed implementation plan.
+
+        Args:
+            plan: implementation_plan.json contents (not modified)
+
+        Returns:
+            Graph of every subtask that is pending and runnable
+        """
+        graph = cls()
+        phases = [
+            (_phase_key(phase, i), phase)
+            for i, phase in enumerate(plan.get("phases", []))
+        ]
+        deps = {key: _phase_dependencies(phase) for key, phase in phases}
+        by_key = {key: phase for key, phase in phases}
+
+        # Visit phases in dependency order; phases in a cycle are never visited
+        waiting = {key: set(d) for key, d in deps.items()}
+        order = list(dict.fromkeys(key for key, _ in phases if not waiting[key]))
+        visited = set(order)
+        position = 0
+        while position < len(order):
+            done_key = order[position]
+            position += 1
+            for key, _ in phases:
+                if key not in visited and done_key in waiting[key]:
+                    waiting[key].discard(done_key)
+                    if not waiting[key]:
+                        visited.add(key)
+                        order.append(key)
+
+        runnable: dict[str, bool] = {}
+        completable: dict[str, bool] = {}
+        phase_nodes: dict[str, list[str]] = {}
+        index = 0
+        for key in order:
+            phase = by_key[key]
+            runnable[key] = all(completable.get(dep, False) for dep in deps[key])
+            subtasks = phase.get("subtasks", phase.get("chunks", []))
+            statuses = [s.get("status", "pending") for s in subtasks]
+            completable[key] = runnable[key] and all(
+                status == "completed" or status in PENDING_STATUSES
+                for status in statuses
+            )
+            if not runnable[key]:
+                continue
+
+            upstream = [
+                node_id for dep in deps[key] for node_id in phase_nodes.get(dep, ())
+            ]
+            previous: str | None = None
+            phase_nodes[key] = []
+            for subtask, status in zip(subtasks, statuses):
+                subtask_id = subtask.get("id")
+                if status not in PENDING_STATUSES or subtask_id is None:
+                    continue
+                subtask_id = str(subtask_id)
+                if subtask_id in graph.nodes:
+                    logger.warning(f"Duplicate subtask id in plan: {subtask_id}")
+                    continue
+                subtask_out, _changed = normalize_subtask_aliases(
+                    copy.deepcopy(subtask)
+                )
+                subtask_out["status"] = "pending"
+                node = SubtaskNode(
+                    id=subtask_id,
+                    subtask={
+                        **subtask_out,
+                        "phase_id": phase.get("id")
+                        if phase.get("id") is not None
+                        else phase.get("phase"),
+                        "phase_name": phase.get("name"),
+                        "phase_num": phase.get("phase"),
+                    },
+                    index=index,
+                )
+                index += 1
+                node.depends_on.update(upstream)
+                if previous is not None and not phase.get("parallel_safe", False):
+                    node.depends_on.add(previous)
+                graph.nodes[subtask_id] = node
+                phase_nodes[key].append(subtask_id)
+                previous = subtask_id
+
+        for node in graph.nodes.values():
+            for dep in node.depends_on:
+                graph.nodes[dep].dependents.add(node.id)
+
+        for key, phase in phases:
+            if runnable.get(key):
+                continue
+            for subtask in phase.get("subtasks", phase.get("chunks", [])):
+                if subtask.get("status", "pending") in PENDING_STATUSES:
+                    graph.blocked.append(str(subtask.get("id")))
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def levels(self) -> dict[str, int]:
+        """Length of the longest chain starting at each subtask (itself included)."""
+        levels: dict[str, int] = {}
+        # Nodes are created in dependency order, so dependents come later
+        for node in sorted(self.nodes.values(), key=lambda n: n.index, reverse=True):
+            levels[node.id] = 1 + max((levels[d] for d in node.dependents), default=0)
+        return levels
+
+    def critical_path(self) -> list[str]:
+        """The longest dependency chain, as subtask ids in execution order."""
+        levels = self.levels()
+        path: list[str] = []
+        candidates = [n for n in self.nodes.values() if not n.depends_on]
+        while candidates:
+            node = min(candidates, key=lambda n: (-levels[n.id], n.index))
+            path.append(node.id)
+            candidates = [self.nodes[d] for d in node.dependents]
+        return path
+
+
+@dataclass
+class ScheduleReport:
+    """What a scheduler run did."""
+
+    started: list[str] = field(default_factory=list)
+    completed: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)  # Dependencies failed
+    critical_path: list[str] = field(default_factory=list)
+    max_running: int = 0
+    elapsed_seconds: float = 0.0
+
+
+SubtaskRunner = Callable[[SubtaskNode], Awaitable[bool]]
+
+
+class DagScheduler:
+    """Runs a SubtaskGraph with bounded concurrency."""
+
+    def __init__(
+        self,
+        graph: SubtaskGraph,
+        run_subtask: SubtaskRunner,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            graph: Subtasks to run
+            run_subtask: Runs one subtask; returns True if it completed (an
+                exception counts as a failure)
+            max_parallel: Maximum number of subtasks running at once
+        """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+        self.graph = graph
+        self.run_subtask = run_subtask
+        self.max_parallel = max_parallel
+
+    async def run(self) -> ScheduleReport:
+        """Run every subtask whose dependencies complete."""
+        graph = self.graph
+        levels = graph.levels()
+        report = ScheduleReport(critical_path=graph.critical_path())
+        waiting = {
+            node_id: len(node.depends_on) for node_id, node in graph.nodes.items()
+        }
+        ready = [graph.nodes[i] for i, count in waiting.items() if count == 0]
+        running: dict[asyncio.Task, SubtaskNode] = {}
+        start = time.perf_counter()
+
+        while ready or running:
+            # Longest remaining chain first, then plan order
+            ready.sort(key=lambda n: (-levels[n.id], n.index))
+            while ready and len(running) < self.max_parallel:
+                node = ready.pop(0)
+                report.started.append(node.id)
+                running[asyncio.create_task(self._run(node))] = node
+            report.max_running = max(report.max_running, len(running))
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(finished, key=lambda t: running[t].index):
+                node = running.pop(task)
+                if task.result():
+                    report.completed.append(node.id)
+                    for dependent in sorted(node.dependents):
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            ready.append(graph.nodes[dependent])
+                else:
+                    report.failed.append(node.id)
+                    self._skip_dependents(node, waiting, report)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
+
+    async def _run(self, node: SubtaskNode) -> bool:
+        try:
+            return bool(await self.run_subtask(node))
+        except Exception as e:
+            logger.warning(f"Subtask {node.id} raised {type(e).__name__}: {e}")
+            return False
+
+    def _skip_dependents(
+        self, node: SubtaskNode, waiting: dict[str, int], report: ScheduleReport
+    ) -> None:
+        stack = list(node.dependents)
+        while stack:
+            dependent = stack.pop()
+            if waiting.pop(dependent, None) is None:
+                continue  # Already skipped
+            report.skipped.append(dependent)
+            stack.extend(self.graph.nodes[dependent].dependents)
+        report.skipped.sort(key=lambda i: self.graph.nodes[i].index)
+
+
+# =============================================================================
+# Per-subtask worktrees
+# =============================================================================
+
+
+class SubtaskWorktreeManager(WorktreeManager):
+    """
+    Worktrees for single subtasks, nested in the build's project directory.
+
+    Branches fork from the build branch's current tip (never from origin, which
+    may hold an older push of it), and merge_worktree() merges them back into
+    the build branch.
+    """
+
+    def __init__(self, project_dir: Path, spec_name: str):
+        result = run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=project_dir)
+        if result.returncode != 0:
+            raise WorktreeError(f"Failed to get current branch: {result.stderr}")
+        super().__init__(project_dir, base_branch=result.stdout.strip())
+        self.spec_name = spec_name
+
+    def name_for(self, subtask_id: str) -> str:
+        safe_id = re.sub(r"[^A-Za-z0-9._-]", "-", subtask_id)
+        return f"{self.spec_name}--{safe_id}"
+
+    def create_worktree(self, spec_name: str) -> WorktreeInfo:
+        worktree_path = self.worktrees_dir / spec_name
+        branch_name = self.get_branch_name(spec_name)
+
+        # Leftovers from an interrupted run started from an older base
+        self._run_git(["worktree", "prune"])
+        if worktree_path.exists():
+            self.remove_worktree(spec_name, delete_branch=True)
+        elif self._branch_exists(branch_name):
+            self._run_git(["branch", "-D", branch_name])
+
+        result = self._run_git(
+            ["worktree", "add", "-b", branch_name, str(worktree_path), self.base_branch]
+        )
+        if result.returncode != 0:
+            raise WorktreeError(
+                f"Failed to create worktree for {spec_name}: {result.stderr}"
+            )
+        return WorktreeInfo(
+            path=worktree_path,
+            branch=branch_name,
+            spec_name=spec_name,
+            base_branch=self.base_branch,
+        )
+
+
+# =============================================================================
+# Parallel coder sessions
+# =============================================================================
+
+
+async def run_parallel_subtasks(
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    recovery_manager: RecoveryManager,
+    status_manager: StatusManager | None = None,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    verbose: bool = False,
+    source_spec_dir: Path | None = None,
+    linear_enabled: bool = False,
+    first_session: int = 1,
+    max_sessions: int | None = None,
+) -> int:
+    """
+    Run the plan's pending subtasks as concurrent coder sessions.
+
+    Each session works in its own worktree; completed subtasks are merged
+    into the build branch before their dependents start. Subtasks that fail,
+    or whose merge conflicts, are reset to pending for the sequential loop;
+    so are subtasks not started because max_sessions was reached.
+
+    Args:
+        project_dir: Build directory (the spec's worktree or the project)
+        spec_dir: Spec directory (shared by all sessions)
+        model: Claude model to use
+        recovery_manager: Recovery manager for attempt tracking
+        status_manager: Optional status manager for ccstatusline
+        max_parallel: Maximum number of concurrent sessions
+        verbose: Whether to show detailed output
+        source_spec_dir: Original spec directory (for syncing back from worktree)
+        linear_enabled: Whether Linear integration is enabled
+        first_session: Session number of the first parallel session
+        max_sessions: Maximum number of sessions to start (None for unlimited)
+
+    Returns:
+        Number of sessions run; they were numbered from first_session on
+    """
+    try:
+        plan = get_plan_store(spec_dir).load()
+    except PLAN_READ_ERRORS:
+        plan = None
+    if not plan:
+        return 0
+
+    graph = SubtaskGraph.from_plan(plan)
+    if not graph:
+        return 0
+    critical_path = graph.critical_path()
+    print_status(
+        f"Parallel build: {len(graph)} subtasks, up to {max_parallel} at a time, "
+        f"critical path {len(critical_path)} subtasks",
+        "info",
+    )
+    print(muted(f"  Critical path: {' -> '.join(critical_path)}"))
+
+    worktrees = SubtaskWorktreeManager(project_dir, spec_dir.name)
+    # Worktree creation and merges change the build branch; one at a time
+    git_lock = worktrees._merge_lock
+    sessions_run = 0
+
+    async def run_subtask(node: SubtaskNode) -> bool:
+        nonlocal sessions_run
+        if max_sessions is not None and sessions_run >= max_sessions:
+            # Left pending: the sequential loop stops at the same limit
+            print_status(f"Session limit reached, not starting {node.id}", "info")
+            return False
+        session_num = first_session + sessions_run
+        sessions_run += 1
+
+        name = worktrees.name_for(node.id)
+        async with git_lock:
+            info = await asyncio.to_thread(worktrees.create_worktree, name)
+        merged = False
+        try:
+            success = await _run_subtask_session(
+                node,
+                info.path,
+                spec_dir=spec_dir,
+                model=model,
+                recovery_manager=recovery_manager,
+                status_manager=status_manager,
+                verbose=verbose,
+                source_spec_dir=source_spec_dir,
+                linear_enabled=linear_enabled,
+                session_num=session_num,
+            )
+            if success:
+                async with git_lock:
+                    await asyncio.to_thread(
+                        worktrees.commit_in_worktree, name, f"auto-claude: {node.id}"
+                    )
+                    merged = await asyncio.to_thread(worktrees.merge_worktree, name)
+                if not merged:
+                    print_status(f"Could not merge {node.id}", "warning")
+            return merged
+        finally:
+            async with git_lock:
+                await asyncio.to_thread(worktrees.remove_worktree, name, True)
+            if not merged:
+                # Its worktree is gone, so it starts over in the sequential loop
+                _reset_to_pending(spec_dir, node.id)
+
+    report = await DagScheduler(graph, run_subtask, max_parallel).run()
+
+    print_status(
+        f"Parallel build finished in {report.elapsed_seconds:.0f}s: "
+        f"{len(report.completed)} completed, {len(report.failed)} failed, "
+        f"{len(report.skipped)} waiting on failed subtasks",
+        "success" if not report.failed else "warning",
+    )
+    return sessions_run
+
+
+async def _run_subtask_session(
+    node: SubtaskNode,
+    worktree_path: Path,
+    *,
+    spec_dir: Path,
+    model: str,
+    recovery_manager: RecoveryManager,
+    status_manager: StatusManager | None,
+    verbose: bool,
+    source_spec_dir: Path | None,
+    linear_enabled: bool,
+    session_num: int,
+) -> bool:
+    """One coder session for one subtask, in its worktree."""
+    subtask = node.subtask
+    recovery_manager.flush_attempt_history()
+    attempt_count = recovery_manager.get_attempt_count(node.id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(node.id) if attempt_count > 0 else None
+    )
+    try:
+        phase = get_plan_store(spec_dir).get_phase_for_subtask(node.id)
+    except PLAN_READ_ERRORS:
+        phase = None
+
+    prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=worktree_path,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+    context = load_subtask_context(spec_dir, worktree_path, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+    graphiti_context = await get_graphiti_context(spec_dir, worktree_path, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+
+    print(f"Starting: {highlight(node.id)} - {subtask.get('description', '')}")
+
+    client = create_client(
+        worktree_path,
+        spec_dir,
+        get_phase_model(spec_dir, "coding", model),
+        agent_type="coder",
+        max_thinking_tokens=get_phase_thinking_budget(spec_dir, "coding"),
+    )
+    commit_before = get_latest_commit(worktree_path)
+    commit_count_before = get_commit_count(worktree_path)
+    async with client:
+        await run_agent_session(
+            client, prompt, spec_dir, verbose, phase=LogPhase.CODING
+        )
+
+    return await post_session_processing(
+        spec_dir=spec_dir,
+        project_dir=worktree_path,
+        subtask_id=node.id,
+        session_num=session_num,
+        commit_before=commit_before,
+        commit_count_before=commit_count_before,
+        recovery_manager=recovery_manager,
+        linear_enabled=linear_enabled,
+        status_manager=status_manager,
+        source_spec_dir=source_spec_dir,
+    )
+
+
+def _reset_to_pending(spec_dir: Path, subtask_id: str) -> None:
+    def reset(plan: dict) -> bool:
+        for phase in plan.get("phases", []):
+            for subtask in phase.get("subtasks", phase.get("chunks", [])):
+                if str(subtask.get("id")) == subtask_id:
+                    subtask["status"] = "pending"
+                    return True
+        return False
+
+    try:
+        get_plan_store(spec_dir).update(reset)
+    except PLAN_READ_ERRORS as e:
+        logger.warning(f"Could not reset {subtask_id} to pending: {e}")
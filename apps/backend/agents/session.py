@@ -10,6 +10,17 @@ import logging
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeSDKClient
+from core.plan_store import PLAN_READ_ERRORS, get_plan_store
+from core.telemetry import (
+    MODEL_ATTR,
+    PHASE_ATTR,
+    TOOL_CALL_ID_ATTR,
+    TOOL_NAME_ATTR,
+    SpanKind,
+    get_tracer,
+    record_usage,
+    traced_post_session,
+)
 from debug import debug, debug_detailed, debug_error, debug_section, debug_success
 from insight_extractor import extract_session_insights
 from linear_updater import (
@@ -36,16 +47,15 @@ from ui import (
 
 from .memory_manager import save_session_memory
 from .utils import (
-    find_subtask_in_plan,
     get_commit_count,
     get_latest_commit,
-    load_implementation_plan,
     sync_spec_to_source,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@traced_post_session
 async def post_session_processing(
     spec_dir: Path,
     project_dir: Path,
@@ -80,18 +90,27 @@ async def post_session_processing(
     """
     print()
     print(muted("--- Post-Session Processing ---"))
+    tracer = get_tracer(spec_dir)
 
     # Sync implementation plan back to source (for worktree mode)
-    if sync_spec_to_source(spec_dir, source_spec_dir):
+    with tracer.span("sync_spec", SpanKind.POST_SESSION):
+        synced = sync_spec_to_source(spec_dir, source_spec_dir)
+    if synced:
         print_status("Implementation plan synced to main project", "success")
 
-    # Check if implementation plan was updated
-    plan = load_implementation_plan(spec_dir)
+    # Check if implementation plan was updated (the shared plan store only
+    # re-parses the file if the session changed it)
+    plan_store = get_plan_store(spec_dir)
+    with tracer.span("load_plan", SpanKind.POST_SESSION):
+        try:
+            plan = plan_store.load()
+        except PLAN_READ_ERRORS:
+            plan = None
     if not plan:
         print("  Warning: Could not load implementation plan")
         return False
 
-    subtask = find_subtask_in_plan(plan, subtask_id)
+    subtask = plan_store.get_subtask(subtask_id)
     if not subtask:
         print(f"  Warning: Subtask {subtask_id} not found in plan")
         return False
@@ -99,8 +118,9 @@ async def post_session_processing(
     subtask_status = subtask.get("status", "pending")
 
     # Check for new commits
-    commit_after = get_latest_commit(project_dir)
-    commit_count_after = get_commit_count(project_dir)
+    with tracer.span("check_commits", SpanKind.POST_SESSION):
+        commit_after = get_latest_commit(project_dir)
+        commit_count_after = get_commit_count(project_dir)
     new_commits = commit_count_after - commit_count_before
 
     print_key_value("Subtask status", subtask_status)
@@ -136,25 +156,33 @@ async def post_session_processing(
         if linear_enabled:
             # Get progress counts for the comment
             subtasks_detail = count_subtasks_detailed(spec_dir)
-            await linear_subtask_completed(
-                spec_dir=spec_dir,
-                subtask_id=subtask_id,
-                completed_count=subtasks_detail["completed"],
-                total_count=subtasks_detail["total"],
+            await tracer.run(
+                linear_subtask_completed(
+                    spec_dir=spec_dir,
+                    subtask_id=subtask_id,
+                    completed_count=subtasks_detail["completed"],
+                    total_count=subtasks_detail["total"],
+                ),
+                "linear_update",
+                SpanKind.POST_SESSION,
             )
             print_status("Linear progress recorded", "success")
 
         # Extract rich insights from session (LLM-powered analysis)
         try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=True,
-                recovery_manager=recovery_manager,
+            extracted_insights = await tracer.run(
+                extract_session_insights(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=session_num,
+                    commit_before=commit_before,
+                    commit_after=commit_after,
+                    success=True,
+                    recovery_manager=recovery_manager,
+                ),
+                "extract_insights",
+                SpanKind.POST_SESSION,
             )
             insight_count = len(extracted_insights.get("file_insights", []))
             pattern_count = len(extracted_insights.get("patterns_discovered", []))
@@ -169,14 +197,18 @@ async def post_session_processing(
 
         # Save session memory (Graphiti=primary, file-based=fallback)
         try:
-            save_success, storage_type = await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=True,
-                subtasks_completed=[subtask_id],
-                discoveries=extracted_insights,
+            save_success, storage_type = await tracer.run(
+                save_session_memory(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=session_num,
+                    success=True,
+                    subtasks_completed=[subtask_id],
+                    discoveries=extracted_insights,
+                ),
+                "save_memory",
+                SpanKind.POST_SESSION,
             )
             if save_success:
                 if storage_type == "graphiti":
@@ -215,24 +247,32 @@ async def post_session_processing(
         # Record Linear session result (if enabled)
         if linear_enabled:
             attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            await linear_subtask_failed(
-                spec_dir=spec_dir,
-                subtask_id=subtask_id,
-                attempt=attempt_count,
-                error_summary="Session ended without completion",
+            await tracer.run(
+                linear_subtask_failed(
+                    spec_dir=spec_dir,
+                    subtask_id=subtask_id,
+                    attempt=attempt_count,
+                    error_summary="Session ended without completion",
+                ),
+                "linear_update",
+                SpanKind.POST_SESSION,
             )
 
         # Extract insights even from failed sessions (valuable for future attempts)
         try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=False,
-                recovery_manager=recovery_manager,
+            extracted_insights = await tracer.run(
+                extract_session_insights(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=session_num,
+                    commit_before=commit_before,
+                    commit_after=commit_after,
+                    success=False,
+                    recovery_manager=recovery_manager,
+                ),
+                "extract_insights",
+                SpanKind.POST_SESSION,
             )
         except Exception as e:
             logger.debug(f"Insight extraction failed for incomplete session: {e}")
@@ -240,14 +280,18 @@ async def post_session_processing(
 
         # Save failed session memory (to track what didn't work)
         try:
-            await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=False,
-                subtasks_completed=[],
-                discoveries=extracted_insights,
+            await tracer.run(
+                save_session_memory(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=session_num,
+                    success=False,
+                    subtasks_completed=[],
+                    discoveries=extracted_insights,
+                ),
+                "save_memory",
+                SpanKind.POST_SESSION,
             )
         except Exception as e:
             logger.debug(f"Failed to save incomplete session memory: {e}")
@@ -271,24 +315,32 @@ async def post_session_processing(
         # Record Linear session result (if enabled)
         if linear_enabled:
             attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            await linear_subtask_failed(
-                spec_dir=spec_dir,
-                subtask_id=subtask_id,
-                attempt=attempt_count,
-                error_summary=f"Subtask status: {subtask_status}",
+            await tracer.run(
+                linear_subtask_failed(
+                    spec_dir=spec_dir,
+                    subtask_id=subtask_id,
+                    attempt=attempt_count,
+                    error_summary=f"Subtask status: {subtask_status}",
+                ),
+                "linear_update",
+                SpanKind.POST_SESSION,
             )
 
         # Extract insights even from completely failed sessions
         try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=False,
-                recovery_manager=recovery_manager,
+            extracted_insights = await tracer.run(
+                extract_session_insights(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=session_num,
+                    commit_before=commit_before,
+                    commit_after=commit_after,
+                    success=False,
+                    recovery_manager=recovery_manager,
+                ),
+                "extract_insights",
+                SpanKind.POST_SESSION,
             )
         except Exception as e:
             logger.debug(f"Insight extraction failed for failed session: {e}")
@@ -296,14 +348,18 @@ async def post_session_processing(
 
         # Save failed session memory (to track what didn't work)
         try:
-            await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=False,
-                subtasks_completed=[],
-                discoveries=extracted_insights,
+            await tracer.run(
+                save_session_memory(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=session_num,
+                    success=False,
+                    subtasks_completed=[],
+                    discoveries=extracted_insights,
+                ),
+                "save_memory",
+                SpanKind.POST_SESSION,
             )
         except Exception as e:
             logger.debug(f"Failed to save failed session memory: {e}")
@@ -311,6 +367,13 @@ async def post_session_processing(
         return False
 
 
+def _client_cwd(client: ClaudeSDKClient) -> str | None:
+    """The working directory a client's agent runs in, if it says."""
+    options = getattr(client, "options", None)
+    cwd = getattr(options, "cwd", None) or getattr(client, "cwd", None)
+    return str(cwd) if isinstance(cwd, (str, Path)) else None
+
+
 async def run_agent_session(
     client: ClaudeSDKClient,
     message: str,
@@ -351,6 +414,20 @@ async def run_agent_session(
     message_count = 0
     tool_count = 0
 
+    # Trace the session: model turns, tool calls (by tool use id) and the
+    # hooks the SDK runs for them become children of the session span
+    tracer = get_tracer(spec_dir)
+    session_span = tracer.start_span(
+        f"session {phase.value}",
+        SpanKind.SESSION,
+        {PHASE_ATTR: phase.value},
+        activate=True,
+        cwd=_client_cwd(client),
+    )
+    session_error = None
+    tool_spans = {}
+    model_span = tracer.start_span("model", SpanKind.MODEL, parent=session_span)
+
     try:
         # Send the query
         debug("session", "Sending query to Claude SDK...")
@@ -371,6 +448,10 @@ async def run_agent_session(
 
             # Handle AssistantMessage (text and tool use)
             if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                if model_span:
+                    model_span.end()
+                    model_span = None
+                session_span.set_attribute(MODEL_ATTR, getattr(msg, "model", None))
                 for block in msg.content:
                     block_type = type(block).__name__
 
@@ -389,6 +470,14 @@ async def run_agent_session(
                         tool_name = block.name
                         tool_input_display = None
                         tool_count += 1
+                        tool_use_id = getattr(block, "id", None)
+                        tool_spans[tool_use_id] = tracer.start_span(
+                            f"tool {tool_name}",
+                            SpanKind.TOOL,
+                            {TOOL_NAME_ATTR: tool_name, TOOL_CALL_ID_ATTR: tool_use_id},
+                            parent=session_span,
+                            tool_use_id=tool_use_id,
+                        )
 
                         # Safely extract tool input (handles None, non-dict, etc.)
                         inp = get_safe_tool_input(block)
@@ -444,6 +533,13 @@ async def run_agent_session(
                     if block_type == "ToolResultBlock":
                         result_content = getattr(block, "content", "")
                         is_error = getattr(block, "is_error", False)
+                        tool_span = tool_spans.pop(
+                            getattr(block, "tool_use_id", None), None
+                        )
+                        if tool_span:
+                            tool_span.end(
+                                error=str(result_content)[:200] if is_error else None
+                            )
 
                         # Check if this is an error (not just content containing "blocked")
                         if is_error and "blocked" in str(result_content).lower():
@@ -518,6 +614,15 @@ async def run_agent_session(
 
                         current_tool = None
 
+                # Tool results go back to the model
+                if not tool_spans and not model_span:
+                    model_span = tracer.start_span(
+                        "model", SpanKind.MODEL, parent=session_span
+                    )
+
+            elif msg_type == "ResultMessage":
+                record_usage(session_span, msg)
+
         print("\n" + "-" * 70 + "\n")
 
         # Check if build is complete
@@ -551,4 +656,14 @@ async def run_agent_session(
         print(f"Error during agent session: {e}")
         if task_logger:
             task_logger.log_error(f"Session error: {e}", phase)
+        session_error = f"{type(e).__name__}: {e}"
         return "error", str(e)
+
+    finally:
+        if model_span:
+            model_span.end()
+        for tool_span in tool_spans.values():
+            tool_span.end(error="No tool result received")
+        session_span.set_attribute("auto_claude.message_count", message_count)
+        session_span.set_attribute("auto_claude.tool_count", tool_count)
+        session_span.end(error=session_error)
@@ -5,10 +5,11 @@ Build Progress Tools
 Tools for tracking and reporting build progress.
 """
 
-import json
 from pathlib import Path
 from typing import Any
 
+from core.plan_store import get_plan_store
+
 try:
     from claude_agent_sdk import tool
 
@@ -57,8 +58,7 @@ def create_progress_tools(spec_dir: Path, project_dir: Path) -> list:
             }
 
         try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
+            plan = get_plan_store(spec_dir).load() or {}
 
             stats = {
                 "total": 0,
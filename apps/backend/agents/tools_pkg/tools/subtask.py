@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from core.file_utils import write_json_atomic
+from core.plan_store import get_plan_store
 from spec.validate_pkg.auto_fix import auto_fix_plan
 
 try:
@@ -112,11 +112,14 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
-        try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
+        plan_store = get_plan_store(spec_dir)
+
+        def apply_update(plan: dict[str, Any]) -> bool:
+            return _update_subtask_in_plan(plan, subtask_id, status, notes)
 
-            subtask_found = _update_subtask_in_plan(plan, subtask_id, status, notes)
+        try:
+            # Atomic write-through keeps the shared parsed plan current
+            subtask_found = plan_store.update(apply_update)
 
             if not subtask_found:
                 return {
@@ -128,9 +131,6 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                     ]
                 }
 
-            # Use atomic write to prevent file corruption
-            write_json_atomic(plan_file, plan, indent=2)
-
             return {
                 "content": [
                     {
@@ -145,15 +145,9 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             if auto_fix_plan(spec_dir):
                 # Retry after fix
                 try:
-                    with open(plan_file, encoding="utf-8") as f:
-                        plan = json.load(f)
-
-                    subtask_found = _update_subtask_in_plan(
-                        plan, subtask_id, status, notes
-                    )
+                    subtask_found = plan_store.update(apply_update)
 
                     if subtask_found:
-                        write_json_atomic(plan_file, plan, indent=2)
                         return {
                             "content": [
                                 {
@@ -5,12 +5,13 @@ Utility Functions for Agent System
 Helper functions for git operations, plan management, and file syncing.
 """
 
-import json
+import copy
 import logging
 import shutil
 from pathlib import Path
 
 from core.git_executable import run_git
+from core.plan_store import PLAN_READ_ERRORS, get_plan_store
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +44,12 @@ def get_commit_count(project_dir: Path) -> int:
 
 
 def load_implementation_plan(spec_dir: Path) -> dict | None:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
+    """Load the implementation plan JSON (a copy the caller may modify)."""
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        plan = get_plan_store(spec_dir).load()
+    except PLAN_READ_ERRORS:
         return None
+    return copy.deepcopy(plan) if plan is not None else None
 
 
 def find_subtask_in_plan(plan: dict, subtask_id: str) -> dict | None:
@@ -16,6 +16,9 @@ Usage:
     # Output to specific file
     python auto-claude/analyzer.py --index --output path/to/output.json
 
+    # Only re-analyze services that changed since the existing output file
+    python auto-claude/analyzer.py --index --output path/to/output.json --incremental
+
 The analyzer will:
 1. Detect if this is a monorepo or single project
 2. Find all services/packages and analyze each separately
@@ -79,6 +82,11 @@ def main():
         default=None,
         help="Output file for JSON results",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse unchanged services from an existing --output file",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -91,7 +99,9 @@ def main():
     if args.service:
         results = analyze_service(args.project_dir, args.service, args.output)
     else:
-        results = analyze_project(args.project_dir, args.output)
+        results = analyze_project(
+            args.project_dir, args.output, incremental=args.incremental
+        )
 
     # Print results
     if not args.quiet or not args.output:
@@ -28,27 +28,46 @@ __all__ = [
 ]
 
 
-def analyze_project(project_dir: Path, output_file: Path | None = None) -> dict:
+def analyze_project(
+    project_dir: Path, output_file: Path | None = None, incremental: bool = False
+) -> dict:
     """
     Analyze a project and optionally save results.
 
     Args:
         project_dir: Path to the project root
         output_file: Optional path to save JSON output
+        incremental: Reuse unchanged service sections from an existing
+            output_file instead of re-analyzing every service
 
     Returns:
         Project index as a dictionary
     """
     import json
 
-    analyzer = ProjectAnalyzer(project_dir)
+    previous_index = None
+    if incremental and output_file and output_file.exists():
+        try:
+            with open(output_file, encoding="utf-8") as f:
+                previous_index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            previous_index = None  # Corrupt or unreadable - full analysis
+
+    analyzer = ProjectAnalyzer(project_dir, previous_index=previous_index)
     results = analyzer.analyze()
 
     if output_file:
         output_file.parent.mkdir(parents=True, exist_ok=True)
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(results, f, indent=2)
-        print(f"Project index saved to: {output_file}")
+        if previous_index is not None:
+            print(
+                f"Project index saved to: {output_file} "
+                f"({len(analyzer.analyzed_services)} services analyzed, "
+                f"{len(analyzer.reused_services)} reused)"
+            )
+        else:
+            print(f"Project index saved to: {output_file}")
 
     return results
 
@@ -0,0 +1,203 @@
+"""
+Incremental Analysis Module
+===========================
+
+Fingerprints the inputs of each service so that ProjectAnalyzer can splice
+unchanged service sections from a previous project_index.json back into the
+new index instead of re-running the full ServiceAnalyzer for them.
+
+A service's fingerprint covers every file under its directory (skipping
+SKIP_DIRS and hidden directories, which the analyzers never draw conclusions
+from) and is stored in the service section under FINGERPRINT_KEY. The project
+fingerprint, stored at the top level of the index under the same key, only
+covers manifests, lockfiles and config files (see is_index_input()): it drives
+should_refresh_project_index(), and source edits alone must not trigger a
+re-analysis before every session.
+
+File identities come from core.fingerprint: git object IDs for clean tracked
+files, stat data for untracked or modified ones.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any
+
+from core.fingerprint import ProjectFingerprinter
+
+from .base import SKIP_DIRS
+
+# Key under which the index and each service section record their input fingerprint
+FINGERPRINT_KEY = "input_fingerprint"
+
+# Files that decide services, frameworks, tooling and infrastructure: package
+# manifests, lockfiles and config files. Changing one of them may change the
+# project index; source edits are picked up per service by is_service_fresh().
+INDEX_INPUT_NAMES = frozenset(
+    {
+        # Manifests
+        "package.json",
+        "pyproject.toml",
+        "setup.py",
+        "setup.cfg",
+        "Pipfile",
+        "Gemfile",
+        "go.mod",
+        "Cargo.toml",
+        "composer.json",
+        "pom.xml",
+        "build.gradle",
+        "build.gradle.kts",
+        "pubspec.yaml",
+        # Lockfiles
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "bun.lock",
+        "bun.lockb",
+        "poetry.lock",
+        "uv.lock",
+        "Pipfile.lock",
+        "Gemfile.lock",
+        "go.sum",
+        "Cargo.lock",
+        "composer.lock",
+        # Workspace, build, deploy and tool config
+        "pnpm-workspace.yaml",
+        "lerna.json",
+        "nx.json",
+        "turbo.json",
+        "rush.json",
+        "tsconfig.json",
+        "Dockerfile",
+        "Makefile",
+        "Procfile",
+        "fly.toml",
+        "netlify.toml",
+        "vercel.json",
+        "railway.json",
+        "render.yaml",
+        "app.yaml",
+        "serverless.yml",
+        "alembic.ini",
+        "pytest.ini",
+        "ruff.toml",
+        "schema.prisma",
+        "ormconfig.json",
+        ".eslintrc.js",
+        ".eslintrc.json",
+        ".eslintrc.yml",
+        ".prettierrc.js",
+        ".prettierrc.json",
+        ".pre-commit-config.yaml",
+        ".gitlab-ci.yml",
+    }
+)
+
+# Name patterns for the same kind of files: requirements-dev.txt,
+# docker-compose.prod.yml, vite.config.ts, knexfile.js, .env.local, ...
+INDEX_INPUT_PATTERN = re.compile(
+    r"^(requirements.*\.txt"
+    r"|(docker-)?compose.*\.ya?ml"
+    r"|Dockerfile\..+"
+    r"|.+\.config\.[cm]?[jt]s"
+    r"|knexfile\.[jt]s"
+    r"|\.env(\..+)?)$"
+)
+
+
+def is_index_input(rel_path: str) -> bool:
+    """
+    Check whether a file feeds the project-level index fingerprint.
+
+    Args:
+        rel_path: POSIX-style path relative to the project root
+
+    Returns:
+        True for manifests, lockfiles and config files
+    """
+    name = rel_path.rsplit("/", 1)[-1]
+    return name in INDEX_INPUT_NAMES or INDEX_INPUT_PATTERN.match(name) is not None
+
+
+def create_fingerprinter(project_dir: Path) -> ProjectFingerprinter:
+    """
+    Create a fingerprinter that sees the same files the analyzers draw on.
+
+    Args:
+        project_dir: Root directory of the project
+
+    Returns:
+        ProjectFingerprinter rooted at project_dir
+    """
+    return ProjectFingerprinter(project_dir, skip_dirs=SKIP_DIRS, skip_hidden_dirs=True)
+
+
+def compute_project_fingerprint(
+    project_dir: Path, fingerprinter: ProjectFingerprinter | None = None
+) -> dict[str, Any]:
+    """
+    Compute the project-level input fingerprint.
+
+    Covers the manifests, lockfiles and config files anywhere in the project
+    (see is_index_input()), so adding, removing or reconfiguring a service
+    changes it while editing source files does not.
+
+    Args:
+        project_dir: Root directory of the project
+        fingerprinter: Optional fingerprinter snapshot to reuse
+
+    Returns:
+        Serialized fingerprint over the project's index inputs
+    """
+    fingerprinter = fingerprinter or create_fingerprinter(project_dir)
+    return fingerprinter.fingerprint_tree(match=is_index_input).to_dict()
+
+
+def compute_service_fingerprint(
+    service_path: Path, fingerprinter: ProjectFingerprinter | None = None
+) -> dict[str, Any]:
+    """
+    Compute the input fingerprint for a single service.
+
+    Args:
+        service_path: Root directory of the service
+        fingerprinter: Optional fingerprinter rooted at (or above) service_path,
+            so a monorepo only queries git once for all of its services
+
+    Returns:
+        Serialized fingerprint over every analyzable file in the service
+    """
+    service_path = service_path.resolve()
+    if fingerprinter is None:
+        fingerprinter = create_fingerprinter(service_path)
+
+    try:
+        subdir = service_path.relative_to(fingerprinter.root).as_posix()
+    except ValueError:
+        fingerprinter = create_fingerprinter(service_path)
+        subdir = ""
+
+    return fingerprinter.fingerprint_tree("" if subdir == "." else subdir).to_dict()
+
+
+def is_service_fresh(
+    previous: dict[str, Any], service_path: Path, fingerprint: dict[str, Any]
+) -> bool:
+    """
+    Check whether a previously analyzed service section can be reused.
+
+    Args:
+        previous: Service section from the previous project index
+        service_path: Current root directory of the service
+        fingerprint: Freshly computed fingerprint for the service
+
+    Returns:
+        True if the section was produced from identical inputs at the same path
+    """
+    if not isinstance(previous, dict):
+        return False
+    if previous.get("path") != str(service_path):
+        return False
+    return previous.get(FINGERPRINT_KEY) == fingerprint
@@ -3,6 +3,9 @@ Project Analyzer Module
 =======================
 
 Analyzes entire projects, detecting monorepo structures, services, infrastructure, and conventions.
+
+When given a previous project index, services whose input fingerprint is
+unchanged are reused from it instead of being re-analyzed.
 """
 
 from __future__ import annotations
@@ -11,14 +14,27 @@ from pathlib import Path
 from typing import Any
 
 from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS
+from .incremental import (
+    FINGERPRINT_KEY,
+    compute_project_fingerprint,
+    compute_service_fingerprint,
+    create_fingerprinter,
+    is_service_fresh,
+)
 from .service_analyzer import ServiceAnalyzer
 
 
 class ProjectAnalyzer:
     """Analyzes an entire project, detecting monorepo structure and all services."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, previous_index: dict | None = None):
         self.project_dir = project_dir.resolve()
+        self.previous_index = previous_index or {}
+        # One git snapshot shared by every fingerprint taken during this run
+        self.fingerprinter = create_fingerprinter(self.project_dir)
+        # Service names re-analyzed vs. reused from previous_index in this run
+        self.analyzed_services: list[str] = []
+        self.reused_services: list[str] = []
         self.index = {
             "project_root": str(self.project_dir),
             "project_type": "single",  # or "monorepo"
@@ -29,6 +45,10 @@ class ProjectAnalyzer:
 
     def analyze(self) -> dict[str, Any]:
         """Run full project analysis."""
+        # Fingerprint before analyzing so edits made mid-analysis trigger a re-run
+        self.index[FINGERPRINT_KEY] = compute_project_fingerprint(
+            self.project_dir, self.fingerprinter
+        )
         self._detect_project_type()
         self._find_and_analyze_services()
         self._analyze_infrastructure()
@@ -109,21 +129,40 @@ class ProjectAnalyzer:
                     if has_root_file or (
                         location == self.project_dir and is_service_name
                     ):
-                        analyzer = ServiceAnalyzer(item, item.name)
-                        service_info = analyzer.analyze()
+                        service_info = self._analyze_service(item, item.name)
                         if service_info.get(
                             "language"
                         ):  # Only include if we detected something
                             services[item.name] = service_info
         else:
             # Single project - analyze root
-            analyzer = ServiceAnalyzer(self.project_dir, "main")
-            service_info = analyzer.analyze()
+            service_info = self._analyze_service(self.project_dir, "main")
             if service_info.get("language"):
                 services["main"] = service_info
 
         self.index["services"] = services
 
+    def _analyze_service(self, service_path: Path, service_name: str) -> dict[str, Any]:
+        """Analyze a service, reusing its previous section if its inputs are unchanged."""
+        # Fingerprint before analyzing so edits made mid-analysis trigger a re-run
+        fingerprint = compute_service_fingerprint(service_path, self.fingerprinter)
+
+        previous_services = self.previous_index.get("services")
+        if isinstance(previous_services, dict):
+            previous = previous_services.get(service_name)
+            if is_service_fresh(previous, service_path, fingerprint):
+                service_info = dict(previous)
+                # Cross-service links are recomputed by _map_dependencies
+                service_info.pop("consumes", None)
+                self.reused_services.append(service_name)
+                return service_info
+
+        analyzer = ServiceAnalyzer(service_path, service_name)
+        service_info = analyzer.analyze()
+        service_info[FINGERPRINT_KEY] = fingerprint
+        self.analyzed_services.append(service_name)
+        return service_info
+
     def _analyze_infrastructure(self) -> None:
         """Analyze infrastructure configuration."""
         infra = {}
@@ -6,9 +6,12 @@ Command-line interface for the Auto Claude autonomous coding framework.
 """
 
 import argparse
+import importlib
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 # Ensure parent directory is in path for imports (before other imports)
 _PARENT_DIR = Path(__file__).parent.parent
@@ -16,19 +19,6 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 
-from .batch_commands import (
-    handle_batch_cleanup_command,
-    handle_batch_create_command,
-    handle_batch_status_command,
-)
-from .build_commands import handle_build_command
-from .followup_commands import handle_followup_command
-from .qa_commands import (
-    handle_qa_command,
-    handle_qa_status_command,
-    handle_review_status_command,
-)
-from .spec_commands import print_specs_list
 from .utils import (
     DEFAULT_MODEL,
     find_spec,
@@ -36,14 +26,35 @@ from .utils import (
     print_banner,
     setup_environment,
 )
-from .workspace_commands import (
-    handle_cleanup_worktrees_command,
-    handle_create_pr_command,
-    handle_discard_command,
-    handle_list_worktrees_command,
-    handle_merge_command,
-    handle_review_command,
-)
+
+# Command handler -> module in this package. A handler's module is imported
+# only when its command runs, so e.g. --list does not load the agent, merge,
+# QA and Graphiti machinery that the build and QA commands need.
+COMMAND_MODULES = {
+    "print_specs_list": "spec_commands",
+    "handle_build_command": "build_commands",
+    "handle_followup_command": "followup_commands",
+    "handle_batch_create_command": "batch_commands",
+    "handle_batch_status_command": "batch_commands",
+    "handle_batch_cleanup_command": "batch_commands",
+    "handle_qa_command": "qa_commands",
+    "handle_qa_status_command": "qa_commands",
+    "handle_review_status_command": "qa_commands",
+    "handle_trace_summary_command": "telemetry_commands",
+    "handle_list_worktrees_command": "workspace_commands",
+    "handle_cleanup_worktrees_command": "workspace_commands",
+    "handle_merge_command": "workspace_commands",
+    "handle_merge_preview_command": "workspace_commands",
+    "handle_review_command": "workspace_commands",
+    "handle_discard_command": "workspace_commands",
+    "handle_create_pr_command": "workspace_commands",
+}
+
+
+def get_command(name: str) -> Callable[..., Any]:
+    """Import a command handler's module and return the handler."""
+    module = importlib.import_module(f".{COMMAND_MODULES[name]}", __package__)
+    return getattr(module, name)
 
 
 def parse_args() -> argparse.Namespace:
@@ -72,6 +83,7 @@ Examples:
   # Status checks
   python auto-claude/run.py --spec 001 --review-status  # Check human review status
   python auto-claude/run.py --spec 001 --qa-status      # Check QA validation status
+  python auto-claude/run.py --spec 001 --trace-summary  # Session latency by tool and phase
 
 Prerequisites:
   1. Authenticate: Run 'claude' and type '/login'
@@ -111,6 +123,14 @@ Environment Variables:
         help="Maximum number of agent sessions (default: unlimited)",
     )
 
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Build up to N independent subtasks at once, each in its own worktree (default: 1)",
+    )
+
     parser.add_argument(
         "--model",
         type=str,
@@ -222,6 +242,13 @@ Environment Variables:
         help="Show human review/approval status for a spec",
     )
 
+    # Telemetry
+    parser.add_argument(
+        "--trace-summary",
+        action="store_true",
+        help="Show p50/p95/p99 latencies by tool and phase from a spec's session traces",
+    )
+
     # Non-interactive mode (for UI/automation)
     parser.add_argument(
         "--auto-continue",
@@ -330,30 +357,32 @@ def _run_cli() -> None:
     # Handle --list command
     if args.list:
         print_banner()
-        print_specs_list(project_dir)
+        get_command("print_specs_list")(project_dir)
         return
 
     # Handle --list-worktrees command
     if args.list_worktrees:
-        handle_list_worktrees_command(project_dir)
+        get_command("handle_list_worktrees_command")(project_dir)
         return
 
     # Handle --cleanup-worktrees command
     if args.cleanup_worktrees:
-        handle_cleanup_worktrees_command(project_dir)
+        get_command("handle_cleanup_worktrees_command")(project_dir)
         return
 
     # Handle batch commands
     if args.batch_create:
-        handle_batch_create_command(args.batch_create, str(project_dir))
+        get_command("handle_batch_create_command")(args.batch_create, str(project_dir))
         return
 
     if args.batch_status:
-        handle_batch_status_command(str(project_dir))
+        get_command("handle_batch_status_command")(str(project_dir))
         return
 
     if args.batch_cleanup:
-        handle_batch_cleanup_command(str(project_dir), dry_run=not args.no_dry_run)
+        get_command("handle_batch_cleanup_command")(
+            str(project_dir), dry_run=not args.no_dry_run
+        )
         return
 
     # Require --spec if not listing
@@ -375,7 +404,7 @@ def _run_cli() -> None:
         print_banner()
         print(f"\nError: Spec '{args.spec}' not found")
         print("\nAvailable specs:")
-        print_specs_list(project_dir)
+        get_command("print_specs_list")(project_dir)
         sys.exit(1)
 
     debug_success("run.py", "Spec found", spec_dir=str(spec_dir))
@@ -391,9 +420,7 @@ def _run_cli() -> None:
 
     # Handle build management commands
     if args.merge_preview:
-        from cli.workspace_commands import handle_merge_preview_command
-
-        result = handle_merge_preview_command(
+        result = get_command("handle_merge_preview_command")(
             project_dir, spec_dir.name, base_branch=args.base_branch
         )
         # Output as JSON for the UI to parse
@@ -403,7 +430,7 @@ def _run_cli() -> None:
         return
 
     if args.merge:
-        success = handle_merge_command(
+        success = get_command("handle_merge_command")(
             project_dir,
             spec_dir.name,
             no_commit=args.no_commit,
@@ -414,17 +441,17 @@ def _run_cli() -> None:
         return
 
     if args.review:
-        handle_review_command(project_dir, spec_dir.name)
+        get_command("handle_review_command")(project_dir, spec_dir.name)
         return
 
     if args.discard:
-        handle_discard_command(project_dir, spec_dir.name)
+        get_command("handle_discard_command")(project_dir, spec_dir.name)
         return
 
     if args.create_pr:
         # Pass args.pr_target directly - WorktreeManager._detect_base_branch
         # handles base branch detection internally when target_branch is None
-        result = handle_create_pr_command(
+        result = get_command("handle_create_pr_command")(
             project_dir=project_dir,
             spec_name=spec_dir.name,
             target_branch=args.pr_target,
@@ -438,15 +465,19 @@ def _run_cli() -> None:
 
     # Handle QA commands
     if args.qa_status:
-        handle_qa_status_command(spec_dir)
+        get_command("handle_qa_status_command")(spec_dir)
         return
 
     if args.review_status:
-        handle_review_status_command(spec_dir)
+        get_command("handle_review_status_command")(spec_dir)
+        return
+
+    if args.trace_summary:
+        get_command("handle_trace_summary_command")(spec_dir)
         return
 
     if args.qa:
-        handle_qa_command(
+        get_command("handle_qa_command")(
             project_dir=project_dir,
             spec_dir=spec_dir,
             model=model,
@@ -456,7 +487,7 @@ def _run_cli() -> None:
 
     # Handle --followup command
     if args.followup:
-        handle_followup_command(
+        get_command("handle_followup_command")(
             project_dir=project_dir,
             spec_dir=spec_dir,
             model=model,
@@ -465,7 +496,7 @@ def _run_cli() -> None:
         return
 
     # Normal build flow
-    handle_build_command(
+    get_command("handle_build_command")(
         project_dir=project_dir,
         spec_dir=spec_dir,
         model=model,
@@ -477,6 +508,7 @@ def _run_cli() -> None:
         skip_qa=args.skip_qa,
         force_bypass_approval=args.force,
         base_branch=args.base_branch,
+        max_parallel=args.parallel,
     )
 
 
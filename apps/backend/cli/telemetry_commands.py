@@ -0,0 +1,82 @@
+"""
+Telemetry Commands
+==================
+
+CLI command summarizing a spec's session traces (see core.telemetry).
+"""
+
+from pathlib import Path
+
+from core.telemetry import (
+    CACHE_CREATION_TOKENS_ATTR,
+    CACHE_READ_TOKENS_ATTR,
+    COST_ATTR,
+    INPUT_TOKENS_ATTR,
+    OUTPUT_TOKENS_ATTR,
+    TRACE_FILENAME,
+    load_spans,
+    summarize_latencies,
+    summarize_tokens,
+)
+from ui import bold, muted, print_status
+
+from .utils import print_banner
+
+
+def handle_trace_summary_command(spec_dir: Path) -> None:
+    """
+    Handle the --trace-summary command.
+
+    Prints p50/p95/p99 latencies of the spec's recorded sessions, model
+    turns, tool calls, hooks and post-session steps, by name and phase,
+    followed by token usage per phase.
+
+    Args:
+        spec_dir: Spec directory path
+    """
+    print_banner()
+    print(f"\nSpec: {spec_dir.name}\n")
+
+    trace_file = spec_dir / TRACE_FILENAME
+    records = load_spans(trace_file)
+    if not records:
+        print_status(f"No session traces recorded in {trace_file}", "info")
+        return
+
+    print(bold("Latency by tool and phase (ms)"))
+    header = (
+        f"  {'KIND':13} {'NAME':34} {'PHASE':11} {'COUNT':>6} {'ERR':>4} "
+        f"{'P50':>9} {'P95':>9} {'P99':>9} {'TOTAL':>10}"
+    )
+    print(muted(header))
+    kind = None
+    for row in summarize_latencies(records):
+        if kind is not None and row.kind != kind:
+            print()
+        kind = row.kind
+        print(
+            f"  {row.kind:13} {row.name[:34]:34} {row.phase or '-':11} "
+            f"{row.count:6} {row.errors:4} {row.p50_ms:9.1f} {row.p95_ms:9.1f} "
+            f"{row.p99_ms:9.1f} {row.total_ms:10.1f}"
+        )
+
+    tokens = summarize_tokens(records)
+    if tokens:
+        print()
+        print(bold("Token usage by phase"))
+        print(
+            muted(
+                f"  {'PHASE':11} {'SESSIONS':>8} {'INPUT':>12} {'OUTPUT':>12} "
+                f"{'CACHE READ':>12} {'CACHE WRITE':>12} {'COST USD':>9}"
+            )
+        )
+        for phase, totals in tokens.items():
+            print(
+                f"  {phase:11} {totals['sessions']:8} "
+                f"{totals.get(INPUT_TOKENS_ATTR, 0):12} "
+                f"{totals.get(OUTPUT_TOKENS_ATTR, 0):12} "
+                f"{totals.get(CACHE_READ_TOKENS_ATTR, 0):12} "
+                f"{totals.get(CACHE_CREATION_TOKENS_ATTR, 0):12} "
+                f"{totals.get(COST_ATTR, 0.0):9.2f}"
+            )
+    print()
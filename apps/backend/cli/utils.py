@@ -58,9 +58,8 @@ def import_dotenv():
 load_dotenv = import_dotenv()
 # NOTE: graphiti_config is imported lazily in validate_environment() to avoid
 # triggering graphiti_core -> real_ladybug -> pywintypes import chain before
-# platform dependency validation can run. See ACS-253.
-from linear_integration import LinearManager
-from linear_updater import is_linear_enabled
+# platform dependency validation can run. See ACS-253. The Linear modules
+# (which import the Claude SDK) are also imported there, as only builds use them.
 from spec.pipeline import get_specs_dir
 from ui import (
     Icons,
@@ -188,6 +187,9 @@ def validate_environment(spec_dir: Path) -> bool:
         valid = False
 
     # Check Linear integration (optional but show status)
+    from linear_integration import LinearManager
+    from linear_updater import is_linear_enabled
+
     if is_linear_enabled():
         print("Linear integration: ENABLED")
         # Show Linear project status if initialized
@@ -12,15 +12,19 @@ The client factory now uses AGENT_CONFIGS from agents/tools_pkg/models.py as the
 single source of truth for phase-aware tool and MCP server configuration.
 """
 
-import copy
 import json
 import logging
 import os
 import threading
 import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from core.debug import debug, debug_verbose
+from core.fingerprint import stat_token
 from core.platform import (
     is_windows,
     validate_cli_path,
@@ -33,78 +37,124 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # Caches project index and capabilities to avoid reloading on every create_client() call.
 # This significantly reduces the time to create new agent sessions.
+#
+# Entries are invalidated by the fingerprint of project_index.json (see
+# core.fingerprint), not by age: a regenerated index is picked up on the next
+# call, and an unchanged one is never reloaded. Cached data is deep-frozen
+# into read-only mappings/tuples, so hits are shared without copying.
 
-_PROJECT_INDEX_CACHE: dict[str, tuple[dict[str, Any], dict[str, bool], float]] = {}
-_CACHE_TTL_SECONDS = 300  # 5 minute TTL
-_CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE access
+
+@dataclass(frozen=True)
+class _CachedProjectData:
+    """Frozen project index and capabilities for one project directory."""
+
+    project_index: Mapping[str, Any]
+    project_capabilities: Mapping[str, bool]
+    index_fingerprint: str | None
+
+
+_PROJECT_INDEX_CACHE: dict[str, _CachedProjectData] = {}
+_CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE and _CACHE_STATS
+_CACHE_STATS = {"hits": 0, "misses": 0, "invalidations": 0, "load_time_ms": 0.0}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into read-only mappings/tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _get_index_fingerprint(project_dir: Path) -> str | None:
+    """Fingerprint of the project's project_index.json (None if missing)."""
+    return stat_token(project_dir / ".auto-claude" / "project_index.json")
 
 
 def _get_cached_project_data(
     project_dir: Path,
-) -> tuple[dict[str, Any], dict[str, bool]]:
+) -> tuple[Mapping[str, Any], Mapping[str, bool]]:
     """
     Get project index and capabilities with caching.
 
+    The returned mappings are read-only views shared with the cache; callers
+    that need to mutate them must copy them first.
+
     Args:
         project_dir: Path to the project directory
 
     Returns:
         Tuple of (project_index, project_capabilities)
     """
-
     key = str(project_dir.resolve())
-    now = time.time()
-    debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
+    index_fingerprint = _get_index_fingerprint(project_dir)
 
-    # Check cache with lock
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = now - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                if debug:
-                    print(
-                        f"[ClientCache] Cache HIT for project index (age: {cache_age:.1f}s / TTL: {_CACHE_TTL_SECONDS}s)"
-                    )
-                logger.debug(f"Using cached project index for {project_dir}")
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-            elif debug:
-                print(
-                    f"[ClientCache] Cache EXPIRED for project index (age: {cache_age:.1f}s > TTL: {_CACHE_TTL_SECONDS}s)"
-                )
-
-    # Cache miss or expired - load fresh data (outside lock to avoid blocking)
-    load_start = time.time()
-    logger.debug(f"Loading project index for {project_dir}")
-    project_index = load_project_index(project_dir)
-    project_capabilities = detect_project_capabilities(project_index)
-
-    if debug:
-        load_duration = (time.time() - load_start) * 1000
-        print(
-            f"[ClientCache] Cache MISS - loaded project index in {load_duration:.1f}ms"
+        cached = _PROJECT_INDEX_CACHE.get(key)
+        is_hit = cached is not None and cached.index_fingerprint == index_fingerprint
+        if is_hit:
+            _CACHE_STATS["hits"] += 1
+        else:
+            _CACHE_STATS["misses"] += 1
+            if cached is not None:
+                _CACHE_STATS["invalidations"] += 1
+        stats = dict(_CACHE_STATS)
+
+    if is_hit:
+        debug_verbose(
+            "client",
+            "Project index cache HIT",
+            project_dir=key,
+            hits=stats["hits"],
+            misses=stats["misses"],
         )
+        return cached.project_index, cached.project_capabilities
+
+    # Cache miss or stale fingerprint - load fresh data (outside lock to avoid blocking)
+    load_start = time.perf_counter()
+    project_index = load_project_index(project_dir)
+    entry = _CachedProjectData(
+        project_index=_freeze(project_index),
+        project_capabilities=_freeze(detect_project_capabilities(project_index)),
+        index_fingerprint=index_fingerprint,
+    )
+    load_ms = (time.perf_counter() - load_start) * 1000
 
-    # Store in cache with lock - use double-checked locking pattern
-    # Re-check if another thread populated the cache while we were loading
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = time.time() - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                # Another thread already cached valid data while we were loading
-                if debug:
-                    print(
-                        "[ClientCache] Cache was populated by another thread, using cached data"
-                    )
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-        # Either no cache entry or it's expired - store our fresh data
-        _PROJECT_INDEX_CACHE[key] = (project_index, project_capabilities, time.time())
+        _CACHE_STATS["load_time_ms"] += load_ms
+        # Keep whichever entry reflects the newest index file on disk; another
+        # thread may have stored a fresher one while we were loading
+        current = _PROJECT_INDEX_CACHE.get(key)
+        if current is None or current.index_fingerprint != _get_index_fingerprint(
+            project_dir
+        ):
+            _PROJECT_INDEX_CACHE[key] = entry
+        stats = dict(_CACHE_STATS)
+
+    debug(
+        "client",
+        "Project index cache MISS - loaded project index",
+        project_dir=key,
+        load_ms=round(load_ms, 1),
+        stale=cached is not None,
+        hits=stats["hits"],
+        misses=stats["misses"],
+    )
+    return entry.project_index, entry.project_capabilities
 
-    # Return the freshly loaded data (no need to copy since it's not from cache)
-    return project_index, project_capabilities
+
+def get_project_cache_stats() -> dict[str, float]:
+    """
+    Get hit/miss/load-time metrics for the project index cache.
+
+    Returns:
+        Dict with hits, misses, invalidations, total load_time_ms and entries
+    """
+    with _CACHE_LOCK:
+        stats = dict(_CACHE_STATS)
+        stats["entries"] = len(_PROJECT_INDEX_CACHE)
+    return stats
 
 
 def invalidate_project_cache(project_dir: Path | None = None) -> None:
@@ -143,6 +193,8 @@ from core.auth import (
     require_auth_token,
     validate_token_not_encrypted,
 )
+from core.session_replay import create_replay_client, is_replaying, maybe_record
+from core.telemetry import traced_hook
 from linear_updater import is_linear_enabled
 from prompts_pkg.project_context import detect_project_capabilities, load_project_index
 from security import bash_security_hook
@@ -490,16 +542,20 @@ def create_client(
        (see security.py for ALLOWED_COMMANDS)
     4. Tool filtering - Each agent type only sees relevant tools (prevents misuse)
     """
-    # Get OAuth token - Claude CLI handles token lifecycle internally
-    oauth_token = require_auth_token()
+    # Replayed sessions (see core.session_replay) never reach the SDK, so they
+    # need no credentials; everything else below is set up as usual
+    replaying = is_replaying()
+    if not replaying:
+        # Get OAuth token - Claude CLI handles token lifecycle internally
+        oauth_token = require_auth_token()
 
-    # Validate token is not encrypted before passing to SDK
-    # Encrypted tokens (enc:...) should have been decrypted by require_auth_token()
-    # If we still have an encrypted token here, it means decryption failed or was skipped
-    validate_token_not_encrypted(oauth_token)
+        # Validate token is not encrypted before passing to SDK
+        # Encrypted tokens (enc:...) should have been decrypted by require_auth_token()
+        # If we still have an encrypted token here, it means decryption failed or was skipped
+        validate_token_not_encrypted(oauth_token)
 
-    # Ensure SDK can access it via its expected env var
-    os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = oauth_token
+        # Ensure SDK can access it via its expected env var
+        os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = oauth_token
 
     # Collect env vars to pass to SDK (ANTHROPIC_BASE_URL, etc.)
     sdk_env = get_sdk_env_vars()
@@ -803,7 +859,7 @@ def create_client(
         "mcp_servers": mcp_servers,
         "hooks": {
             "PreToolUse": [
-                HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
+                HookMatcher(matcher="Bash", hooks=[traced_hook(bash_security_hook)]),
             ],
         },
         "max_turns": 1000,
@@ -836,4 +892,10 @@ def create_client(
     if agents:
         options_kwargs["agents"] = agents
 
-    return ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs))
+    if replaying:
+        return create_replay_client(
+            agent_type, options_kwargs["hooks"], options_kwargs["cwd"]
+        )
+    return maybe_record(
+        ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs)), agent_type, model
+    )
@@ -7,7 +7,8 @@ Centralized debug logging for the Auto-Claude framework.
 Controlled via environment variables:
   - DEBUG=true          Enable debug mode
   - DEBUG_LEVEL=1|2|3   Log verbosity (1=basic, 2=detailed, 3=verbose)
-  - DEBUG_LOG_FILE=path Optional file output
+  - DEBUG_LOG_FILE=path Optional file output (written in the background,
+                        rotated at 10 MB; see core.debug_sink)
 
 Usage:
     from debug import debug, debug_detailed, debug_verbose, is_debug_enabled
@@ -26,6 +27,8 @@ from functools import wraps
 from pathlib import Path
 from typing import Any
 
+from core.debug_sink import get_debug_sink
+
 
 # ANSI color codes for terminal output
 class Colors:
@@ -104,16 +107,8 @@ def _write_log(message: str, to_file: bool = True) -> None:
     if to_file:
         log_file = _get_log_file()
         if log_file:
-            try:
-                log_file.parent.mkdir(parents=True, exist_ok=True)
-                # Strip ANSI codes for file output
-                import re
-
-                clean_message = re.sub(r"\033\[[0-9;]*m", "", message)
-                with open(log_file, "a", encoding="utf-8") as f:
-                    f.write(clean_message + "\n")
-            except Exception:
-                pass  # Silently fail file logging
+            # Written (ANSI codes stripped) by a background thread
+            get_debug_sink(log_file).write(message)
 
 
 def debug(module: str, message: str, level: int = 1, **kwargs) -> None:
@@ -213,6 +208,12 @@ def debug_error(module: str, message: str, **kwargs) -> None:
 
     _write_log(log_line)
 
+    # Errors often precede a crash: make sure they (and everything before
+    # them) are on disk
+    log_file = _get_log_file()
+    if log_file:
+        get_debug_sink(log_file).flush()
+
 
 def debug_warning(module: str, message: str, **kwargs) -> None:
     """Log a warning debug message."""
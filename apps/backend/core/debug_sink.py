@@ -0,0 +1,238 @@
+"""
+Debug Log Sink
+==============
+
+Background writer for DEBUG_LOG_FILE output.
+
+Every debug line used to create the log directory, strip ANSI codes with a
+freshly looked-up regex and open and close the log file. A DebugLogSink
+keeps one open handle per log file instead: callers put lines on a bounded
+queue (blocking if it is full, so lines are never dropped) and a daemon
+thread strips, writes and flushes them in batches.
+
+The file is rotated RotatingFileHandler-style once it would exceed
+max_bytes: debug.log -> debug.log.1 -> ... -> debug.log.{backup_count}.
+
+Queued lines reach the file:
+- when the queue drains (the writer flushes after every batch)
+- on flush(), which blocks until everything queued so far is written
+- at interpreter exit, including after an unhandled exception (atexit)
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import re
+import threading
+from pathlib import Path
+
+# ANSI color codes are stripped from file output
+ANSI_ESCAPE_RE = re.compile(r"\033\[[0-9;]*m")
+
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+_STOP = object()
+
+
+class DebugLogSink:
+    """One log file, written by a background thread."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """
+        Initialize the sink (the file is opened by the first write).
+
+        Args:
+            path: Log file
+            max_bytes: Rotate before the file would grow past this (0 = never)
+            backup_count: Rotated files to keep (0 = truncate instead)
+            queue_size: Lines that may wait for the writer before write() blocks
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._file = None
+        self._size = 0
+        self._closed = False
+        self.lines_written = 0
+        self.rotations = 0
+
+    def write(self, message: str) -> None:
+        """Queue a message (ANSI codes are stripped before writing)."""
+        if self._closed or not self._ensure_thread():
+            # Too late for a writer thread (interpreter shutdown): write inline
+            with self._lock:
+                self._write(message)
+                self._flush_file()
+            return
+        self._queue.put(message)
+
+    def flush(self) -> None:
+        """Block until every message queued so far is written and flushed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write everything still queued, stop the writer and close the file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+        with self._lock:
+            # Lines queued by other threads while the writer was stopping
+            while True:
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message is not _STOP:
+                    self._write(message)
+                self._queue.task_done()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> bool:
+        if self._thread is not None:
+            return True
+        with self._lock:
+            if self._thread is None and not self._closed:
+                thread = threading.Thread(
+                    target=self._run, name="debug-log-sink", daemon=True
+                )
+                try:
+                    thread.start()
+                except RuntimeError:
+                    return False
+                self._thread = thread
+        return self._thread is not None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            with self._lock:
+                for message in batch:
+                    if message is _STOP:
+                        stop = True
+                    else:
+                        self._write(message)
+                self._flush_file()
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, message: str) -> None:
+        # Caller holds the lock; file errors are ignored, as debug output
+        # must never break the program
+        try:
+            data = (ANSI_ESCAPE_RE.sub("", message) + "\n").encode(
+                "utf-8", errors="replace"
+            )
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "ab")  # noqa: SIM115 - kept open
+                self._size = self._file.tell()
+            if (
+                self.max_bytes
+                and self._size
+                and self._size + len(data) > self.max_bytes
+            ):
+                self._rotate()
+            self._file.write(data)
+            self._size += len(data)
+            self.lines_written += 1
+        except Exception:
+            pass
+
+    def _flush_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError:
+                pass
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = Path(f"{self.path}.{i}")
+                if source.exists():
+                    os.replace(source, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+            self._file = open(self.path, "ab")  # noqa: SIM115 - kept open
+        else:
+            self._file = open(self.path, "wb")  # noqa: SIM115 - kept open
+        self._size = 0
+        self.rotations += 1
+
+
+_sinks: dict[Path, DebugLogSink] = {}
+_sinks_lock = threading.Lock()
+_exiting = False
+
+
+def get_debug_sink(path: Path) -> DebugLogSink:
+    """Get the process-wide sink for a log file."""
+    key = Path(path).absolute()
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is None:
+            sink = DebugLogSink(key)
+            # Lines logged by later exit handlers are written inline
+            sink._closed = _exiting
+            _sinks[key] = sink
+        return sink
+
+
+def flush_debug_sinks() -> None:
+    """Block until every queued debug line is written."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+    for sink in sinks:
+        sink.flush()
+
+
+def close_debug_sinks() -> None:
+    """Write out and close every sink."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+        _sinks.clear()
+    for sink in sinks:
+        sink.close()
+
+
+def _close_at_exit() -> None:
+    global _exiting
+    _exiting = True
+    close_debug_sinks()
+
+
+atexit.register(_close_at_exit)
@@ -0,0 +1,302 @@
+"""
+Project Fingerprinting
+======================
+
+Cheap, precise answers to "did the project change?" shared by the security
+profile, project_index.json freshness checks and the client cache.
+
+Files tracked by git and unmodified in the working tree are identified by
+the object ID recorded in the index (``git ls-files -s``), which is stable
+across worktrees, fresh checkouts and touched-but-unchanged files. Only files
+that are untracked or modified in the working tree fall back to stat data
+(mtime, size). Outside a git repository every file falls back to stat data.
+
+Usage:
+    from core.fingerprint import ProjectFingerprinter
+
+    fingerprinter = ProjectFingerprinter(project_dir)
+    deps = fingerprinter.fingerprint(["package.json", "pyproject.toml"])
+    tree = fingerprinter.fingerprint_tree("apps/web")
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.git_executable import run_git
+
+# Bump when token or digest semantics change so stored fingerprints are stale
+FINGERPRINT_VERSION = 2
+
+# Directories that never contribute to a project fingerprint by default
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".auto-claude",
+        ".worktrees",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+    }
+)
+
+# Bound how long a fingerprint may block callers on huge or wedged repos
+_GIT_TIMEOUT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Digest over the identities of a set of files."""
+
+    digest: str
+    file_count: int
+    source: str  # "git" or "stat"
+
+    def to_dict(self) -> dict:
+        """Serialize for storage alongside the data it fingerprints."""
+        return {
+            "version": FINGERPRINT_VERSION,
+            "digest": self.digest,
+            "file_count": self.file_count,
+        }
+
+    def matches(self, stored: object) -> bool:
+        """Check whether a stored fingerprint dict describes the same inputs."""
+        return isinstance(stored, dict) and stored == self.to_dict()
+
+
+def stat_token(path: Path | str) -> str | None:
+    """
+    Identity token for a single file from stat data.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        "stat:<mtime_ns>:<size>", or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"stat:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class ProjectFingerprinter:
+    """
+    Point-in-time snapshot of file identities under a project root.
+
+    Git is queried lazily and at most once per instance (two subprocesses:
+    ``ls-files -s`` for tracked object IDs and ``ls-files -m -o`` for dirty
+    and untracked paths), so one instance can answer many fingerprint
+    questions about the same snapshot cheaply. Create a new instance to
+    observe later changes.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+        skip_hidden_dirs: bool = False,
+    ):
+        """
+        Initialize the fingerprinter.
+
+        Args:
+            root: Project root; all paths are relative to it
+            skip_dirs: Directory names excluded from tree fingerprints
+            skip_hidden_dirs: Also exclude directories whose name starts with "."
+        """
+        self.root = Path(root).resolve()
+        self.skip_dirs = frozenset(skip_dirs)
+        self.skip_hidden_dirs = skip_hidden_dirs
+        self._loaded = False
+        self._tracked: dict[str, str] = {}
+        self._dirty: set[str] = set()
+        self._git_paths: list[str] = []  # Sorted tracked + untracked paths
+        self._is_git = False
+
+    @property
+    def source(self) -> str:
+        """Where tracked-file identities come from: "git" or "stat"."""
+        self._load()
+        return "git" if self._is_git else "stat"
+
+    def token(self, rel_path: str) -> str | None:
+        """
+        Identity token for one file.
+
+        Args:
+            rel_path: POSIX-style path relative to the root
+
+        Returns:
+            Git object ID for clean tracked files, stat token otherwise,
+            or None if the file does not exist
+        """
+        self._load()
+        if rel_path in self._tracked and rel_path not in self._dirty:
+            return self._tracked[rel_path]
+        return stat_token(self.root / rel_path)
+
+    def fingerprint(self, rel_paths: Iterable[str]) -> Fingerprint:
+        """
+        Fingerprint an explicit set of files (missing files are skipped).
+
+        Args:
+            rel_paths: POSIX-style paths relative to the root
+
+        Returns:
+            Fingerprint over the files that exist
+        """
+        entries = []
+        for rel_path in sorted(set(rel_paths)):
+            token = self.token(rel_path)
+            if token is not None:
+                entries.append((rel_path, token))
+        return self._digest(entries)
+
+    def fingerprint_tree(
+        self,
+        subdir: str = "",
+        match: Callable[[str], bool] | None = None,
+    ) -> Fingerprint:
+        """
+        Fingerprint every non-skipped file under a subdirectory.
+
+        Args:
+            subdir: POSIX-style subdirectory relative to the root ("" for root)
+            match: Optional predicate on the relative path to narrow the set
+
+        Returns:
+            Fingerprint over the matching files
+        """
+        return self.fingerprint(self.list_files(subdir, match))
+
+    def list_files(
+        self,
+        subdir: str = "",
+        match: Callable[[str], bool] | None = None,
+    ) -> list[str]:
+        """
+        List non-skipped files under a subdirectory.
+
+        In a git repository this reads the listing git already produced
+        (tracked plus untracked-but-not-ignored files) instead of walking
+        the tree; otherwise it walks the tree, pruning skipped directories.
+
+        Args:
+            subdir: POSIX-style subdirectory relative to the root ("" for root)
+            match: Optional predicate on the relative path
+
+        Returns:
+            Sorted POSIX-style paths relative to the root
+        """
+        self._load()
+        prefix = f"{subdir.strip('/')}/" if subdir.strip("/") else ""
+
+        if self._is_git:
+            candidates: Iterable[str] = (
+                path
+                for path in self._iter_git_paths(prefix)
+                if not self._is_skipped(path[len(prefix) :])
+            )
+        else:
+            candidates = self._walk(prefix)
+
+        return sorted(path for path in candidates if match is None or match(path))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _is_skipped(self, rel_path: str) -> bool:
+        """Check whether any directory component of a path is skipped."""
+        for part in rel_path.split("/")[:-1]:
+            if part in self.skip_dirs:
+                return True
+            if self.skip_hidden_dirs and part.startswith("."):
+                return True
+        return False
+
+    def _iter_git_paths(self, prefix: str) -> Iterable[str]:
+        """Yield git-known paths under a prefix via binary search."""
+        paths = self._git_paths
+        index = bisect.bisect_left(paths, prefix)
+        while index < len(paths) and paths[index].startswith(prefix):
+            yield paths[index]
+            index += 1
+
+    def _walk(self, prefix: str) -> Iterable[str]:
+        """Yield file paths under root/prefix without git."""
+        start = self.root / prefix if prefix else self.root
+        for dirpath, dirs, files in os.walk(start):
+            dirs[:] = [
+                d
+                for d in dirs
+                if d not in self.skip_dirs
+                and not (self.skip_hidden_dirs and d.startswith("."))
+            ]
+            rel_dir = os.path.relpath(dirpath, self.root).replace(os.sep, "/")
+            for name in files:
+                yield name if rel_dir == "." else f"{rel_dir}/{name}"
+
+    def _load(self) -> None:
+        """Query git once for tracked object IDs and dirty paths."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.root.is_dir():
+            return
+
+        staged = run_git(
+            ["ls-files", "-s", "-z"], cwd=self.root, timeout=_GIT_TIMEOUT_SECONDS
+        )
+        if staged.returncode != 0:
+            return
+
+        dirty = run_git(
+            ["ls-files", "-z", "-m", "-o", "--exclude-standard"],
+            cwd=self.root,
+            timeout=_GIT_TIMEOUT_SECONDS,
+        )
+        if dirty.returncode != 0:
+            return
+
+        tracked: dict[str, str] = {}
+        for record in staged.stdout.split("\0"):
+            # "<mode> <object> <stage>\t<path>"
+            meta, sep, path = record.partition("\t")
+            if not sep:
+                continue
+            fields = meta.split()
+            if len(fields) == 3:
+                tracked[path] = f"git:{fields[1]}"
+
+        dirty_paths = {path for path in dirty.stdout.split("\0") if path}
+
+        # A directory git ignores entirely says nothing - fall back to stat data
+        if not tracked and not dirty_paths:
+            return
+
+        self._tracked = tracked
+        self._dirty = dirty_paths
+        self._git_paths = sorted(tracked.keys() | dirty_paths)
+        self._is_git = True
+
+    def _digest(self, entries: list[tuple[str, str]]) -> Fingerprint:
+        """Hash (path, token) pairs into a Fingerprint."""
+        hasher = hashlib.sha256()
+        for rel_path, token in entries:
+            hasher.update(f"{rel_path}\0{token}\n".encode())
+        return Fingerprint(
+            digest=hasher.hexdigest(),
+            file_count=len(entries),
+            source=self.source,
+        )
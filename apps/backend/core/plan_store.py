@@ -0,0 +1,266 @@
+"""
+Implementation Plan Store
+=========================
+
+Parsed, indexed view of implementation_plan.json shared by every reader in
+the process.
+
+The coder loop asks for the next subtask, the current phase, the progress
+counts and the status of the subtask it just ran - each of which used to
+re-open and json.load() the whole plan. PlanStore keeps one parsed model
+per plan file and only re-parses when the file's identity (mtime, size,
+inode) changes, so external writers such as the agent's own edits are still
+picked up. Updates made through update() write the file atomically and keep
+the cached model, so they never force a re-parse.
+
+Subtasks are indexed by id and by status.
+
+A file rewritten within the same mtime tick with the same size would keep
+its identity, so entries observed less than RACY_WINDOW_NS after their mtime
+are "racy" (as in git's racy-index handling): they are checked against the
+raw bytes on the next read and only trusted once they match.
+
+Usage:
+    from core.plan_store import get_plan_store
+
+    store = get_plan_store(spec_dir)
+    plan = store.load()  # Shared, read-only; None if there is no plan
+    subtask = store.get_subtask("subtask-1-1")  # Private copy
+    store.update(lambda plan: mark_done(plan))  # Atomic write-through
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import atomic_write
+
+PLAN_FILENAME = "implementation_plan.json"
+
+# Entries whose mtime is this close to when they were observed are re-checked
+# byte-for-byte (covers coarse mtime granularity, up to FAT's 2 seconds)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Errors load() raises for an unreadable or corrupt plan
+PLAN_READ_ERRORS = (OSError, json.JSONDecodeError, UnicodeDecodeError)
+
+_Identity = tuple[int, int, int]  # (mtime_ns, size, inode)
+
+
+def _identity(stat: os.stat_result) -> _Identity:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class PlanStore:
+    """
+    Cached implementation_plan.json for one spec directory.
+
+    The dict returned by load() is shared with every other caller and must
+    not be modified; change the plan through update(), or take a copy.
+    """
+
+    def __init__(self, plan_file: Path):
+        self.plan_file = Path(plan_file)
+        self._lock = threading.RLock()
+        self._identity: _Identity | None = None
+        self._observed_ns = 0
+        self._raw: bytes = b""
+        self._plan: dict | None = None
+        self._by_id: dict[str, tuple[dict, dict]] = {}  # id -> (phase, subtask)
+        self._by_status: dict[str, list[dict]] = {}
+        self.parses = 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def load(self) -> dict | None:
+        """
+        Get the parsed plan, re-parsing only if the file changed.
+
+        Returns:
+            The shared plan dict, or None if the file does not exist
+
+        Raises:
+            OSError, json.JSONDecodeError, UnicodeDecodeError: If the plan
+                can't be read or parsed
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.plan_file)
+            except FileNotFoundError:
+                self.invalidate()
+                return None
+            if self._plan is not None and _identity(stat) == self._identity:
+                if not self._is_racy() or self._raw_unchanged():
+                    return self._plan
+            return self._parse()
+
+    def get_subtask(self, subtask_id: str) -> dict | None:
+        """Get a copy of a subtask by id, or None if unknown or no plan."""
+        with self._lock:
+            if self.load() is None or subtask_id not in self._by_id:
+                return None
+            return copy.deepcopy(self._by_id[subtask_id][1])
+
+    def get_phase_for_subtask(self, subtask_id: str) -> dict | None:
+        """Get a copy of the phase containing a subtask."""
+        with self._lock:
+            if self.load() is None or subtask_id not in self._by_id:
+                return None
+            return copy.deepcopy(self._by_id[subtask_id][0])
+
+    def subtasks_with_status(self, status: str) -> list[dict]:
+        """Get the (shared, read-only) subtasks with a status, in plan order."""
+        with self._lock:
+            if self.load() is None:
+                return []
+            return list(self._by_status.get(status, []))
+
+    def status_counts(self) -> dict[str, int]:
+        """Count subtasks by status ("pending" if unset); empty if no plan."""
+        with self._lock:
+            if self.load() is None:
+                return {}
+            return {status: len(items) for status, items in self._by_status.items()}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def update(self, mutate: Callable[[dict[str, Any]], bool]) -> bool:
+        """
+        Modify the plan in place and write it through atomically.
+
+        Args:
+            mutate: Called with the current plan; changes it and returns
+                True, or returns False without changing anything
+
+        Returns:
+            What mutate returned (the file is only written on True)
+
+        Raises:
+            FileNotFoundError: If there is no plan
+            OSError, json.JSONDecodeError, UnicodeDecodeError: If the plan
+                can't be read, parsed or written
+        """
+        with self._lock:
+            plan = self.load()
+            if plan is None:
+                raise FileNotFoundError(self.plan_file)
+            try:
+                if not mutate(plan):
+                    return False
+                self._write(plan)
+            except BaseException:
+                # The model may be half-modified; re-read it next time
+                self.invalidate()
+                raise
+            return True
+
+    def save(self, plan: dict[str, Any]) -> None:
+        """Replace the plan with a new one (atomic write-through)."""
+        with self._lock:
+            try:
+                self._write(plan)
+            except BaseException:
+                self.invalidate()
+                raise
+
+    def invalidate(self) -> None:
+        """Forget the cached model; the next read re-parses the file."""
+        with self._lock:
+            self._identity = None
+            self._plan = None
+            self._raw = b""
+            self._by_id = {}
+            self._by_status = {}
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _is_racy(self) -> bool:
+        return self._observed_ns - self._identity[0] < RACY_WINDOW_NS
+
+    def _raw_unchanged(self) -> bool:
+        try:
+            with open(self.plan_file, "rb") as f:
+                raw = f.read()
+                identity = _identity(os.fstat(f.fileno()))
+        except OSError:
+            return False
+        if raw != self._raw or identity != self._identity:
+            return False
+        self._observed_ns = time.time_ns()
+        return True
+
+    def _parse(self) -> dict:
+        self.invalidate()
+        with open(self.plan_file, "rb") as f:
+            raw = f.read()
+            # fstat describes exactly the file that was read, even if it has
+            # been replaced since the stat() in load()
+            identity = _identity(os.fstat(f.fileno()))
+        plan = json.loads(raw.decode("utf-8"))
+        self.parses += 1
+        self._remember(plan, raw, identity)
+        return plan
+
+    def _write(self, plan: dict) -> None:
+        # Same serialization as write_json_atomic(plan_file, plan, indent=2)
+        raw = json.dumps(plan, indent=2, ensure_ascii=False).encode("utf-8")
+        with atomic_write(self.plan_file, "wb", encoding=None) as f:
+            f.write(raw)
+        self._remember(plan, raw, _identity(os.stat(self.plan_file)))
+
+    def _remember(self, plan: Any, raw: bytes, identity: _Identity) -> None:
+        if not isinstance(plan, dict):
+            # Valid JSON but not a plan: readers expect .get() to work
+            raise json.JSONDecodeError("Plan is not a JSON object", "", 0)
+        self._plan = plan
+        self._raw = raw
+        self._identity = identity
+        self._observed_ns = time.time_ns()
+        self._reindex()
+
+    def _reindex(self) -> None:
+        by_id: dict[str, tuple[dict, dict]] = {}
+        by_status: dict[str, list[dict]] = {}
+        for phase in self._plan.get("phases", []):
+            for subtask in phase.get("subtasks", []):
+                subtask_id = subtask.get("id")
+                if subtask_id is not None:
+                    by_id.setdefault(subtask_id, (phase, subtask))
+                status = subtask.get("status", "pending")
+                by_status.setdefault(status, []).append(subtask)
+        self._by_id = by_id
+        self._by_status = by_status
+
+
+_stores: dict[Path, PlanStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_plan_store(spec_dir: Path) -> PlanStore:
+    """Get the process-wide store for a spec directory's plan."""
+    plan_file = (Path(spec_dir) / PLAN_FILENAME).resolve()
+    with _stores_lock:
+        store = _stores.get(plan_file)
+        if store is None:
+            store = PlanStore(plan_file)
+            _stores[plan_file] = store
+        return store
+
+
+def clear_plan_stores() -> None:
+    """Drop every cached plan (for tests and long-lived processes)."""
+    with _stores_lock:
+        _stores.clear()
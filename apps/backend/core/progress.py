@@ -8,10 +8,11 @@ Uses subtask-based implementation plans (implementation_plan.json).
 Enhanced with colored output, icons, and better visual formatting.
 """
 
-import json
+import copy
 from pathlib import Path
 
 from core.plan_normalization import normalize_subtask_aliases
+from core.plan_store import PLAN_READ_ERRORS, get_plan_store
 from ui import (
     Icons,
     bold,
@@ -37,27 +38,11 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return 0, 0
-
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        counts = get_plan_store(spec_dir).status_counts()
+    except PLAN_READ_ERRORS:
         return 0, 0
+    return counts.get("completed", 0), sum(counts.values())
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -67,8 +52,6 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
     result = {
         "completed": 0,
         "in_progress": 0,
@@ -77,25 +60,19 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
         "total": 0,
     }
 
-    if not plan_file.exists():
-        return result
-
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        counts = get_plan_store(spec_dir).status_counts()
+    except PLAN_READ_ERRORS:
+        return result
 
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
+    for status, count in counts.items():
+        result["total"] += count
+        if status in result and status != "total":
+            result[status] += count
+        else:
+            result["pending"] += count
 
-        return result
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return result
+    return result
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -182,8 +159,7 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
 
         # Phase summary
         try:
-            with open(spec_dir / "implementation_plan.json", encoding="utf-8") as f:
-                plan = json.load(f)
+            plan = get_plan_store(spec_dir).load() or {}
 
             print("\nPhases:")
             for phase in plan.get("phases", []):
@@ -230,7 +206,7 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
                         f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                     )
 
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        except PLAN_READ_ERRORS:
             pass  # Ignore corrupted/unreadable progress files
     else:
         print()
@@ -287,9 +263,12 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    try:
+        plan = get_plan_store(spec_dir).load()
+    except PLAN_READ_ERRORS:
+        plan = None
 
-    if not plan_file.exists():
+    if plan is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -301,83 +280,63 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+    summary = {
+        "workflow_type": plan.get("workflow_type"),
+        "total_phases": len(plan.get("phases", [])),
+        "total_subtasks": 0,
+        "completed_subtasks": 0,
+        "pending_subtasks": 0,
+        "in_progress_subtasks": 0,
+        "failed_subtasks": 0,
+        "phases": [],
+    }
 
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
+    for phase in plan.get("phases", []):
+        phase_info = {
+            "id": phase.get("id"),
+            "phase": phase.get("phase"),
+            "name": phase.get("name"),
+            "depends_on": phase.get("depends_on", []),
+            "subtasks": [],
+            "completed": 0,
+            "total": 0,
         }
 
-        for phase in plan.get("phases", []):
-            phase_info = {
-                "id": phase.get("id"),
-                "phase": phase.get("phase"),
-                "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
-            }
-
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
-
-            summary["phases"].append(phase_info)
+        for subtask in phase.get("subtasks", []):
+            status = subtask.get("status", "pending")
+            summary["total_subtasks"] += 1
+            phase_info["total"] += 1
+
+            if status == "completed":
+                summary["completed_subtasks"] += 1
+                phase_info["completed"] += 1
+            elif status == "in_progress":
+                summary["in_progress_subtasks"] += 1
+            elif status == "failed":
+                summary["failed_subtasks"] += 1
+            else:
+                summary["pending_subtasks"] += 1
+
+            phase_info["subtasks"].append(
+                {
+                    "id": subtask.get("id"),
+                    "description": subtask.get("description"),
+                    "status": status,
+                    "service": subtask.get("service"),
+                }
+            )
 
-        return summary
+        summary["phases"].append(phase_info)
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return None
-
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = get_plan_store(spec_dir).load()
+        if plan is None:
+            return None
 
         for phase in plan.get("phases", []):
             subtasks = phase.get("subtasks", phase.get("chunks", []))
@@ -396,7 +355,7 @@ def get_current_phase(spec_dir: Path) -> dict | None:
 
         return None
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+    except PLAN_READ_ERRORS:
         return None
 
 
@@ -410,14 +369,10 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return None
-
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = get_plan_store(spec_dir).load()
+        if plan is None:
+            return None
 
         phases = plan.get("phases", [])
 
@@ -459,7 +414,9 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
             for subtask in phase.get("subtasks", phase.get("chunks", [])):
                 status = subtask.get("status", "pending")
                 if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
+                    subtask_out, _changed = normalize_subtask_aliases(
+                        copy.deepcopy(subtask)
+                    )
                     subtask_out["status"] = "pending"
                     return {
                         **subtask_out,
@@ -470,7 +427,7 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
 
         return None
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+    except PLAN_READ_ERRORS:
         return None
 
 
@@ -0,0 +1,507 @@
+"""
+SDK Session Recording and Replay
+================================
+
+Records the Claude Agent SDK message stream of real sessions to disk and
+plays recordings back through a client with the same interface, so agent
+sessions (and the coder/QA loop around them) can run offline in tests and
+benchmarks, and the framework's own per-message overhead can be profiled.
+
+Both modes are switched on by environment variables and apply to every
+client made by create_client() and create_simple_client():
+
+    AUTO_CLAUDE_RECORD_DIR=/path   Record each session to a JSON Lines file
+    AUTO_CLAUDE_REPLAY_DIR=/path   Replay recordings instead of calling the SDK
+    AUTO_CLAUDE_REPLAY_SPEED=N     Replay timing: 1 = original, N = N times
+                                   faster, 0 (default) = no delays
+
+A recording starts with a header line (agent type, model, start time)
+followed by one line per query() and per received message, each with the
+seconds elapsed since the session started. Messages are stored as their
+dataclass fields plus the class name.
+
+Replay hands out recordings in file name order (recordings are named by
+start time), separately for each agent type, so a replayed run makes the
+same sequence of planner, coder and QA sessions the recorded run did.
+Replayed AssistantMessages run the client's PreToolUse hooks (the bash
+security hook) for their tool calls, as the SDK would before executing
+the tool; the recorded tool results are then replayed as they were.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RECORD_DIR_ENV_VAR = "AUTO_CLAUDE_RECORD_DIR"
+REPLAY_DIR_ENV_VAR = "AUTO_CLAUDE_REPLAY_DIR"
+REPLAY_SPEED_ENV_VAR = "AUTO_CLAUDE_REPLAY_SPEED"
+
+RECORDING_FORMAT_VERSION = 1
+RECORDING_SUFFIX = ".jsonl"
+
+# Key holding the class name of an encoded SDK object
+TYPE_KEY = "__type__"
+
+
+class ReplayError(RuntimeError):
+    """A recording is missing, exhausted or unreadable."""
+
+
+# =============================================================================
+# Message encoding
+# =============================================================================
+
+
+def encode_message(value: Any) -> Any:
+    """
+    Convert an SDK message (or any part of one) to JSON-compatible data.
+
+    Dataclasses become dicts of their fields plus TYPE_KEY; lists, tuples
+    and dicts are converted recursively. Anything else that JSON can't
+    represent is stored as its str().
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        encoded = {TYPE_KEY: type(value).__name__}
+        for field in dataclasses.fields(value):
+            encoded[field.name] = encode_message(getattr(value, field.name))
+        return encoded
+    if isinstance(value, _ReplayedObject):
+        return {TYPE_KEY: type(value).__name__, **encode_message(vars(value))}
+    if isinstance(value, dict):
+        return {str(k): encode_message(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_message(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class _ReplayedObject:
+    """Base for stand-ins of SDK classes that can't be rebuilt directly."""
+
+    def __init__(self, **fields: Any):
+        self.__dict__.update(fields)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and vars(self) == vars(other)
+
+
+_replayed_classes: dict[str, type] = {}
+
+
+def _sdk_class(name: str) -> type | None:
+    """The SDK dataclass with this name, if the SDK is installed."""
+    try:
+        import claude_agent_sdk
+    except ImportError:
+        return None
+    cls = getattr(claude_agent_sdk, name, None)
+    if isinstance(cls, type) and dataclasses.is_dataclass(cls):
+        return cls
+    return None
+
+
+def decode_message(value: Any) -> Any:
+    """
+    Rebuild an SDK message from encode_message() output.
+
+    Uses the SDK's own class when it is installed and accepts the recorded
+    fields. Otherwise builds a stand-in with the same class name and
+    attributes, which is all the session code inspects (it dispatches on
+    type(msg).__name__).
+    """
+    if isinstance(value, list):
+        return [decode_message(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    fields = {k: decode_message(v) for k, v in value.items() if k != TYPE_KEY}
+    name = value.get(TYPE_KEY)
+    if name is None:
+        return fields
+
+    cls = _sdk_class(name)
+    if cls is not None:
+        try:
+            return cls(**fields)
+        except TypeError:
+            pass  # Recorded with another SDK version
+    if name not in _replayed_classes:
+        _replayed_classes[name] = type(name, (_ReplayedObject,), {})
+    return _replayed_classes[name](**fields)
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+_recording_counter = itertools.count(1)
+_recording_lock = threading.Lock()
+
+
+class SessionRecorder:
+    """Appends one session's queries and messages to a recording file."""
+
+    def __init__(self, path: Path, agent_type: str, model: str | None = None):
+        self.path = path
+        self._start = time.monotonic()
+        self._file = path.open("w", encoding="utf-8")
+        self._write(
+            {
+                "kind": "header",
+                "version": RECORDING_FORMAT_VERSION,
+                "agent_type": agent_type,
+                "model": model,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    @classmethod
+    def create(
+        cls, directory: Path, agent_type: str, model: str | None = None
+    ) -> SessionRecorder:
+        """Start a recording in `directory`, named so names sort by start time."""
+        directory.mkdir(parents=True, exist_ok=True)
+        with _recording_lock:
+            number = next(_recording_counter)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        name = f"{stamp}-{os.getpid()}-{number:04d}-{agent_type}{RECORDING_SUFFIX}"
+        return cls(directory / name, agent_type, model)
+
+    def _write(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def _elapsed(self) -> float:
+        return round(time.monotonic() - self._start, 6)
+
+    def record_query(self, prompt: Any) -> None:
+        self._write({"kind": "query", "t": self._elapsed(), "prompt": str(prompt)})
+
+    def record_message(self, message: Any) -> None:
+        self._write(
+            {
+                "kind": "message",
+                "t": self._elapsed(),
+                "message": encode_message(message),
+            }
+        )
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class RecordingClient:
+    """
+    Wraps an SDK client and records everything it sends and receives.
+
+    Behaves exactly like the wrapped client: unknown attributes are
+    forwarded to it.
+    """
+
+    def __init__(self, client: Any, recorder: SessionRecorder):
+        self._client = client
+        self.recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def __aenter__(self) -> RecordingClient:
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> Any:
+        try:
+            return await self._client.__aexit__(*exc_info)
+        finally:
+            self.recorder.close()
+
+    async def query(self, prompt: Any, *args: Any, **kwargs: Any) -> None:
+        self.recorder.record_query(prompt)
+        await self._client.query(prompt, *args, **kwargs)
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        async for message in self._client.receive_response():
+            self.recorder.record_message(message)
+            yield message
+
+    async def receive_messages(self) -> AsyncIterator[Any]:
+        async for message in self._client.receive_messages():
+            self.recorder.record_message(message)
+            yield message
+
+
+# =============================================================================
+# Replay
+# =============================================================================
+
+
+@dataclasses.dataclass
+class RecordedTurn:
+    """One query and the messages received for it."""
+
+    prompt: str
+    sent_at: float  # Seconds since the session started
+    messages: list[tuple[float, Any]]  # (seconds since start, encoded message)
+
+
+@dataclasses.dataclass
+class SessionRecording:
+    """A loaded recording: its header and the messages after each query."""
+
+    path: Path
+    agent_type: str
+    model: str | None
+    turns: list[RecordedTurn]
+
+    @classmethod
+    def load(cls, path: Path) -> SessionRecording:
+        """
+        Read a recording file.
+
+        Raises:
+            ReplayError: If the file is not a recording
+        """
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+            entries = [json.loads(line) for line in lines if line.strip()]
+        except (OSError, json.JSONDecodeError) as e:
+            raise ReplayError(f"Cannot read recording {path}: {e}")
+        if not entries or entries[0].get("kind") != "header":
+            raise ReplayError(f"{path} is not a session recording")
+        header = entries[0]
+        if header.get("version") != RECORDING_FORMAT_VERSION:
+            raise ReplayError(
+                f"{path} has recording format {header.get('version')}, "
+                f"expected {RECORDING_FORMAT_VERSION}"
+            )
+
+        turns: list[RecordedTurn] = []
+        for entry in entries[1:]:
+            elapsed = float(entry.get("t", 0.0))
+            if entry.get("kind") == "query":
+                turns.append(RecordedTurn(entry.get("prompt", ""), elapsed, []))
+            elif entry.get("kind") == "message":
+                if not turns:
+                    turns.append(RecordedTurn("", 0.0, []))
+                turns[-1].messages.append((elapsed, entry["message"]))
+        return cls(path, header.get("agent_type", ""), header.get("model"), turns)
+
+
+def _hook_matches(matcher: str | None, tool_name: str) -> bool:
+    if not matcher or matcher == "*":
+        return True
+    if not isinstance(matcher, str):
+        return False
+    try:
+        return re.fullmatch(matcher, tool_name) is not None
+    except re.error:
+        return matcher == tool_name
+
+
+class ReplayClient:
+    """
+    Plays a SessionRecording back through the ClaudeSDKClient interface.
+
+    Each query() moves on to the recording's next turn; receive_response()
+    and receive_messages() yield that turn's messages, waiting between
+    them for the recorded gaps divided by `speed` (no waiting when speed
+    is 0). Tool calls in replayed AssistantMessages are passed through the
+    PreToolUse hooks, as the SDK would.
+
+    Attributes:
+        stats: Counts of replayed queries, messages, hook calls and blocks
+    """
+
+    def __init__(
+        self,
+        recording: SessionRecording,
+        speed: float = 0.0,
+        hooks: dict | None = None,
+        cwd: str | None = None,
+    ):
+        self.recording = recording
+        self.speed = speed
+        self.cwd = cwd
+        self._pre_tool_use = list((hooks or {}).get("PreToolUse", []))
+        self._turn = -1
+        self.stats = {"queries": 0, "messages": 0, "hook_calls": 0, "hook_blocks": 0}
+
+    async def __aenter__(self) -> ReplayClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+    async def connect(self, prompt: Any = None) -> None:
+        if prompt is not None:
+            await self.query(prompt)
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def interrupt(self) -> None:
+        pass
+
+    async def query(self, prompt: Any, *args: Any, **kwargs: Any) -> None:
+        self._turn += 1
+        self.stats["queries"] += 1
+        if self._turn >= len(self.recording.turns):
+            raise ReplayError(
+                f"{self.recording.path.name} has {len(self.recording.turns)} "
+                f"queries, session sent more"
+            )
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        if not 0 <= self._turn < len(self.recording.turns):
+            return
+        turn = self.recording.turns[self._turn]
+        previous = turn.sent_at
+        for elapsed, encoded in turn.messages:
+            if self.speed > 0 and elapsed > previous:
+                await asyncio.sleep((elapsed - previous) / self.speed)
+            previous = elapsed
+            message = decode_message(encoded)
+            if type(message).__name__ == "AssistantMessage":
+                await self._run_pre_tool_hooks(message)
+            self.stats["messages"] += 1
+            yield message
+
+    async def receive_messages(self) -> AsyncIterator[Any]:
+        async for message in self.receive_response():
+            yield message
+
+    async def _run_pre_tool_hooks(self, message: Any) -> None:
+        for block in getattr(message, "content", None) or []:
+            if type(block).__name__ != "ToolUseBlock":
+                continue
+            tool_name = getattr(block, "name", "")
+            input_data = {
+                "hook_event_name": "PreToolUse",
+                "tool_name": tool_name,
+                "tool_input": getattr(block, "input", None),
+                "cwd": self.cwd,
+            }
+            for matcher in self._pre_tool_use:
+                if not _hook_matches(getattr(matcher, "matcher", None), tool_name):
+                    continue
+                for hook in getattr(matcher, "hooks", None) or []:
+                    self.stats["hook_calls"] += 1
+                    result = await hook(input_data, getattr(block, "id", None), None)
+                    if isinstance(result, dict) and result.get("decision") == "block":
+                        self.stats["hook_blocks"] += 1
+
+
+class ReplaySource:
+    """Hands out the recordings in a directory, in order, per agent type."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._pending: dict[str, list[Path]] = {}
+        for path in sorted(directory.glob(f"*{RECORDING_SUFFIX}")):
+            agent_type = SessionRecording.load(path).agent_type
+            self._pending.setdefault(agent_type, []).append(path)
+
+    def next_recording(self, agent_type: str) -> SessionRecording:
+        """
+        The next unused recording of an agent type.
+
+        Raises:
+            ReplayError: If none is left
+        """
+        with self._lock:
+            pending = self._pending.get(agent_type)
+            if not pending:
+                raise ReplayError(
+                    f"No recorded {agent_type!r} session left in {self.directory}"
+                )
+            path = pending.pop(0)
+        return SessionRecording.load(path)
+
+    def remaining(self) -> dict[str, int]:
+        with self._lock:
+            return {k: len(v) for k, v in self._pending.items() if v}
+
+
+# Replay sources by directory, shared by every client made in this process
+_replay_sources: dict[Path, ReplaySource] = {}
+_replay_lock = threading.Lock()
+
+
+def get_replay_source() -> ReplaySource | None:
+    """The ReplaySource for AUTO_CLAUDE_REPLAY_DIR, or None when not replaying."""
+    value = os.environ.get(REPLAY_DIR_ENV_VAR)
+    if not value:
+        return None
+    directory = Path(value).resolve()
+    with _replay_lock:
+        if directory not in _replay_sources:
+            if not directory.is_dir():
+                raise ReplayError(f"Replay directory {directory} does not exist")
+            _replay_sources[directory] = ReplaySource(directory)
+        return _replay_sources[directory]
+
+
+def reset_replay_sources() -> None:
+    """Forget handed-out recordings so the next client starts over."""
+    with _replay_lock:
+        _replay_sources.clear()
+
+
+def get_replay_speed() -> float:
+    """AUTO_CLAUDE_REPLAY_SPEED as a float (0, no delays, if unset or invalid)."""
+    try:
+        return max(0.0, float(os.environ.get(REPLAY_SPEED_ENV_VAR, "0")))
+    except ValueError:
+        logger.warning(f"Invalid {REPLAY_SPEED_ENV_VAR}, replaying without delays")
+        return 0.0
+
+
+def is_replaying() -> bool:
+    return bool(os.environ.get(REPLAY_DIR_ENV_VAR))
+
+
+def create_replay_client(
+    agent_type: str, hooks: dict | None = None, cwd: str | None = None
+) -> ReplayClient:
+    """
+    A ReplayClient for the next recorded session of this agent type.
+
+    Raises:
+        ReplayError: If replay is not enabled or no recording is left
+    """
+    source = get_replay_source()
+    if source is None:
+        raise ReplayError(f"{REPLAY_DIR_ENV_VAR} is not set")
+    return ReplayClient(
+        source.next_recording(agent_type), get_replay_speed(), hooks, cwd
+    )
+
+
+def maybe_record(client: Any, agent_type: str, model: str | None = None) -> Any:
+    """Wrap a new SDK client in a RecordingClient if AUTO_CLAUDE_RECORD_DIR is set."""
+    directory = os.environ.get(RECORD_DIR_ENV_VAR)
+    if not directory:
+        return client
+    return RecordingClient(
+        client, SessionRecorder.create(Path(directory), agent_type, model)
+    )
@@ -32,6 +32,7 @@ from core.auth import (
     validate_token_not_encrypted,
 )
 from core.platform import validate_cli_path
+from core.session_replay import create_replay_client, is_replaying, maybe_record
 from phase_config import get_thinking_budget
 
 logger = logging.getLogger(__name__)
@@ -72,17 +73,20 @@ def create_simple_client(
     Raises:
         ValueError: If agent_type is not found in AGENT_CONFIGS
     """
-    # Get authentication
-    oauth_token = require_auth_token()
+    import os
 
-    # Validate token is not encrypted before passing to SDK
-    # Encrypted tokens (enc:...) should have been decrypted by require_auth_token()
-    # If we still have an encrypted token here, it means decryption failed or was skipped
-    validate_token_not_encrypted(oauth_token)
+    # Replayed sessions (see core.session_replay) need no credentials
+    replaying = is_replaying()
+    if not replaying:
+        # Get authentication
+        oauth_token = require_auth_token()
 
-    import os
+        # Validate token is not encrypted before passing to SDK
+        # Encrypted tokens (enc:...) should have been decrypted by require_auth_token()
+        # If we still have an encrypted token here, it means decryption failed or was skipped
+        validate_token_not_encrypted(oauth_token)
 
-    os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = oauth_token
+        os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = oauth_token
 
     # Get environment variables for SDK
     sdk_env = get_sdk_env_vars()
@@ -119,4 +123,8 @@ def create_simple_client(
         options_kwargs["cli_path"] = env_cli_path
         logger.info(f"Using CLAUDE_CLI_PATH override: {env_cli_path}")
 
-    return ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs))
+    if replaying:
+        return create_replay_client(agent_type, cwd=options_kwargs["cwd"])
+    return maybe_record(
+        ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs)), agent_type, model
+    )
@@ -0,0 +1,746 @@
+"""
+Session Telemetry
+=================
+
+Lightweight tracing for agent sessions: where did a slow session spend its
+time - waiting on the model, in a slow tool, evaluating security hooks or in
+post-session processing?
+
+Spans are recorded for each agent session, each model turn (prompt or tool
+result sent until the next assistant message arrives), each tool call (tool
+use until its result), each hook evaluation and each post-session step.
+Sessions carry the token usage reported in the SDK's ResultMessage.
+
+Finished traces are appended to the spec's traces.jsonl in the OpenTelemetry
+protocol's JSON encoding (one ExportTraceServiceRequest per line, as the
+OpenTelemetry Collector's file exporter writes them), followed at the end of
+each session by a metrics line holding per-tool latency histograms and token
+counts. The file can be fed to any OTLP/JSON consumer; `run.py --spec 001
+--trace-summary` prints latency percentiles by tool and phase from it.
+
+    AUTO_CLAUDE_TELEMETRY=0   Don't write trace files
+
+Spans are buffered per trace and written when the trace's root span ends,
+so tracing adds no file I/O to the message loop itself.
+
+Usage:
+    from core.telemetry import SpanKind, get_tracer
+
+    tracer = get_tracer(spec_dir)
+    with tracer.span("load_plan", SpanKind.POST_SESSION):
+        ...
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_ENV_VAR = "AUTO_CLAUDE_TELEMETRY"
+TRACE_FILENAME = "traces.jsonl"
+
+SERVICE_NAME = "auto-claude"
+SCOPE_NAME = "auto_claude.telemetry"
+SCOPE_VERSION = "1"
+
+# Span attribute keys (gen_ai.* follow the OpenTelemetry GenAI conventions)
+KIND_ATTR = "auto_claude.span_kind"
+PHASE_ATTR = "auto_claude.phase"
+TOOL_NAME_ATTR = "gen_ai.tool.name"
+TOOL_CALL_ID_ATTR = "gen_ai.tool.call.id"
+MODEL_ATTR = "gen_ai.response.model"
+INPUT_TOKENS_ATTR = "gen_ai.usage.input_tokens"
+OUTPUT_TOKENS_ATTR = "gen_ai.usage.output_tokens"
+CACHE_READ_TOKENS_ATTR = "auto_claude.usage.cache_read_input_tokens"
+CACHE_CREATION_TOKENS_ATTR = "auto_claude.usage.cache_creation_input_tokens"
+COST_ATTR = "auto_claude.usage.cost_usd"
+CWD_ATTR = "auto_claude.cwd"
+
+# SDK usage keys -> span attributes
+USAGE_ATTRS = {
+    "input_tokens": INPUT_TOKENS_ATTR,
+    "output_tokens": OUTPUT_TOKENS_ATTR,
+    "cache_read_input_tokens": CACHE_READ_TOKENS_ATTR,
+    "cache_creation_input_tokens": CACHE_CREATION_TOKENS_ATTR,
+}
+
+# Upper bounds (ms) of the tool latency histogram buckets
+LATENCY_BUCKETS_MS = (
+    5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000, 60_000,
+    120_000, 300_000,
+)  # fmt: skip
+
+# A trace with more finished spans than this is written out early
+MAX_BUFFERED_SPANS = 512
+
+# OTLP enum values
+_SPAN_KIND_INTERNAL = 1
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+_AGGREGATION_DELTA = 1
+
+
+class SpanKind:
+    """Values of the KIND_ATTR attribute, which group spans in summaries."""
+
+    SESSION = "session"
+    MODEL = "model"
+    TOOL = "tool"
+    HOOK = "hook"
+    POST_SESSION = "post_session"
+
+
+def is_telemetry_enabled() -> bool:
+    """Whether trace files are written (AUTO_CLAUDE_TELEMETRY is not off)."""
+    value = os.environ.get(TELEMETRY_ENV_VAR, "").strip().lower()
+    return value not in ("0", "false", "no", "off")
+
+
+# =============================================================================
+# Spans
+# =============================================================================
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "auto_claude_current_span", default=None
+)
+
+# Root spans that were activated and haven't ended, oldest first
+_active_roots: list[Span] = []
+# Open tool spans by tool use id, so hooks can find the call they belong to
+_tool_spans: dict[str, Span] = {}
+_spans_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """One timed operation; create through Tracer.start_span()/span()."""
+
+    tracer: Tracer
+    name: str
+    trace_id: str
+    span_id: str
+    parent: Span | None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_unix_ns: int = field(default_factory=time.time_ns)
+    _start_ns: int = field(default_factory=time.perf_counter_ns, repr=False)
+    duration_ns: int | None = None
+    error: str | None = None
+    _token: contextvars.Token | None = field(default=None, repr=False)
+    _tool_use_id: str | None = field(default=None, repr=False)
+
+    @property
+    def ended(self) -> bool:
+        return self.duration_ns is not None
+
+    @property
+    def duration_ms(self) -> float | None:
+        return None if self.duration_ns is None else self.duration_ns / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def end(self, error: str | None = None) -> None:
+        """End the span (later calls are ignored) and hand it to its tracer."""
+        if self.ended:
+            return
+        self.duration_ns = time.perf_counter_ns() - self._start_ns
+        if error is not None:
+            self.error = error
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Ended from another context; that context keeps its own value
+                pass
+            self._token = None
+        with _spans_lock:
+            if self.parent is None and self in _active_roots:
+                _active_roots.remove(self)
+            if self._tool_use_id is not None:
+                _tool_spans.pop(self._tool_use_id, None)
+        self.tracer._finish(self)
+
+    def to_otlp(self) -> dict[str, Any]:
+        """The span in OTLP/JSON encoding."""
+        encoded = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_unix_ns),
+            "endTimeUnixNano": str(self.start_unix_ns + (self.duration_ns or 0)),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": (
+                {"code": _STATUS_ERROR, "message": self.error}
+                if self.error is not None
+                else {"code": _STATUS_OK}
+            ),
+        }
+        if self.parent is not None:
+            encoded["parentSpanId"] = self.parent.span_id
+        return encoded
+
+
+def current_span(cwd: str | Path | None = None) -> Span | None:
+    """
+    The innermost span activated in the current context.
+
+    Code the SDK runs in its own tasks (hook callbacks) doesn't see the
+    session's context, so it falls back to the running root span started
+    for the given working directory, or to the only running root span.
+    Several sessions can run in one process (parallel subtasks), so with
+    more than one root span and no cwd match there is no current span.
+
+    Args:
+        cwd: Working directory of the caller, e.g. the hook input's cwd
+
+    Returns:
+        The span, or None
+    """
+    span = _current_span.get()
+    if span is not None:
+        return span
+    key = _cwd_key(cwd)
+    with _spans_lock:
+        if key is not None:
+            for root in reversed(_active_roots):
+                if root.attributes.get(CWD_ATTR) == key:
+                    return root
+        return _active_roots[0] if len(_active_roots) == 1 else None
+
+
+def _cwd_key(cwd: str | Path | None) -> str | None:
+    """A working directory in the form recorded in CWD_ATTR."""
+    if not cwd or not isinstance(cwd, (str, Path)):
+        return None
+    try:
+        return str(Path(cwd).resolve())
+    except (OSError, RuntimeError):
+        return str(cwd)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
+
+def _from_otlp_value(value: dict[str, Any]) -> Any:
+    if "intValue" in value:
+        return int(value["intValue"])
+    for key in ("stringValue", "boolValue", "doubleValue"):
+        if key in value:
+            return value[key]
+    return None
+
+
+# =============================================================================
+# Tracer
+# =============================================================================
+
+
+class Tracer:
+    """Records spans and appends finished traces to one trace file."""
+
+    def __init__(self, path: Path, resource: dict[str, Any] | None = None):
+        self.path = Path(path)
+        self.resource = {"service.name": SERVICE_NAME, **(resource or {})}
+        self._buffers: dict[str, list[Span]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def start_span(
+        self,
+        name: str,
+        kind: str,
+        attributes: dict[str, Any] | None = None,
+        parent: Span | None = None,
+        activate: bool = False,
+        tool_use_id: str | None = None,
+        cwd: str | Path | None = None,
+    ) -> Span:
+        """
+        Start a span; end it with Span.end().
+
+        Args:
+            name: Span name
+            kind: One of the SpanKind values
+            attributes: Initial attributes (None values are dropped)
+            parent: Parent span (default: the span activated in this
+                context, if it is one of this tracer's)
+            activate: Make this the current span until it ends, so spans
+                started meanwhile in this context become its children
+            tool_use_id: For tool spans, the SDK's tool use id; hooks for
+                that call become children of this span
+            cwd: For session spans, the agent's working directory; hooks
+                whose input carries that cwd become children of this span
+
+        Returns:
+            The running span
+        """
+        if parent is None:
+            parent = _current_span.get()
+            if parent is not None and parent.tracer is not self:
+                parent = None
+        span = Span(
+            tracer=self,
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent=parent,
+        )
+        span.attributes[KIND_ATTR] = kind
+        if parent is not None and PHASE_ATTR in parent.attributes:
+            span.attributes[PHASE_ATTR] = parent.attributes[PHASE_ATTR]
+        for key, value in (attributes or {}).items():
+            span.set_attribute(key, value)
+        span.set_attribute(CWD_ATTR, _cwd_key(cwd))
+        if activate:
+            span._token = _current_span.set(span)
+        with _spans_lock:
+            if activate and parent is None:
+                _active_roots.append(span)
+            if tool_use_id is not None:
+                span._tool_use_id = tool_use_id
+                _tool_spans[tool_use_id] = span
+        return span
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: str,
+        attributes: dict[str, Any] | None = None,
+        parent: Span | None = None,
+    ) -> Iterator[Span]:
+        """Run a block inside an activated span; exceptions mark it failed."""
+        span = self.start_span(name, kind, attributes, parent, activate=True)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(error=f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            span.end()
+
+    async def run(
+        self,
+        awaitable: Awaitable[Any],
+        name: str,
+        kind: str,
+        attributes: dict[str, Any] | None = None,
+    ) -> Any:
+        """Await inside an activated span; returns the awaitable's result."""
+        with self.span(name, kind, attributes):
+            return await awaitable
+
+    def flush(self) -> None:
+        """Write every buffered span, including those of unfinished traces."""
+        with self._lock:
+            spans = [span for buffer in self._buffers.values() for span in buffer]
+            self._buffers.clear()
+        self._write(spans)
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            buffer = self._buffers[span.trace_id]
+            buffer.append(span)
+            if span.parent is not None and len(buffer) < MAX_BUFFERED_SPANS:
+                return
+            del self._buffers[span.trace_id]
+        metrics = self._session_metrics(span, buffer) if span.parent is None else None
+        self._write(buffer, metrics)
+
+    def _session_metrics(self, root: Span, spans: list[Span]) -> list[dict] | None:
+        """Tool latency histograms and token counts of a finished session."""
+        if root.attributes.get(KIND_ATTR) != SpanKind.SESSION:
+            return None
+        start = str(root.start_unix_ns)
+        end = str(root.start_unix_ns + root.duration_ns)
+        phase = root.attributes.get(PHASE_ATTR)
+
+        durations: dict[str, list[float]] = defaultdict(list)
+        for span in spans:
+            if span.attributes.get(KIND_ATTR) == SpanKind.TOOL:
+                tool = span.attributes.get(TOOL_NAME_ATTR, span.name)
+                durations[tool].append(span.duration_ms)
+
+        histogram_points = []
+        for tool, values in sorted(durations.items()):
+            counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            for value in values:
+                counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value)] += 1
+            histogram_points.append(
+                {
+                    "attributes": _otlp_attributes(
+                        {TOOL_NAME_ATTR: tool, PHASE_ATTR: phase}
+                    ),
+                    "startTimeUnixNano": start,
+                    "timeUnixNano": end,
+                    "count": str(len(values)),
+                    "sum": sum(values),
+                    "min": min(values),
+                    "max": max(values),
+                    "bucketCounts": [str(c) for c in counts],
+                    "explicitBounds": [float(b) for b in LATENCY_BUCKETS_MS],
+                }
+            )
+
+        token_points = [
+            {
+                "attributes": _otlp_attributes(
+                    {"gen_ai.token.type": usage_key, PHASE_ATTR: phase}
+                ),
+                "startTimeUnixNano": start,
+                "timeUnixNano": end,
+                "asInt": str(root.attributes[attr]),
+            }
+            for usage_key, attr in USAGE_ATTRS.items()
+            if isinstance(root.attributes.get(attr), int)
+        ]
+
+        metrics = []
+        if histogram_points:
+            metrics.append(
+                {
+                    "name": "auto_claude.tool.duration",
+                    "unit": "ms",
+                    "histogram": {
+                        "aggregationTemporality": _AGGREGATION_DELTA,
+                        "dataPoints": histogram_points,
+                    },
+                }
+            )
+        if token_points:
+            metrics.append(
+                {
+                    "name": "auto_claude.session.tokens",
+                    "unit": "{token}",
+                    "sum": {
+                        "aggregationTemporality": _AGGREGATION_DELTA,
+                        "isMonotonic": True,
+                        "dataPoints": token_points,
+                    },
+                }
+            )
+        return metrics or None
+
+    def _write(self, spans: list[Span], metrics: list[dict] | None = None) -> None:
+        if not spans or not is_telemetry_enabled():
+            return
+        resource = {"attributes": _otlp_attributes(self.resource)}
+        scope = {"name": SCOPE_NAME, "version": SCOPE_VERSION}
+        lines = [
+            {
+                "resourceSpans": [
+                    {
+                        "resource": resource,
+                        "scopeSpans": [
+                            {
+                                "scope": scope,
+                                "spans": [span.to_otlp() for span in spans],
+                            }
+                        ],
+                    }
+                ]
+            }
+        ]
+        if metrics:
+            lines.append(
+                {
+                    "resourceMetrics": [
+                        {
+                            "resource": resource,
+                            "scopeMetrics": [{"scope": scope, "metrics": metrics}],
+                        }
+                    ]
+                }
+            )
+        data = "".join(json.dumps(line, separators=(",", ":")) + "\n" for line in lines)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # One write per trace in append mode, so concurrent writers
+            # don't interleave lines
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+        except OSError as e:
+            logger.debug(f"Could not write trace file {self.path}: {e}")
+
+
+_tracers: dict[Path, Tracer] = {}
+_tracers_lock = threading.Lock()
+
+
+def get_tracer(spec_dir: Path) -> Tracer:
+    """Get the process-wide tracer writing a spec directory's trace file."""
+    path = (Path(spec_dir) / TRACE_FILENAME).resolve()
+    with _tracers_lock:
+        tracer = _tracers.get(path)
+        if tracer is None:
+            tracer = Tracer(path, {"auto_claude.spec": Path(spec_dir).name})
+            _tracers[path] = tracer
+        return tracer
+
+
+def reset_tracers() -> None:
+    """Flush and drop every tracer and forget running spans (for tests)."""
+    with _tracers_lock:
+        tracers = list(_tracers.values())
+        _tracers.clear()
+    for tracer in tracers:
+        tracer.flush()
+    with _spans_lock:
+        _active_roots.clear()
+        _tool_spans.clear()
+    _current_span.set(None)
+
+
+# =============================================================================
+# Instrumentation helpers
+# =============================================================================
+
+
+def record_usage(span: Span, result_message: Any) -> None:
+    """Copy token usage and cost from an SDK ResultMessage onto a span."""
+    usage = getattr(result_message, "usage", None)
+    if isinstance(usage, dict):
+        for key, attr in USAGE_ATTRS.items():
+            value = usage.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                span.attributes[attr] = span.attributes.get(attr, 0) + value
+    cost = getattr(result_message, "total_cost_usd", None)
+    if isinstance(cost, (int, float)) and not isinstance(cost, bool):
+        span.attributes[COST_ATTR] = span.attributes.get(COST_ATTR, 0.0) + cost
+
+
+def traced_hook(hook: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    """
+    Wrap an SDK hook callback so each evaluation is recorded as a hook span.
+
+    The span is a child of the tool call it checks if that call's span is
+    already open (the SDK usually runs PreToolUse hooks before the tool use
+    reaches the session's message loop), otherwise of the current span for
+    the hook input's cwd, and carries the tool use id either way. With
+    neither span (no session is being traced, or several are and none runs
+    in that cwd) the hook just runs.
+    """
+    hook_name = getattr(hook, "__name__", "hook")
+
+    @functools.wraps(hook)
+    async def wrapper(
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        with _spans_lock:
+            parent = _tool_spans.get(tool_use_id) if tool_use_id else None
+        parent = parent or current_span(input_data.get("cwd"))
+        if parent is None:
+            return await hook(input_data, tool_use_id, context)
+
+        attributes = {
+            TOOL_NAME_ATTR: input_data.get("tool_name"),
+            TOOL_CALL_ID_ATTR: tool_use_id,
+        }
+        with parent.tracer.span(
+            f"hook {hook_name}", SpanKind.HOOK, attributes, parent=parent
+        ) as span:
+            result = await hook(input_data, tool_use_id, context)
+            if isinstance(result, dict) and result.get("decision"):
+                span.set_attribute("auto_claude.hook.decision", result["decision"])
+            return result
+
+    return wrapper
+
+
+def traced_post_session(func: Callable[..., Awaitable[Any]]):
+    """
+    Record an async post-session function taking spec_dir first as a root span.
+
+    Spans of the steps it runs under Tracer.span() become its children.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(spec_dir: Path, *args, **kwargs):
+        with get_tracer(spec_dir).span(name, SpanKind.POST_SESSION):
+            return await func(spec_dir, *args, **kwargs)
+
+    return wrapper
+
+
+# =============================================================================
+# Reading and summarizing trace files
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """A span read back from a trace file."""
+
+    name: str
+    trace_id: str
+    duration_ms: float
+    attributes: dict[str, Any]
+    error: str | None = None
+
+    @property
+    def kind(self) -> str | None:
+        return self.attributes.get(KIND_ATTR)
+
+    @property
+    def phase(self) -> str | None:
+        return self.attributes.get(PHASE_ATTR)
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Latency percentiles of one group of spans."""
+
+    kind: str
+    name: str
+    phase: str | None
+    count: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    total_ms: float
+
+
+def load_spans(path: Path) -> list[SpanRecord]:
+    """
+    Read every span from an OTLP/JSON trace file.
+
+    Metrics lines and lines that don't parse (e.g. a write cut short by a
+    crash) are skipped. A missing file has no spans.
+    """
+    records = []
+    try:
+        f = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return records
+    with f:
+        for line in f:
+            try:
+                request = json.loads(line)
+                for resource_spans in request.get("resourceSpans", []):
+                    for scope_spans in resource_spans.get("scopeSpans", []):
+                        records.extend(map(_span_record, scope_spans["spans"]))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                logger.debug(f"Skipping unreadable line in {path}")
+    return records
+
+
+def _span_record(span: dict[str, Any]) -> SpanRecord:
+    status = span.get("status", {})
+    return SpanRecord(
+        name=span["name"],
+        trace_id=span["traceId"],
+        duration_ms=(int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"]))
+        / 1e6,
+        attributes={
+            a["key"]: _from_otlp_value(a["value"]) for a in span.get("attributes", [])
+        },
+        error=status.get("message", "")
+        if status.get("code") == _STATUS_ERROR
+        else None,
+    )
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an already sorted, non-empty list."""
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        position - lower
+    )
+
+
+def _group_name(record: SpanRecord) -> str:
+    if record.kind == SpanKind.TOOL:
+        return record.attributes.get(TOOL_NAME_ATTR, record.name)
+    if record.kind == SpanKind.HOOK:
+        hook = record.name.removeprefix("hook ")
+        tool = record.attributes.get(TOOL_NAME_ATTR)
+        return f"{hook} ({tool})" if tool else hook
+    return record.name
+
+
+def summarize_latencies(records: list[SpanRecord]) -> list[LatencySummary]:
+    """Latency percentiles grouped by span kind, name (tool) and phase."""
+    groups: dict[tuple[str, str, str | None], list[SpanRecord]] = defaultdict(list)
+    for record in records:
+        groups[(record.kind or "other", _group_name(record), record.phase)].append(
+            record
+        )
+
+    kind_order = [
+        SpanKind.SESSION,
+        SpanKind.MODEL,
+        SpanKind.TOOL,
+        SpanKind.HOOK,
+        SpanKind.POST_SESSION,
+    ]
+    summaries = []
+    for (kind, name, phase), group in groups.items():
+        durations = sorted(record.duration_ms for record in group)
+        summaries.append(
+            LatencySummary(
+                kind=kind,
+                name=name,
+                phase=phase,
+                count=len(durations),
+                errors=sum(1 for record in group if record.error is not None),
+                p50_ms=percentile(durations, 0.50),
+                p95_ms=percentile(durations, 0.95),
+                p99_ms=percentile(durations, 0.99),
+                total_ms=sum(durations),
+            )
+        )
+    summaries.sort(
+        key=lambda s: (
+            kind_order.index(s.kind) if s.kind in kind_order else len(kind_order),
+            s.phase or "",
+            -s.total_ms,
+        )
+    )
+    return summaries
+
+
+def summarize_tokens(records: list[SpanRecord]) -> dict[str, dict[str, int | float]]:
+    """Token usage and cost of the recorded sessions, totalled per phase."""
+    totals: dict[str, dict[str, int | float]] = {}
+    for record in records:
+        if record.kind != SpanKind.SESSION:
+            continue
+        phase_totals = totals.setdefault(record.phase or "-", {"sessions": 0})
+        phase_totals["sessions"] += 1
+        for attr in (*USAGE_ATTRS.values(), COST_ATTR):
+            if attr in record.attributes:
+                phase_totals[attr] = phase_totals.get(attr, 0) + record.attributes[attr]
+    return totals
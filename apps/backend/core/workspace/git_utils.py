@@ -407,107 +407,109 @@ def is_lock_file(file_path: str) -> bool:
     return Path(file_path).name in LOCK_FILES
 
 
-def validate_merged_syntax(
+_JS_EXTENSIONS = {".ts", ".tsx", ".js", ".jsx"}
+
+
+def _validate_js_with_esbuild_cli(
     file_path: str, content: str, project_dir: Path
 ) -> tuple[bool, str]:
     """
-    Validate the syntax of merged code.
-
-    Returns (is_valid, error_message).
+    Validate one TypeScript/JavaScript file with the esbuild CLI.
 
-    Uses esbuild for TypeScript/JavaScript validation as it:
-    - Is much faster than tsc (no npm setup overhead)
-    - Has accurate JSX/TSX parsing (matches Vite's behavior)
-    - Works in isolation without tsconfig.json
+    Fallback for when no syntax worker can be started: spawns esbuild (or
+    npx) once per file.
     """
     import tempfile
     from pathlib import Path as P
 
     ext = P(file_path).suffix.lower()
 
-    # TypeScript/JavaScript validation using esbuild
-    if ext in {".ts", ".tsx", ".js", ".jsx"}:
+    try:
+        # Write to temp file in system temp dir (NOT project dir to avoid HMR triggers)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            suffix=ext,
+            delete=False,
+            # Don't set dir= to avoid writing to project directory which triggers HMR
+        ) as tmp:
+            tmp.write(content)
+            tmp_path = tmp.name
+
         try:
-            # Write to temp file in system temp dir (NOT project dir to avoid HMR triggers)
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=ext,
-                delete=False,
-                # Don't set dir= to avoid writing to project directory which triggers HMR
-            ) as tmp:
-                tmp.write(content)
-                tmp_path = tmp.name
-
-            try:
-                # Find esbuild binary - try multiple locations
-                esbuild_cmd = None
-
-                # Try to find esbuild in node_modules (works with pnpm, npm, yarn)
-                for search_dir in [project_dir, project_dir.parent]:
-                    # pnpm stores it differently
-                    pnpm_esbuild = search_dir / "node_modules" / ".pnpm"
-                    if pnpm_esbuild.exists():
-                        for esbuild_dir in pnpm_esbuild.glob(
-                            "esbuild@*/node_modules/esbuild/bin/esbuild"
-                        ):
-                            if esbuild_dir.exists():
-                                esbuild_cmd = str(esbuild_dir)
-                                break
-                    # Standard npm/yarn location
-                    npm_esbuild = search_dir / "node_modules" / ".bin" / "esbuild"
-                    if npm_esbuild.exists():
-                        esbuild_cmd = str(npm_esbuild)
-                        break
-                    if esbuild_cmd:
-                        break
-
-                # Fall back to npx if not found
-                if not esbuild_cmd:
-                    esbuild_cmd = "npx"
-                    args = ["npx", "esbuild", tmp_path, "--log-level=error"]
-                else:
-                    args = [esbuild_cmd, tmp_path, "--log-level=error"]
-
-                # Use esbuild for fast, accurate syntax validation
-                # esbuild infers loader from extension (.tsx, .ts, etc.)
-                # --log-level=error only shows errors
-                result = subprocess.run(
-                    args,
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=15,  # esbuild is fast, 15s is plenty
-                )
-
-                if result.returncode != 0:
-                    # Filter out npm warnings and extract actual errors
-                    error_output = result.stderr.strip()
-                    error_lines = [
-                        line
-                        for line in error_output.split("\n")
-                        if line
-                        and not line.startswith("npm warn")
-                        and not line.startswith("npm WARN")
-                    ]
-                    if error_lines:
-                        # Extract just the error message, not full path
-                        error_msg = "\n".join(error_lines[:3])
-                        return False, f"Syntax error: {error_msg}"
-
-                return True, ""
-
-            finally:
-                P(tmp_path).unlink(missing_ok=True)
-
-        except subprocess.TimeoutExpired:
-            return True, ""  # Timeout = assume ok
-        except FileNotFoundError:
-            return True, ""  # No esbuild = skip validation
-        except Exception as e:
-            return True, ""  # Other errors = skip validation
+            # Find esbuild binary - try multiple locations
+            esbuild_cmd = None
+
+            # Try to find esbuild in node_modules (works with pnpm, npm, yarn)
+            for search_dir in [project_dir, project_dir.parent]:
+                # pnpm stores it differently
+                pnpm_esbuild = search_dir / "node_modules" / ".pnpm"
+                if pnpm_esbuild.exists():
+                    for esbuild_dir in pnpm_esbuild.glob(
+                        "esbuild@*/node_modules/esbuild/bin/esbuild"
+                    ):
+                        if esbuild_dir.exists():
+                            esbuild_cmd = str(esbuild_dir)
+                            break
+                # Standard npm/yarn location
+                npm_esbuild = search_dir / "node_modules" / ".bin" / "esbuild"
+                if npm_esbuild.exists():
+                    esbuild_cmd = str(npm_esbuild)
+                    break
+                if esbuild_cmd:
+                    break
+
+            # Fall back to npx if not found
+            if not esbuild_cmd:
+                esbuild_cmd = "npx"
+                args = ["npx", "esbuild", tmp_path, "--log-level=error"]
+            else:
+                args = [esbuild_cmd, tmp_path, "--log-level=error"]
+
+            # Use esbuild for fast, accurate syntax validation
+            # esbuild infers loader from extension (.tsx, .ts, etc.)
+            # --log-level=error only shows errors
+            result = subprocess.run(
+                args,
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                timeout=15,  # esbuild is fast, 15s is plenty
+            )
+
+            if result.returncode != 0:
+                # Filter out npm warnings and extract actual errors
+                error_output = result.stderr.strip()
+                error_lines = [
+                    line
+                    for line in error_output.split("\n")
+                    if line
+                    and not line.startswith("npm warn")
+                    and not line.startswith("npm WARN")
+                ]
+                if error_lines:
+                    # Extract just the error message, not full path
+                    error_msg = "\n".join(error_lines[:3])
+                    return False, f"Syntax error: {error_msg}"
+
+            return True, ""
+
+        finally:
+            P(tmp_path).unlink(missing_ok=True)
+
+    except subprocess.TimeoutExpired:
+        return True, ""  # Timeout = assume ok
+    except FileNotFoundError:
+        return True, ""  # No esbuild = skip validation
+    except Exception as e:
+        return True, ""  # Other errors = skip validation
+
+
+def _validate_in_process(file_path: str, content: str) -> tuple[bool, str]:
+    """Validate Python and JSON without a subprocess."""
+    ext = Path(file_path).suffix.lower()
 
     # Python validation
-    elif ext == ".py":
+    if ext == ".py":
         try:
             compile(content, file_path, "exec")
             return True, ""
@@ -526,6 +528,34 @@ def validate_merged_syntax(
     return True, ""
 
 
+def validate_merged_syntax(
+    file_path: str, content: str, project_dir: Path
+) -> tuple[bool, str]:
+    """
+    Validate the syntax of merged code.
+
+    Returns (is_valid, error_message).
+
+    Python and JSON are checked in-process. TypeScript/JavaScript goes to a
+    long-lived esbuild worker (see syntax_worker), so Node starts once per
+    process rather than once per file; if no worker can be started, the
+    esbuild CLI is used instead. esbuild is used as it:
+    - Is much faster than tsc (no npm setup overhead)
+    - Has accurate JSX/TSX parsing (matches Vite's behavior)
+    - Works in isolation without tsconfig.json
+    """
+    from .syntax_worker import get_syntax_worker
+
+    if Path(file_path).suffix.lower() not in _JS_EXTENSIONS:
+        return _validate_in_process(file_path, content)
+
+    worker = get_syntax_worker(Path(project_dir))
+    results = worker.validate_batch([(file_path, content)]) if worker else None
+    if results is None:
+        return _validate_js_with_esbuild_cli(file_path, content, Path(project_dir))
+    return results[0]
+
+
 def create_conflict_file_with_git(
     main_content: str,
     worktree_content: str,
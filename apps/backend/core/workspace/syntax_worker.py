@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Syntax Validation Worker
+========================
+
+Long-lived Node process that validates TypeScript/JavaScript with esbuild's
+transform API, so a merge pays Node's startup cost once instead of once per
+merged file.
+
+Requests and responses are JSON lines over stdin/stdout matched by id, so a
+batch of files is written in one go and the results are read back as they
+arrive. One worker is kept per esbuild installation and shut down at exit.
+When no worker can be started (no node, no esbuild package in node_modules),
+get_syntax_worker() returns None and callers fall back to the per-file
+esbuild CLI.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import json
+import queue
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.syntax_worker"
+
+# Seconds to wait for one file's result before the worker is considered hung
+RESPONSE_TIMEOUT = 15
+
+# esbuild loaders by file extension (same inference as the esbuild CLI)
+LOADERS = {".ts": "ts", ".tsx": "tsx", ".js": "js", ".jsx": "jsx"}
+
+# Runs under `node -e`; argv[1] is the esbuild package directory
+_WORKER_SOURCE = r"""
+const esbuild = require(process.argv[1]);
+const readline = require("readline");
+
+const rl = readline.createInterface({ input: process.stdin });
+rl.on("line", (line) => {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (e) {
+    return;
+  }
+  const response = { id: request.id, ok: true, error: "" };
+  try {
+    esbuild.transformSync(request.content, {
+      loader: request.loader,
+      sourcefile: request.path,
+      logLevel: "silent",
+    });
+  } catch (e) {
+    const messages = (e && e.errors) || [];
+    if (messages.length > 0) {
+      response.ok = false;
+      response.error = messages
+        .slice(0, 3)
+        .map((m) =>
+          m.location
+            ? `${m.text} (line ${m.location.line}, column ${m.location.column})`
+            : m.text
+        )
+        .join("\n");
+    }
+  }
+  process.stdout.write(JSON.stringify(response) + "\n");
+});
+"""
+
+
+def find_esbuild_package(project_dir: Path) -> Path | None:
+    """
+    Locate the esbuild package (not the CLI shim) for a project.
+
+    Args:
+        project_dir: Project root; its parent is searched too
+
+    Returns:
+        Directory of the esbuild package, or None if it isn't installed
+    """
+    for search_dir in [project_dir, project_dir.parent]:
+        node_modules = search_dir / "node_modules"
+        # Standard npm/yarn location
+        package = node_modules / "esbuild"
+        if (package / "package.json").exists():
+            return package
+        # pnpm stores it differently
+        pnpm_dir = node_modules / ".pnpm"
+        if pnpm_dir.exists():
+            for package in sorted(pnpm_dir.glob("esbuild@*/node_modules/esbuild")):
+                if (package / "package.json").exists():
+                    return package
+    return None
+
+
+class SyntaxValidationWorker:
+    """A Node process validating files with one esbuild installation."""
+
+    def __init__(self, esbuild_dir: Path, node: str = "node"):
+        """
+        Initialize the worker (call start() before use).
+
+        Args:
+            esbuild_dir: Directory of the esbuild package to require()
+            node: Node executable
+        """
+        self.esbuild_dir = esbuild_dir
+        self.node = node
+        self._process: subprocess.Popen | None = None
+        self._responses: queue.Queue = queue.Queue()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()  # One batch in flight at a time
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> bool:
+        """
+        Start the Node process.
+
+        Returns:
+            True if the worker is running
+        """
+        try:
+            self._process = subprocess.Popen(
+                [self.node, "-e", _WORKER_SOURCE, str(self.esbuild_dir)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except OSError as e:
+            debug_warning(MODULE, f"Could not start syntax worker: {e}")
+            self._process = None
+            return False
+
+        threading.Thread(
+            target=self._read_responses,
+            args=(self._process.stdout, self._responses),
+            daemon=True,
+        ).start()
+        debug(MODULE, f"Started syntax worker with {self.esbuild_dir}")
+        return True
+
+    def validate_batch(
+        self, files: list[tuple[str, str]]
+    ) -> list[tuple[bool, str]] | None:
+        """
+        Validate several files in one round trip.
+
+        Args:
+            files: (file_path, content) pairs with .ts/.tsx/.js/.jsx paths
+
+        Returns:
+            (is_valid, error_message) per file in input order, or None if the
+            worker failed (it is stopped; callers should fall back)
+        """
+        with self._lock:
+            if not self.alive:
+                return None
+
+            pending: dict[int, int] = {}
+            try:
+                for index, (file_path, content) in enumerate(files):
+                    request_id = next(self._ids)
+                    pending[request_id] = index
+                    self._process.stdin.write(
+                        json.dumps(
+                            {
+                                "id": request_id,
+                                "path": Path(file_path).name,
+                                "loader": LOADERS.get(
+                                    Path(file_path).suffix.lower(), "js"
+                                ),
+                                "content": content,
+                            }
+                        )
+                        + "\n"
+                    )
+                self._process.stdin.flush()
+            except (OSError, ValueError) as e:
+                debug_warning(MODULE, f"Syntax worker write failed: {e}")
+                self._stop()
+                return None
+
+            results: list[tuple[bool, str]] = [(True, "")] * len(files)
+            while pending:
+                try:
+                    response = self._responses.get(timeout=RESPONSE_TIMEOUT)
+                except queue.Empty:
+                    response = None
+                if response is None:
+                    debug_warning(MODULE, "Syntax worker stopped responding")
+                    self._stop()
+                    return None
+                index = pending.pop(response.get("id"), None)
+                if index is None:
+                    continue  # Stale answer from an abandoned batch
+                if response.get("ok", True):
+                    results[index] = (True, "")
+                else:
+                    results[index] = (False, f"Syntax error: {response.get('error')}")
+            return results
+
+    def close(self) -> None:
+        """Stop the Node process."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=2)
+        except Exception:
+            process.kill()
+
+    @staticmethod
+    def _read_responses(stream, responses: queue.Queue) -> None:
+        """Forward parsed response lines; None marks end of output."""
+        for line in stream:
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        responses.put(None)
+
+
+_workers: dict[Path, SyntaxValidationWorker | None] = {}
+_workers_lock = threading.Lock()
+
+
+def get_syntax_worker(project_dir: Path) -> SyntaxValidationWorker | None:
+    """
+    Get a running worker for the project's esbuild, starting one if needed.
+
+    Args:
+        project_dir: Project root used to locate esbuild
+
+    Returns:
+        A running worker, or None if node or esbuild isn't available
+    """
+    esbuild_dir = find_esbuild_package(Path(project_dir))
+    if esbuild_dir is None:
+        return None
+
+    with _workers_lock:
+        if esbuild_dir in _workers:
+            worker = _workers[esbuild_dir]
+            # A worker that died is restarted; a failed start is remembered
+            if worker is None or worker.alive:
+                return worker
+
+        node = shutil.which("node")
+        worker = SyntaxValidationWorker(esbuild_dir, node) if node else None
+        if worker is not None and not worker.start():
+            worker = None
+        _workers[esbuild_dir] = worker
+        return worker
+
+
+@atexit.register
+def shutdown_syntax_workers() -> None:
+    """Stop all workers (registered to run at interpreter exit)."""
+    with _workers_lock:
+        workers = [worker for worker in _workers.values() if worker is not None]
+        _workers.clear()
+    for worker in workers:
+        worker.close()
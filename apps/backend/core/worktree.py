@@ -28,6 +28,11 @@ from typing import TypedDict, TypeVar
 
 from core.gh_executable import get_gh_executable, invalidate_gh_cache
 from core.git_executable import get_git_executable, get_isolated_git_env, run_git
+from core.worktree_inventory import (
+    WorktreeInventory,
+    date_stats,
+    parse_shortstat,
+)
 from debug import debug_warning
 
 T = TypeVar("T")
@@ -532,46 +537,7 @@ class WorktreeManager:
             ["log", "-1", "--format=%cd", "--date=iso"], cwd=worktree_path
         )
         if result.returncode == 0 and result.stdout.strip():
-            try:
-                # Parse ISO date format: "2026-01-04 00:25:25 +0100"
-                date_str = result.stdout.strip()
-                # Convert git format to ISO format for fromisoformat()
-                # "2026-01-04 00:25:25 +0100" -> "2026-01-04T00:25:25+01:00"
-                parts = date_str.rsplit(" ", 1)
-                if len(parts) == 2:
-                    date_part, tz_part = parts
-                    # Convert timezone format: "+0100" -> "+01:00"
-                    if len(tz_part) == 5 and (
-                        tz_part.startswith("+") or tz_part.startswith("-")
-                    ):
-                        tz_formatted = f"{tz_part[:3]}:{tz_part[3:]}"
-                        iso_str = f"{date_part.replace(' ', 'T')}{tz_formatted}"
-                        last_commit_date = datetime.fromisoformat(iso_str)
-                        stats["last_commit_date"] = last_commit_date
-                        # Use timezone-aware now() for accurate comparison
-                        now_aware = datetime.now(last_commit_date.tzinfo)
-                        stats["days_since_last_commit"] = (
-                            now_aware - last_commit_date
-                        ).days
-                    else:
-                        # Fallback for unexpected timezone format
-                        last_commit_date = datetime.strptime(
-                            parts[0], "%Y-%m-%d %H:%M:%S"
-                        )
-                        stats["last_commit_date"] = last_commit_date
-                        stats["days_since_last_commit"] = (
-                            datetime.now() - last_commit_date
-                        ).days
-                else:
-                    # No timezone in output
-                    last_commit_date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    stats["last_commit_date"] = last_commit_date
-                    stats["days_since_last_commit"] = (
-                        datetime.now() - last_commit_date
-                    ).days
-            except (ValueError, TypeError) as e:
-                # If parsing fails, silently continue without date info
-                pass
+            stats.update(date_stats(result.stdout))
 
         # Diff stats
         result = self._run_git(
@@ -579,15 +545,7 @@ class WorktreeManager:
         )
         if result.returncode == 0 and result.stdout.strip():
             # Parse: "3 files changed, 50 insertions(+), 10 deletions(-)"
-            match = re.search(r"(\d+) files? changed", result.stdout)
-            if match:
-                stats["files_changed"] = int(match.group(1))
-            match = re.search(r"(\d+) insertions?", result.stdout)
-            if match:
-                stats["additions"] = int(match.group(1))
-            match = re.search(r"(\d+) deletions?", result.stdout)
-            if match:
-                stats["deletions"] = int(match.group(1))
+            stats.update(parse_shortstat(result.stdout))
 
         return stats
 
@@ -886,27 +844,57 @@ class WorktreeManager:
     # ==================== Listing & Discovery ====================
 
     def list_all_worktrees(self) -> list[WorktreeInfo]:
-        """List all spec worktrees (includes legacy .worktrees/ location)."""
-        worktrees = []
+        """List all spec worktrees (includes legacy .worktrees/ location).
+
+        Statistics for all registered worktrees are gathered by a
+        WorktreeInventory in a constant number of git calls; only directories
+        git doesn't know about fall back to per-worktree queries.
+        """
+        candidates: list[tuple[str, Path]] = []
         seen_specs = set()
 
         # Check new location first
         if self.worktrees_dir.exists():
             for item in self.worktrees_dir.iterdir():
                 if item.is_dir():
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
-                        seen_specs.add(item.name)
+                    candidates.append((item.name, item))
+                    seen_specs.add(item.name)
 
         # Check legacy location (.worktrees/)
         legacy_dir = self.project_dir / ".worktrees"
         if legacy_dir.exists():
             for item in legacy_dir.iterdir():
                 if item.is_dir() and item.name not in seen_specs:
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
+                    candidates.append((item.name, item))
+
+        inventory = WorktreeInventory(self.project_dir, self.base_branch).collect(
+            path for _, path in candidates
+        )
+
+        worktrees = []
+        for spec_name, path in candidates:
+            entry = inventory.get(path)
+            if entry is None:
+                info = self.get_worktree_info(spec_name)
+            else:
+                branch = entry.record.branch
+                if branch is None:
+                    branch = self.get_branch_name(spec_name)
+                    debug_warning(
+                        "worktree",
+                        f"Worktree '{spec_name}' is in detached HEAD state. "
+                        f"Using expected branch name: {branch}",
+                    )
+                info = WorktreeInfo(
+                    path=path,
+                    branch=branch,
+                    spec_name=spec_name,
+                    base_branch=self.base_branch,
+                    is_active=True,
+                    **entry.stats,
+                )
+            if info:
+                worktrees.append(info)
 
         return worktrees
 
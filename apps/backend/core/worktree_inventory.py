@@ -0,0 +1,443 @@
+"""
+Worktree Inventory
+==================
+
+Collects branch, HEAD and diff statistics for many spec worktrees with a
+constant number of git invocations, however many worktrees there are:
+
+1. ``git worktree list --porcelain`` - registered paths, HEADs and branches
+2. ``git for-each-ref`` over ``auto-claude/*`` and the base branch - ref tips
+   and commit dates
+3. ``git rev-list --parents --boundary <heads> ^<base>`` - commit counts and
+   merge bases for every HEAD at once
+4. ``git diff-tree --stdin --shortstat`` - diff stats of every HEAD against
+   its merge base in one process
+
+Results are cached on (base tip, HEAD), so steps 3 and 4 only run for HEADs
+that moved since the last call and polling an unchanged repository costs
+two git calls. Commit dates are cached per commit.
+
+Usage:
+    from core.worktree_inventory import WorktreeInventory
+
+    entries = WorktreeInventory(project_dir, "main").collect(worktree_paths)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from core.git_executable import run_git
+
+# Bound the caches; entries are tiny but the process may live for days
+_MAX_CACHE_ENTRIES = 4096
+
+# (repo, base tip, HEAD) -> commit_count/files_changed/additions/deletions
+_diff_stats_cache: OrderedDict[tuple[str, str, str], dict[str, int]] = OrderedDict()
+# Commit SHA -> committer date string (commits are immutable)
+_commit_date_cache: OrderedDict[str, str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+_HEX_SHA = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+@dataclass(frozen=True)
+class WorktreeRecord:
+    """One entry of ``git worktree list --porcelain``."""
+
+    path: Path
+    head: str | None
+    branch: str | None  # Without refs/heads/; None when detached
+
+
+@dataclass
+class WorktreeInventoryEntry:
+    """Branch and statistics for one worktree."""
+
+    record: WorktreeRecord
+    stats: dict
+
+
+def parse_git_date(date_str: str) -> datetime | None:
+    """
+    Parse a ``--date=iso`` commit date.
+
+    Args:
+        date_str: Date such as "2026-01-04 00:25:25 +0100"
+
+    Returns:
+        Parsed datetime (timezone-aware when the offset is well-formed),
+        or None if the string can't be parsed
+    """
+    date_str = date_str.strip()
+    if not date_str:
+        return None
+    try:
+        parts = date_str.rsplit(" ", 1)
+        if len(parts) == 2:
+            date_part, tz_part = parts
+            # Convert timezone format: "+0100" -> "+01:00"
+            if len(tz_part) == 5 and tz_part[0] in "+-":
+                tz_formatted = f"{tz_part[:3]}:{tz_part[3:]}"
+                return datetime.fromisoformat(
+                    f"{date_part.replace(' ', 'T')}{tz_formatted}"
+                )
+            # Fallback for unexpected timezone format
+            return datetime.strptime(parts[0], "%Y-%m-%d %H:%M:%S")
+        # No timezone in output
+        return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError):
+        return None
+
+
+def date_stats(date_str: str | None) -> dict:
+    """
+    Build the last-commit fields of the worktree stats from a date string.
+
+    Args:
+        date_str: ``--date=iso`` commit date, or None if unknown
+
+    Returns:
+        Dict with last_commit_date and days_since_last_commit
+    """
+    last_commit_date = parse_git_date(date_str) if date_str else None
+    if last_commit_date is None:
+        return {"last_commit_date": None, "days_since_last_commit": None}
+    # Use timezone-aware now() for accurate comparison
+    now = datetime.now(last_commit_date.tzinfo)
+    return {
+        "last_commit_date": last_commit_date,
+        "days_since_last_commit": (now - last_commit_date).days,
+    }
+
+
+def parse_shortstat(text: str) -> dict[str, int]:
+    """
+    Parse ``--shortstat`` output.
+
+    Args:
+        text: e.g. "3 files changed, 50 insertions(+), 10 deletions(-)"
+
+    Returns:
+        Dict with files_changed, additions and deletions
+    """
+    stats = {"files_changed": 0, "additions": 0, "deletions": 0}
+    match = re.search(r"(\d+) files? changed", text)
+    if match:
+        stats["files_changed"] = int(match.group(1))
+    match = re.search(r"(\d+) insertions?", text)
+    if match:
+        stats["additions"] = int(match.group(1))
+    match = re.search(r"(\d+) deletions?", text)
+    if match:
+        stats["deletions"] = int(match.group(1))
+    return stats
+
+
+def parse_worktree_list(output: str) -> list[WorktreeRecord]:
+    """
+    Parse ``git worktree list --porcelain`` output.
+
+    Args:
+        output: Porcelain output (entries separated by blank lines)
+
+    Returns:
+        One record per registered worktree
+    """
+    records = []
+    path: Path | None = None
+    head: str | None = None
+    branch: str | None = None
+
+    for line in [*output.split("\n"), ""]:
+        if line.startswith("worktree "):
+            path = Path(line[len("worktree ") :])
+        elif line.startswith("HEAD "):
+            head = line[len("HEAD ") :].strip()
+        elif line.startswith("branch refs/heads/"):
+            branch = line[len("branch refs/heads/") :]
+        elif line == "" and path is not None:
+            records.append(WorktreeRecord(path=path, head=head, branch=branch))
+            path, head, branch = None, None, None
+
+    return records
+
+
+def _path_key(path: Path) -> str:
+    """Normalize a path for comparison with git's registered paths."""
+    try:
+        path = path.resolve()
+    except OSError:
+        pass
+    return os.path.normcase(str(path))
+
+
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _MAX_CACHE_ENTRIES:
+        cache.popitem(last=False)
+
+
+class WorktreeInventory:
+    """Batched worktree statistics for one repository and base branch."""
+
+    def __init__(self, project_dir: Path, base_branch: str):
+        """
+        Initialize the inventory.
+
+        Args:
+            project_dir: Main repository directory
+            base_branch: Branch the spec worktrees are compared against
+        """
+        self.project_dir = Path(project_dir)
+        self.base_branch = base_branch
+        self._repo_key = _path_key(self.project_dir)
+
+    def collect(
+        self, worktree_paths: Iterable[Path]
+    ) -> dict[Path, WorktreeInventoryEntry]:
+        """
+        Collect branch and statistics for worktrees.
+
+        Args:
+            worktree_paths: Worktree directories to describe
+
+        Returns:
+            Entries keyed by the given paths. Paths that aren't registered
+            git worktrees (or whose HEAD is unknown) are omitted.
+        """
+        wanted = {_path_key(path): path for path in worktree_paths}
+        if not wanted:
+            return {}
+
+        result = run_git(["worktree", "list", "--porcelain"], cwd=self.project_dir)
+        if result.returncode != 0:
+            return {}
+
+        records: dict[Path, WorktreeRecord] = {}
+        for record in parse_worktree_list(result.stdout):
+            requested = wanted.get(_path_key(record.path))
+            if requested is not None and record.head and _HEX_SHA.match(record.head):
+                records[requested] = record
+        if not records:
+            return {}
+
+        base_sha, ref_dates = self._read_refs()
+        heads = {record.head for record in records.values()}
+        diff_stats = self._diff_stats(base_sha, heads)
+        dates = self._commit_dates(heads, ref_dates)
+
+        return {
+            path: WorktreeInventoryEntry(
+                record=record,
+                stats={
+                    **diff_stats[record.head],
+                    **date_stats(dates.get(record.head)),
+                },
+            )
+            for path, record in records.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _read_refs(self) -> tuple[str | None, dict[str, str]]:
+        """Read spec branch tips, their dates and the base branch tip."""
+        base = self.base_branch
+        result = run_git(
+            [
+                "for-each-ref",
+                "--format=%(objectname)%00%(committerdate:iso)%00%(refname)",
+                "refs/heads/auto-claude/",
+                f"refs/heads/{base}",
+                f"refs/remotes/{base}",
+            ],
+            cwd=self.project_dir,
+        )
+
+        dates: dict[str, str] = {}
+        tips: dict[str, str] = {}
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                fields = line.split("\0")
+                if len(fields) == 3:
+                    sha, date, refname = fields
+                    dates[sha] = date
+                    tips[refname] = sha
+
+        base_sha = tips.get(f"refs/heads/{base}") or tips.get(f"refs/remotes/{base}")
+        if base_sha is None:
+            # Base given as a tag, SHA or other revision
+            result = run_git(
+                ["rev-parse", "--verify", "--quiet", f"{base}^{{commit}}"],
+                cwd=self.project_dir,
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                base_sha = result.stdout.strip()
+
+        return base_sha, dates
+
+    def _diff_stats(
+        self, base_sha: str | None, heads: set[str]
+    ) -> dict[str, dict[str, int]]:
+        """Commit counts and diff stats for each HEAD against the base."""
+        empty = {"commit_count": 0, "files_changed": 0, "additions": 0, "deletions": 0}
+        if base_sha is None:
+            return {head: dict(empty) for head in heads}
+
+        stats: dict[str, dict[str, int]] = {}
+        with _cache_lock:
+            for head in heads:
+                cached = _diff_stats_cache.get((self._repo_key, base_sha, head))
+                if cached is not None:
+                    _diff_stats_cache.move_to_end((self._repo_key, base_sha, head))
+                    stats[head] = dict(cached)
+        missing = sorted(heads - stats.keys())
+        if not missing:
+            return stats
+
+        counts, merge_bases = self._walk_history(base_sha, missing)
+        shortstats = self._shortstats(merge_bases)
+
+        with _cache_lock:
+            for head in missing:
+                head_stats = {
+                    **empty,
+                    "commit_count": counts.get(head, 0),
+                    **shortstats.get(head, {}),
+                }
+                stats[head] = head_stats
+                _cache_put(
+                    _diff_stats_cache, (self._repo_key, base_sha, head), head_stats
+                )
+        return stats
+
+    def _walk_history(
+        self, base_sha: str, heads: list[str]
+    ) -> tuple[dict[str, int], dict[str, str]]:
+        """
+        Count commits ahead of the base and find merge bases for many HEADs.
+
+        One ``rev-list --boundary`` lists every commit reachable from the
+        HEADs but not from the base, plus the boundary commits where that
+        history meets the base. A HEAD whose history touches exactly one
+        boundary commit has it as its merge base; the rare HEAD with several
+        (criss-cross merges) asks ``git merge-base`` directly.
+        """
+        result = run_git(
+            ["rev-list", "--parents", "--boundary", *heads, f"^{base_sha}"],
+            cwd=self.project_dir,
+        )
+        if result.returncode != 0:
+            return {}, {}
+
+        parents: dict[str, list[str]] = {}
+        boundary: set[str] = set()
+        for line in result.stdout.splitlines():
+            if line.startswith("-"):
+                boundary.add(line[1:].split()[0])
+            elif line:
+                sha, *commit_parents = line.split()
+                parents[sha] = commit_parents
+
+        counts: dict[str, int] = {}
+        merge_bases: dict[str, str] = {}
+        for head in heads:
+            if head not in parents:
+                # Already contained in the base: nothing ahead, empty diff
+                counts[head] = 0
+                continue
+
+            seen = {head}
+            stack = [head]
+            bases: set[str] = set()
+            while stack:
+                for parent in parents.get(stack.pop(), ()):
+                    if parent in seen:
+                        continue
+                    seen.add(parent)
+                    if parent in parents:
+                        stack.append(parent)
+                    elif parent in boundary:
+                        bases.add(parent)
+            counts[head] = len(seen) - len(bases)
+
+            if len(bases) == 1:
+                merge_bases[head] = bases.pop()
+            else:
+                merge_base = run_git(
+                    ["merge-base", base_sha, head], cwd=self.project_dir
+                )
+                if merge_base.returncode == 0 and merge_base.stdout.strip():
+                    merge_bases[head] = merge_base.stdout.split()[0]
+
+        return counts, merge_bases
+
+    def _shortstats(self, merge_bases: dict[str, str]) -> dict[str, dict[str, int]]:
+        """Diff stats for every (merge base, HEAD) pair in one diff-tree call."""
+        if not merge_bases:
+            return {}
+
+        # diff-tree --stdin reads "<commit> <parent>" and diffs parent -> commit,
+        # echoing the commit before each diff
+        input_data = "".join(f"{head} {base}\n" for head, base in merge_bases.items())
+        result = run_git(
+            ["diff-tree", "--stdin", "-r", "--shortstat"],
+            cwd=self.project_dir,
+            input_data=input_data,
+        )
+        if result.returncode != 0:
+            return {}
+
+        stats: dict[str, dict[str, int]] = {}
+        current: str | None = None
+        for line in result.stdout.splitlines():
+            if _HEX_SHA.match(line):
+                current = line
+            elif current is not None and "changed" in line:
+                stats[current] = parse_shortstat(line)
+        return stats
+
+    def _commit_dates(
+        self, heads: set[str], ref_dates: dict[str, str]
+    ) -> dict[str, str]:
+        """Committer dates for HEADs, from refs, cache, or one batched query."""
+        dates: dict[str, str] = {}
+        with _cache_lock:
+            for head in heads:
+                if head in ref_dates:
+                    dates[head] = ref_dates[head]
+                    _cache_put(_commit_date_cache, head, ref_dates[head])
+                elif head in _commit_date_cache:
+                    dates[head] = _commit_date_cache[head]
+
+        missing = sorted(heads - dates.keys())
+        if missing:
+            result = run_git(
+                ["show", "-s", "--format=%H%x00%cd", "--date=iso", *missing],
+                cwd=self.project_dir,
+            )
+            if result.returncode == 0:
+                with _cache_lock:
+                    for line in result.stdout.splitlines():
+                        sha, sep, date = line.partition("\0")
+                        if sep and sha in heads:
+                            dates[sha] = date
+                            _cache_put(_commit_date_cache, sha, date)
+        return dates
+
+
+def clear_inventory_cache() -> None:
+    """Drop cached statistics (useful for testing)."""
+    with _cache_lock:
+        _diff_stats_cache.clear()
+        _commit_date_cache.clear()
@@ -56,7 +56,7 @@ class ProjectIndexPhase:
         # Run analyzer
         print_status("Running project analyzer...", "progress")
         success, output = self.script_runner.run_script(
-            "analyzer.py", ["--output", str(project_index)]
+            "analyzer.py", ["--output", str(project_index), "--incremental"]
         )
 
         if success and project_index.exists():
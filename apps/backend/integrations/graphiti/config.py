@@ -20,6 +20,7 @@ Environment Variables:
     # Database
     GRAPHITI_DATABASE: Graph database name (default: auto_claude_memory)
     GRAPHITI_DB_PATH: Database storage path (default: ~/.auto-claude/memories)
+    GRAPHITI_EMBEDDING_CACHE_MB: On-disk embedding cache limit in MB (default: 256, 0 disables)
 
     # OpenAI
     OPENAI_API_KEY: Required for OpenAI provider
@@ -66,6 +67,7 @@ from typing import Optional
 # Default configuration values
 DEFAULT_DATABASE = "auto_claude_memory"
 DEFAULT_DB_PATH = "~/.auto-claude/memories"
+DEFAULT_EMBEDDING_CACHE_MB = 256
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 
 # Graphiti state marker file (stores connection info and status)
@@ -118,6 +120,7 @@ class GraphitiConfig:
     # Database settings (LadybugDB - embedded, no Docker required)
     database: str = DEFAULT_DATABASE
     db_path: str = DEFAULT_DB_PATH
+    embedding_cache_mb: int = DEFAULT_EMBEDDING_CACHE_MB
 
     # OpenAI settings
     openai_api_key: str = ""
@@ -171,6 +174,14 @@ class GraphitiConfig:
         # Database settings (LadybugDB - embedded)
         database = os.environ.get("GRAPHITI_DATABASE", DEFAULT_DATABASE)
         db_path = os.environ.get("GRAPHITI_DB_PATH", DEFAULT_DB_PATH)
+        try:
+            embedding_cache_mb = int(
+                os.environ.get(
+                    "GRAPHITI_EMBEDDING_CACHE_MB", str(DEFAULT_EMBEDDING_CACHE_MB)
+                )
+            )
+        except ValueError:
+            embedding_cache_mb = DEFAULT_EMBEDDING_CACHE_MB
 
         # OpenAI settings
         openai_api_key = os.environ.get("OPENAI_API_KEY", "")
@@ -233,6 +244,7 @@ class GraphitiConfig:
             embedder_provider=embedder_provider,
             database=database,
             db_path=db_path,
+            embedding_cache_mb=embedding_cache_mb,
             openai_api_key=openai_api_key,
             openai_model=openai_model,
             openai_embedding_model=openai_embedding_model,
@@ -221,6 +221,15 @@ class EmbeddingMigrator:
             else:
                 stats["failed"] += 1
 
+        if not self.dry_run and stats["failed"] == 0:
+            # Vectors from the old embedder are no longer needed
+            from integrations.graphiti.providers_pkg.embedding_cache import (
+                invalidate_embedding_cache,
+            )
+
+            invalidate_embedding_cache(self.source_config)
+            logger.info("Cleared cached embeddings for the source provider")
+
         return stats
 
     async def close(self):
@@ -25,6 +25,15 @@ Usage:
 # Core exceptions
 # Cross-encoder / reranker
 from .cross_encoder import create_cross_encoder
+
+# Embedding cache
+from .embedding_cache import (
+    CachingEmbedder,
+    EmbeddingCache,
+    get_embedding_cache,
+    invalidate_embedding_cache,
+    wrap_embedder_with_cache,
+)
 from .exceptions import ProviderError, ProviderNotInstalled
 
 # Factory functions
@@ -52,6 +61,12 @@ __all__ = [
     "create_llm_client",
     "create_embedder",
     "create_cross_encoder",
+    # Embedding cache
+    "CachingEmbedder",
+    "EmbeddingCache",
+    "get_embedding_cache",
+    "invalidate_embedding_cache",
+    "wrap_embedder_with_cache",
     # Models
     "EMBEDDING_DIMENSIONS",
     "get_expected_embedding_dim",
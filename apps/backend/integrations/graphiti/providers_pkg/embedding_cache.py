@@ -0,0 +1,321 @@
+"""
+Graphiti Embedding Cache
+========================
+
+On-disk, content-addressed cache in front of the Graphiti embedder.
+
+The same subtask descriptions, gotchas and patterns are searched for and
+saved again and again; each time Graphiti asks the provider for an embedding
+of identical text. CachingEmbedder answers those from disk.
+
+Entries are keyed by (provider, model, dimension, sha256 of the text):
+
+    <db_path>/embedding_cache/<provider>-<model>-<dim>/<ab>/<sha256>.f64
+
+Each file holds the vector as packed float64, so a cache hit returns exactly
+the floats the provider returned on the miss. The cache is bounded by
+GRAPHITI_EMBEDDING_CACHE_MB (0 disables it); least recently used entries
+are evicted once the total size exceeds the limit. Because the namespace
+includes the model and dimension, switching embedders never serves stale
+vectors; migrate_embeddings.py additionally clears the old namespace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphiti_config import GraphitiConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "embedding_cache"
+ENTRY_SUFFIX = ".f64"
+# Entries in an older format, removed when the cache directory is first scanned
+LEGACY_ENTRY_SUFFIXES = (".f32",)
+ENTRY_TYPECODE = "d"
+ENTRY_ITEMSIZE = array(ENTRY_TYPECODE).itemsize
+# After evicting, shrink to this fraction of the limit so eviction is rare
+EVICTION_LOW_WATER = 0.9
+
+
+def get_embedding_model_name(config: GraphitiConfig) -> str:
+    """Get the embedding model (or Azure deployment) the config selects."""
+    return {
+        "openai": config.openai_embedding_model,
+        "voyage": config.voyage_embedding_model,
+        "azure_openai": config.azure_openai_embedding_deployment,
+        "ollama": config.ollama_embedding_model,
+        "google": config.google_embedding_model,
+        "openrouter": config.openrouter_embedding_model,
+    }.get(config.embedder_provider, "")
+
+
+def embedding_namespace(config: GraphitiConfig) -> str:
+    """Directory name identifying (provider, model, dimension)."""
+    model = re.sub(r"[^A-Za-z0-9_.-]+", "_", get_embedding_model_name(config))
+    return (
+        f"{config.embedder_provider}-{model or 'default'}-"
+        f"{config.get_embedding_dimension()}"
+    )
+
+
+def text_key(text: str) -> str:
+    """Content address of an embedded text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Size-bounded LRU of embedding vectors stored one file per entry.
+
+    The LRU order is kept in memory, seeded from file modification times on
+    first use, so several processes can share a cache directory: each one
+    evicts by its own view, and files another process removed are treated
+    as misses.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        """
+        Initialize the cache (the directory is scanned on first use).
+
+        Args:
+            root: Cache directory
+            max_bytes: Maximum total size of cached vectors
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Path, int] | None = None  # path -> size, LRU first
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, namespace: str, text: str) -> Path:
+        key = text_key(text)
+        return self.root / namespace / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def _load_index(self) -> OrderedDict[Path, int]:
+        """Scan the cache directory once (caller holds the lock)."""
+        if self._entries is None:
+            found = []
+            if self.root.exists():
+                for suffix in LEGACY_ENTRY_SUFFIXES:
+                    for path in self.root.glob(f"*/*/*{suffix}"):
+                        path.unlink(missing_ok=True)
+                for path in self.root.glob(f"*/*/*{ENTRY_SUFFIX}"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    found.append((stat.st_mtime, path, stat.st_size))
+            found.sort()
+            self._entries = OrderedDict((path, size) for _, path, size in found)
+            self._total_bytes = sum(self._entries.values())
+        return self._entries
+
+    def get(self, namespace: str, text: str) -> list[float] | None:
+        """Return the cached vector for a text, or None."""
+        path = self._path(namespace, text)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = None
+
+        with self._lock:
+            entries = self._load_index()
+            if not data or len(data) % ENTRY_ITEMSIZE:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if path in entries:
+                entries.move_to_end(path)
+            else:  # Written by another process since we scanned
+                entries[path] = len(data)
+                self._total_bytes += len(data)
+
+        try:
+            os.utime(path)  # Persist recency for the next process's scan
+        except OSError:
+            pass
+        vector = array(ENTRY_TYPECODE)
+        vector.frombytes(data)
+        return vector.tolist()
+
+    def put(self, namespace: str, text: str, vector: list[float]) -> None:
+        """Store a vector, evicting least recently used entries if needed."""
+        if self.max_bytes <= 0:
+            return
+        path = self._path(namespace, text)
+        data = array(ENTRY_TYPECODE, vector).tobytes()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write embedding cache entry: {e}")
+            return
+
+        with self._lock:
+            entries = self._load_index()
+            self._total_bytes += len(data) - entries.pop(path, 0)
+            entries[path] = len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * EVICTION_LOW_WATER))
+
+    def _evict(self, target_bytes: int) -> None:
+        """Remove least recently used entries (caller holds the lock)."""
+        while self._entries and self._total_bytes > target_bytes:
+            path, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def invalidate(self, namespace: str | None = None) -> None:
+        """
+        Delete cached vectors.
+
+        Args:
+            namespace: Only clear this (provider, model, dimension) namespace;
+                None clears everything
+        """
+        with self._lock:
+            target = self.root / namespace if namespace else self.root
+            shutil.rmtree(target, ignore_errors=True)
+            if self._entries is not None:
+                for path in [p for p in self._entries if target in p.parents]:
+                    self._total_bytes -= self._entries.pop(path)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total_bytes
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and size for memory statistics."""
+        with self._lock:
+            entries = self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": len(entries),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+
+class CachingEmbedder:
+    """
+    Graphiti embedder wrapper that answers repeated texts from the cache.
+
+    Implements the create()/create_batch() interface Graphiti calls; other
+    attributes are delegated to the wrapped embedder. Non-text inputs (token
+    ids) are passed through uncached.
+    """
+
+    def __init__(self, embedder: Any, cache: EmbeddingCache, namespace: str):
+        self.embedder = embedder
+        self.cache = cache
+        self.namespace = namespace
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.embedder, name)
+
+    @staticmethod
+    def _cacheable_text(input_data: Any) -> str | None:
+        # Graphiti passes either a string or a one-element list of strings
+        if isinstance(input_data, str):
+            return input_data
+        if (
+            isinstance(input_data, list)
+            and len(input_data) == 1
+            and isinstance(input_data[0], str)
+        ):
+            return input_data[0]
+        return None
+
+    async def create(self, input_data: Any) -> list[float]:
+        text = self._cacheable_text(input_data)
+        if text is None:
+            return await self.embedder.create(input_data)
+
+        vector = self.cache.get(self.namespace, text)
+        if vector is None:
+            vector = await self.embedder.create(input_data)
+            self.cache.put(self.namespace, text, vector)
+        return vector
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        results: list[list[float] | None] = [
+            self.cache.get(self.namespace, text) for text in input_data_list
+        ]
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if missing:
+            computed = await self.embedder.create_batch(
+                [input_data_list[i] for i in missing]
+            )
+            for i, vector in zip(missing, computed):
+                results[i] = vector
+                self.cache.put(self.namespace, input_data_list[i], vector)
+        return results
+
+
+_caches: dict[Path, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(config: GraphitiConfig) -> EmbeddingCache | None:
+    """
+    Get the process-wide cache for a config's database path.
+
+    Returns:
+        The cache, or None if GRAPHITI_EMBEDDING_CACHE_MB is 0
+    """
+    if config.embedding_cache_mb <= 0:
+        return None
+    root = Path(config.db_path).expanduser() / CACHE_DIRNAME
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = EmbeddingCache(root, config.embedding_cache_mb * 1024 * 1024)
+            _caches[root] = cache
+        return cache
+
+
+def wrap_embedder_with_cache(embedder: Any, config: GraphitiConfig) -> Any:
+    """Wrap an embedder with the on-disk cache, unless caching is disabled."""
+    cache = get_embedding_cache(config)
+    if cache is None:
+        return embedder
+    return CachingEmbedder(embedder, cache, embedding_namespace(config))
+
+
+def invalidate_embedding_cache(config: GraphitiConfig) -> None:
+    """Drop cached vectors for the config's (provider, model, dimension)."""
+    cache = get_embedding_cache(config)
+    if cache is not None:
+        cache.invalidate(embedding_namespace(config))
@@ -101,6 +101,11 @@ class GraphitiClient:
         """Check if client is initialized."""
         return self._initialized
 
+    def get_embedding_cache_stats(self) -> dict | None:
+        """Get embedding cache statistics, or None if caching is off."""
+        cache = getattr(self._embedder, "cache", None)
+        return cache.stats() if cache is not None else None
+
     async def initialize(self, state: GraphitiState | None = None) -> bool:
         """
         Initialize the Graphiti client with configured providers.
@@ -124,6 +129,7 @@ class GraphitiClient:
                 ProviderNotInstalled,
                 create_embedder,
                 create_llm_client,
+                wrap_embedder_with_cache,
             )
 
             # Create providers using factory pattern
@@ -154,7 +160,10 @@ class GraphitiClient:
                 return False
 
             try:
-                self._embedder = create_embedder(self.config)
+                # Repeated texts (queries, gotchas) are served from disk
+                self._embedder = wrap_embedder_with_cache(
+                    create_embedder(self.config), self.config
+                )
                 logger.info(
                     f"Created embedder for provider: {self.config.embedder_provider}"
                 )
@@ -65,6 +65,7 @@ class GraphitiMemory:
 
         # Component modules
         self._client: GraphitiClient | None = None
+        self._owns_client = True
         self._queries: GraphitiQueries | None = None
         self._search: GraphitiSearch | None = None
 
@@ -120,10 +121,15 @@ class GraphitiMemory:
         """Get a context ID specific to this spec (for filtering in project mode)."""
         return self.spec_dir.name
 
-    async def initialize(self) -> bool:
+    async def initialize(self, client: GraphitiClient | None = None) -> bool:
         """
         Initialize the Graphiti client with configured providers.
 
+        Args:
+            client: Optional client shared with other memory instances (see
+                memory.graphiti_session). It is initialized here if needed,
+                but close() leaves it open for its owner to close.
+
         Returns:
             True if initialization succeeded
         """
@@ -155,8 +161,9 @@ class GraphitiMemory:
             self.state = None
 
         try:
-            # Create client
-            self._client = GraphitiClient(self.config)
+            # Create client (or reuse the shared one)
+            self._owns_client = client is None
+            self._client = client or GraphitiClient(self.config)
 
             # Initialize client with state tracking
             if not await self._client.initialize(self.state):
@@ -212,7 +219,8 @@ class GraphitiMemory:
         Close the Graphiti client and clean up connections.
         """
         if self._client:
-            await self._client.close()
+            if self._owns_client:
+                await self._client.close()
             self._client = None
             self._queries = None
             self._search = None
@@ -504,6 +512,9 @@ class GraphitiMemory:
             "episode_count": self.state.episode_count if self.state else 0,
             "last_session": self.state.last_session if self.state else None,
             "errors": len(self.state.error_log) if self.state else 0,
+            "embedding_cache": self._client.get_embedding_cache_stats()
+            if self._client
+            else None,
         }
 
     async def _ensure_initialized(self) -> bool:
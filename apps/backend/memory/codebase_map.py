@@ -11,7 +11,7 @@ import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .graphiti_helpers import get_graphiti_memory, is_graphiti_memory_enabled, run_async
+from .graphiti_helpers import is_graphiti_memory_enabled, queue_graphiti_write
 from .paths import get_memory_dir
 
 logger = logging.getLogger(__name__)
@@ -64,11 +64,8 @@ def update_codebase_map(spec_dir: Path, discoveries: dict[str, str]) -> None:
     # Also save to Graphiti if enabled
     if is_graphiti_memory_enabled() and discoveries:
         try:
-            graphiti = run_async(get_graphiti_memory(spec_dir))
-            if graphiti:
-                run_async(graphiti.save_codebase_discoveries(discoveries))
-                run_async(graphiti.close())
-                logger.info("Codebase discoveries also saved to Graphiti")
+            queue_graphiti_write(spec_dir, "save_codebase_discoveries", discoveries)
+            logger.info("Codebase discoveries also queued for Graphiti")
         except Exception as e:
             logger.warning(f"Graphiti codebase save failed: {e}")
 
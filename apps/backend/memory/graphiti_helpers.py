@@ -5,6 +5,11 @@ Graphiti Integration Helpers
 
 Helper functions for Graphiti memory system integration.
 Handles checking if Graphiti is available and managing async operations.
+
+Synchronous callers write through queue_graphiti_write() and
+queue_session_insights(), which hand episodes to the process-wide
+GraphitiSessionManager (see graphiti_session.py) instead of opening a
+connection and event loop per write.
 """
 
 import asyncio
@@ -116,6 +121,64 @@ def run_async(coro):
         return asyncio.run(coro)
 
 
+def queue_graphiti_write(
+    spec_dir: Path, method: str, *args: Any, project_dir: Path | None = None
+) -> None:
+    """
+    Queue a Graphiti write from synchronous code (write-behind).
+
+    Returns immediately; the write happens on the shared session's background
+    loop and failures are logged there.
+
+    Args:
+        spec_dir: Spec directory
+        method: GraphitiMemory method to call, e.g. "save_gotcha"
+        *args: Arguments for the method
+        project_dir: Project root directory (defaults to spec_dir.parent.parent)
+    """
+    from .graphiti_session import get_session_manager
+
+    get_session_manager().submit(spec_dir, method, *args, project_dir=project_dir)
+
+
+def queue_session_insights(
+    spec_dir: Path,
+    session_num: int,
+    insights: dict[str, Any],
+    project_dir: Path | None = None,
+) -> None:
+    """
+    Queue the same episodes save_to_graphiti_async() writes, without waiting.
+
+    Args:
+        spec_dir: Spec directory
+        session_num: Session number
+        insights: Session insights dictionary
+        project_dir: Optional project directory
+    """
+    queue_graphiti_write(
+        spec_dir,
+        "save_session_insights",
+        session_num,
+        insights,
+        project_dir=project_dir,
+    )
+
+    discoveries = insights.get("discoveries", {})
+    files_understood = discoveries.get("files_understood", {})
+    if files_understood:
+        queue_graphiti_write(
+            spec_dir,
+            "save_codebase_discoveries",
+            files_understood,
+            project_dir=project_dir,
+        )
+    for pattern in discoveries.get("patterns_found", []):
+        queue_graphiti_write(spec_dir, "save_pattern", pattern, project_dir=project_dir)
+    for gotcha in discoveries.get("gotchas_encountered", []):
+        queue_graphiti_write(spec_dir, "save_gotcha", gotcha, project_dir=project_dir)
+
+
 async def save_to_graphiti_async(
     spec_dir: Path,
     session_num: int,
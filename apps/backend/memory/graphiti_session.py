@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Graphiti Session Manager
+========================
+
+Process-wide owner of the Graphiti connection for synchronous memory writes.
+
+append_gotcha(), append_pattern(), update_codebase_map() and
+save_session_insights() are called from synchronous code. Each used to open
+a GraphitiMemory, run asyncio.run() for every step, write one episode and
+close the database again. The session manager instead keeps:
+
+- one background thread running one event loop,
+- one GraphitiClient (database connection) shared by every spec's
+  GraphitiMemory, opened on first use,
+- a write-behind queue: submit() returns immediately, and queued writes are
+  flushed in batches when max_batch writes are waiting or flush_interval
+  seconds have passed, whichever comes first.
+
+flush() waits until everything submitted so far has been written, and
+shutdown() (registered with atexit for the shared manager) drains the queue
+and closes the connection.
+
+Writes are best-effort, as before: a failed write is logged and counted,
+never raised to the caller. The file-based memory remains the primary store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.sentry import capture_exception
+
+logger = logging.getLogger(__name__)
+
+# Flush once this many writes are queued...
+DEFAULT_MAX_BATCH = 16
+# ...or this many seconds after the previous flush
+DEFAULT_FLUSH_INTERVAL = 2.0
+# Seconds shutdown() waits for the queue to drain
+SHUTDOWN_TIMEOUT = 30.0
+# Seconds before a memory that failed to open is tried again, doubling on
+# every further failure up to the maximum
+OPEN_RETRY_INITIAL = 5.0
+OPEN_RETRY_MAX = 300.0
+
+# Opens a memory for (spec_dir, project_dir) using the manager's shared
+# client; returns None if Graphiti isn't available
+MemoryFactory = Callable[[Path, Path, Any], Awaitable[Any]]
+
+
+@dataclass
+class _QueuedWrite:
+    """One pending GraphitiMemory call, e.g. save_gotcha("...")."""
+
+    spec_dir: Path
+    project_dir: Path
+    method: str
+    args: tuple
+
+
+async def _open_graphiti_memory(spec_dir: Path, project_dir: Path, client: Any):
+    """Open a project-scoped GraphitiMemory on the shared client."""
+    from graphiti_memory import GraphitiMemory, GroupIdMode
+
+    memory = GraphitiMemory(spec_dir, project_dir, group_id_mode=GroupIdMode.PROJECT)
+    if not await memory.initialize(client=client):
+        return None
+    return memory
+
+
+def _create_client() -> Any:
+    """Create the (not yet initialized) shared GraphitiClient."""
+    from graphiti_config import GraphitiConfig
+    from integrations.graphiti.queries_pkg.client import GraphitiClient
+
+    return GraphitiClient(GraphitiConfig.from_env())
+
+
+class GraphitiSessionManager:
+    """Background event loop, shared Graphiti client and write-behind queue."""
+
+    def __init__(
+        self,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        memory_factory: MemoryFactory = _open_graphiti_memory,
+        client_factory: Callable[[], Any] = _create_client,
+    ):
+        """
+        Initialize the manager (the loop thread starts on first use).
+
+        Args:
+            max_batch: Queued writes that trigger an immediate flush
+            flush_interval: Maximum seconds a write waits in the queue
+            memory_factory: Opens a memory for a spec on the shared client
+            client_factory: Creates the shared client
+        """
+        self.max_batch = max(1, max_batch)
+        self.flush_interval = flush_interval
+        self._memory_factory = memory_factory
+        self._client_factory = client_factory
+
+        self._lock = threading.Lock()  # Protects startup/shutdown
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._writer: asyncio.Future | None = None
+
+        # Loop-thread state (only touched from coroutines on self._loop)
+        self._buffer: list[_QueuedWrite] = []
+        self._wakeup: asyncio.Event | None = None
+        self._write_lock: asyncio.Lock | None = None
+        self._stopping = False
+        self._client: Any = None
+        self._memories: dict[tuple[Path, Path], Any] = {}
+        # (retry_at, backoff) for memories that failed to open
+        self._open_failures: dict[tuple[Path, Path], tuple[float, float]] = {}
+
+        self.episodes_written = 0
+        self.episodes_failed = 0
+        self.batches_flushed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------
+    # Public API (any thread)
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        spec_dir: Path,
+        method: str,
+        *args: Any,
+        project_dir: Path | None = None,
+    ) -> None:
+        """
+        Queue a GraphitiMemory write without waiting for it.
+
+        Args:
+            spec_dir: Spec directory the write belongs to
+            method: GraphitiMemory method, e.g. "save_gotcha"
+            *args: Arguments for the method
+            project_dir: Project root (defaults to spec_dir.parent.parent)
+        """
+        spec_dir = Path(spec_dir)
+        write = _QueuedWrite(
+            spec_dir=spec_dir,
+            project_dir=Path(project_dir) if project_dir else spec_dir.parent.parent,
+            method=method,
+            args=args,
+        )
+        loop = self._ensure_started()
+        loop.call_soon_threadsafe(self._enqueue, write)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every write submitted so far has been attempted."""
+        if not self.running:
+            return
+        asyncio.run_coroutine_threadsafe(self._flush(), self._loop).result(timeout)
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Drain the queue, close the connection and stop the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._close(), loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"Graphiti session shutdown incomplete: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+            self._loop = None
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Loop thread
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self.running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                self._wakeup = asyncio.Event()
+                self._write_lock = asyncio.Lock()
+                self._stopping = False
+                self._writer = loop.create_task(self._write_behind())
+                ready.set()
+                loop.run_forever()
+
+            self._thread = threading.Thread(
+                target=run_loop, name="graphiti-session", daemon=True
+            )
+            self._loop = loop
+            self._thread.start()
+            ready.wait()
+            return loop
+
+    def _enqueue(self, write: _QueuedWrite) -> None:
+        self._buffer.append(write)
+        if len(self._buffer) >= self.max_batch:
+            self._wakeup.set()
+
+    async def _write_behind(self) -> None:
+        """Flush on size (wakeup) or time (flush_interval), until stopped."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self._flush()
+
+    async def _flush(self) -> None:
+        async with self._write_lock:
+            while self._buffer:
+                batch = self._buffer[: self.max_batch]
+                del self._buffer[: self.max_batch]
+                await self._write_batch(batch)
+
+    async def _write_batch(self, batch: list[_QueuedWrite]) -> None:
+        for write in batch:
+            memory = await self._get_memory(write.spec_dir, write.project_dir)
+            if memory is None:
+                self.episodes_failed += 1
+                continue
+            try:
+                if await getattr(memory, write.method)(*write.args):
+                    self.episodes_written += 1
+                else:
+                    self.episodes_failed += 1
+            except Exception as e:
+                self.episodes_failed += 1
+                logger.warning(f"Graphiti {write.method} failed: {e}")
+                capture_exception(
+                    e,
+                    function="GraphitiSessionManager._write_batch",
+                    operation=write.method,
+                    spec_dir=str(write.spec_dir),
+                )
+        self.batches_flushed += 1
+
+    async def _get_memory(self, spec_dir: Path, project_dir: Path) -> Any:
+        key = (spec_dir, project_dir)
+        if key in self._memories:
+            return self._memories[key]
+        # A backend that just failed isn't retried for every queued write
+        failure = self._open_failures.get(key)
+        if failure is not None and time.monotonic() < failure[0]:
+            return None
+        try:
+            if self._client is None:
+                self._client = self._client_factory()
+            memory = await self._memory_factory(spec_dir, project_dir, self._client)
+        except Exception as e:
+            logger.warning(f"Failed to open Graphiti memory: {e}")
+            capture_exception(
+                e,
+                function="GraphitiSessionManager._get_memory",
+                spec_dir=str(spec_dir),
+                project_dir=str(project_dir),
+            )
+            memory = None
+
+        if memory is None:
+            # Back off rather than give up: the failure may be transient
+            backoff = OPEN_RETRY_INITIAL
+            if failure is not None:
+                backoff = min(failure[1] * 2, OPEN_RETRY_MAX)
+            self._open_failures[key] = (time.monotonic() + backoff, backoff)
+            return None
+
+        self._open_failures.pop(key, None)
+        self._memories[key] = memory
+        return memory
+
+    async def _close(self) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        await self._writer
+        await self._flush()
+        for memory in self._memories.values():
+            try:
+                await memory.close()
+            except Exception:
+                logger.debug("Failed to close Graphiti memory", exc_info=True)
+        self._memories.clear()
+        self._open_failures.clear()
+        if self._client is not None:
+            try:
+                await self._client.close()
+            except Exception:
+                logger.debug("Failed to close Graphiti client", exc_info=True)
+            self._client = None
+
+
+_manager: GraphitiSessionManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> GraphitiSessionManager:
+    """Get the process-wide session manager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = GraphitiSessionManager()
+        return _manager
+
+
+@atexit.register
+def shutdown_session_manager() -> None:
+    """Drain pending writes and close the shared connection (runs at exit)."""
+    global _manager
+    with _manager_lock:
+        manager, _manager = _manager, None
+    if manager is not None:
+        manager.shutdown()
@@ -9,7 +9,7 @@ Functions for managing code patterns and gotchas (pitfalls to avoid).
 import logging
 from pathlib import Path
 
-from .graphiti_helpers import get_graphiti_memory, is_graphiti_memory_enabled, run_async
+from .graphiti_helpers import is_graphiti_memory_enabled, queue_graphiti_write
 from .paths import get_memory_dir
 
 logger = logging.getLogger(__name__)
@@ -57,10 +57,7 @@ def append_gotcha(spec_dir: Path, gotcha: str) -> None:
         # Also save to Graphiti if enabled
         if is_graphiti_memory_enabled():
             try:
-                graphiti = run_async(get_graphiti_memory(spec_dir))
-                if graphiti:
-                    run_async(graphiti.save_gotcha(gotcha_stripped))
-                    run_async(graphiti.close())
+                queue_graphiti_write(spec_dir, "save_gotcha", gotcha_stripped)
             except Exception as e:
                 logger.warning(f"Graphiti gotcha save failed: {e}")
 
@@ -134,10 +131,7 @@ def append_pattern(spec_dir: Path, pattern: str) -> None:
         # Also save to Graphiti if enabled
         if is_graphiti_memory_enabled():
             try:
-                graphiti = run_async(get_graphiti_memory(spec_dir))
-                if graphiti:
-                    run_async(graphiti.save_pattern(pattern_stripped))
-                    run_async(graphiti.close())
+                queue_graphiti_write(spec_dir, "save_pattern", pattern_stripped)
             except Exception as e:
                 logger.warning(f"Graphiti pattern save failed: {e}")
 
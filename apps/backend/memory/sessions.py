@@ -12,11 +12,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from .graphiti_helpers import (
-    is_graphiti_memory_enabled,
-    run_async,
-    save_to_graphiti_async,
-)
+from .graphiti_helpers import is_graphiti_memory_enabled, queue_session_insights
 from .paths import get_session_insights_dir
 
 logger = logging.getLogger(__name__)
@@ -82,8 +78,8 @@ def save_session_insights(
     # Also save to Graphiti if enabled (non-blocking, errors logged but not raised)
     if is_graphiti_memory_enabled():
         try:
-            run_async(save_to_graphiti_async(spec_dir, session_num, session_data))
-            logger.info(f"Session {session_num} insights also saved to Graphiti")
+            queue_session_insights(spec_dir, session_num, session_data)
+            logger.info(f"Session {session_num} insights also queued for Graphiti")
         except Exception as e:
             # Don't fail the save if Graphiti fails - file-based is the primary storage
             logger.warning(f"Graphiti save failed (file-based save succeeded): {e}")
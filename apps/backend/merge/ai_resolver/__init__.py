@@ -10,6 +10,7 @@ minimal context to reduce token usage and cost.
 Components:
 - AIResolver: Main resolver class
 - ConflictContext: Minimal context for AI prompts
+- ResolutionCache: Content-addressed cache of AI resolutions
 - create_claude_resolver: Factory for Claude-based resolver
 
 Usage:
@@ -25,6 +26,7 @@ Usage:
     result = resolver.resolve_conflict(conflict, baseline_code, task_snapshots)
 """
 
+from .cache import ResolutionCache, conflict_cache_key
 from .claude_client import create_claude_resolver
 from .context import ConflictContext
 from .resolver import AIResolver
@@ -32,5 +34,7 @@ from .resolver import AIResolver
 __all__ = [
     "AIResolver",
     "ConflictContext",
+    "ResolutionCache",
+    "conflict_cache_key",
     "create_claude_resolver",
 ]
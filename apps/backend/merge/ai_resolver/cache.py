@@ -0,0 +1,179 @@
+"""
+Resolution Cache
+================
+
+Content-addressed cache of AI merge responses.
+
+Identical conflict regions recur across tasks and merge retries. This module
+keys each AI response by a hash of the normalized conflict (baseline code and
+the code each task wrote, in task order) plus the prompt version, so a
+repeated conflict is answered from memory instead of another AI call.
+
+Task ids and intents are deliberately left out of the key: two tasks making
+the same edits to the same code should get the same merge.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from .prompts import PROMPT_VERSION
+
+if TYPE_CHECKING:
+    from .context import ConflictContext
+
+# Maximum number of responses kept in memory
+MAX_CACHED_RESOLUTIONS = 256
+
+
+def normalize_code(code: str | None) -> str:
+    """
+    Normalize code so formatting noise doesn't defeat the cache.
+
+    Unifies line endings, strips trailing whitespace from each line and
+    drops leading/trailing blank lines.
+    """
+    if not code:
+        return ""
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def conflict_cache_key(
+    contexts: list[ConflictContext], prompt_version: int = PROMPT_VERSION
+) -> str:
+    """
+    Compute the cache key for one conflict or a batch of conflicts.
+
+    Args:
+        contexts: Contexts of the conflicts sent in one AI call, in order
+        prompt_version: Version of the prompt templates used
+
+    Returns:
+        Hex digest identifying the normalized conflict(s)
+    """
+    payload = {
+        "prompt_version": prompt_version,
+        "conflicts": [
+            {
+                "language": context.language,
+                "location": context.location,
+                "baseline": normalize_code(context.baseline_code),
+                "tasks": [
+                    [
+                        [
+                            change.change_type.value,
+                            change.target,
+                            normalize_code(change.content_before),
+                            normalize_code(change.content_after),
+                        ]
+                        for change in changes
+                    ]
+                    for _task_id, _intent, changes in context.task_changes
+                ],
+            }
+            for context in contexts
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class _KeyLock:
+    """A per-key lock and the number of threads holding or waiting on it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class ResolutionCache:
+    """
+    Bounded, thread-safe LRU of AI responses keyed by conflict_cache_key().
+
+    key_lock() gives a per-key lock so that concurrent resolutions of the
+    same conflict make one AI call: the first holder calls the AI and
+    stores the response, the others then find it in the cache. A key's
+    lock only exists while some thread holds or waits on it.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_RESOLUTIONS):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()  # Protects _entries and _key_locks
+        self._key_locks: dict[str, _KeyLock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for a key, or None."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response that parsed into a usable resolution."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @contextmanager
+    def key_lock(self, key: str) -> Iterator[None]:
+        """
+        Hold the lock serializing resolution of one conflict key.
+
+        The lock is dropped once its last user leaves, whether or not a
+        response was stored, so failed resolutions don't accumulate locks.
+        """
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = _KeyLock()
+            key_lock.users += 1
+        try:
+            with key_lock.lock:
+                yield
+        finally:
+            with self._lock:
+                key_lock.users -= 1
+                if key_lock.users == 0 and self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_shared_cache: ResolutionCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_resolution_cache() -> ResolutionCache:
+    """Get the process-wide cache shared by resolvers created for Claude."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResolutionCache()
+        return _shared_cache
@@ -30,6 +30,9 @@ def create_claude_resolver() -> AIResolver:
     - UTILITY_MODEL_ID: Full model ID (e.g., "claude-haiku-4-5-20251001")
     - UTILITY_THINKING_BUDGET: Thinking budget tokens (e.g., "1024")
 
+    Resolvers created here share one process-wide resolution cache, so a
+    conflict that recurs across tasks or merge retries is resolved once.
+
     Returns:
         Configured AIResolver instance
     """
@@ -37,6 +40,7 @@ def create_claude_resolver() -> AIResolver:
     from core.auth import ensure_claude_code_oauth_token, get_auth_token
     from core.model_config import get_utility_model_config
 
+    from .cache import get_shared_resolution_cache
     from .resolver import AIResolver
 
     if not get_auth_token():
@@ -103,4 +107,4 @@ def create_claude_resolver() -> AIResolver:
             return ""
 
     logger.info("Using Claude Agent SDK for merge resolution")
-    return AIResolver(ai_call_fn=call_claude)
+    return AIResolver(ai_call_fn=call_claude, cache=get_shared_resolution_cache())
@@ -10,6 +10,10 @@ in merging conflicting code changes.
 
 from __future__ import annotations
 
+# Version of the templates below. Bump it whenever a prompt changes so cached
+# resolutions produced by the old prompt are no longer reused.
+PROMPT_VERSION = 1
+
 # System prompt for the AI
 SYSTEM_PROMPT = "You are an expert code merge assistant. Be concise and precise."
 
@@ -6,12 +6,20 @@ Core conflict resolution logic using AI.
 
 This module provides the AIResolver class that coordinates the
 resolution of conflicts using AI with minimal context.
+
+Conflicts in different files are resolved concurrently (up to
+max_concurrency AI calls in flight); conflicts within one file are always
+resolved in order by a single worker. With a ResolutionCache, a conflict
+whose normalized content was already resolved is answered without an AI call.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 from ..types import (
     ConflictRegion,
@@ -21,6 +29,7 @@ from ..types import (
     MergeStrategy,
     TaskSnapshot,
 )
+from .cache import ResolutionCache, conflict_cache_key
 from .context import ConflictContext
 from .language_utils import infer_language, locations_overlap
 from .parsers import extract_batch_code_blocks, extract_code_block
@@ -35,6 +44,11 @@ logger = logging.getLogger(__name__)
 # Type for the AI call function
 AICallFunction = Callable[[str, str], str]
 
+# Default number of files resolved concurrently
+MAX_CONCURRENT_RESOLUTIONS = 4
+
+_Parsed = TypeVar("_Parsed")
+
 
 class AIResolver:
     """
@@ -58,6 +72,8 @@ class AIResolver:
         self,
         ai_call_fn: AICallFunction | None = None,
         max_context_tokens: int = MAX_CONTEXT_TOKENS,
+        cache: ResolutionCache | None = None,
+        max_concurrency: int = MAX_CONCURRENT_RESOLUTIONS,
     ):
         """
         Initialize the AI resolver.
@@ -65,12 +81,21 @@ class AIResolver:
         Args:
             ai_call_fn: Function that calls AI. Signature: (system_prompt, user_prompt) -> response
                         If None, uses a stub that requires explicit calls.
+                        Must be safe to call from several threads when
+                        max_concurrency > 1.
             max_context_tokens: Maximum tokens to include in context
+            cache: Optional cache of AI responses for repeated conflicts
+                   (may be shared between resolvers)
+            max_concurrency: Maximum number of files resolved at once
         """
         self.ai_call_fn = ai_call_fn
         self.max_context_tokens = max_context_tokens
+        self.cache = cache
+        self.max_concurrency = max(1, max_concurrency)
+        self._stats_lock = threading.Lock()
         self._call_count = 0
         self._total_tokens = 0
+        self._cache_hits = 0
 
     def set_ai_function(self, ai_call_fn: AICallFunction) -> None:
         """Set the AI call function after initialization."""
@@ -79,15 +104,63 @@ class AIResolver:
     @property
     def stats(self) -> dict[str, int]:
         """Get usage statistics."""
-        return {
-            "calls_made": self._call_count,
-            "estimated_tokens_used": self._total_tokens,
-        }
+        with self._stats_lock:
+            return {
+                "calls_made": self._call_count,
+                "estimated_tokens_used": self._total_tokens,
+                "cache_hits": self._cache_hits,
+            }
 
     def reset_stats(self) -> None:
         """Reset usage statistics."""
-        self._call_count = 0
-        self._total_tokens = 0
+        with self._stats_lock:
+            self._call_count = 0
+            self._total_tokens = 0
+            self._cache_hits = 0
+
+    def _call_ai(self, prompt: str, context_tokens: int) -> str:
+        """Call the AI function and record usage."""
+        response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
+        with self._stats_lock:
+            self._call_count += 1
+            self._total_tokens += context_tokens + len(response) // 4
+        return response
+
+    def _complete(
+        self,
+        contexts: list[ConflictContext],
+        prompt: str,
+        context_tokens: int,
+        parse: Callable[[str], _Parsed],
+    ) -> tuple[str, _Parsed, bool]:
+        """
+        Get a parsed AI response for a prompt, using the cache when possible.
+
+        Only responses that parse into something truthy are cached, so an
+        unusable answer is retried next time.
+
+        Returns:
+            Tuple of (response, parsed response, whether it came from the cache)
+        """
+        if self.cache is None:
+            response = self._call_ai(prompt, context_tokens)
+            return response, parse(response), False
+
+        key = conflict_cache_key(contexts)
+        # Hold the key's lock across the AI call so a concurrent resolution
+        # of the same conflict waits for this answer instead of asking again
+        with self.cache.key_lock(key):
+            response = self.cache.get(key)
+            if response is not None:
+                with self._stats_lock:
+                    self._cache_hits += 1
+                return response, parse(response), True
+
+            response = self._call_ai(prompt, context_tokens)
+            parsed = parse(response)
+            if parsed:
+                self.cache.put(key, response)
+            return response, parsed, False
 
     def build_context(
         self,
@@ -198,14 +271,22 @@ class AIResolver:
         # Call AI
         try:
             logger.info(f"Calling AI to resolve conflict in {conflict.file_path}")
-            response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
-            self._call_count += 1
-            self._total_tokens += context.estimated_tokens + len(response) // 4
-
-            # Parse response
-            merged_code = extract_code_block(response, context.language)
+            _, merged_code, cached = self._complete(
+                [context],
+                prompt,
+                context.estimated_tokens,
+                lambda response: extract_code_block(response, context.language),
+            )
 
-            if merged_code:
+            if merged_code and cached:
+                return MergeResult(
+                    decision=MergeDecision.AI_MERGED,
+                    file_path=conflict.file_path,
+                    merged_content=merged_code,
+                    conflicts_resolved=[conflict],
+                    explanation=f"Reused cached AI resolution at {conflict.location}",
+                )
+            elif merged_code:
                 return MergeResult(
                     decision=MergeDecision.AI_MERGED,
                     file_path=conflict.file_path,
@@ -245,6 +326,10 @@ class AIResolver:
         """
         Resolve multiple conflicts.
 
+        Files are resolved concurrently (up to max_concurrency at once);
+        the conflicts of one file are resolved in order by one worker.
+        Results are returned in the same order regardless of timing.
+
         Args:
             conflicts: List of conflicts to resolve
             baseline_codes: Map of location -> baseline code
@@ -252,42 +337,57 @@ class AIResolver:
             batch: Whether to batch conflicts (reduces API calls)
 
         Returns:
-            List of MergeResults
+            List of MergeResults - one per file when batching (in order of
+            each file's first conflict), otherwise one per conflict in input
+            order
         """
-        results = []
-
-        if batch and len(conflicts) > 1:
-            # Try to batch conflicts from the same file
-            by_file: dict[str, list[ConflictRegion]] = {}
-            for conflict in conflicts:
-                if conflict.file_path not in by_file:
-                    by_file[conflict.file_path] = []
-                by_file[conflict.file_path].append(conflict)
-
-            for file_path, file_conflicts in by_file.items():
-                if len(file_conflicts) == 1:
-                    # Single conflict, resolve individually
-                    baseline = baseline_codes.get(file_conflicts[0].location, "")
-                    results.append(
-                        self.resolve_conflict(
-                            file_conflicts[0], baseline, task_snapshots
-                        )
-                    )
-                else:
-                    # Multiple conflicts in same file - batch resolve
-                    result = self._resolve_file_batch(
-                        file_path, file_conflicts, baseline_codes, task_snapshots
-                    )
-                    results.append(result)
-        else:
-            # Resolve each individually
-            for conflict in conflicts:
-                baseline = baseline_codes.get(conflict.location, "")
-                results.append(
-                    self.resolve_conflict(conflict, baseline, task_snapshots)
+        batch = batch and len(conflicts) > 1
+
+        # Group by file, remembering each conflict's input position
+        by_file: dict[str, list[tuple[int, ConflictRegion]]] = {}
+        for index, conflict in enumerate(conflicts):
+            by_file.setdefault(conflict.file_path, []).append((index, conflict))
+
+        def resolve_file(
+            file_path: str, file_conflicts: list[tuple[int, ConflictRegion]]
+        ) -> list[tuple[int, MergeResult]]:
+            if batch and len(file_conflicts) > 1:
+                # Multiple conflicts in same file - batch resolve
+                result = self._resolve_file_batch(
+                    file_path,
+                    [conflict for _, conflict in file_conflicts],
+                    baseline_codes,
+                    task_snapshots,
+                )
+                return [(file_conflicts[0][0], result)]
+            # Resolve each individually, in file order
+            return [
+                (
+                    index,
+                    self.resolve_conflict(
+                        conflict,
+                        baseline_codes.get(conflict.location, ""),
+                        task_snapshots,
+                    ),
                 )
+                for index, conflict in file_conflicts
+            ]
 
-        return results
+        groups = list(by_file.items())
+        if self.max_concurrency == 1 or len(groups) <= 1:
+            file_results = [resolve_file(*group) for group in groups]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(groups)),
+                thread_name_prefix="ai-resolver",
+            ) as executor:
+                file_results = list(executor.map(lambda g: resolve_file(*g), groups))
+
+        ordered = sorted(
+            (item for items in file_results for item in items),
+            key=lambda item: item[0],
+        )
+        return [result for _, result in ordered]
 
     def _resolve_file_batch(
         self,
@@ -350,26 +450,24 @@ class AIResolver:
             language=language,
         )
 
-        try:
-            response = self.ai_call_fn(SYSTEM_PROMPT, batch_prompt)
-            self._call_count += 1
-            self._total_tokens += total_tokens + len(response) // 4
-
+        def find_resolved(response: str) -> list[ConflictRegion]:
             # Parse batch response
             # This is a simplified parser - production would be more robust
-            resolved = []
-            remaining = []
-
-            for conflict in conflicts:
+            return [
+                conflict
+                for conflict in conflicts
                 # Try to find the resolution for this location
-                code_block = extract_batch_code_blocks(
-                    response, conflict.location, language
-                )
+                if extract_batch_code_blocks(response, conflict.location, language)
+            ]
 
-                if code_block:
-                    resolved.append(conflict)
-                else:
-                    remaining.append(conflict)
+        try:
+            response, resolved, cached = self._complete(
+                all_contexts, batch_prompt, total_tokens, find_resolved
+            )
+            resolved_ids = {id(conflict) for conflict in resolved}
+            remaining = [c for c in conflicts if id(c) not in resolved_ids]
+            ai_calls_made = 0 if cached else 1
+            tokens_used = 0 if cached else total_tokens
 
             # Return combined result
             if resolved:
@@ -381,8 +479,8 @@ class AIResolver:
                     merged_content=response,  # Full response for manual extraction
                     conflicts_resolved=resolved,
                     conflicts_remaining=remaining,
-                    ai_calls_made=1,
-                    tokens_used=total_tokens,
+                    ai_calls_made=ai_calls_made,
+                    tokens_used=tokens_used,
                     explanation=f"Batch resolved {len(resolved)}/{len(conflicts)} conflicts",
                 )
             else:
@@ -391,8 +489,8 @@ class AIResolver:
                     file_path=file_path,
                     explanation="Could not parse batch AI response",
                     conflicts_remaining=conflicts,
-                    ai_calls_made=1,
-                    tokens_used=total_tokens,
+                    ai_calls_made=ai_calls_made,
+                    tokens_used=tokens_used,
                 )
 
         except Exception as e:
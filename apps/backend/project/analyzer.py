@@ -6,11 +6,14 @@ Orchestrates project analysis to build dynamic security profiles.
 Coordinates stack detection, framework detection, and structure analysis.
 """
 
+import fnmatch
 import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
 
+from core.fingerprint import ProjectFingerprinter
+
 from .command_registry import (
     BASE_COMMANDS,
     CLOUD_COMMANDS,
@@ -87,7 +90,10 @@ class ProjectAnalyzer:
         """
         Compute a hash of key project files to detect changes.
 
-        This allows us to know when to re-analyze.
+        This allows us to know when to re-analyze. Files are identified via
+        core.fingerprint (git object IDs for tracked files, stat data for
+        untracked ones), so checkouts and worktrees that only change mtimes
+        don't force a re-analysis.
         """
         hash_files = [
             # JavaScript/TypeScript
@@ -139,52 +145,38 @@ class ProjectAnalyzer:
             "*.vbproj",  # VB.NET projects
         ]
 
-        hasher = hashlib.md5(usedforsecurity=False)
-        files_found = 0
-
-        for filename in hash_files:
-            filepath = self.project_dir / filename
-            if filepath.exists():
-                try:
-                    stat = filepath.stat()
-                    hasher.update(f"{filename}:{stat.st_mtime}:{stat.st_size}".encode())
-                    files_found += 1
-                except OSError:
-                    continue
-
-        # Check glob patterns for project files that can be anywhere
-        for pattern in glob_patterns:
-            for filepath in self.project_dir.glob(f"**/{pattern}"):
-                try:
-                    stat = filepath.stat()
-                    rel_path = filepath.relative_to(self.project_dir)
-                    hasher.update(f"{rel_path}:{stat.st_mtime}:{stat.st_size}".encode())
-                    files_found += 1
-                except OSError:
-                    continue
-
-        # If no config files found, hash the project directory structure
-        # to at least detect when files are added/removed
-        if files_found == 0:
-            # Count source files as a proxy for project structure
-            source_exts = [
-                "*.py",
-                "*.js",
-                "*.ts",
-                "*.go",
-                "*.rs",
-                "*.dart",
-                "*.cs",
-                "*.swift",
-                "*.kt",
-                "*.java",
-            ]
-            for ext in source_exts:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
-                hasher.update(f"{ext}:{count}".encode())
-            # Also include the project directory name for uniqueness
-            hasher.update(self.project_dir.name.encode())
+        fingerprinter = ProjectFingerprinter(self.project_dir)
+
+        # Root config files plus project files that can be anywhere in the tree
+        config_files = [f for f in hash_files if fingerprinter.token(f) is not None]
+        config_files += fingerprinter.list_files(
+            match=lambda path: any(
+                fnmatch.fnmatch(path.rsplit("/", 1)[-1], pattern)
+                for pattern in glob_patterns
+            )
+        )
+        if config_files:
+            return fingerprinter.fingerprint(config_files).digest
 
+        # If no config files found, hash the set of source file paths
+        # to at least detect when files are added/removed
+        source_exts = (
+            ".py",
+            ".js",
+            ".ts",
+            ".go",
+            ".rs",
+            ".dart",
+            ".cs",
+            ".swift",
+            ".kt",
+            ".java",
+        )
+        hasher = hashlib.sha256()
+        for path in fingerprinter.list_files(match=lambda p: p.endswith(source_exts)):
+            hasher.update(f"{path}\n".encode())
+        # Also include the project directory name for uniqueness
+        hasher.update(self.project_dir.name.encode())
         return hasher.hexdigest()
 
     def should_reanalyze(self, profile: SecurityProfile) -> bool:
@@ -0,0 +1,708 @@
+"""
+File Excerpts
+=============
+
+Region-aware excerpts of the files a subtask names, for the coder prompt.
+
+load_subtask_context() used to read each file in full and keep its leading
+lines, on every session and retry. Large files were cut off before the code
+the subtask is about. Excerpts are now built from a file outline: the
+top-level symbols (plus the methods of classes) and their line ranges,
+parsed with ast for Python and with a brace-depth scanner for TypeScript
+and JavaScript. Outlines are cached per file and re-parsed only when the
+file's mtime, size or inode changes.
+
+An excerpt stays within a token budget (estimated at 4 characters per
+token) and takes, in order:
+
+1. The file header (module docstring, imports), capped at a quarter of
+   the budget
+2. The symbols the subtask references by name, explicit references
+   (`backticked`, CamelCase, snake_case, called or dotted names) before
+   plain words; a class too large to fit keeps its signature and the
+   referenced methods
+3. With no referenced symbols, the leading code, as before
+4. An outline of the omitted classes and functions with their line ranges
+
+Files that fit the budget are included whole; other languages get their
+leading lines.
+
+Usage:
+    from prompts_pkg.file_excerpts import excerpt_file, referenced_symbols
+
+    explicit, plain = referenced_symbols(subtask)
+    text = excerpt_file(project_dir / "app/models.py", explicit, plain, 2000)
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_MAX_TOKENS = 2000
+
+# Rough estimate: 4 chars per token for code
+CHARS_PER_TOKEN = 4
+
+# Parts of the budget the header and the omitted-symbol outline may take
+HEADER_SHARE = 0.25
+OUTLINE_SHARE = 0.15
+
+# Cached outlines (with their file's lines) are evicted beyond this size
+MAX_CACHED_BYTES = 32 * 1024 * 1024
+
+PYTHON_SUFFIXES = frozenset({".py", ".pyi"})
+SCRIPT_SUFFIXES = frozenset({".ts", ".tsx", ".mts", ".cts", ".js", ".jsx", ".mjs", ".cjs"})  # fmt: skip
+
+# Subtask fields whose text may name the symbols it is about
+SUBTASK_TEXT_FIELDS = ("description", "details", "notes", "verification")
+
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+# `code` spans, Dotted.names and call( sites
+_BACKTICKED = re.compile(r"`([^`]+)`")
+_DOTTED_OR_CALLED = re.compile(r"[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)+|[A-Za-z_$][\w$]*(?=\()")  # fmt: skip
+_CAMEL_OR_SNAKE = re.compile(r"^(?:_*[a-z0-9]+_[\w]*|[A-Za-z]*[a-z][A-Z]\w*|[A-Z][a-z0-9]+[A-Z]\w*)$")  # fmt: skip
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of text (4 characters per token, rounded up)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+# =============================================================================
+# Outlines
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A declaration and the lines it spans (1-based, inclusive)."""
+
+    name: str
+    kind: str  # "class", "function", "variable", "interface", "type", ...
+    start: int  # First line, including decorators and leading comments
+    end: int
+    children: tuple[Symbol, ...] = ()
+
+
+@dataclass(frozen=True)
+class FileOutline:
+    """A file's lines and top-level symbols."""
+
+    path: Path
+    language: str | None  # "python", "script" or None (no outline)
+    lines: tuple[str, ...] = field(repr=False)
+    header_end: int  # Last line of the leading docstring/imports, 0 if none
+    symbols: tuple[Symbol, ...]
+
+    @functools.cached_property
+    def size(self) -> int:
+        """Characters in the file, with "\\n" line endings."""
+        return sum(len(line) + 1 for line in self.lines) - 1
+
+    @functools.cached_property
+    def name_index(self) -> dict[str, list[int]]:
+        """Lowercased symbol and method names -> indexes into symbols."""
+        index: dict[str, list[int]] = {}
+        for position, symbol in enumerate(self.symbols):
+            for name in {symbol.name, *(child.name for child in symbol.children)}:
+                index.setdefault(name.lower(), []).append(position)
+        return index
+
+
+def outline_source(path: Path, text: str) -> FileOutline:
+    """
+    Outline source text as if it were the file at path (not cached).
+
+    Args:
+        path: File path; its suffix selects the language
+        text: The file's contents
+
+    Returns:
+        FileOutline; languages without a parser get no symbols
+    """
+    lines = tuple(text.replace("\r\n", "\n").replace("\r", "\n").split("\n"))
+    suffix = Path(path).suffix.lower()
+    if suffix in PYTHON_SUFFIXES:
+        language = "python"
+        header_end, symbols = _outline_python(lines)
+    elif suffix in SCRIPT_SUFFIXES:
+        language = "script"
+        header_end, symbols = _outline_script(lines)
+    else:
+        language, header_end, symbols = None, 0, ()
+    return FileOutline(Path(path), language, lines, header_end, tuple(symbols))
+
+
+_outlines: OrderedDict[Path, tuple[tuple[int, int, int], FileOutline]] = OrderedDict()
+_outlines_bytes = 0
+_outlines_lock = threading.Lock()
+
+
+def get_file_outline(path: Path) -> FileOutline:
+    """
+    Get a file's outline from the process-wide cache, parsing it if needed.
+
+    Entries are keyed by resolved path and checked against the file's mtime,
+    size and inode, so edits are picked up.
+
+    Raises:
+        OSError: If the file can't be read
+        UnicodeDecodeError: If the file isn't UTF-8
+    """
+    global _outlines_bytes
+    path = Path(path).resolve()
+    stat = os.stat(path)
+    identity = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    with _outlines_lock:
+        cached = _outlines.get(path)
+        if cached is not None and cached[0] == identity:
+            _outlines.move_to_end(path)
+            return cached[1]
+
+    outline = outline_source(path, path.read_text(encoding="utf-8"))
+
+    with _outlines_lock:
+        previous = _outlines.pop(path, None)
+        if previous is not None:
+            _outlines_bytes -= previous[1].size
+        _outlines[path] = (identity, outline)
+        _outlines_bytes += outline.size
+        while _outlines_bytes > MAX_CACHED_BYTES and len(_outlines) > 1:
+            _, (_, evicted) = _outlines.popitem(last=False)
+            _outlines_bytes -= evicted.size
+    return outline
+
+
+def clear_outline_cache() -> None:
+    """Drop every cached outline (for tests and long-lived processes)."""
+    global _outlines_bytes
+    with _outlines_lock:
+        _outlines.clear()
+        _outlines_bytes = 0
+
+
+def _extend_over_comments(lines: tuple[str, ...], start: int, prefixes) -> int:
+    """Move a 1-based start line up over the comment lines directly above it."""
+    while start > 1 and lines[start - 2].lstrip().startswith(prefixes):
+        start -= 1
+    return start
+
+
+# --- Python ------------------------------------------------------------------
+
+
+def _outline_python(lines: tuple[str, ...]) -> tuple[int, list[Symbol]]:
+    try:
+        module = ast.parse("\n".join(lines))
+    except (SyntaxError, ValueError):
+        # Mid-edit files still get an outline
+        return _outline_python_by_indent(lines)
+
+    header_end = 0
+    symbols = []
+    in_header = True
+    for index, node in enumerate(module.body):
+        if in_header and _is_python_header(node, index):
+            header_end = node.end_lineno
+            continue
+        in_header = False
+        symbol = _python_symbol(lines, node)
+        if symbol is not None:
+            symbols.append(symbol)
+    return header_end, symbols
+
+
+def _is_python_header(node: ast.stmt, index: int) -> bool:
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return True
+    if index == 0 and isinstance(node, ast.Expr):
+        return isinstance(node.value, ast.Constant) and isinstance(
+            node.value.value, str
+        )
+    # try: import x / except ImportError, if TYPE_CHECKING: import y
+    if isinstance(node, (ast.Try, ast.If)):
+        return all(isinstance(n, (ast.Import, ast.ImportFrom)) for n in node.body)
+    return False
+
+
+def _python_symbol(lines: tuple[str, ...], node: ast.stmt) -> Symbol | None:
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        start = min([d.lineno for d in node.decorator_list] + [node.lineno])
+        start = _extend_over_comments(lines, start, "#")
+        children = ()
+        if isinstance(node, ast.ClassDef):
+            children = tuple(
+                child
+                for child in (_python_symbol(lines, n) for n in node.body)
+                if child is not None and child.kind == "function"
+            )
+        kind = "class" if isinstance(node, ast.ClassDef) else "function"
+        return Symbol(node.name, kind, start, node.end_lineno, children)
+
+    targets = []
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, ast.AnnAssign):
+        targets = [node.target]
+    names = [t.id for t in targets if isinstance(t, ast.Name)]
+    if names:
+        start = _extend_over_comments(lines, node.lineno, "#")
+        return Symbol(names[0], "variable", start, node.end_lineno)
+    return None
+
+
+_PY_DEF = re.compile(r"^(?:async\s+def|def|class)\s+(\w+)")
+
+
+def _outline_python_by_indent(lines: tuple[str, ...]) -> tuple[int, list[Symbol]]:
+    """Top-level defs and classes of unparsable code, ended by dedent."""
+    symbols = []
+    starts = [i for i, line in enumerate(lines) if _PY_DEF.match(line)]
+    for position, index in enumerate(starts):
+        limit = starts[position + 1] if position + 1 < len(starts) else len(lines)
+        end = index
+        for j in range(index + 1, limit):
+            line = lines[j]
+            if line.strip() and not line[0].isspace() and not line.startswith("#"):
+                if not line.startswith((")", "]", "}")):
+                    break
+            if line.strip():
+                end = j
+        # Decorators above a def belong to it
+        start = index
+        while start > 0 and lines[start - 1].startswith("@"):
+            start -= 1
+        start = _extend_over_comments(lines, start + 1, "#")
+        kind = "class" if lines[index].startswith("class") else "function"
+        symbols.append(
+            Symbol(_PY_DEF.match(lines[index]).group(1), kind, start, end + 1)
+        )
+    return 0, symbols
+
+
+# --- TypeScript / JavaScript -------------------------------------------------
+
+
+_SCRIPT_DECLARATION = re.compile(
+    r"^(?:export\s+(?:default\s+)?)?(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?"
+    r"(?P<kind>function\s*\*?|class|interface|type|const\s+enum|enum|const|let|var"
+    r"|namespace|module)\s+(?P<name>[A-Za-z_$][\w$]*)"
+)
+_SCRIPT_FUNCTION_VALUE = re.compile(
+    r"=\s*(?:async\s+)?(?:function\b|(?:\([^)]*\)|[A-Za-z_$][\w$]*)\s*(?::[^=]+)?=>)"
+)
+_SCRIPT_MEMBER = re.compile(
+    r"^\s+(?:(?:public|private|protected|static|readonly|abstract|override|async"
+    r"|get|set|declare)\s+)*\*?\s*(?P<name>#?[A-Za-z_$][\w$]*)\s*(?:<[^>]*>)?\s*\("
+)
+_SCRIPT_NOT_MEMBERS = frozenset(
+    {"if", "for", "while", "switch", "catch", "return", "function", "await", "new"}
+)
+_SCRIPT_HEADER = re.compile(
+    r"""^(?:import\b|export\s+(?:\*|\{[^}]*\}?)\s*(?:as\s+\w+\s+)?from\b"""
+    r"""|export\s+\{|//|/\*|\*|['"]use \w+['"]|#!)"""
+)
+_SCRIPT_COMMENT_PREFIXES = ("//", "/*", "*", "@")
+_SCRIPT_KINDS = {
+    "class": "class",
+    "interface": "interface",
+    "type": "type",
+    "enum": "enum",
+    "const enum": "enum",
+    "namespace": "namespace",
+    "module": "namespace",
+}
+
+
+_SCRIPT_TOKEN = re.compile(r"""//|/\*|\*/|\\.|['"`()\[\]{}]""")
+
+
+def _bracket_depths(lines: tuple[str, ...]) -> tuple[list[int], list[int]]:
+    """
+    Nesting depth of (), [] and {} at the start and end of every line.
+
+    Brackets inside strings, template literals and comments are ignored.
+    """
+    starts, ends = [], []
+    depth = 0
+    state = None  # None, "'", '"', "`" or "/*"
+    for line in lines:
+        starts.append(depth)
+        for match in _SCRIPT_TOKEN.finditer(line):
+            token = match.group()
+            if state == "/*":
+                if token == "*/":
+                    state = None
+            elif state is not None:
+                # Escapes are whole tokens, so a match here is the closing quote
+                if token == state:
+                    state = None
+            elif token == "//":
+                break
+            elif token == "/*":
+                state = "/*"
+            elif token in ("'", '"', "`"):
+                state = token
+            elif token in ("(", "[", "{"):
+                depth += 1
+            elif token in (")", "]", "}"):
+                depth = max(depth - 1, 0)
+        if state in ("'", '"'):
+            # Unterminated quote; these don't continue onto the next line
+            state = None
+        ends.append(depth)
+    return starts, ends
+
+
+def _statement_end(
+    lines: tuple[str, ...], ends: list[int], index: int, base: int, stop: int
+) -> int:
+    """0-based last line of the statement starting at index, at depth base."""
+    opened = False
+    for j in range(index, stop):
+        opened = opened or ends[j] > base or any(c in lines[j] for c in "({[")
+        if ends[j] > base:
+            continue
+        stripped = lines[j].rstrip()
+        if base > 0:
+            if opened or stripped.endswith(";"):
+                return j
+            continue
+        following = next((k for k in range(j + 1, stop) if lines[k].strip()), None)
+        if following is None:
+            return j
+        first = lines[following][0]
+        if not first.isspace() and first not in ".?:|&)]}":
+            return j
+    return max(index, stop - 1)
+
+
+def _outline_script(lines: tuple[str, ...]) -> tuple[int, list[Symbol]]:
+    starts, ends = _bracket_depths(lines)
+    total = len(lines)
+
+    # Imports and directives; comments only count when an import follows
+    header_end = 0
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if starts[i] > 0 or not stripped:
+            continue
+        if not _SCRIPT_HEADER.match(stripped):
+            break
+        if not stripped.startswith(_SCRIPT_COMMENT_PREFIXES):
+            header_end = _statement_end(lines, ends, i, 0, total) + 1
+
+    symbols = []
+    i = header_end
+    while i < total:
+        line = lines[i]
+        match = _SCRIPT_DECLARATION.match(line) if starts[i] == 0 else None
+        if match is None:
+            i += 1
+            continue
+        end = _statement_end(lines, ends, i, 0, total)
+        keyword = " ".join(match.group("kind").replace("*", "").split())
+        if keyword.startswith("function"):
+            kind = "function"
+        elif keyword in _SCRIPT_KINDS:
+            kind = _SCRIPT_KINDS[keyword]
+        else:
+            kind = "function" if _SCRIPT_FUNCTION_VALUE.search(line) else "variable"
+        children = ()
+        if kind == "class":
+            children = tuple(_script_members(lines, starts, ends, i + 1, end))
+        start = _extend_over_comments(lines, i + 1, _SCRIPT_COMMENT_PREFIXES)
+        symbols.append(Symbol(match.group("name"), kind, start, end + 1, children))
+        i = end + 1
+    return header_end, symbols
+
+
+def _script_members(
+    lines: tuple[str, ...], starts: list[int], ends: list[int], first: int, last: int
+) -> list[Symbol]:
+    """Methods of the class whose body spans lines first..last (0-based)."""
+    members = []
+    i = first
+    while i < last:
+        match = _SCRIPT_MEMBER.match(lines[i]) if starts[i] == 1 else None
+        if match is None or match.group("name") in _SCRIPT_NOT_MEMBERS:
+            i += 1
+            continue
+        end = _statement_end(lines, ends, i, 1, last)
+        start = _extend_over_comments(lines, i + 1, _SCRIPT_COMMENT_PREFIXES)
+        members.append(Symbol(match.group("name"), "function", start, end + 1))
+        i = end + 1
+    return members
+
+
+# =============================================================================
+# Excerpts
+# =============================================================================
+
+
+def referenced_symbols(subtask: dict) -> tuple[set[str], set[str]]:
+    """
+    Names a subtask's text may refer to, split by how explicit they are.
+
+    Args:
+        subtask: Implementation plan subtask
+
+    Returns:
+        (explicit, plain): explicit names are backticked, CamelCase,
+        snake_case, dotted or followed by "("; plain are other words of 3+
+        characters
+    """
+    texts = []
+
+    def collect(value) -> None:
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+
+    for key in SUBTASK_TEXT_FIELDS:
+        collect(subtask.get(key))
+    text = "\n".join(texts)
+
+    explicit = set()
+    for span in _BACKTICKED.findall(text) + _DOTTED_OR_CALLED.findall(text):
+        explicit.update(_IDENTIFIER.findall(span))
+    plain = set()
+    for word in _IDENTIFIER.findall(text):
+        if _CAMEL_OR_SNAKE.match(word):
+            explicit.add(word)
+        elif len(word) >= 3:
+            plain.add(word)
+    return explicit, plain - explicit
+
+
+class _Excerpt:
+    """Line ranges chosen from an outline, rendered within a budget."""
+
+    def __init__(self, outline: FileOutline, max_tokens: int, max_lines: int | None):
+        self.outline = outline
+        self.max_tokens = max_tokens
+        self.max_lines = max_lines
+        self.ranges: list[tuple[int, int]] = []
+
+    def covered(self, line: int) -> bool:
+        return any(start <= line <= end for start, end in self.ranges)
+
+    def render(self, ranges: list[tuple[int, int]] | None = None) -> str:
+        ranges = sorted(self.ranges if ranges is None else ranges)
+        lines = self.outline.lines
+        out = []
+        shown = 0
+        for start, end in ranges:
+            if end <= shown:
+                continue
+            start = max(start, shown + 1)
+            if start > shown + 1:
+                out.append(f"... (lines {shown + 1}-{start - 1} omitted)")
+            out.extend(lines[start - 1 : end])
+            shown = end
+        if shown < len(lines):
+            out.append(f"... (lines {shown + 1}-{len(lines)} omitted)")
+        return "\n".join(out)
+
+    def fits(self, ranges: list[tuple[int, int]], max_tokens: float) -> bool:
+        text = self.render(ranges)
+        if self.max_lines is not None and text.count("\n") + 1 > self.max_lines:
+            return False
+        return estimate_tokens(text) <= max_tokens
+
+    def add(self, start: int, end: int, max_tokens: float) -> bool:
+        """Add lines start..end if the excerpt still fits max_tokens."""
+        if start > end:
+            return False
+        candidate = [*self.ranges, (start, end)]
+        if not self.fits(candidate, max_tokens):
+            return False
+        self.ranges = candidate
+        return True
+
+    def add_prefix(self, start: int, end: int, max_tokens: float) -> int:
+        """Add as many leading lines of start..end as fit; returns the last."""
+        if self.add(start, end, max_tokens):
+            return end
+        low, high = start - 1, end - 1  # Largest fitting last line is in here
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.fits([*self.ranges, (start, middle)], max_tokens):
+                low = middle
+            else:
+                high = middle - 1
+        if low >= start:
+            self.ranges.append((start, low))
+        return low
+
+
+def _trim_blank_tail(lines: tuple[str, ...], start: int, end: int) -> int:
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    return end
+
+
+def excerpt_file(
+    path: Path,
+    symbols: Iterable[str] = (),
+    weak_symbols: Iterable[str] = (),
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    max_lines: int | None = None,
+) -> str:
+    """
+    Excerpt a file for a prompt, focused on the given symbols.
+
+    Args:
+        path: File to excerpt
+        symbols: Names to focus on
+        weak_symbols: Names to include after those, only where whole
+            symbols still fit (e.g. the plain words of referenced_symbols())
+        max_tokens: Token budget of the excerpt
+        max_lines: Optional limit on the excerpt's lines
+
+    Returns:
+        The whole file if it fits, otherwise an excerpt with omitted line
+        ranges marked
+
+    Raises:
+        OSError: If the file can't be read
+        UnicodeDecodeError: If the file isn't UTF-8
+    """
+    return excerpt_outline(
+        get_file_outline(path), symbols, weak_symbols, max_tokens, max_lines
+    )
+
+
+def excerpt_outline(
+    outline: FileOutline,
+    symbols: Iterable[str] = (),
+    weak_symbols: Iterable[str] = (),
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    max_lines: int | None = None,
+) -> str:
+    """excerpt_file() for an already parsed outline."""
+    explicit = set(symbols)
+    plain = set(weak_symbols) - explicit
+
+    lines = outline.lines
+    fits_lines = max_lines is None or len(lines) <= max_lines
+    if fits_lines and -(-outline.size // CHARS_PER_TOKEN) <= max_tokens:
+        return "\n".join(lines)
+    excerpt = _Excerpt(outline, max_tokens, max_lines)
+
+    content_budget = max_tokens * (1 - OUTLINE_SHARE) if outline.symbols else max_tokens
+
+    # 1. Header
+    if outline.header_end:
+        excerpt.add_prefix(1, outline.header_end, max_tokens * HEADER_SHARE)
+
+    header_ranges = len(excerpt.ranges)
+
+    # 2. Referenced symbols, the strong references first
+    for wanted in (explicit, plain):
+        lowered = {name.lower() for name in wanted}
+        hits = {i for name in lowered for i in outline.name_index.get(name, ())}
+        for symbol in (outline.symbols[i] for i in sorted(hits)):
+            children = [c for c in symbol.children if c.name.lower() in lowered]
+            if symbol.name.lower() in lowered and not excerpt.covered(symbol.start):
+                if excerpt.add(symbol.start, symbol.end, content_budget):
+                    continue
+                if wanted is plain:
+                    continue
+                if not symbol.children:
+                    excerpt.add_prefix(symbol.start, symbol.end, content_budget)
+                    continue
+            if children:
+                # The class's signature (up to its first method), then methods
+                body_start = symbol.children[0].start - 1
+                signature_end = _trim_blank_tail(lines, symbol.start, body_start)
+                if not excerpt.covered(symbol.start):
+                    excerpt.add_prefix(symbol.start, signature_end, content_budget)
+                for child in children:
+                    if excerpt.covered(child.start):
+                        continue
+                    if not excerpt.add(child.start, child.end, content_budget):
+                        if wanted is explicit:
+                            excerpt.add_prefix(child.start, child.end, content_budget)
+
+    # 3. No referenced symbol shown: the leading code, as files used to be cut
+    if len(excerpt.ranges) == header_ranges:
+        start = outline.header_end + 1 if header_ranges else 1
+        excerpt.add_prefix(start, len(lines), content_budget)
+
+    # 4. Outline of the classes and functions left out, as far as the budget goes
+    text = excerpt.render()
+    omitted = _omitted_symbols(outline.symbols, excerpt.ranges)
+    if not omitted:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    line_limit = max_lines if max_lines is not None else float("inf")
+    notes = ["", "Omitted symbols:"]
+    used_chars = len(text) + sum(len(note) + 1 for note in notes)
+    used_lines = text.count("\n") + 1 + len(notes)
+    for position, symbol in enumerate(omitted):
+        span = (
+            f"L{symbol.start}"
+            if symbol.start == symbol.end
+            else f"L{symbol.start}-{symbol.end}"
+        )
+        note = f"  {span} {symbol.kind} {symbol.name}"
+        remaining = len(omitted) - position - 1
+        # Room for this note and, unless it is the last, a "... and N more"
+        reserve = len(f"  ... and {remaining} more") + 1 if remaining else 0
+        if (
+            used_chars + len(note) + 1 + reserve <= max_chars
+            and used_lines + 1 + bool(remaining) <= line_limit
+        ):
+            notes.append(note)
+            used_chars += len(note) + 1
+            used_lines += 1
+            continue
+        more = f"  ... and {remaining + 1} more"
+        if position == 0:
+            # Not even one note fits
+            notes = []
+        elif used_chars + len(more) + 1 <= max_chars and used_lines < line_limit:
+            notes.append(more)
+        break
+    if notes:
+        text += "\n" + "\n".join(notes)
+    # Only a budget too small for the omission marker itself gets cut here
+    return text[:max_chars]
+
+
+def _omitted_symbols(
+    symbols: tuple[Symbol, ...], ranges: list[tuple[int, int]]
+) -> list[Symbol]:
+    """Classes and functions not wholly inside the shown line ranges."""
+    merged: list[list[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    omitted = []
+    position = 0
+    for symbol in symbols:
+        while position < len(merged) and merged[position][1] < symbol.start:
+            position += 1
+        shown = position < len(merged) and (
+            merged[position][0] <= symbol.start and symbol.end <= merged[position][1]
+        )
+        if symbol.kind != "variable" and not shown:
+            omitted.append(symbol)
+    return omitted
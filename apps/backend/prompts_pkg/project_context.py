@@ -166,10 +166,15 @@ def detect_project_capabilities(project_index: dict) -> dict:
 
 def should_refresh_project_index(project_dir: Path) -> bool:
     """
-    Check if project_index.json needs refresh based on dependency file changes.
+    Check if project_index.json needs refresh based on project file changes.
 
-    Uses smart caching: only refresh if dependency files (package.json,
-    pyproject.toml, etc.) have been modified since the last index generation.
+    Indexes that record an input fingerprint are compared against a fresh
+    fingerprint of the project's manifests, lockfiles and config files (git
+    object IDs for tracked files, stat data for untracked ones), so source
+    edits and checkouts that only touch mtimes don't trigger a refresh.
+    Older indexes without a fingerprint fall back to
+    checking whether dependency files (package.json, pyproject.toml, etc.)
+    have been modified since the last index generation.
 
     Args:
         project_dir: Root directory of the project
@@ -187,6 +192,16 @@ def should_refresh_project_index(project_dir: Path) -> bool:
     except OSError:
         return True  # Can't stat file, regenerate
 
+    # Imported lazily: the analyzers are only needed for this check
+    from analysis.analyzers.incremental import (
+        FINGERPRINT_KEY,
+        compute_project_fingerprint,
+    )
+
+    stored_fingerprint = load_project_index(project_dir).get(FINGERPRINT_KEY)
+    if stored_fingerprint is not None:
+        return compute_project_fingerprint(project_dir) != stored_fingerprint
+
     # Check all dependency files that could change frameworks
     dep_files = [
         project_dir / "package.json",
@@ -17,6 +17,8 @@ import os
 import re
 from pathlib import Path
 
+from .file_excerpts import DEFAULT_MAX_TOKENS, excerpt_file, referenced_symbols
+
 
 def get_supported_languages() -> set[str]:
     """
@@ -502,15 +504,21 @@ def load_subtask_context(
     project_dir: Path,
     subtask: dict,
     max_file_lines: int = 200,
+    max_file_tokens: int = DEFAULT_MAX_TOKENS,
 ) -> dict:
     """
     Load minimal context needed for a subtask.
 
+    Files that don't fit the budget are excerpted around the symbols the
+    subtask mentions (see file_excerpts), not just cut after their first
+    lines.
+
     Args:
         spec_dir: Spec directory
         project_dir: Project root
         subtask: The subtask being implemented
         max_file_lines: Maximum lines to include per file
+        max_file_tokens: Maximum estimated tokens to include per file
 
     Returns:
         Dict with file contents and relevant context
@@ -520,40 +528,21 @@ def load_subtask_context(
         "files_to_modify": {},
         "spec_excerpt": None,
     }
-
-    # Load pattern files (truncated)
-    for pattern_path in subtask.get("patterns_from", []):
-        full_path = project_dir / pattern_path
-        if full_path.exists():
-            try:
-                lines = full_path.read_text(encoding="utf-8").split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["patterns"][pattern_path] = content
-            except Exception:
-                context["patterns"][pattern_path] = "(Could not read file)"
-
-    # Load files to modify (truncated)
-    for file_path in subtask.get("files_to_modify", []):
-        full_path = project_dir / file_path
-        if full_path.exists():
-            try:
-                lines = full_path.read_text(encoding="utf-8").split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
+    explicit, plain = referenced_symbols(subtask)
+
+    for key, paths in (
+        ("patterns", subtask.get("patterns_from", [])),
+        ("files_to_modify", subtask.get("files_to_modify", [])),
+    ):
+        for file_path in paths:
+            full_path = project_dir / file_path
+            if full_path.exists():
+                try:
+                    context[key][file_path] = excerpt_file(
+                        full_path, explicit, plain, max_file_tokens, max_file_lines
                     )
-                else:
-                    content = "\n".join(lines)
-                context["files_to_modify"][file_path] = content
-            except Exception:
-                context["files_to_modify"][file_path] = "(Could not read file)"
+                except Exception:
+                    context[key][file_path] = "(Could not read file)"
 
     return context
 
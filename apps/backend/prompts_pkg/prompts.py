@@ -268,16 +268,13 @@ def _get_recovery_context(spec_dir: Path) -> str:
     Returns:
         Recovery context string or empty string
     """
-    import json
-
-    attempt_history_file = spec_dir / "memory" / "attempt_history.json"
-
-    if not attempt_history_file.exists():
-        return ""
+    from services.attempt_log import load_attempt_history
 
     try:
-        with open(attempt_history_file, encoding="utf-8") as f:
-            history = json.load(f)
+        # Snapshot plus attempts logged since it was last compacted
+        history = load_attempt_history(spec_dir / "memory")
+        if history is None:
+            return ""
 
         # Check for stuck subtasks
         stuck_subtasks = history.get("stuck_subtasks", [])
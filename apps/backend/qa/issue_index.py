@@ -0,0 +1,150 @@
+"""
+Issue Similarity Index
+======================
+
+Finds the normalized issue keys that are "the same issue" as a given key -
+SequenceMatcher ratio >= ISSUE_SIMILARITY_THRESHOLD - without comparing it
+against every key seen so far.
+
+Keys are indexed by length and by character bigram. Two filters, both
+necessary conditions for ratio >= t, prune the candidates before the exact
+SequenceMatcher check, so results are identical to comparing every pair.
+A third bound, difflib's quick_ratio(), is checked per candidate:
+
+1. Length: ratio = 2M / (la + lb) with M <= min(la, lb) matched characters.
+2. Shared bigrams: SequenceMatcher's matching blocks are disjoint, and
+   adjacent blocks are merged, so B blocks leave at least B - 1 unmatched
+   characters: B <= T - 2M + 1 with T = la + lb. Each block of length L
+   contributes L - 1 bigrams common to both keys, hence
+
+       shared bigrams >= M - B >= T * (1.5t - 1) - 1   when ratio >= t.
+
+   Where that bound is not positive (short keys, or t <= 2/3) every key in
+   the length window is a candidate.
+3. Characters: M is at most the size of the keys' character multiset
+   intersection (the same bound as SequenceMatcher.quick_ratio()).
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from difflib import SequenceMatcher
+
+# Slack for float rounding, so the filters never drop a true match
+_EPSILON = 1e-9
+
+
+def _bigrams(key: str) -> Counter[str]:
+    return Counter(key[i : i + 2] for i in range(len(key) - 1))
+
+
+class IssueKeyIndex:
+    """
+    Distinct normalized issue keys, in insertion order, searchable by
+    similarity.
+
+    Key ids are positions in insertion order, so callers that need the
+    first matching key (like greedy grouping) can take the smallest id.
+    """
+
+    def __init__(self, threshold: float):
+        """
+        Initialize an empty index.
+
+        Args:
+            threshold: Minimum SequenceMatcher ratio for two keys to match
+        """
+        self.threshold = threshold
+        self.keys: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._chars: list[Counter[str]] = []
+        self._by_length: dict[int, list[int]] = defaultdict(list)
+        self._postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self._ratios: dict[tuple[str, str], float] = {}
+        # Bigram bound slope; T <= _bound_cutoff keeps every length candidate
+        slope = 1.5 * threshold - 1
+        self._slope = slope
+        self._bound_cutoff = 1 / slope if slope > 0 else math.inf
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str) -> int:
+        """Add a key (no-op if already present) and return its id."""
+        key_id = self._ids.get(key)
+        if key_id is not None:
+            return key_id
+        key_id = len(self.keys)
+        self.keys.append(key)
+        self._chars.append(Counter(key))
+        self._ids[key] = key_id
+        self._by_length[len(key)].append(key_id)
+        for gram, count in _bigrams(key).items():
+            self._postings[gram].append((key_id, count))
+        return key_id
+
+    def ratio(self, key: str, other: str) -> float:
+        """SequenceMatcher(None, key, other).ratio(), memoized."""
+        pair = (key, other)
+        ratio = self._ratios.get(pair)
+        if ratio is None:
+            ratio = SequenceMatcher(None, key, other).ratio()
+            self._ratios[pair] = ratio
+        return ratio
+
+    def _length_window(self, length: int) -> tuple[int, float]:
+        # 2 * min(la, lb) / (la + lb) >= t bounds the other key's length
+        t = self.threshold
+        if t <= 0:
+            return 0, math.inf
+        return (
+            math.ceil(length * t / (2 - t) - _EPSILON),
+            math.floor(length * (2 - t) / t + _EPSILON),
+        )
+
+    def candidates(self, key: str) -> list[int]:
+        """Ids of keys that may match `key`, ascending."""
+        length = len(key)
+        low, high = self._length_window(length)
+
+        found: set[int] = set()
+        # Lengths where the bigram bound is vacuous: take every key
+        always_high = high
+        if self._bound_cutoff != math.inf:
+            always_high = min(high, self._bound_cutoff - length + _EPSILON)
+        for other_length in self._by_length:
+            if low <= other_length <= always_high:
+                found.update(self._by_length[other_length])
+
+        shared: Counter[int] = Counter()
+        for gram, count in _bigrams(key).items():
+            for key_id, other_count in self._postings.get(gram, ()):
+                shared[key_id] += min(count, other_count)
+        for key_id, count in shared.items():
+            other_length = len(self.keys[key_id])
+            if not low <= other_length <= high or key_id in found:
+                continue
+            required = (length + other_length) * self._slope - 1
+            if count >= required - _EPSILON:
+                found.add(key_id)
+        return sorted(found)
+
+    def matches(self, key: str) -> Iterator[int]:
+        """
+        Yield ids of keys with ratio(key, other) >= threshold, ascending.
+
+        The ratio is computed as SequenceMatcher(None, key, other), the same
+        orientation the QA report has always used.
+        """
+        chars = Counter(key)
+        for key_id in self.candidates(key):
+            other = self.keys[key_id]
+            other_chars = self._chars[key_id]
+            common = sum(min(n, other_chars[c]) for c, n in chars.items())
+            total = len(key) + len(other)
+            if total and 2 * common < self.threshold * total - _EPSILON:
+                continue
+            if self.ratio(key, other) >= self.threshold:
+                yield key_id
@@ -6,6 +6,7 @@ Main QA loop that coordinates reviewer and fixer sessions until
 approval or max iterations.
 """
 
+import asyncio
 import os
 import time as time_module
 from pathlib import Path
@@ -24,6 +25,7 @@ from phase_config import get_phase_model, get_phase_thinking_budget
 from phase_event import ExecutionPhase, emit_phase
 from progress import count_subtasks, is_build_complete
 from security.constants import PROJECT_DIR_ENV_VAR
+from services.orchestrator import EnvironmentLease
 from task_logger import (
     LogPhase,
     get_task_logger,
@@ -50,6 +52,11 @@ from .reviewer import run_qa_agent_session
 MAX_QA_ITERATIONS = 50
 MAX_CONSECUTIVE_ERRORS = 3  # Stop after 3 consecutive errors without progress
 
+# Set to 1 to have the loop start the project's services (docker-compose or
+# monorepo services) before each QA review, keeping them running between
+# iterations while they stay healthy and their definition is unchanged
+QA_SERVICES_ENV_VAR = "AUTO_CLAUDE_QA_SERVICES"
+
 
 # =============================================================================
 # QA VALIDATION LOOP
@@ -85,6 +92,42 @@ async def run_qa_validation_loop(
     Returns:
         True if QA approved, False otherwise
     """
+    lease = None
+    if os.environ.get(QA_SERVICES_ENV_VAR, "").strip().lower() in ("1", "true", "yes"):
+        lease = EnvironmentLease(project_dir)
+        if not lease.orchestrator.is_multi_service():
+            lease = None
+
+    try:
+        return await _run_qa_validation_loop(
+            project_dir, spec_dir, model, verbose, lease
+        )
+    finally:
+        if lease is not None:
+            await asyncio.to_thread(lease.release)
+
+
+async def _acquire_services(lease: EnvironmentLease) -> None:
+    """Start the project's services, or keep them running, before a review."""
+    result = await asyncio.to_thread(lease.acquire)
+    if result.reused:
+        debug("qa_loop", "Reusing running services", services=result.services_started)
+    elif result.success:
+        debug_success("qa_loop", "Services started", services=result.services_started)
+        print(f"Services started: {', '.join(result.services_started)}")
+    else:
+        debug_warning("qa_loop", "Services failed to start", errors=result.errors)
+        print(f"⚠️  Services failed to start: {'; '.join(result.errors)}")
+
+
+async def _run_qa_validation_loop(
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    verbose: bool,
+    lease: EnvironmentLease | None,
+) -> bool:
+    """Run the QA validation loop; see run_qa_validation_loop()."""
     # Set environment variable for security hooks to find the correct project directory
     # This is needed because os.getcwd() may return the wrong directory in worktree mode
     os.environ[PROJECT_DIR_ENV_VAR] = str(project_dir.resolve())
@@ -217,6 +260,9 @@ async def run_qa_validation_loop(
             ExecutionPhase.QA_REVIEW, f"Running QA review iteration {qa_iteration}"
         )
 
+        if lease is not None:
+            await _acquire_services(lease)
+
         # Run QA reviewer with phase-specific model and thinking budget
         qa_model = get_phase_model(spec_dir, "qa", model)
         qa_thinking_budget = get_phase_thinking_budget(spec_dir, "qa")
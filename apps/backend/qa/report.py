@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any
 
 from .criteria import load_implementation_plan, save_implementation_plan
+from .issue_index import IssueKeyIndex
 
 # Configuration
 RECURRING_ISSUE_THRESHOLD = 3  # Escalate if same issue appears this many times
@@ -149,23 +150,25 @@ def has_recurring_issues(
     Returns:
         (has_recurring, recurring_issues) tuple
     """
-    # Flatten all historical issues
-    historical_issues = []
+    # Flatten all historical issues, counting each distinct key once
+    history_index = IssueKeyIndex(ISSUE_SIMILARITY_THRESHOLD)
+    key_counts: Counter[int] = Counter()
     for record in history:
-        historical_issues.extend(record.get("issues", []))
+        for issue in record.get("issues", []):
+            key_counts[history_index.add(_normalize_issue_key(issue))] += 1
 
-    if not historical_issues:
+    if not key_counts:
         return False, []
 
     recurring = []
 
     for current in current_issues:
-        occurrence_count = 1  # Count current occurrence
-
-        for historical in historical_issues:
-            similarity = _issue_similarity(current, historical)
-            if similarity >= ISSUE_SIMILARITY_THRESHOLD:
-                occurrence_count += 1
+        # Count current occurrence plus every similar historical issue; the
+        # index only runs SequenceMatcher on plausible candidates
+        key = _normalize_issue_key(current)
+        occurrence_count = 1 + sum(
+            key_counts[key_id] for key_id in history_index.matches(key)
+        )
 
         if occurrence_count >= threshold:
             recurring.append(
@@ -194,23 +197,19 @@ def get_recurring_issue_summary(
     if not all_issues:
         return {"total_issues": 0, "unique_issues": 0, "most_common": []}
 
-    # Group similar issues
+    # Group similar issues: each issue joins the first (oldest) group whose
+    # key is similar, or starts a new group
     issue_groups: dict[str, list[dict[str, Any]]] = {}
+    group_index = IssueKeyIndex(ISSUE_SIMILARITY_THRESHOLD)
 
     for issue in all_issues:
         key = _normalize_issue_key(issue)
-        matched = False
-
-        for existing_key in issue_groups:
-            if (
-                SequenceMatcher(None, key, existing_key).ratio()
-                >= ISSUE_SIMILARITY_THRESHOLD
-            ):
-                issue_groups[existing_key].append(issue)
-                matched = True
-                break
+        first_match = next(group_index.matches(key), None)
 
-        if not matched:
+        if first_match is not None:
+            issue_groups[group_index.keys[first_match]].append(issue)
+        else:
+            group_index.add(key)
             issue_groups[key] = [issue]
 
     # Find most common issues
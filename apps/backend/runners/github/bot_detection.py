@@ -37,9 +37,9 @@ from pathlib import Path
 from core.gh_executable import get_gh_executable
 
 try:
-    from .file_lock import FileLock, atomic_write
+    from .state_store import get_state_store
 except (ImportError, ValueError, SystemError):
-    from file_lock import FileLock, atomic_write
+    from state_store import get_state_store
 
 
 @dataclass
@@ -68,25 +68,15 @@ class BotDetectionState:
         )
 
     def save(self, state_dir: Path) -> None:
-        """Save state to disk with file locking for concurrent safety."""
-        state_dir.mkdir(parents=True, exist_ok=True)
-        state_file = state_dir / "bot_detection_state.json"
-
-        # Use file locking to prevent concurrent write corruption
-        with FileLock(state_file, timeout=5.0, exclusive=True):
-            with atomic_write(state_file) as f:
-                json.dump(self.to_dict(), f, indent=2)
+        """Replace the stored state with this one, in one transaction."""
+        get_state_store(state_dir).replace_bot_state(
+            self.reviewed_commits, self.last_review_times
+        )
 
     @classmethod
     def load(cls, state_dir: Path) -> BotDetectionState:
-        """Load state from disk."""
-        state_file = state_dir / "bot_detection_state.json"
-
-        if not state_file.exists():
-            return cls()
-
-        with open(state_file, encoding="utf-8") as f:
-            return cls.from_dict(json.load(f))
+        """Load state from the state store."""
+        return cls.from_dict(get_state_store(state_dir).get_bot_state())
 
 
 class BotDetector:
@@ -360,19 +350,14 @@ class BotDetector:
             commit_sha: The commit SHA that was reviewed
         """
         pr_key = str(pr_number)
+        reviewed_at = datetime.now().isoformat()
 
-        # Add to reviewed commits
-        if pr_key not in self.state.reviewed_commits:
-            self.state.reviewed_commits[pr_key] = []
-
-        if commit_sha not in self.state.reviewed_commits[pr_key]:
-            self.state.reviewed_commits[pr_key].append(commit_sha)
-
-        # Update last review time
-        self.state.last_review_times[pr_key] = datetime.now().isoformat()
-
-        # Save state
-        self.state.save(self.state_dir)
+        # Update only this PR's row; the returned list includes commits
+        # other runners recorded since we loaded
+        self.state.reviewed_commits[pr_key] = get_state_store(
+            self.state_dir
+        ).add_reviewed_commit(pr_key, commit_sha, reviewed_at)
+        self.state.last_review_times[pr_key] = reviewed_at
 
         print(
             f"[BotDetector] Marked PR #{pr_number} as reviewed at {commit_sha[:8]} "
@@ -394,7 +379,7 @@ class BotDetector:
         if pr_key in self.state.last_review_times:
             del self.state.last_review_times[pr_key]
 
-        self.state.save(self.state_dir)
+        get_state_store(self.state_dir).delete_bot_prs([pr_key])
 
         print(f"[BotDetector] Cleared state for PR #{pr_number}")
 
@@ -422,7 +407,7 @@ class BotDetector:
         """
         Remove tracking state for PRs that haven't been reviewed recently.
 
-        This prevents unbounded growth of the state file by cleaning up
+        This prevents unbounded growth of the state store by cleaning up
         entries for PRs that are likely closed/merged.
 
         Args:
@@ -451,7 +436,7 @@ class BotDetector:
                 del self.state.last_review_times[pr_key]
 
         if prs_to_remove:
-            self.state.save(self.state_dir)
+            get_state_store(self.state_dir).delete_bot_prs(prs_to_remove)
             print(
                 f"[BotDetector] Cleaned up {len(prs_to_remove)} stale PRs "
                 f"(older than {max_age_days} days)"
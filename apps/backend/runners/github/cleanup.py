@@ -255,6 +255,7 @@ class DataCleaner:
             if not dry_run:
                 file_size = file_path.stat().st_size
                 file_path.unlink()
+                self._storage_calculator.note_deleted(file_path)
                 result.freed_bytes += file_size
             return True
 
@@ -290,6 +291,7 @@ class DataCleaner:
                 else:
                     # Delete
                     file_path.unlink()
+                    self._storage_calculator.note_deleted(file_path)
 
                 result.freed_bytes += file_size
 
@@ -329,9 +331,11 @@ class DataCleaner:
 
         with open(archive_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+        self._storage_calculator.note_written(archive_path)
 
         # Remove original
         file_path.unlink()
+        self._storage_calculator.note_deleted(file_path)
 
     async def _prune_indexes(
         self,
@@ -377,6 +381,7 @@ class DataCleaner:
 
                     with open(index_path, "w", encoding="utf-8") as f:
                         json.dump(index_data, f, indent=2)
+                    self._storage_calculator.note_written(index_path)
 
                 result.pruned_index_entries += pruned
 
@@ -409,6 +414,7 @@ class DataCleaner:
                     file_size = log_file.stat().st_size
                     if not dry_run:
                         log_file.unlink()
+                        self._storage_calculator.note_deleted(log_file)
                         result.freed_bytes += file_size
                     result.deleted_count += 1
             except OSError as e:
@@ -10,6 +10,12 @@ Features:
 - Pattern detection for cross-project learning
 - Feedback loop for prompt optimization
 
+Outcomes are rows in the runner's state store (state.db); recording one
+upserts only that outcome. Accuracy counts are kept per (repo, prediction
+type, UTC day) and per pattern key as outcomes are recorded, so accuracy
+queries and pattern detection combine counters instead of rescanning every
+outcome.
+
 Usage:
     tracker = LearningTracker(state_dir=Path(".auto-claude/github"))
 
@@ -25,13 +31,18 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import heapq
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import get_state_store
+except (ImportError, ValueError, SystemError):
+    from state_store import get_state_store
+
 
 class PredictionType(str, Enum):
     """Types of predictions the system makes."""
@@ -225,6 +236,41 @@ class AccuracyStats:
         }
 
 
+@dataclass
+class _AccuracyBucket:
+    """Running counts for one (repo, prediction type, day) bucket."""
+
+    total: int = 0
+    correct: int = 0
+    incorrect: int = 0
+    pending: int = 0
+    merge_seconds: float = 0.0
+    merge_count: int = 0
+    # Outcomes in the bucket, for the partial day at a `since` boundary
+    review_ids: set[str] = field(default_factory=set)
+
+    def add(self, outcome: ReviewOutcome, sign: int) -> None:
+        self.total += sign
+        if outcome.is_complete:
+            was_correct = outcome.was_correct
+            if was_correct is True:
+                self.correct += sign
+            elif was_correct is False:
+                self.incorrect += sign
+            if outcome.actual_outcome == OutcomeType.MERGED and outcome.time_to_outcome:
+                self.merge_seconds += sign * outcome.time_to_outcome.total_seconds()
+                self.merge_count += sign
+        else:
+            self.pending += sign
+
+
+def _day(moment: datetime) -> date:
+    """UTC day of a timestamp (naive timestamps are taken as UTC)."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
 @dataclass
 class LearningPattern:
     """
@@ -289,41 +335,69 @@ class LearningTracker:
         self.learning_dir.mkdir(parents=True, exist_ok=True)
 
         self._outcomes: dict[str, ReviewOutcome] = {}
+        # repo -> (prediction type, day) -> counts
+        self._buckets: dict[str, dict[tuple[str, date], _AccuracyBucket]] = {}
+        # pattern type -> key -> {"correct": n, "incorrect": n}
+        self._pattern_counts: dict[str, dict[str, dict[str, int]]] = {
+            "file_type": {},
+            "category": {},
+            "change_size": {},
+        }
         self._load_outcomes()
 
-    def _get_outcomes_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.learning_dir / f"{safe_name}_outcomes.json"
-
     def _load_outcomes(self) -> None:
-        """Load all outcomes from disk."""
-        for file in self.learning_dir.glob("*_outcomes.json"):
+        """Load all outcomes from the state store."""
+        for item in get_state_store(self.state_dir).get_outcomes():
             try:
-                with open(file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    for item in data.get("outcomes", []):
-                        outcome = ReviewOutcome.from_dict(item)
-                        self._outcomes[outcome.review_id] = outcome
-            except (json.JSONDecodeError, KeyError):
+                outcome = ReviewOutcome.from_dict(item)
+            except (KeyError, ValueError):
                 continue
+            self._set_outcome(outcome)
+
+    def _set_outcome(self, outcome: ReviewOutcome) -> None:
+        """Store an outcome in memory, replacing its previous counts."""
+        previous = self._outcomes.get(outcome.review_id)
+        if previous is not None:
+            self._count(previous, -1)
+        self._outcomes[outcome.review_id] = outcome
+        self._count(outcome, 1)
+
+    def _count(self, outcome: ReviewOutcome, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an outcome's aggregate counts."""
+        key = (outcome.prediction.value, _day(outcome.created_at))
+        repo_buckets = self._buckets.setdefault(outcome.repo, {})
+        bucket = repo_buckets.get(key)
+        if bucket is None:
+            bucket = repo_buckets[key] = _AccuracyBucket()
+        bucket.add(outcome, sign)
+        if sign > 0:
+            bucket.review_ids.add(outcome.review_id)
+        else:
+            bucket.review_ids.discard(outcome.review_id)
+            if bucket.total == 0:
+                del repo_buckets[key]
+
+        was_correct = outcome.was_correct
+        if was_correct is None:
+            return
+        result = "correct" if was_correct else "incorrect"
+        for pattern_type, keys in (
+            ("file_type", outcome.file_types),
+            ("category", outcome.categories),
+            ("change_size", [outcome.change_size]),
+        ):
+            counts_by_key = self._pattern_counts[pattern_type]
+            for pattern_key in keys:
+                counts = counts_by_key.setdefault(
+                    pattern_key, {"correct": 0, "incorrect": 0}
+                )
+                counts[result] += sign
+                if counts["correct"] == 0 and counts["incorrect"] == 0:
+                    del counts_by_key[pattern_key]
 
-    def _save_outcomes(self, repo: str) -> None:
-        """Save outcomes for a repo to disk with file locking for concurrency safety."""
-        from .file_lock import FileLock, atomic_write
-
-        file = self._get_outcomes_file(repo)
-        repo_outcomes = [o for o in self._outcomes.values() if o.repo == repo]
-
-        data = {
-            "repo": repo,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "outcomes": [o.to_dict() for o in repo_outcomes],
-        }
-
-        # Use file locking and atomic write for safe concurrent access
-        with FileLock(file, timeout=5.0):
-            with atomic_write(file) as f:
-                json.dump(data, f, indent=2)
+    def _save_outcome(self, outcome: ReviewOutcome) -> None:
+        """Upsert one outcome's row (other outcomes are not rewritten)."""
+        get_state_store(self.state_dir).upsert_outcome(outcome.to_dict())
 
     def record_prediction(
         self,
@@ -366,8 +440,8 @@ class LearningTracker:
             categories=categories or [],
         )
 
-        self._outcomes[review_id] = outcome
-        self._save_outcomes(repo)
+        self._set_outcome(outcome)
+        self._save_outcome(outcome)
 
         return outcome
 
@@ -396,12 +470,14 @@ class LearningTracker:
             return None
 
         review_outcome = self._outcomes[review_id]
+        self._count(review_outcome, -1)
         review_outcome.actual_outcome = outcome
         review_outcome.time_to_outcome = time_to_outcome
         review_outcome.author_response = author_response
         review_outcome.outcome_recorded_at = datetime.now(timezone.utc)
+        self._count(review_outcome, 1)
 
-        self._save_outcomes(repo)
+        self._save_outcome(review_outcome)
 
         return review_outcome
 
@@ -432,47 +508,49 @@ class LearningTracker:
             AccuracyStats with aggregated metrics
         """
         stats = AccuracyStats()
-        merge_times = []
+        merge_seconds = 0.0
+        merge_count = 0
 
-        for outcome in self._outcomes.values():
-            # Apply filters
-            if repo and outcome.repo != repo:
-                continue
-            if since and outcome.created_at < since:
-                continue
-            if prediction_type and outcome.prediction != prediction_type:
-                continue
-
-            stats.total_predictions += 1
-
-            # Track by type
-            type_key = outcome.prediction.value
-            if type_key not in stats.by_type:
-                stats.by_type[type_key] = {"total": 0, "correct": 0, "incorrect": 0}
-            stats.by_type[type_key]["total"] += 1
-
-            if outcome.is_complete:
-                was_correct = outcome.was_correct
-                if was_correct is True:
-                    stats.correct_predictions += 1
-                    stats.by_type[type_key]["correct"] += 1
-                elif was_correct is False:
-                    stats.incorrect_predictions += 1
-                    stats.by_type[type_key]["incorrect"] += 1
-
-                # Track merge times
-                if (
-                    outcome.actual_outcome == OutcomeType.MERGED
-                    and outcome.time_to_outcome
-                ):
-                    merge_times.append(outcome.time_to_outcome)
-            else:
-                stats.pending_outcomes += 1
+        if repo:
+            repo_buckets = [self._buckets.get(repo, {})]
+        else:
+            repo_buckets = list(self._buckets.values())
+        type_filter = prediction_type.value if prediction_type else None
+        since_day = _day(since) if since else None
+
+        for buckets in repo_buckets:
+            for (type_key, day), bucket in buckets.items():
+                if type_filter and type_key != type_filter:
+                    continue
+                if since_day and day < since_day:
+                    continue
+                if since_day == day:
+                    # The day `since` falls in: count its outcomes one by one
+                    bucket = _AccuracyBucket()
+                    for review_id in buckets[(type_key, day)].review_ids:
+                        outcome = self._outcomes[review_id]
+                        if outcome.created_at >= since:
+                            bucket.add(outcome, 1)
+                    if bucket.total == 0:
+                        continue
+
+                stats.total_predictions += bucket.total
+                stats.correct_predictions += bucket.correct
+                stats.incorrect_predictions += bucket.incorrect
+                stats.pending_outcomes += bucket.pending
+                merge_seconds += bucket.merge_seconds
+                merge_count += bucket.merge_count
+
+                by_type = stats.by_type.setdefault(
+                    type_key, {"total": 0, "correct": 0, "incorrect": 0}
+                )
+                by_type["total"] += bucket.total
+                by_type["correct"] += bucket.correct
+                by_type["incorrect"] += bucket.incorrect
 
         # Calculate average merge time
-        if merge_times:
-            avg_seconds = sum(t.total_seconds() for t in merge_times) / len(merge_times)
-            stats.avg_time_to_merge = timedelta(seconds=avg_seconds)
+        if merge_count:
+            stats.avg_time_to_merge = timedelta(seconds=merge_seconds / merge_count)
 
         return stats
 
@@ -482,13 +560,12 @@ class LearningTracker:
         limit: int = 50,
     ) -> list[ReviewOutcome]:
         """Get recent outcomes, most recent first."""
-        outcomes = list(self._outcomes.values())
+        outcomes = self._outcomes.values()
 
         if repo:
             outcomes = [o for o in outcomes if o.repo == repo]
 
-        outcomes.sort(key=lambda o: o.created_at, reverse=True)
-        return outcomes[:limit]
+        return heapq.nlargest(limit, outcomes, key=lambda o: o.created_at)
 
     def detect_patterns(self, min_sample_size: int = 20) -> list[LearningPattern]:
         """
@@ -504,101 +581,22 @@ class LearningTracker:
         """
         patterns = []
 
-        # Pattern: Accuracy by file type
-        by_file_type: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for file_type in outcome.file_types:
-                if file_type not in by_file_type:
-                    by_file_type[file_type] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_file_type[file_type]["correct"] += 1
-                else:
-                    by_file_type[file_type]["incorrect"] += 1
-
-        for file_type, counts in by_file_type.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)  # More samples = higher confidence
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"file_type_{file_type}",
-                        pattern_type="file_type_accuracy",
-                        context={"file_type": file_type},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
-
-        # Pattern: Accuracy by category
-        by_category: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for category in outcome.categories:
-                if category not in by_category:
-                    by_category[category] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_category[category]["correct"] += 1
-                else:
-                    by_category[category]["incorrect"] += 1
-
-        for category, counts in by_category.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"category_{category}",
-                        pattern_type="category_accuracy",
-                        context={"category": category},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
+        # Accuracy by file type, category and change size
+        for pattern_type, counts_by_key in self._pattern_counts.items():
+            for key, counts in counts_by_key.items():
+                total = counts["correct"] + counts["incorrect"]
+                if total >= min_sample_size:
+                    patterns.append(
+                        LearningPattern(
+                            pattern_id=f"{pattern_type}_{key}",
+                            pattern_type=f"{pattern_type}_accuracy",
+                            context={pattern_type: key},
+                            sample_size=total,
+                            accuracy=counts["correct"] / total,
+                            # More samples = higher confidence
+                            confidence=min(1.0, total / 100),
+                        )
                     )
-                )
-
-        # Pattern: Accuracy by change size
-        by_size: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            size = outcome.change_size
-            if size not in by_size:
-                by_size[size] = {"correct": 0, "incorrect": 0}
-
-            if outcome.was_correct:
-                by_size[size]["correct"] += 1
-            else:
-                by_size[size]["incorrect"] += 1
-
-        for size, counts in by_size.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"change_size_{size}",
-                        pattern_type="change_size_accuracy",
-                        context={"change_size": size},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
 
         return patterns
 
@@ -612,15 +610,17 @@ class LearningTracker:
         week_ago = now - timedelta(days=7)
         month_ago = now - timedelta(days=30)
 
+        all_time = self.get_accuracy(repo)
+
         return {
-            "all_time": self.get_accuracy(repo).to_dict(),
+            "all_time": all_time.to_dict(),
             "last_week": self.get_accuracy(repo, since=week_ago).to_dict(),
             "last_month": self.get_accuracy(repo, since=month_ago).to_dict(),
             "patterns": [p.to_dict() for p in self.detect_patterns()],
             "recent_outcomes": [
                 o.to_dict() for o in self.get_recent_outcomes(repo, limit=10)
             ],
-            "pending_count": len(self.get_pending_outcomes(repo)),
+            "pending_count": all_time.pending_outcomes,
         }
 
     def check_pr_status(
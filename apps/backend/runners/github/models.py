@@ -10,6 +10,7 @@ All save() operations use file locking to prevent corruption in concurrent scena
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -18,8 +19,10 @@ from pathlib import Path
 
 try:
     from .file_lock import locked_json_update, locked_json_write
+    from .state_store import get_state_store
 except (ImportError, ValueError, SystemError):
     from file_lock import locked_json_update, locked_json_write
+    from state_store import get_state_store
 
 
 class ReviewSeverity(str, Enum):
@@ -644,46 +647,10 @@ class PRReviewResult:
         # Atomic locked write
         await locked_json_write(review_file, self.to_dict(), timeout=5.0)
 
-        # Update index with locking
-        await self._update_index(pr_dir)
-
-    async def _update_index(self, pr_dir: Path) -> None:
-        """Update the PR review index with file locking."""
-        index_file = pr_dir / "index.json"
-
-        def update_index(current_data):
-            """Update function for atomic index update."""
-            if current_data is None:
-                current_data = {"reviews": [], "last_updated": None}
-
-            # Update or add entry
-            reviews = current_data.get("reviews", [])
-            existing = next(
-                (r for r in reviews if r["pr_number"] == self.pr_number), None
-            )
-
-            entry = {
-                "pr_number": self.pr_number,
-                "repo": self.repo,
-                "overall_status": self.overall_status,
-                "findings_count": len(self.findings),
-                "reviewed_at": self.reviewed_at,
-            }
-
-            if existing:
-                reviews = [
-                    entry if r["pr_number"] == self.pr_number else r for r in reviews
-                ]
-            else:
-                reviews.append(entry)
-
-            current_data["reviews"] = reviews
-            current_data["last_updated"] = datetime.now().isoformat()
-
-            return current_data
-
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        # Index row in the state store (replaces the rewritten pr/index.json)
+        await asyncio.to_thread(
+            get_state_store(github_dir).upsert_review_record, self.to_dict()
+        )
 
     @classmethod
     def load(cls, github_dir: Path, pr_number: int) -> PRReviewResult | None:
@@ -9,6 +9,8 @@ Features:
 - Count-based cleanup (keep only N most recent worktrees)
 - Orphaned worktree cleanup (worktrees not registered with git)
 - Automatic cleanup on review completion
+- Warm pool of detached worktrees recycled across reviews
+- Coalesced fetches for concurrent reviews of different PRs
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ import logging
 import os
 import shutil
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import NamedTuple
@@ -28,6 +31,10 @@ logger = logging.getLogger(__name__)
 # Default cleanup policies (can be overridden via environment variables)
 DEFAULT_MAX_PR_WORKTREES = 10  # Max worktrees to keep
 DEFAULT_PR_WORKTREE_MAX_AGE_DAYS = 7  # Max age in days
+DEFAULT_PR_WORKTREE_POOL_SIZE = 3  # Warm worktrees kept for reuse (0 disables)
+
+# Pooled worktrees live in this subdirectory of the worktree base dir
+POOL_DIRNAME = ".pool"
 
 
 def _get_max_pr_worktrees() -> int:
@@ -52,12 +59,156 @@ def _get_max_age_days() -> int:
         return DEFAULT_PR_WORKTREE_MAX_AGE_DAYS
 
 
+def _get_pool_size() -> int:
+    """Get worktree pool size setting, read at runtime for testability."""
+    try:
+        value = int(
+            os.environ.get("PR_WORKTREE_POOL_SIZE", str(DEFAULT_PR_WORKTREE_POOL_SIZE))
+        )
+        return value if value >= 0 else DEFAULT_PR_WORKTREE_POOL_SIZE
+    except (ValueError, TypeError):
+        return DEFAULT_PR_WORKTREE_POOL_SIZE
+
+
 # Safe pattern for git refs (SHA, branch names)
 # Allows: alphanumeric, dots, underscores, hyphens, forward slashes
 import re
 
 SAFE_REF_PATTERN = re.compile(r"^[a-zA-Z0-9._/\-]+$")
 
+# Full commit SHAs never move, so a local copy never needs re-fetching
+FULL_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+# How long a caller waits on a fetch led by another thread. A batch can take a
+# few git fetch timeouts (60s each) when its refs are retried one by one.
+FETCH_WAIT_TIMEOUT_SECONDS = 300
+
+
+class _FetchBatch:
+    """Refs requested while a fetch was already running."""
+
+    def __init__(self):
+        self.refs: set[str] = set()
+        self.done = threading.Event()
+        self.fetched: set[str] = set()
+
+
+class _FetchCoalescer:
+    """
+    Coalesces concurrent fetches from origin for one repository.
+
+    While a fetch is running, refs requested by other threads are queued into
+    the next batch, which is fetched with a single multi-refspec
+    ``git fetch origin <ref>...`` once the current one finishes. The thread
+    that started fetching keeps draining batches; the others just wait.
+    """
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+        self._lock = threading.Lock()
+        self._next_batch: _FetchBatch | None = None
+        self._fetching = False
+
+    def fetch(self, ref: str) -> bool:
+        """
+        Fetch a ref from origin, sharing the fetch with concurrent callers.
+
+        Args:
+            ref: Commit SHA or ref name (already validated)
+
+        Returns:
+            True if the ref was fetched
+        """
+        with self._lock:
+            if self._next_batch is None:
+                self._next_batch = _FetchBatch()
+            batch = self._next_batch
+            batch.refs.add(ref)
+            leader = not self._fetching
+            self._fetching = True
+
+        if leader:
+            self._lead()
+
+        if not batch.done.wait(timeout=FETCH_WAIT_TIMEOUT_SECONDS):
+            logger.warning(f"Timed out waiting for a shared fetch of {ref}")
+            return False
+        return ref in batch.fetched
+
+    def _lead(self) -> None:
+        """Fetch queued batches until none is left."""
+        finished = False
+        try:
+            while True:
+                with self._lock:
+                    pending, self._next_batch = self._next_batch, None
+                    if pending is None:
+                        self._fetching = False
+                        finished = True
+                        break
+                try:
+                    pending.fetched = self._run_fetch(sorted(pending.refs))
+                finally:
+                    pending.done.set()
+        finally:
+            if not finished:
+                # Release waiters queued behind the failed fetch; a later
+                # fetch() will lead again
+                with self._lock:
+                    queued, self._next_batch = self._next_batch, None
+                    self._fetching = False
+                if queued is not None:
+                    queued.done.set()
+
+    def _run_fetch(self, refs: list[str]) -> set[str]:
+        """Fetch refs in one call, retrying one by one if the batch fails."""
+        if self._git_fetch(refs):
+            return set(refs)
+        if len(refs) == 1:
+            return set()
+        # One unreachable ref (e.g. a fork PR head) fails the whole batch
+        return {ref for ref in refs if self._git_fetch([ref])}
+
+    def _git_fetch(self, refs: list[str]) -> bool:
+        try:
+            result = subprocess.run(
+                ["git", "fetch", "origin", *refs],
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env=get_isolated_git_env(),
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(
+                f"Timeout fetching {', '.join(refs)} from origin, continuing anyway"
+            )
+            return False
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Could not run git fetch for {', '.join(refs)}: {e}")
+            return False
+
+        if result.returncode != 0:
+            logger.warning(
+                f"Could not fetch {', '.join(refs)} from origin (fork PR?): {result.stderr}"
+            )
+            return False
+        return True
+
+
+_fetch_coalescers: dict[Path, _FetchCoalescer] = {}
+_fetch_coalescers_lock = threading.Lock()
+
+
+def _get_fetch_coalescer(project_dir: Path) -> _FetchCoalescer:
+    """Get the shared fetch coalescer for a repository."""
+    key = project_dir.resolve()
+    with _fetch_coalescers_lock:
+        coalescer = _fetch_coalescers.get(key)
+        if coalescer is None:
+            coalescer = _fetch_coalescers[key] = _FetchCoalescer(key)
+        return coalescer
+
 
 class WorktreeInfo(NamedTuple):
     """Information about a PR worktree."""
@@ -87,6 +238,36 @@ class PRWorktreeManager:
         """
         self.project_dir = Path(project_dir)
         self.worktree_base_dir = self.project_dir / worktree_dir
+        self.pool_dir = self.worktree_base_dir / POOL_DIRNAME
+
+    @staticmethod
+    def _validate_request(head_sha: str, pr_number: int) -> None:
+        """Validate inputs to prevent command injection."""
+        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
+            raise ValueError(
+                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
+            )
+        if not isinstance(pr_number, int) or pr_number <= 0:
+            raise ValueError(
+                f"Invalid pr_number: must be a positive integer, got {pr_number}"
+            )
+
+    def _fetch_commit(self, head_sha: str) -> None:
+        """Fetch a PR head from origin unless the commit is already local."""
+        if FULL_SHA_PATTERN.match(head_sha):
+            try:
+                result = subprocess.run(
+                    ["git", "cat-file", "-e", f"{head_sha}^{{commit}}"],
+                    cwd=self.project_dir,
+                    capture_output=True,
+                    timeout=30,
+                    env=get_isolated_git_env(),
+                )
+                if result.returncode == 0:
+                    return
+            except subprocess.TimeoutExpired:
+                pass  # Fall through to fetching
+        _get_fetch_coalescer(self.project_dir).fetch(head_sha)
 
     def create_worktree(
         self, head_sha: str, pr_number: int, auto_cleanup: bool = True
@@ -106,15 +287,7 @@ class PRWorktreeManager:
             RuntimeError: If worktree creation fails
             ValueError: If head_sha or pr_number are invalid
         """
-        # Validate inputs to prevent command injection
-        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
-            raise ValueError(
-                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
-            )
-        if not isinstance(pr_number, int) or pr_number <= 0:
-            raise ValueError(
-                f"Invalid pr_number: must be a positive integer, got {pr_number}"
-            )
+        self._validate_request(head_sha, pr_number)
 
         # Run cleanup before creating new worktree (can be disabled for tests)
         if auto_cleanup:
@@ -132,24 +305,7 @@ class PRWorktreeManager:
         logger.debug(f"Creating worktree: {worktree_path}")
 
         env = get_isolated_git_env()
-        try:
-            fetch_result = subprocess.run(
-                ["git", "fetch", "origin", head_sha],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                env=env,
-            )
-
-            if fetch_result.returncode != 0:
-                logger.warning(
-                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
-                )
-        except subprocess.TimeoutExpired:
-            logger.warning(
-                f"Timeout fetching {head_sha} from origin, continuing anyway"
-            )
+        self._fetch_commit(head_sha)
 
         try:
             result = subprocess.run(
@@ -184,6 +340,235 @@ class PRWorktreeManager:
         logger.info(f"[WorktreeManager] Created worktree at {worktree_path}")
         return worktree_path
 
+    # ------------------------------------------------------------------
+    # Worktree pool
+    # ------------------------------------------------------------------
+
+    def acquire_worktree(self, head_sha: str, pr_number: int) -> Path:
+        """
+        Get a clean worktree at head_sha, reusing a warm pooled one if possible.
+
+        Idle pool slots are recycled with ``git checkout --detach --force``
+        plus ``git clean``, which only rewrites the files that differ instead
+        of checking out the whole tree. Empty slots are created on first use.
+        When every slot is busy (or the pool is disabled) this falls back to
+        create_worktree(). Hand the worktree back with release_worktree().
+
+        Args:
+            head_sha: Git commit SHA to checkout
+            pr_number: PR number (used for logging and unpooled naming)
+
+        Returns:
+            Path to a worktree checked out at head_sha
+
+        Raises:
+            RuntimeError: If worktree creation fails
+            ValueError: If head_sha or pr_number are invalid
+        """
+        self._validate_request(head_sha, pr_number)
+        self._fetch_commit(head_sha)
+
+        for slot in range(_get_pool_size()):
+            slot_path = self.pool_dir / f"slot-{slot}"
+            if not self._lock_slot(slot_path):
+                continue
+            try:
+                if self._recycle_slot(slot_path, head_sha):
+                    logger.info(
+                        f"[WorktreeManager] Reusing pooled worktree {slot_path.name} "
+                        f"for PR #{pr_number}"
+                    )
+                    return slot_path
+            except Exception:
+                self._unlock_slot(slot_path)
+                raise
+            self._unlock_slot(slot_path)
+
+        return self.create_worktree(head_sha, pr_number)
+
+    def release_worktree(self, worktree_path: Path) -> None:
+        """
+        Return a worktree from acquire_worktree().
+
+        Pooled worktrees are kept for the next review; others are removed.
+
+        Args:
+            worktree_path: Path returned by acquire_worktree()
+        """
+        if worktree_path and self._is_pool_slot(worktree_path):
+            self._unlock_slot(worktree_path)
+            logger.debug(f"Returned {worktree_path.name} to the worktree pool")
+            return
+        self.remove_worktree(worktree_path)
+
+    def warm_pool(self, ref: str = "HEAD") -> int:
+        """
+        Pre-create idle pool worktrees so the first reviews skip the checkout.
+
+        Args:
+            ref: Commit to check the warm worktrees out at
+
+        Returns:
+            Number of pool worktrees that are ready
+        """
+        if not SAFE_REF_PATTERN.match(ref):
+            raise ValueError(
+                f"Invalid ref: must match pattern {SAFE_REF_PATTERN.pattern}"
+            )
+
+        ready = 0
+        for slot in range(_get_pool_size()):
+            slot_path = self.pool_dir / f"slot-{slot}"
+            if not self._lock_slot(slot_path):
+                continue
+            try:
+                if slot_path.exists() or self._recycle_slot(slot_path, ref):
+                    ready += 1
+            finally:
+                self._unlock_slot(slot_path)
+        return ready
+
+    def drain_pool(self) -> int:
+        """
+        Remove all idle pooled worktrees (busy ones are left alone).
+
+        Returns:
+            Number of pooled worktrees removed
+        """
+        if not self.pool_dir.exists():
+            return 0
+
+        count = 0
+        for slot_path in sorted(self.pool_dir.glob("slot-*")):
+            if not slot_path.is_dir() or not self._lock_slot(slot_path):
+                continue
+            try:
+                self.remove_worktree(slot_path)
+                count += 1
+            finally:
+                self._unlock_slot(slot_path)
+        return count
+
+    def _is_pool_slot(self, path: Path) -> bool:
+        return path.parent.resolve() == self.pool_dir.resolve()
+
+    @staticmethod
+    def _slot_lock_path(slot_path: Path) -> Path:
+        return slot_path.with_name(f"{slot_path.name}.lock")
+
+    def _lock_slot(self, slot_path: Path) -> bool:
+        """
+        Claim a pool slot across threads and processes.
+
+        The lock file holds the owner's PID; locks left behind by processes
+        that no longer exist are taken over.
+        """
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = self._slot_lock_path(slot_path)
+        for _ in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if not self._is_stale_lock(lock_path):
+                    return False
+                lock_path.unlink(missing_ok=True)
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            return True
+        return False
+
+    @staticmethod
+    def _unlock_slot(slot_path: Path) -> None:
+        PRWorktreeManager._slot_lock_path(slot_path).unlink(missing_ok=True)
+
+    @staticmethod
+    def _is_stale_lock(lock_path: Path) -> bool:
+        try:
+            pid = int(lock_path.read_text().strip())
+        except (OSError, ValueError):
+            # Unreadable or half-written lock: only stale once it's old
+            try:
+                return time.time() - lock_path.stat().st_mtime > 60
+            except OSError:
+                return True
+        if pid == os.getpid():
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def _recycle_slot(self, slot_path: Path, head_sha: str) -> bool:
+        """
+        Bring a locked slot to a clean checkout of head_sha.
+
+        Returns:
+            True if the slot is ready, False if it couldn't be prepared
+        """
+        env = get_isolated_git_env()
+
+        if not (slot_path / ".git").exists():
+            # Empty (or broken) slot: create the worktree once
+            if slot_path.exists():
+                shutil.rmtree(slot_path, ignore_errors=True)
+            try:
+                subprocess.run(
+                    ["git", "worktree", "prune"],
+                    cwd=self.project_dir,
+                    capture_output=True,
+                    timeout=30,
+                    env=env,
+                )
+                result = subprocess.run(
+                    ["git", "worktree", "add", "--detach", str(slot_path), head_sha],
+                    cwd=self.project_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                    env=env,
+                )
+            except subprocess.TimeoutExpired:
+                shutil.rmtree(slot_path, ignore_errors=True)
+                return False
+            if result.returncode != 0:
+                logger.warning(
+                    f"Could not create pooled worktree {slot_path.name}: {result.stderr.strip()}"
+                )
+                shutil.rmtree(slot_path, ignore_errors=True)
+                return False
+            return slot_path.exists()
+
+        try:
+            checkout = subprocess.run(
+                ["git", "checkout", "--detach", "--force", head_sha],
+                cwd=slot_path,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                env=env,
+            )
+            if checkout.returncode != 0:
+                logger.warning(
+                    f"Could not recycle pooled worktree {slot_path.name}: {checkout.stderr.strip()}"
+                )
+                return False
+            clean = subprocess.run(
+                ["git", "clean", "-ffdxq"],
+                cwd=slot_path,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                env=env,
+            )
+            return clean.returncode == 0
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timeout recycling pooled worktree {slot_path.name}")
+            return False
+
     def remove_worktree(self, worktree_path: Path) -> None:
         """
         Remove a PR worktree with fallback chain.
@@ -246,7 +631,8 @@ class PRWorktreeManager:
         current_time = time.time()
 
         for item in self.worktree_base_dir.iterdir():
-            if not item.is_dir():
+            # Pooled worktrees are managed by acquire/release, not age/count policies
+            if not item.is_dir() or item.name == POOL_DIRNAME:
                 continue
 
             # Get modification time
@@ -420,7 +806,7 @@ class PRWorktreeManager:
             return 0
 
         worktrees = self.get_worktree_info()
-        count = 0
+        count = self.drain_pool()
 
         for wt in worktrees:
             logger.info(f"[WorktreeManager] Removing worktree: {wt.path.name}")
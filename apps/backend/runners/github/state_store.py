@@ -0,0 +1,525 @@
+"""
+GitHub Runner State Store
+=========================
+
+Transactional SQLite storage for the runner's state directory
+(.auto-claude/github/state.db).
+
+Review outcomes, trust state and bot-detection state used to be JSON files
+rewritten in full, under a file lock, on every change - so each update cost
+O(all records) and concurrent runners queued on the lock files. The store
+keeps one row per record instead and updates rows in place:
+
+    outcomes        review_id -> ReviewOutcome.to_dict()
+    trust_state     repo -> TrustState.to_dict()
+    bot_detection   PR number -> reviewed commit SHAs, last review time
+    review_records  PR number -> PRReviewResult.to_dict() and index columns
+    storage_files   state file -> size and stat signature (storage_metrics.py)
+
+The database runs in WAL mode, so readers never block writers and writers
+from several processes take turns on short BEGIN IMMEDIATE transactions.
+
+Existing JSON state is imported once, when a state directory's database is
+created (see import_json_state()). Review files (pr/review_{n}.json) are
+still written as well, since the desktop app reads them.
+
+Usage:
+    store = get_state_store(state_dir)
+    store.upsert_outcome(outcome.to_dict())
+    with store.transaction() as conn:
+        ...  # Several statements, committed together
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+STATE_DB_FILENAME = "state.db"
+SCHEMA_VERSION = 1
+
+# Seconds to wait for another process's write transaction
+DEFAULT_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outcomes (
+    review_id TEXT PRIMARY KEY,
+    repo TEXT NOT NULL,
+    created_at TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outcomes_by_repo ON outcomes (repo);
+CREATE TABLE IF NOT EXISTS trust_state (
+    repo TEXT PRIMARY KEY,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bot_detection (
+    pr_key TEXT PRIMARY KEY,
+    reviewed_commits TEXT NOT NULL,
+    last_review_at TEXT
+);
+CREATE TABLE IF NOT EXISTS review_records (
+    pr_number INTEGER PRIMARY KEY,
+    repo TEXT,
+    overall_status TEXT,
+    findings_count INTEGER NOT NULL DEFAULT 0,
+    reviewed_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS storage_files (
+    path TEXT PRIMARY KEY,
+    component TEXT NOT NULL,
+    is_json INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+class StateStore:
+    """SQLite-backed state for one GitHub runner state directory."""
+
+    def __init__(self, state_dir: Path, busy_timeout: float = DEFAULT_BUSY_TIMEOUT):
+        """
+        Open (creating and importing JSON state if needed) the database.
+
+        Args:
+            state_dir: Runner state directory (.auto-claude/github)
+            busy_timeout: Seconds to wait for other writers before failing
+        """
+        self.state_dir = Path(state_dir)
+        self.path = self.state_dir / STATE_DB_FILENAME
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+        is_new = not self.path.exists()
+        # One connection per store, shared by threads under the lock;
+        # isolation_level=None leaves transaction control to transaction()
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._lock = threading.RLock()
+        if is_new:
+            # Trust state used to be written owner-only; keep that for the db
+            os.chmod(self.path, 0o600)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self.transaction() as conn:
+            # executescript() would commit; run the DDL inside the transaction
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+            imported = conn.execute(
+                "SELECT value FROM meta WHERE key = 'json_imported_at'"
+            ).fetchone()
+            if imported is None:
+                self._import_json_state(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run statements in one write transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so read-modify-write
+        sequences inside the block see no concurrent changes.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Review outcomes (learning.py)
+    # ------------------------------------------------------------------
+
+    def upsert_outcome(self, outcome: dict[str, Any]) -> None:
+        """Insert or replace one ReviewOutcome (as its to_dict())."""
+        with self.transaction() as conn:
+            self._upsert_outcome(conn, outcome)
+
+    def get_outcomes(self, repo: str | None = None) -> list[dict[str, Any]]:
+        """Outcomes in insertion order, optionally for one repo."""
+        if repo is None:
+            rows = self._query("SELECT data FROM outcomes ORDER BY rowid")
+        else:
+            rows = self._query(
+                "SELECT data FROM outcomes WHERE repo = ? ORDER BY rowid", (repo,)
+            )
+        return [json.loads(data) for (data,) in rows]
+
+    @staticmethod
+    def _upsert_outcome(conn: sqlite3.Connection, outcome: dict[str, Any]) -> None:
+        conn.execute(
+            """
+            INSERT INTO outcomes (review_id, repo, created_at, completed, data)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (review_id) DO UPDATE SET
+                repo = excluded.repo,
+                created_at = excluded.created_at,
+                completed = excluded.completed,
+                data = excluded.data
+            """,
+            (
+                outcome["review_id"],
+                outcome["repo"],
+                outcome.get("created_at"),
+                int(outcome.get("actual_outcome") is not None),
+                json.dumps(outcome),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Trust state (trust.py)
+    # ------------------------------------------------------------------
+
+    def get_trust_state(self, repo: str) -> dict[str, Any] | None:
+        rows = self._query("SELECT data FROM trust_state WHERE repo = ?", (repo,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def get_trust_states(self) -> list[dict[str, Any]]:
+        rows = self._query("SELECT data FROM trust_state ORDER BY repo")
+        return [json.loads(data) for (data,) in rows]
+
+    def upsert_trust_state(self, repo: str, state: dict[str, Any]) -> None:
+        with self.transaction() as conn:
+            self._upsert_trust_state(conn, repo, state)
+
+    @staticmethod
+    def _upsert_trust_state(
+        conn: sqlite3.Connection, repo: str, state: dict[str, Any]
+    ) -> None:
+        conn.execute(
+            """
+            INSERT INTO trust_state (repo, updated_at, data) VALUES (?, ?, ?)
+            ON CONFLICT (repo) DO UPDATE SET
+                updated_at = excluded.updated_at,
+                data = excluded.data
+            """,
+            (repo, _now(), json.dumps(state)),
+        )
+
+    # ------------------------------------------------------------------
+    # Bot detection (bot_detection.py)
+    # ------------------------------------------------------------------
+
+    def get_bot_state(self) -> dict[str, dict[str, Any]]:
+        """All PRs as {"reviewed_commits": {...}, "last_review_times": {...}}."""
+        reviewed_commits: dict[str, list[str]] = {}
+        last_review_times: dict[str, str] = {}
+        rows = self._query(
+            "SELECT pr_key, reviewed_commits, last_review_at FROM bot_detection "
+            "ORDER BY rowid"
+        )
+        for pr_key, commits, last_review_at in rows:
+            reviewed_commits[pr_key] = json.loads(commits)
+            if last_review_at is not None:
+                last_review_times[pr_key] = last_review_at
+        return {
+            "reviewed_commits": reviewed_commits,
+            "last_review_times": last_review_times,
+        }
+
+    def add_reviewed_commit(
+        self, pr_key: str, commit_sha: str, reviewed_at: str
+    ) -> list[str]:
+        """
+        Record a reviewed commit for one PR.
+
+        Returns:
+            Every commit reviewed for the PR, including ones other
+            processes recorded
+        """
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT reviewed_commits FROM bot_detection WHERE pr_key = ?",
+                (pr_key,),
+            ).fetchone()
+            commits = json.loads(row[0]) if row else []
+            if commit_sha not in commits:
+                commits.append(commit_sha)
+            self._upsert_bot_pr(conn, pr_key, commits, reviewed_at)
+        return commits
+
+    def delete_bot_prs(self, pr_keys: Iterable[str]) -> None:
+        with self.transaction() as conn:
+            conn.executemany(
+                "DELETE FROM bot_detection WHERE pr_key = ?",
+                [(pr_key,) for pr_key in pr_keys],
+            )
+
+    def replace_bot_state(
+        self,
+        reviewed_commits: dict[str, list[str]],
+        last_review_times: dict[str, str],
+    ) -> None:
+        """Replace all bot-detection state (a full BotDetectionState.save())."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM bot_detection")
+            self._insert_bot_state(conn, reviewed_commits, last_review_times)
+
+    @classmethod
+    def _insert_bot_state(
+        cls,
+        conn: sqlite3.Connection,
+        reviewed_commits: dict[Any, list[str]],
+        last_review_times: dict[Any, str],
+    ) -> None:
+        for pr_key in dict.fromkeys([*reviewed_commits, *last_review_times]):
+            cls._upsert_bot_pr(
+                conn,
+                str(pr_key),
+                list(reviewed_commits.get(pr_key, [])),
+                last_review_times.get(pr_key),
+            )
+
+    @staticmethod
+    def _upsert_bot_pr(
+        conn: sqlite3.Connection,
+        pr_key: str,
+        commits: list[str],
+        last_review_at: str | None,
+    ) -> None:
+        conn.execute(
+            """
+            INSERT INTO bot_detection (pr_key, reviewed_commits, last_review_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT (pr_key) DO UPDATE SET
+                reviewed_commits = excluded.reviewed_commits,
+                last_review_at = excluded.last_review_at
+            """,
+            (pr_key, json.dumps(commits), last_review_at),
+        )
+
+    # ------------------------------------------------------------------
+    # PR review records (models.py)
+    # ------------------------------------------------------------------
+
+    def upsert_review_record(self, record: dict[str, Any]) -> None:
+        """Insert or replace a PRReviewResult (as its to_dict())."""
+        with self.transaction() as conn:
+            self._upsert_review_record(conn, record)
+
+    def get_review_record(self, pr_number: int) -> dict[str, Any] | None:
+        rows = self._query(
+            "SELECT data FROM review_records WHERE pr_number = ?", (pr_number,)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def get_review_index(self) -> list[dict[str, Any]]:
+        """Summary of every review: pr_number, repo, status, findings, time."""
+        rows = self._query(
+            "SELECT pr_number, repo, overall_status, findings_count, reviewed_at "
+            "FROM review_records ORDER BY pr_number"
+        )
+        return [
+            {
+                "pr_number": pr_number,
+                "repo": repo,
+                "overall_status": overall_status,
+                "findings_count": findings_count,
+                "reviewed_at": reviewed_at,
+            }
+            for pr_number, repo, overall_status, findings_count, reviewed_at in rows
+        ]
+
+    @staticmethod
+    def _upsert_review_record(conn: sqlite3.Connection, record: dict[str, Any]) -> None:
+        conn.execute(
+            """
+            INSERT INTO review_records
+                (pr_number, repo, overall_status, findings_count, reviewed_at, data)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (pr_number) DO UPDATE SET
+                repo = excluded.repo,
+                overall_status = excluded.overall_status,
+                findings_count = excluded.findings_count,
+                reviewed_at = excluded.reviewed_at,
+                data = excluded.data
+            """,
+            (
+                record["pr_number"],
+                record.get("repo"),
+                record.get("overall_status"),
+                len(record.get("findings", [])),
+                record.get("reviewed_at"),
+                json.dumps(record),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Storage ledger (storage_metrics.py)
+    # ------------------------------------------------------------------
+
+    def get_storage_files(self) -> dict[str, tuple[int, int, int]]:
+        """Ledger entries: relative path -> (size, mtime_ns, inode)."""
+        rows = self._query("SELECT path, size, mtime_ns, inode FROM storage_files")
+        return {path: (size, mtime_ns, inode) for path, size, mtime_ns, inode in rows}
+
+    def update_storage_files(
+        self,
+        upserts: Iterable[tuple[str, str, bool, int, int, int]] = (),
+        deletes: Iterable[str] = (),
+    ) -> None:
+        """
+        Apply ledger changes in one transaction.
+
+        Args:
+            upserts: (path, component, is_json, size, mtime_ns, inode) rows
+            deletes: Relative paths no longer present
+        """
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO storage_files
+                    (path, component, is_json, size, mtime_ns, inode)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    component = excluded.component,
+                    is_json = excluded.is_json,
+                    size = excluded.size,
+                    mtime_ns = excluded.mtime_ns,
+                    inode = excluded.inode
+                """,
+                [(p, c, int(j), size, m, i) for p, c, j, size, m, i in upserts],
+            )
+            conn.executemany(
+                "DELETE FROM storage_files WHERE path = ?",
+                [(path,) for path in deletes],
+            )
+
+    def get_storage_totals(self) -> dict[str, tuple[int, int]]:
+        """Component -> (bytes, JSON file count) over the ledger."""
+        rows = self._query(
+            "SELECT component, SUM(size), SUM(is_json) FROM storage_files "
+            "GROUP BY component"
+        )
+        return {component: (size, json_files) for component, size, json_files in rows}
+
+    # ------------------------------------------------------------------
+    # One-shot JSON import
+    # ------------------------------------------------------------------
+
+    def import_json_state(self) -> dict[str, int]:
+        """
+        Import the JSON state files into the database (again).
+
+        Runs automatically when the database is created; rows already in the
+        database are overwritten by the JSON version.
+
+        Returns:
+            Number of records imported per table
+        """
+        with self.transaction() as conn:
+            return self._import_json_state(conn)
+
+    def _import_json_state(self, conn: sqlite3.Connection) -> dict[str, int]:
+        counts = {"outcomes": 0, "trust_state": 0, "bot_detection": 0, "reviews": 0}
+
+        for file in sorted((self.state_dir / "learning").glob("*_outcomes.json")):
+            data = _read_json(file)
+            if not isinstance(data, dict):
+                continue
+            for item in data.get("outcomes", []):
+                try:
+                    self._upsert_outcome(conn, item)
+                except (KeyError, TypeError):
+                    continue
+                counts["outcomes"] += 1
+
+        for file in sorted((self.state_dir / "trust").glob("*.json")):
+            data = _read_json(file)
+            if isinstance(data, dict) and data.get("repo"):
+                self._upsert_trust_state(conn, data["repo"], data)
+                counts["trust_state"] += 1
+
+        data = _read_json(self.state_dir / "bot_detection_state.json")
+        if isinstance(data, dict):
+            reviewed_commits = data.get("reviewed_commits", {})
+            last_review_times = data.get("last_review_times", {})
+            self._insert_bot_state(conn, reviewed_commits, last_review_times)
+            counts["bot_detection"] = len({*reviewed_commits, *last_review_times})
+
+        for file in sorted((self.state_dir / "pr").glob("review_*.json")):
+            data = _read_json(file)
+            if not isinstance(data, dict):
+                continue
+            try:
+                self._upsert_review_record(conn, data)
+            except (KeyError, TypeError):
+                continue
+            counts["reviews"] += 1
+
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported_at', ?)",
+            (_now(),),
+        )
+        return counts
+
+
+_stores: dict[Path, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(state_dir: Path) -> StateStore:
+    """Get the process-wide store for a runner state directory."""
+    key = Path(state_dir).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = StateStore(key)
+            _stores[key] = store
+        return store
+
+
+def close_state_stores() -> None:
+    """Close every open store (mainly for tests)."""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
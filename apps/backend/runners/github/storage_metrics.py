@@ -10,6 +10,13 @@ Features:
 - Human-readable size formatting
 - Storage breakdown by component type
 
+Sizes and record counts come from a ledger in the state store (state.db):
+one row per state file with its size and stat signature. calculate() first
+reconciles the ledger with a single scandir pass that only rewrites rows
+for files whose size, mtime or inode changed; code that writes or deletes
+state files can report them with note_written()/note_deleted() so that
+calculate(reconcile=False) is accurate without walking the tree at all.
+
 Usage:
     calculator = StorageMetricsCalculator(state_dir=Path(".auto-claude/github"))
     metrics = calculator.calculate()
@@ -18,10 +25,33 @@ Usage:
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import STATE_DB_FILENAME, get_state_store
+except (ImportError, ValueError, SystemError):
+    from state_store import STATE_DB_FILENAME, get_state_store
+
+# Top-level directory -> StorageMetrics component
+COMPONENT_DIRS = {
+    "pr": "pr_reviews",
+    "issues": "issues",
+    "autofix": "autofix",
+    "audit": "audit_logs",
+    "archive": "archive",
+}
+
+# Components whose .json files count as records
+RECORD_COMPONENTS = ("pr_reviews", "issues", "autofix")
+
+# The database changes whenever the ledger does, so it is measured directly
+DATABASE_FILES = tuple(
+    STATE_DB_FILENAME + suffix for suffix in ("", "-wal", "-shm", "-journal")
+)
+
 
 @dataclass
 class StorageMetrics:
@@ -81,88 +111,146 @@ class StorageMetricsCalculator:
         self.state_dir = state_dir
         self.archive_dir = state_dir / "archive"
 
-    def calculate(self) -> StorageMetrics:
+    def calculate(self, reconcile: bool = True) -> StorageMetrics:
         """
         Calculate current storage usage metrics.
 
+        Args:
+            reconcile: Check the state tree for unreported changes first
+
         Returns:
             StorageMetrics with breakdown by component
         """
         metrics = StorageMetrics()
-
-        # Measure each directory
-        metrics.pr_reviews_bytes = self._calculate_directory_size(self.state_dir / "pr")
-        metrics.issues_bytes = self._calculate_directory_size(self.state_dir / "issues")
-        metrics.autofix_bytes = self._calculate_directory_size(
-            self.state_dir / "autofix"
-        )
-        metrics.audit_logs_bytes = self._calculate_directory_size(
-            self.state_dir / "audit"
-        )
-        metrics.archive_bytes = self._calculate_directory_size(self.archive_dir)
-
-        # Calculate total and other
-        total = self._calculate_directory_size(self.state_dir)
-        counted = (
+        if not self.state_dir.exists():
+            return metrics
+
+        if reconcile:
+            self.reconcile()
+        totals = get_state_store(self.state_dir).get_storage_totals()
+
+        def component(name: str) -> tuple[int, int]:
+            return totals.get(name, (0, 0))
+
+        metrics.pr_reviews_bytes = component("pr_reviews")[0]
+        metrics.issues_bytes = component("issues")[0]
+        metrics.autofix_bytes = component("autofix")[0]
+        metrics.audit_logs_bytes = component("audit_logs")[0]
+        metrics.archive_bytes = component("archive")[0]
+        metrics.other_bytes = component("other")[0] + self._database_size()
+        metrics.total_bytes = (
             metrics.pr_reviews_bytes
             + metrics.issues_bytes
             + metrics.autofix_bytes
             + metrics.audit_logs_bytes
             + metrics.archive_bytes
+            + metrics.other_bytes
         )
-        metrics.other_bytes = max(0, total - counted)
-        metrics.total_bytes = total
 
-        # Count records
-        for subdir in ["pr", "issues", "autofix"]:
-            metrics.record_count += self._count_records(self.state_dir / subdir)
-
-        metrics.archive_count = self._count_records(self.archive_dir)
+        metrics.record_count = sum(component(name)[1] for name in RECORD_COMPONENTS)
+        metrics.archive_count = component("archive")[1]
 
         return metrics
 
-    def _calculate_directory_size(self, path: Path) -> int:
+    def reconcile(self) -> int:
         """
-        Calculate total size of all files in a directory recursively.
+        Bring the ledger in line with the files on disk.
 
-        Args:
-            path: Directory path to measure
+        Every file is stat()ed once; only new, changed (size, mtime or inode)
+        and vanished files touch the ledger.
 
         Returns:
-            Total size in bytes
+            Number of ledger rows written or deleted
         """
-        if not path.exists():
-            return 0
+        store = get_state_store(self.state_dir)
+        known = store.get_storage_files()
+        upserts = []
+        seen = set()
+
+        for relative, stat in self._scan():
+            seen.add(relative)
+            if known.get(relative) != (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+                upserts.append(self._ledger_row(relative, stat))
+        deletes = [relative for relative in known if relative not in seen]
+
+        if upserts or deletes:
+            store.update_storage_files(upserts, deletes)
+        return len(upserts) + len(deletes)
+
+    def note_written(self, path: Path) -> None:
+        """Record a state file that was just created or rewritten."""
+        relative = self._relative(path)
+        if relative is None:
+            return
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            self.note_deleted(path)
+            return
+        get_state_store(self.state_dir).update_storage_files(
+            upserts=[self._ledger_row(relative, stat)]
+        )
 
-        total = 0
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
+    def note_deleted(self, path: Path) -> None:
+        """Record a state file that was just deleted."""
+        relative = self._relative(path)
+        if relative is not None:
+            get_state_store(self.state_dir).update_storage_files(deletes=[relative])
+
+    def _scan(self):
+        """Yield (relative path, stat) for every file under the state dir."""
+        stack = [(self.state_dir, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                relative = prefix + entry.name
                 try:
-                    total += file_path.stat().st_size
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), relative + "/"))
+                    elif entry.is_file() and relative not in DATABASE_FILES:
+                        yield relative, entry.stat()
                 except OSError:
                     # Skip files that can't be accessed
                     continue
 
-        return total
-
-    def _count_records(self, path: Path) -> int:
-        """
-        Count JSON record files in a directory.
+    def _relative(self, path: Path) -> str | None:
+        try:
+            relative = (
+                Path(path).absolute().relative_to(self.state_dir.absolute()).as_posix()
+            )
+        except ValueError:
+            return None
+        if relative in DATABASE_FILES or relative == ".":
+            return None
+        return relative
 
-        Args:
-            path: Directory path to count
-
-        Returns:
-            Number of .json files
-        """
-        if not path.exists():
-            return 0
-
-        count = 0
-        for file_path in path.rglob("*.json"):
-            count += 1
+    @staticmethod
+    def _ledger_row(
+        relative: str, stat: os.stat_result
+    ) -> tuple[str, str, bool, int, int, int]:
+        top, _, rest = relative.partition("/")
+        component = COMPONENT_DIRS.get(top, "other") if rest else "other"
+        return (
+            relative,
+            component,
+            relative.endswith(".json"),
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+        )
 
-        return count
+    def _database_size(self) -> int:
+        total = 0
+        for name in DATABASE_FILES:
+            try:
+                total += (self.state_dir / name).stat().st_size
+            except OSError:
+                continue
+        return total
 
     def get_top_consumers(
         self,
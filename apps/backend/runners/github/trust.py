@@ -11,17 +11,23 @@ Progressive trust system that unlocks more autonomous actions as accuracy improv
 - L4: Full auto-fix with merge
 
 Trust increases with accuracy, decreases with overrides.
+
+Per-repo trust state is a row in the runner's state store (state.db).
 """
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import get_state_store
+except (ImportError, ValueError, SystemError):
+    from state_store import get_state_store
+
 
 class TrustLevel(IntEnum):
     """Trust levels with increasing autonomy."""
@@ -409,42 +415,25 @@ class TrustManager:
         self.trust_dir.mkdir(parents=True, exist_ok=True)
         self._states: dict[str, TrustState] = {}
 
-    def _get_state_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.trust_dir / f"{safe_name}.json"
-
     def get_state(self, repo: str) -> TrustState:
         """Get trust state for a repository."""
         if repo in self._states:
             return self._states[repo]
 
-        state_file = self._get_state_file(repo)
-        if state_file.exists():
-            try:
-                with open(state_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    state = TrustState.from_dict(data)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # Return default state if file is corrupted
-                state = TrustState(repo=repo)
-        else:
+        data = get_state_store(self.state_dir).get_trust_state(repo)
+        try:
+            state = TrustState.from_dict(data) if data else TrustState(repo=repo)
+        except (KeyError, ValueError):
+            # Return default state if the stored record is corrupted
             state = TrustState(repo=repo)
 
         self._states[repo] = state
         return state
 
     def save_state(self, repo: str) -> None:
-        """Save trust state for a repository with secure file permissions."""
-        import os
-
+        """Save trust state for a repository (state.db is owner-only)."""
         state = self.get_state(repo)
-        state_file = self._get_state_file(repo)
-
-        # Write with restrictive permissions (0o600 = owner read/write only)
-        fd = os.open(str(state_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        # os.fdopen takes ownership of fd and will close it when the with block exits
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(state.to_dict(), f, indent=2)
+        get_state_store(self.state_dir).upsert_trust_state(repo, state.to_dict())
 
     def get_trust_level(self, repo: str) -> TrustLevel:
         """Get current trust level for a repository."""
@@ -514,13 +503,11 @@ class TrustManager:
     def get_all_states(self) -> list[TrustState]:
         """Get trust states for all repos."""
         states = []
-        for file in self.trust_dir.glob("*.json"):
+        for data in get_state_store(self.state_dir).get_trust_states():
             try:
-                with open(file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    states.append(TrustState.from_dict(data))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # Skip corrupted state files
+                states.append(TrustState.from_dict(data))
+            except (KeyError, ValueError):
+                # Skip corrupted records
                 continue
         return states
 
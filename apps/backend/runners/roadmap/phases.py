@@ -73,7 +73,7 @@ class ProjectIndexPhase:
         debug("roadmap_phase", "Running project analyzer to create index")
         print_status("Running project analyzer...", "progress")
         success, output = self.script_executor.run_script(
-            "analyzer.py", ["--output", str(self.project_index)]
+            "analyzer.py", ["--output", str(self.project_index), "--incremental"]
         )
 
         if success and self.project_index.exists():
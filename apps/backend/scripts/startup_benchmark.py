@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+=====================
+
+Measures how much import work common run.py subcommands do, using
+``python -X importtime``, and fails when a subcommand exceeds its budget.
+
+Each subcommand runs against a throwaway project with one spec. The total
+import time (the sum of every module's own import time) is the best of
+--runs runs, and the modules with the largest cumulative import time are
+listed. Subcommands also name modules they must never import: those checks
+do not depend on machine speed, so they catch a handler being imported
+eagerly again even on a noisy CI runner.
+
+Usage:
+    cd apps/backend
+    python scripts/startup_benchmark.py
+    python scripts/startup_benchmark.py --budget-ms 300 --budget list=200
+    python scripts/startup_benchmark.py --json startup.json
+
+Exit status is 1 if any budget or import check fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = SCRIPT_DIR.parent
+RUN_PY = BACKEND_DIR / "run.py"
+
+SPEC_NAME = "001-startup-benchmark"
+
+# Modules that only building, QA and follow-up sessions need
+AGENT_MODULES = ("claude_agent_sdk", "agents", "core.client", "qa", "graphiti_core")
+
+# Subcommand -> (run.py arguments, modules it must not import)
+SUBCOMMANDS: dict[str, tuple[list[str], tuple[str, ...]]] = {
+    "help": (["--help"], (*AGENT_MODULES, "core.workspace", "merge")),
+    "list": (["--list"], AGENT_MODULES),
+    "merge-preview": (["--spec", "001", "--merge-preview"], AGENT_MODULES),
+    "qa-status": (["--spec", "001", "--qa-status"], ("graphiti_core",)),
+}
+
+DEFAULT_BUDGET_MS = 400.0
+DEFAULT_RUNS = 3
+TOP_MODULES = 8
+
+
+@dataclass
+class ImportRecord:
+    """One line of -X importtime output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class SubcommandResult:
+    """Best-of-N import cost of one subcommand."""
+
+    name: str
+    args: list[str]
+    total_ms: float
+    budget_ms: float
+    top_modules: list[tuple[str, float]] = field(default_factory=list)
+    forbidden_imported: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return self.total_ms <= self.budget_ms and not self.forbidden_imported
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "args": self.args,
+            "total_ms": round(self.total_ms, 1),
+            "budget_ms": self.budget_ms,
+            "top_modules": [[m, round(ms, 1)] for m, ms in self.top_modules],
+            "forbidden_imported": self.forbidden_imported,
+            "passed": self.passed,
+        }
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """
+    Parse ``-X importtime`` lines from a process's stderr.
+
+    Lines look like ``import time:  self [us] | cumulative | imported package``
+    with the module name indented two spaces per nesting level. Other stderr
+    output is ignored.
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # The header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(ImportRecord(name.strip(), self_us, cumulative_us, depth))
+    return records
+
+
+def create_project(root: Path) -> Path:
+    """Create a minimal project with one spec for the subcommands to use."""
+    spec_dir = root / ".auto-claude" / "specs" / SPEC_NAME
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text("# Startup benchmark\n", encoding="utf-8")
+    return root
+
+
+def measure(
+    name: str,
+    args: list[str],
+    forbidden: tuple[str, ...],
+    project_dir: Path,
+    budget_ms: float,
+    runs: int = DEFAULT_RUNS,
+) -> SubcommandResult:
+    """Run one subcommand `runs` times and keep the cheapest run."""
+    best: list[ImportRecord] | None = None
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", str(RUN_PY), *args]
+            + ["--project-dir", str(project_dir)],
+            cwd=BACKEND_DIR,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        records = parse_importtime(proc.stderr)
+        if best is None or sum(r.self_us for r in records) < sum(
+            r.self_us for r in best
+        ):
+            best = records
+
+    records = best or []
+    imported = {r.module for r in records}
+    top = sorted(records, key=lambda r: r.cumulative_us, reverse=True)
+    return SubcommandResult(
+        name=name,
+        args=args,
+        total_ms=sum(r.self_us for r in records) / 1000,
+        budget_ms=budget_ms,
+        top_modules=[(r.module, r.cumulative_us / 1000) for r in top[:TOP_MODULES]],
+        forbidden_imported=[m for m in forbidden if m in imported],
+    )
+
+
+def parse_budgets(default_ms: float, overrides: list[str]) -> dict[str, float]:
+    """Budgets per subcommand from --budget-ms and NAME=MS overrides."""
+    budgets = dict.fromkeys(SUBCOMMANDS, default_ms)
+    for override in overrides:
+        name, sep, value = override.partition("=")
+        if not sep or name not in SUBCOMMANDS:
+            raise ValueError(
+                f"Invalid budget {override!r}: expected NAME=MS with NAME one of "
+                f"{', '.join(SUBCOMMANDS)}"
+            )
+        budgets[name] = float(value)
+    return budgets
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.environ.get("STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)),
+        help="Import time budget per subcommand (default: $STARTUP_BUDGET_MS "
+        f"or {DEFAULT_BUDGET_MS:g})",
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="NAME=MS",
+        help="Budget for one subcommand (repeatable)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=list(SUBCOMMANDS),
+        help="Measure only these subcommands (repeatable)",
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--json", type=Path, help="Also write results as JSON")
+    options = parser.parse_args(argv)
+
+    try:
+        budgets = parse_budgets(options.budget_ms, options.budget)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = create_project(Path(tmp))
+        for name in options.only or SUBCOMMANDS:
+            args, forbidden = SUBCOMMANDS[name]
+            result = measure(
+                name, args, forbidden, project_dir, budgets[name], options.runs
+            )
+            results.append(result)
+
+            status = "ok" if result.passed else "FAIL"
+            print(
+                f"{status:4} {name:14} {result.total_ms:7.1f} ms "
+                f"(budget {result.budget_ms:g} ms)"
+            )
+            for module, ms in result.top_modules:
+                print(f"       {ms:7.1f} ms  {module}")
+            if result.forbidden_imported:
+                print(f"       imported: {', '.join(result.forbidden_imported)}")
+
+    if options.json:
+        options.json.write_text(
+            json.dumps([r.to_dict() for r in results], indent=2), encoding="utf-8"
+        )
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,10 +4,25 @@ Security Profile Management
 
 Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
+
+Profiles are cached per (project_dir, spec_dir) so that several worktrees or
+specs running in one process (parallel subagents, the GitHub runner reviewing
+several PRs) don't evict each other on every hook call. The cache is
+thread-safe, bounded in size (least recently used entries are evicted) and
+revalidated against the profile/allowlist file stats on every lookup.
+Worktrees whose profile was inherited from the same parent share a single
+SecurityProfile instance.
 """
 
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
+from core.fingerprint import stat_token
 from project_analyzer import (
     SecurityProfile,
     get_or_create_profile,
@@ -19,17 +34,35 @@ from .constants import ALLOWLIST_FILENAME, PROFILE_FILENAME
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: SecurityProfile | None = None
-_cached_project_dir: Path | None = None
-_cached_spec_dir: Path | None = None  # Track spec directory for cache key
-_cached_profile_mtime: float | None = None  # Track file modification time
-_cached_allowlist_mtime: float | None = None  # Track allowlist modification time
+# Maximum number of (project_dir, spec_dir) profiles kept in memory
+MAX_CACHED_PROFILES = 32
+
+_CacheKey = tuple[Path, Path | None]
+
+
+@dataclass
+class _CacheEntry:
+    """A cached profile plus the file stats it was loaded against."""
+
+    profile: SecurityProfile
+    profile_token: str | None
+    allowlist_token: str | None
+
+
+# Cache the security profiles to avoid re-analyzing on every command
+_profile_cache: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+_cache_lock = threading.Lock()  # Protects _profile_cache and _load_locks
+# Per-key locks so concurrent first lookups for one project analyze it once
+_load_locks: dict[_CacheKey, threading.Lock] = {}
 
+# Inherited profiles shared across worktrees, keyed by (parent, content digest).
+# Weak values: a shared profile lives only as long as some cache entry uses it.
+_inherited_profiles: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
-def _get_profile_path(project_dir: Path) -> Path:
-    """Get the security profile file path for a project."""
-    return project_dir / PROFILE_FILENAME
+
+def _get_profile_path(project_dir: Path, spec_dir: Path | None = None) -> Path:
+    """Get the security profile file path for a project (or its spec)."""
+    return (spec_dir or project_dir) / PROFILE_FILENAME
 
 
 def _get_allowlist_path(project_dir: Path) -> Path:
@@ -37,22 +70,19 @@ def _get_allowlist_path(project_dir: Path) -> Path:
     return project_dir / ALLOWLIST_FILENAME
 
 
-def _get_profile_mtime(project_dir: Path) -> float | None:
-    """Get the modification time of the security profile file, or None if not exists."""
-    profile_path = _get_profile_path(project_dir)
-    try:
-        return profile_path.stat().st_mtime
-    except OSError:
-        return None
-
+def _share_inherited_profile(profile: SecurityProfile) -> SecurityProfile:
+    """Return the shared instance for an inherited profile with this content."""
+    if not profile.inherited_from:
+        return profile
 
-def _get_allowlist_mtime(project_dir: Path) -> float | None:
-    """Get the modification time of the allowlist file, or None if not exists."""
-    allowlist_path = _get_allowlist_path(project_dir)
-    try:
-        return allowlist_path.stat().st_mtime
-    except OSError:
-        return None
+    content = json.dumps(profile.to_dict(), sort_keys=True)
+    key = (profile.inherited_from, hashlib.sha256(content.encode()).hexdigest())
+    with _cache_lock:
+        shared = _inherited_profiles.get(key)
+        if shared is None:
+            _inherited_profiles[key] = profile
+            shared = profile
+    return shared
 
 
 def get_security_profile(
@@ -61,12 +91,13 @@ def get_security_profile(
     """
     Get the security profile for a project, using cache when possible.
 
-    The cache is invalidated when:
-    - The project directory changes
-    - The security profile file is created (was None, now exists)
-    - The security profile file is modified (mtime changed)
+    A cached entry is invalidated when:
+    - The security profile file is created, modified, or deleted
     - The allowlist file is created, modified, or deleted
 
+    Entries for other (project_dir, spec_dir) pairs are unaffected, up to
+    MAX_CACHED_PROFILES entries.
+
     Args:
         project_dir: Project root directory
         spec_dir: Optional spec directory
@@ -74,55 +105,59 @@ def get_security_profile(
     Returns:
         SecurityProfile for the project
     """
-    global _cached_profile
-    global _cached_project_dir
-    global _cached_spec_dir
-    global _cached_profile_mtime
-    global _cached_allowlist_mtime
-
     project_dir = Path(project_dir).resolve()
     resolved_spec_dir = Path(spec_dir).resolve() if spec_dir else None
+    key: _CacheKey = (project_dir, resolved_spec_dir)
+
+    profile_path = _get_profile_path(project_dir, resolved_spec_dir)
+    allowlist_path = _get_allowlist_path(project_dir)
 
-    # Check if cache is valid (both project_dir and spec_dir must match)
-    if (
-        _cached_profile is not None
-        and _cached_project_dir == project_dir
-        and _cached_spec_dir == resolved_spec_dir
-    ):
-        # Check if files have been created or modified since caching
-        current_profile_mtime = _get_profile_mtime(project_dir)
-        current_allowlist_mtime = _get_allowlist_mtime(project_dir)
-
-        # Cache is valid if both mtimes are unchanged
-        if (
-            current_profile_mtime == _cached_profile_mtime
-            and current_allowlist_mtime == _cached_allowlist_mtime
-        ):
-            return _cached_profile
-
-        # File was created, modified, or deleted - invalidate cache
-        # (This happens when analyzer creates the file after agent starts,
-        # or when user adds/updates the allowlist)
-
-    # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
-    _cached_spec_dir = resolved_spec_dir
-    _cached_profile_mtime = _get_profile_mtime(project_dir)
-    _cached_allowlist_mtime = _get_allowlist_mtime(project_dir)
-
-    return _cached_profile
+    with _cache_lock:
+        entry = _profile_cache.get(key)
+        if entry is not None:
+            # Check if files have been created or modified since caching
+            # (This happens when analyzer creates the file after agent starts,
+            # or when user adds/updates the allowlist)
+            if entry.profile_token == stat_token(
+                profile_path
+            ) and entry.allowlist_token == stat_token(allowlist_path):
+                _profile_cache.move_to_end(key)
+                return entry.profile
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+
+    with load_lock:
+        # Another thread may have loaded this key while we waited
+        with _cache_lock:
+            entry = _profile_cache.get(key)
+            if (
+                entry is not None
+                and entry.profile_token == stat_token(profile_path)
+                and entry.allowlist_token == stat_token(allowlist_path)
+            ):
+                _profile_cache.move_to_end(key)
+                return entry.profile
+
+        # Analyze outside the cache lock so other projects aren't blocked
+        profile = _share_inherited_profile(get_or_create_profile(project_dir, spec_dir))
+        entry = _CacheEntry(
+            profile=profile,
+            profile_token=stat_token(profile_path),
+            allowlist_token=stat_token(allowlist_path),
+        )
+
+        with _cache_lock:
+            _profile_cache[key] = entry
+            _profile_cache.move_to_end(key)
+            while len(_profile_cache) > MAX_CACHED_PROFILES:
+                evicted_key, _ = _profile_cache.popitem(last=False)
+                _load_locks.pop(evicted_key, None)
+
+    return profile
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile
-    global _cached_project_dir
-    global _cached_spec_dir
-    global _cached_profile_mtime
-    global _cached_allowlist_mtime
-    _cached_profile = None
-    _cached_project_dir = None
-    _cached_spec_dir = None
-    _cached_profile_mtime = None
-    _cached_allowlist_mtime = None
+    """Reset the cached profiles (useful for testing or re-analysis)."""
+    with _cache_lock:
+        _profile_cache.clear()
+        _load_locks.clear()
+        _inherited_profiles.clear()
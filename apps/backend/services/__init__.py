@@ -6,11 +6,12 @@ Background services and orchestration for Auto Claude.
 """
 
 from .context import ServiceContext
-from .orchestrator import ServiceOrchestrator
+from .orchestrator import EnvironmentLease, ServiceOrchestrator
 from .recovery import RecoveryManager
 
 __all__ = [
     "ServiceContext",
+    "EnvironmentLease",
     "ServiceOrchestrator",
     "RecoveryManager",
 ]
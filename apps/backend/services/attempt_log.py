@@ -0,0 +1,369 @@
+"""
+Attempt Log
+===========
+
+Append-only storage for RecoveryManager's attempt history.
+
+RecoveryManager used to load, modify and rewrite the whole
+attempt_history.json on every recorded attempt. Now every change is one
+line appended to a log, and the in-memory index answers reads:
+
+    memory/attempt_history.json   snapshot (same schema as before, plus
+                                  metadata.log_seq)
+    memory/attempt_log.jsonl      changes since the snapshot, one per line:
+        {"seq": 7, "op": "attempt", "subtask_id": "...", "attempt": {...}}
+        {"seq": 8, "op": "stuck", "entry": {...}}
+        {"seq": 9, "op": "reset", "subtask_id": "..."}
+        {"seq": 10, "op": "clear_stuck"}
+
+The log is compacted into the snapshot once it holds COMPACT_MIN_OPS
+changes and at least half as many as the snapshot's attempts, so the total
+rewrite cost stays proportional to the number of attempts. Replay skips
+changes with a seq the snapshot already includes, so a crash between
+writing the snapshot and truncating the log loses nothing and applies
+nothing twice.
+
+The keyword set of each attempt's approach is computed once, when the
+attempt is recorded (or loaded), so circular-fix checks only compare a few
+precomputed sets.
+
+Instances are shared per memory directory (get_attempt_log()) and notice
+changes made by other processes: a replaced snapshot triggers a reload,
+and a grown log is read from where this process left off.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "attempt_history.json"
+LOG_FILENAME = "attempt_log.jsonl"
+
+# Minimum number of logged changes before compacting into the snapshot
+COMPACT_MIN_OPS = 64
+
+# Words ignored when comparing approaches for circular fixes
+APPROACH_STOP_WORDS = frozenset(
+    {
+        "with",
+        "using",
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "trying",
+    }
+)
+
+
+def approach_keywords(approach: str | None) -> frozenset[str]:
+    """Meaningful lower-cased words of an approach description."""
+    return frozenset(
+        word
+        for word in (approach or "").lower().split()
+        if word not in APPROACH_STOP_WORDS
+    )
+
+
+def _empty_history() -> dict[str, Any]:
+    now = datetime.now().isoformat()
+    return {
+        "subtasks": {},
+        "stuck_subtasks": [],
+        "metadata": {"created_at": now, "last_updated": now},
+    }
+
+
+def _identity(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class AttemptLog:
+    """Snapshot plus append-only change log, indexed per subtask."""
+
+    def __init__(self, memory_dir: Path, compact_min_ops: int = COMPACT_MIN_OPS):
+        """
+        Initialize the log (nothing is read until first use).
+
+        Args:
+            memory_dir: Spec memory directory
+            compact_min_ops: Minimum logged changes before compacting
+        """
+        self.memory_dir = Path(memory_dir)
+        self.snapshot_file = self.memory_dir / SNAPSHOT_FILENAME
+        self.log_file = self.memory_dir / LOG_FILENAME
+        self.compact_min_ops = compact_min_ops
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._history: dict[str, Any] = _empty_history()
+        self._keywords: dict[str, list[frozenset[str]]] = {}
+        self._attempt_total = 0
+        self._seq = 0
+        self._snapshot_identity: tuple[int, int, int] | None = None
+        self._log_offset = 0
+        self._pending_ops = 0
+        self.compactions = 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def exists(self) -> bool:
+        return self.snapshot_file.exists() or self.log_file.exists()
+
+    def history(self) -> dict[str, Any]:
+        """Full history in the attempt_history.json schema (a copy)."""
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._history)
+
+    def subtask(self, subtask_id: str) -> dict[str, Any]:
+        """A subtask's {"attempts": [...], "status": ...} entry (a copy)."""
+        with self._lock:
+            self._refresh()
+            entry = self._history["subtasks"].get(subtask_id)
+            if entry is None:
+                return {"attempts": [], "status": "pending"}
+            return copy.deepcopy(entry)
+
+    def attempt_count(self, subtask_id: str) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._keywords.get(subtask_id, ()))
+
+    def recent_keywords(self, subtask_id: str, count: int) -> list[frozenset[str]]:
+        """Keyword sets of a subtask's last `count` attempts, oldest first."""
+        with self._lock:
+            self._refresh()
+            return self._keywords.get(subtask_id, [])[-count:]
+
+    def stuck_subtasks(self) -> list[dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._history["stuck_subtasks"])
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def ensure_snapshot(self) -> None:
+        """Create an empty snapshot if there is no history yet."""
+        with self._lock:
+            if not self.exists():
+                self.memory_dir.mkdir(parents=True, exist_ok=True)
+                self._loaded = False
+                self._history = _empty_history()
+                self._write_snapshot()
+
+    def record_attempt(self, subtask_id: str, attempt: dict[str, Any]) -> None:
+        self._append({"op": "attempt", "subtask_id": subtask_id, "attempt": attempt})
+
+    def mark_stuck(self, entry: dict[str, Any]) -> None:
+        self._append({"op": "stuck", "entry": entry})
+
+    def reset_subtask(self, subtask_id: str) -> None:
+        self._append({"op": "reset", "subtask_id": subtask_id})
+
+    def clear_stuck(self) -> None:
+        self._append({"op": "clear_stuck"})
+
+    def compact(self) -> None:
+        """Fold the log into the snapshot and truncate it."""
+        with self._lock:
+            self._refresh()
+            if self._pending_ops == 0 and self._snapshot_identity is not None:
+                return
+            self._write_snapshot()
+            self.log_file.unlink(missing_ok=True)
+            self._log_offset = 0
+            self._pending_ops = 0
+            self.compactions += 1
+
+    def _append(self, op: dict[str, Any]) -> None:
+        with self._lock:
+            self._refresh()
+            self._seq += 1
+            op = {"seq": self._seq, **op}
+            line = json.dumps(op, ensure_ascii=False) + "\n"
+            self.memory_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                if f.tell() > self._log_offset:
+                    # Unterminated line left by an interrupted writer
+                    line = "\n" + line
+                f.write(line)
+                self._log_offset = f.tell()
+            self._apply(op)
+            self._pending_ops += 1
+            if self._pending_ops >= max(self.compact_min_ops, self._attempt_total // 2):
+                self.compact()
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _write_snapshot(self) -> None:
+        self._history["metadata"]["last_updated"] = datetime.now().isoformat()
+        self._history["metadata"]["log_seq"] = self._seq
+        write_json_atomic(self.snapshot_file, self._history, indent=2)
+        self._snapshot_identity = _identity(self.snapshot_file)
+        self._loaded = True
+
+    def _refresh(self) -> None:
+        snapshot_identity = _identity(self.snapshot_file)
+        if not self._loaded or snapshot_identity != self._snapshot_identity:
+            self._reload(snapshot_identity)
+            return
+        try:
+            log_size = os.path.getsize(self.log_file)
+        except OSError:
+            log_size = 0
+        if log_size < self._log_offset:
+            self._reload(snapshot_identity)  # Log truncated elsewhere
+        elif log_size > self._log_offset:
+            self._read_log()  # Appended to elsewhere
+
+    def _reload(self, snapshot_identity: tuple[int, int, int] | None) -> None:
+        history = None
+        if snapshot_identity is not None:
+            try:
+                with open(self.snapshot_file, encoding="utf-8") as f:
+                    history = json.load(f)
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Unreadable {self.snapshot_file}, starting fresh")
+        if not isinstance(history, dict):
+            history = _empty_history()
+        history.setdefault("subtasks", {})
+        history.setdefault("stuck_subtasks", [])
+        history.setdefault("metadata", _empty_history()["metadata"])
+
+        self._history = history
+        self._seq = history["metadata"].get("log_seq", 0)
+        self._keywords = {
+            subtask_id: [
+                approach_keywords(attempt.get("approach"))
+                for attempt in entry.get("attempts", [])
+            ]
+            for subtask_id, entry in history["subtasks"].items()
+        }
+        self._attempt_total = sum(len(k) for k in self._keywords.values())
+        self._snapshot_identity = snapshot_identity
+        self._log_offset = 0
+        self._pending_ops = 0
+        self._loaded = True
+        self._read_log()
+
+    def _read_log(self) -> None:
+        try:
+            with open(self.log_file, "rb") as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except OSError:
+            return
+        # Leave an unterminated last line for when its writer finishes
+        complete = data[: data.rfind(b"\n") + 1]
+        snapshot_seq = self._history["metadata"].get("log_seq", 0)
+        for raw_line in complete.splitlines():
+            if not raw_line.strip():
+                continue
+            try:
+                op = json.loads(raw_line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Skipping corrupt line in {self.log_file}")
+                continue
+            seq = op.get("seq", 0)
+            if seq <= snapshot_seq:
+                continue  # Already folded into the snapshot
+            self._seq = max(self._seq, seq)
+            self._apply(op)
+            self._pending_ops += 1
+        self._log_offset += len(complete)
+
+    def _apply(self, op: dict[str, Any]) -> None:
+        subtasks = self._history["subtasks"]
+        kind = op.get("op")
+        if kind == "attempt":
+            subtask_id = op["subtask_id"]
+            attempt = op["attempt"]
+            entry = subtasks.setdefault(
+                subtask_id, {"attempts": [], "status": "pending"}
+            )
+            entry["attempts"].append(attempt)
+            entry["status"] = "completed" if attempt.get("success") else "failed"
+            self._keywords.setdefault(subtask_id, []).append(
+                approach_keywords(attempt.get("approach"))
+            )
+            self._attempt_total += 1
+        elif kind == "stuck":
+            entry = op["entry"]
+            subtask_id = entry["subtask_id"]
+            stuck = self._history["stuck_subtasks"]
+            if not any(s["subtask_id"] == subtask_id for s in stuck):
+                stuck.append(entry)
+            if subtask_id in subtasks:
+                subtasks[subtask_id]["status"] = "stuck"
+        elif kind == "reset":
+            subtask_id = op["subtask_id"]
+            if subtask_id in subtasks:
+                self._attempt_total -= len(self._keywords.get(subtask_id, ()))
+                subtasks[subtask_id] = {"attempts": [], "status": "pending"}
+                self._keywords[subtask_id] = []
+            self._history["stuck_subtasks"] = [
+                s
+                for s in self._history["stuck_subtasks"]
+                if s["subtask_id"] != subtask_id
+            ]
+        elif kind == "clear_stuck":
+            self._history["stuck_subtasks"] = []
+        else:
+            logger.warning(f"Unknown attempt log operation: {kind!r}")
+
+
+_logs: dict[Path, AttemptLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_attempt_log(memory_dir: Path) -> AttemptLog:
+    """Get the process-wide attempt log for a spec memory directory."""
+    key = Path(memory_dir).resolve()
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = AttemptLog(key)
+            _logs[key] = log
+        return log
+
+
+def load_attempt_history(memory_dir: Path) -> dict[str, Any] | None:
+    """
+    Read the attempt history (snapshot plus log) without creating files.
+
+    Returns:
+        History in the attempt_history.json schema, or None if there is none
+    """
+    log = get_attempt_log(memory_dir)
+    if not log.exists():
+        return None
+    return log.history()
@@ -6,6 +6,12 @@ Service Orchestrator Module
 Orchestrates multi-service environments for testing.
 Handles docker-compose, monorepo service discovery, and health checks.
 
+Services start in dependency order (compose ``depends_on``) and their
+health checks run concurrently, each polling with its own exponential
+backoff. An EnvironmentLease keeps a healthy environment running across
+repeated uses, such as QA iterations, until the compose file or its
+inputs change.
+
 The service orchestrator is used by:
 - QA Agent: To start services before integration/e2e tests
 - Validation Strategy: To determine if multi-service orchestration is needed
@@ -18,16 +24,50 @@ Usage:
         orchestrator.start_services()
         # run tests
         orchestrator.stop_services()
+
+    with EnvironmentLease(project_dir) as lease:
+        for iteration in range(3):
+            lease.acquire()  # Reuses the running services while they are healthy
+            # run tests
 """
 
+import hashlib
 import json
 import shlex
 import subprocess
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+# Health check polling: per-service exponential backoff between probes
+HEALTH_INITIAL_DELAY = 0.05  # seconds
+HEALTH_MAX_DELAY = 2.0  # seconds
+HEALTH_PROBE_TIMEOUT = 2.0  # seconds, per HTTP request or port connect
+MAX_HEALTH_WORKERS = 16
+
+# Files whose contents feed an environment's fingerprint, besides the compose
+# file itself: a change to any of them means the running services are stale
+ENVIRONMENT_INPUT_FILES = (
+    ".env",
+    "Dockerfile",
+    "package.json",
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "pyproject.toml",
+    "requirements.txt",
+    "poetry.lock",
+    "uv.lock",
+    "go.mod",
+    "go.sum",
+    "Cargo.toml",
+    "Cargo.lock",
+)
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -46,6 +86,7 @@ class ServiceConfig:
         health_check_url: URL for health check
         startup_command: Command to start the service
         startup_timeout: Timeout in seconds for startup
+        depends_on: Names of services that must be healthy before this one starts
     """
 
     name: str
@@ -55,6 +96,7 @@ class ServiceConfig:
     health_check_url: str | None = None
     startup_command: str | None = None
     startup_timeout: int = 120
+    depends_on: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -67,12 +109,14 @@ class OrchestrationResult:
         services_started: List of services that were started
         services_failed: List of services that failed to start
         errors: List of error messages
+        reused: Whether already running services were reused instead of started
     """
 
     success: bool = False
     services_started: list[str] = field(default_factory=list)
     services_failed: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    reused: bool = False
 
 
 # =============================================================================
@@ -87,21 +131,28 @@ class ServiceOrchestrator:
     Supports:
     - Docker Compose for containerized services
     - Monorepo service discovery
-    - Health check waiting
+    - Dependency-ordered startup with concurrent health checks
     """
 
-    def __init__(self, project_dir: Path) -> None:
+    def __init__(
+        self, project_dir: Path, services: list[ServiceConfig] | None = None
+    ) -> None:
         """
         Initialize the service orchestrator.
 
         Args:
             project_dir: Path to the project root
+            services: Explicit service configurations; discovered from the
+                project when omitted
         """
         self.project_dir = Path(project_dir)
         self._compose_file: Path | None = None
         self._services: list[ServiceConfig] = []
         self._processes: dict[str, subprocess.Popen] = {}
-        self._discover_services()
+        if services is not None:
+            self._services = list(services)
+        else:
+            self._discover_services()
 
     def _discover_services(self) -> None:
         """Discover services in the project."""
@@ -192,12 +243,25 @@ class ServiceOrchestrator:
                 if port:
                     health_url = f"http://localhost:{port}/health"
 
+                # depends_on is either a list of names or a mapping of
+                # name -> condition
+                depends_on = config.get("depends_on") or []
+                if isinstance(depends_on, dict):
+                    depends_on = list(depends_on)
+
+                # The build context doubles as the service path
+                build = config.get("build")
+                if isinstance(build, dict):
+                    build = build.get("context")
+
                 self._services.append(
                     ServiceConfig(
                         name=name,
+                        path=build if isinstance(build, str) else None,
                         port=port,
                         type="docker",
                         health_check_url=health_url,
+                        depends_on=[str(dep) for dep in depends_on],
                     )
                 )
         except Exception:
@@ -271,6 +335,39 @@ class ServiceOrchestrator:
         """
         return self._services.copy()
 
+    def start_order(self) -> list[list[ServiceConfig]]:
+        """
+        Group services into start waves by their dependencies.
+
+        Every service comes after the services it depends on; services in the
+        same wave are independent of each other. Dependencies on services
+        that are not part of the environment are ignored.
+
+        Returns:
+            List of waves, each a list of ServiceConfig objects
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        names = {service.name for service in self._services}
+        pending = {
+            service.name: {dep for dep in service.depends_on if dep in names}
+            for service in self._services
+        }
+        waves: list[list[ServiceConfig]] = []
+        while pending:
+            ready = {name for name, deps in pending.items() if not deps}
+            if not ready:
+                cycle = ", ".join(sorted(pending))
+                raise ValueError(f"Dependency cycle between services: {cycle}")
+            waves.append([s for s in self._services if s.name in ready])
+            pending = {
+                name: deps - ready
+                for name, deps in pending.items()
+                if name not in ready
+            }
+        return waves
+
     def start_services(self, timeout: int = 120) -> OrchestrationResult:
         """
         Start all services.
@@ -314,13 +411,22 @@ class ServiceOrchestrator:
                 result.errors.append(f"docker-compose up failed: {proc.stderr}")
                 return result
 
-            # Wait for health checks
-            if self._wait_for_health(timeout):
-                result.success = True
-                result.services_started = [s.name for s in self._services]
+            # Compose starts services in depends_on order itself; wait for
+            # all of them at once
+            health = self.wait_for_health(timeout=timeout)
+            result.services_started = [
+                s.name for s in self._services if health.get(s.name, True)
+            ]
+            result.services_failed = [
+                name for name, healthy in health.items() if not healthy
+            ]
+            if result.services_failed:
+                result.errors.append(
+                    "Services did not become healthy in time: "
+                    + ", ".join(result.services_failed)
+                )
             else:
-                result.errors.append("Services did not become healthy in time")
-                result.services_failed = [s.name for s in self._services]
+                result.success = True
 
         except subprocess.TimeoutExpired:
             result.errors.append("docker-compose startup timed out")
@@ -330,36 +436,73 @@ class ServiceOrchestrator:
         return result
 
     def _start_local_services(self, timeout: int) -> OrchestrationResult:
-        """Start local services (non-docker)."""
+        """
+        Start local services (non-docker), one dependency wave at a time.
+
+        Each wave is launched together and must become healthy before the
+        next one starts; a wave that fails leaves its dependents unstarted.
+        """
         result = OrchestrationResult()
+        deadline = time.monotonic() + timeout
 
-        for service in self._services:
-            if service.startup_command:
+        try:
+            waves = self.start_order()
+        except ValueError as e:
+            result.errors.append(str(e))
+            return result
+
+        for index, wave in enumerate(waves):
+            launched = []
+            for service in wave:
+                if not service.startup_command:
+                    continue
                 try:
                     # Use shlex.split() for safe parsing of shell-like syntax
-                    # shell=False prevents shell injection vulnerabilities
+                    # shell=False prevents shell injection vulnerabilities.
+                    # Output is discarded: nothing drains a pipe while the
+                    # service runs, and a full pipe would stall it
                     proc = subprocess.Popen(
                         shlex.split(service.startup_command),
                         shell=False,
                         cwd=self.project_dir / service.path
                         if service.path
                         else self.project_dir,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                     )
                     self._processes[service.name] = proc
-                    result.services_started.append(service.name)
+                    launched.append(service)
                 except Exception as e:
                     result.errors.append(f"Failed to start {service.name}: {str(e)}")
                     result.services_failed.append(service.name)
 
-        # Wait for services to be ready
-        if result.services_started:
-            if self._wait_for_health(timeout):
-                result.success = True
-            else:
-                result.errors.append("Services did not become healthy in time")
+            # Wait for the wave to be ready
+            remaining = max(deadline - time.monotonic(), 0.0)
+            health = self.wait_for_health(launched, timeout=remaining)
+            for service in launched:
+                if health.get(service.name, True):
+                    result.services_started.append(service.name)
+                else:
+                    result.services_failed.append(service.name)
+                    result.errors.append(
+                        f"Service {service.name} did not become healthy in time"
+                    )
+
+            if result.services_failed:
+                skipped = [
+                    s.name
+                    for later in waves[index + 1 :]
+                    for s in later
+                    if s.startup_command
+                ]
+                if skipped:
+                    result.services_failed.extend(skipped)
+                    result.errors.append(
+                        "Not started, dependencies failed: " + ", ".join(skipped)
+                    )
+                return result
 
+        result.success = bool(result.services_started)
         return result
 
     def stop_services(self) -> None:
@@ -424,33 +567,120 @@ class ServiceOrchestrator:
 
         return None
 
-    def _wait_for_health(self, timeout: int) -> bool:
+    def wait_for_health(
+        self, services: list[ServiceConfig] | None = None, timeout: float = 120
+    ) -> dict[str, bool]:
         """
-        Wait for all services to become healthy.
+        Wait for services to become healthy, polling all of them concurrently.
+
+        Each service is probed with its own exponential backoff until it is
+        healthy, its process exits, or its deadline (the smaller of timeout
+        and its startup_timeout) passes. Services without a port, health
+        check URL or process are skipped.
 
         Args:
+            services: Services to wait for (default: all services)
             timeout: Maximum time to wait in seconds
 
         Returns:
-            True if all services became healthy
+            Dict mapping each checked service name to whether it became healthy
         """
-        start_time = time.time()
+        start = time.monotonic()
+        checked = [
+            service
+            for service in (self._services if services is None else services)
+            if self._has_health_check(service)
+        ]
+        if not checked:
+            return {}
+
+        workers = min(len(checked), MAX_HEALTH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                service.name: pool.submit(
+                    self._wait_for_service,
+                    service,
+                    start + min(timeout, service.startup_timeout),
+                )
+                for service in checked
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def check_health(self) -> dict[str, bool]:
+        """
+        Probe every service once, concurrently.
 
-        while time.time() - start_time < timeout:
-            all_healthy = True
+        Returns:
+            Dict mapping each checked service name to whether it is healthy
+        """
+        checked = [s for s in self._services if self._has_health_check(s)]
+        if not checked:
+            return {}
 
-            for service in self._services:
-                if service.port:
-                    if not self._check_port(service.port):
-                        all_healthy = False
-                        break
+        workers = min(len(checked), MAX_HEALTH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            healthy = pool.map(self._probe_service, checked)
+            return {s.name: ok for s, ok in zip(checked, healthy)}
 
-            if all_healthy:
+    def _wait_for_health(self, timeout: int) -> bool:
+        """
+        Wait for all services to become healthy.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if all services became healthy
+        """
+        return all(self.wait_for_health(timeout=timeout).values())
+
+    def _has_health_check(self, service: ServiceConfig) -> bool:
+        """Check whether a service can be probed for health."""
+        return bool(
+            service.health_check_url or service.port or service.name in self._processes
+        )
+
+    def _wait_for_service(self, service: ServiceConfig, deadline: float) -> bool:
+        """Poll one service with exponential backoff until healthy or deadline."""
+        delay = HEALTH_INITIAL_DELAY
+        while True:
+            if self._probe_service(service):
                 return True
 
-            time.sleep(2)
+            # A local service that exited will not become healthy
+            proc = self._processes.get(service.name)
+            if proc is not None and proc.poll() is not None:
+                return False
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, HEALTH_MAX_DELAY)
+
+    def _probe_service(self, service: ServiceConfig) -> bool:
+        """Check once whether a service is healthy."""
+        if service.health_check_url:
+            return self._check_url(service.health_check_url)
+        if service.port:
+            return self._check_port(service.port)
+        proc = self._processes.get(service.name)
+        return proc is not None and proc.poll() is None
+
+    def _check_url(self, url: str) -> bool:
+        """
+        Check if a health check URL is responding.
 
-        return False
+        Any response below 500 counts: health URLs guessed from compose port
+        mappings may not exist on the service, but a 404 still means it is up.
+        """
+        try:
+            with urllib.request.urlopen(url, timeout=HEALTH_PROBE_TIMEOUT) as response:
+                return response.status < 500
+        except urllib.error.HTTPError as e:
+            return e.code < 500
+        except Exception:
+            return False
 
     def _check_port(self, port: int) -> bool:
         """Check if a port is responding."""
@@ -464,6 +694,49 @@ class ServiceOrchestrator:
         except Exception:
             return False
 
+    def environment_fingerprint(self) -> str:
+        """
+        Fingerprint the environment's definition.
+
+        Covers the service configurations, the compose file and the
+        ENVIRONMENT_INPUT_FILES found in the project root and each service
+        path. Source files are not included: they reach running services
+        through mounts or reloaders, not through a restart.
+
+        Returns:
+            Hex digest that changes when the environment must be restarted
+        """
+        digest = hashlib.sha256()
+        configs = [
+            [
+                s.name,
+                s.path,
+                s.port,
+                s.type,
+                s.health_check_url,
+                s.startup_command,
+                s.depends_on,
+            ]
+            for s in self._services
+        ]
+        digest.update(json.dumps(configs).encode("utf-8"))
+
+        inputs = [self._compose_file] if self._compose_file else []
+        directories = [self.project_dir] + [
+            self.project_dir / s.path for s in self._services if s.path
+        ]
+        for directory in dict.fromkeys(directories):
+            inputs.extend(directory / name for name in ENVIRONMENT_INPUT_FILES)
+
+        for path in inputs:
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+            digest.update(str(path).encode("utf-8") + b"\0")
+            digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert orchestration config to dictionary."""
         return {
@@ -477,6 +750,7 @@ class ServiceOrchestrator:
                     "port": s.port,
                     "type": s.type,
                     "health_check_url": s.health_check_url,
+                    "depends_on": s.depends_on,
                 }
                 for s in self._services
             ],
@@ -556,6 +830,93 @@ class ServiceContext:
         return True  # No services to start
 
 
+class EnvironmentLease:
+    """
+    Keeps an orchestrated environment running across repeated uses.
+
+    The first acquire() starts the services. Later calls reuse them while
+    they are healthy and the environment's fingerprint (compose file,
+    service configuration and their input files) is unchanged; otherwise
+    the services are stopped and started again. release() stops them.
+
+    Usage:
+        with EnvironmentLease(project_dir) as lease:
+            for iteration in range(3):
+                result = lease.acquire()
+                run_tests()
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        timeout: int = 120,
+        services: list[ServiceConfig] | None = None,
+    ) -> None:
+        """
+        Initialize the lease.
+
+        Args:
+            project_dir: Path to the project root
+            timeout: Timeout in seconds for services to start
+            services: Explicit service configurations; discovered from the
+                project when omitted
+        """
+        self.project_dir = Path(project_dir)
+        self.services = services
+        self.orchestrator = ServiceOrchestrator(project_dir, services)
+        self.timeout = timeout
+        self.result: OrchestrationResult | None = None
+        self.starts = 0
+        self._fingerprint: str | None = None
+
+    def acquire(self) -> OrchestrationResult:
+        """
+        Make sure the environment is running, reusing it when possible.
+
+        Returns:
+            OrchestrationResult of the start, or with reused=True when the
+            running services were kept
+        """
+        # Re-discover: the compose file or service layout may have changed
+        current = ServiceOrchestrator(self.project_dir, self.services)
+        fingerprint = current.environment_fingerprint()
+
+        if self.result is not None:
+            if (
+                self.result.success
+                and fingerprint == self._fingerprint
+                and all(self.orchestrator.check_health().values())
+            ):
+                return OrchestrationResult(
+                    success=True,
+                    services_started=list(self.result.services_started),
+                    reused=True,
+                )
+            # Stopped through the orchestrator that started them
+            self.orchestrator.stop_services()
+
+        self.orchestrator = current
+        self._fingerprint = fingerprint
+        self.result = self.orchestrator.start_services(self.timeout)
+        self.starts += 1
+        return self.result
+
+    def release(self) -> None:
+        """Stop the services if this lease started them."""
+        if self.result is not None:
+            self.orchestrator.stop_services()
+            self.result = None
+            self._fingerprint = None
+
+    def __enter__(self) -> "EnvironmentLease":
+        """Return the lease; services start on the first acquire()."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop services on context exit."""
+        self.release()
+
+
 # =============================================================================
 # CLI
 # =============================================================================
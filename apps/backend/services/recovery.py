@@ -20,6 +20,8 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+from .attempt_log import approach_keywords, get_attempt_log
+
 
 class FailureType(Enum):
     """Types of failures that can occur during autonomous builds."""
@@ -69,26 +71,14 @@ class RecoveryManager:
         # Ensure memory directory exists
         self.memory_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize files if they don't exist
-        if not self.attempt_history_file.exists():
-            self._init_attempt_history()
+        # Attempt history: shared append-only log, indexed per subtask
+        self.attempt_log = get_attempt_log(self.memory_dir)
+        self.attempt_log.ensure_snapshot()
 
+        # Initialize files if they don't exist
         if not self.build_commits_file.exists():
             self._init_build_commits()
 
-    def _init_attempt_history(self) -> None:
-        """Initialize the attempt history file."""
-        initial_data = {
-            "subtasks": {},
-            "stuck_subtasks": [],
-            "metadata": {
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
-            },
-        }
-        with open(self.attempt_history_file, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2)
-
     def _init_build_commits(self) -> None:
         """Initialize the build commits tracking file."""
         initial_data = {
@@ -102,22 +92,6 @@ class RecoveryManager:
         with open(self.build_commits_file, "w", encoding="utf-8") as f:
             json.dump(initial_data, f, indent=2)
 
-    def _load_attempt_history(self) -> dict:
-        """Load attempt history from JSON file."""
-        try:
-            with open(self.attempt_history_file, encoding="utf-8") as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-            self._init_attempt_history()
-            with open(self.attempt_history_file, encoding="utf-8") as f:
-                return json.load(f)
-
-    def _save_attempt_history(self, data: dict) -> None:
-        """Save attempt history to JSON file."""
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        with open(self.attempt_history_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-
     def _load_build_commits(self) -> dict:
         """Load build commits from JSON file."""
         try:
@@ -134,6 +108,15 @@ class RecoveryManager:
         with open(self.build_commits_file, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
 
+    def flush_attempt_history(self) -> None:
+        """
+        Fold logged attempts into attempt_history.json.
+
+        Call before starting an agent session: the agent reads that file
+        directly, while this class reads the log as well.
+        """
+        self.attempt_log.compact()
+
     def classify_failure(self, error: str, subtask_id: str) -> FailureType:
         """
         Classify what type of failure occurred.
@@ -193,9 +176,7 @@ class RecoveryManager:
         Returns:
             Number of attempts
         """
-        history = self._load_attempt_history()
-        subtask_data = history["subtasks"].get(subtask_id, {})
-        return len(subtask_data.get("attempts", []))
+        return self.attempt_log.attempt_count(subtask_id)
 
     def record_attempt(
         self,
@@ -215,13 +196,6 @@ class RecoveryManager:
             approach: Description of the approach taken
             error: Error message if failed
         """
-        history = self._load_attempt_history()
-
-        # Initialize subtask entry if it doesn't exist
-        if subtask_id not in history["subtasks"]:
-            history["subtasks"][subtask_id] = {"attempts": [], "status": "pending"}
-
-        # Add the attempt
         attempt = {
             "session": session,
             "timestamp": datetime.now().isoformat(),
@@ -229,15 +203,8 @@ class RecoveryManager:
             "success": success,
             "error": error,
         }
-        history["subtasks"][subtask_id]["attempts"].append(attempt)
-
-        # Update status
-        if success:
-            history["subtasks"][subtask_id]["status"] = "completed"
-        else:
-            history["subtasks"][subtask_id]["status"] = "failed"
-
-        self._save_attempt_history(history)
+        # Appended to the log; the subtask status becomes completed/failed
+        self.attempt_log.record_attempt(subtask_id, attempt)
 
     def is_circular_fix(self, subtask_id: str, current_approach: str) -> bool:
         """
@@ -250,46 +217,18 @@ class RecoveryManager:
         Returns:
             True if this appears to be a circular fix attempt
         """
-        history = self._load_attempt_history()
-        subtask_data = history["subtasks"].get(subtask_id, {})
-        attempts = subtask_data.get("attempts", [])
+        # Check if last 3 attempts used similar approaches
+        # Simple similarity check: look for repeated keywords, which were
+        # extracted once when each attempt was recorded
+        recent_keywords = self.attempt_log.recent_keywords(subtask_id, 3)
 
-        if len(attempts) < 2:
+        if len(recent_keywords) < 2:
             return False
 
-        # Check if last 3 attempts used similar approaches
-        # Simple similarity check: look for repeated keywords
-        recent_attempts = attempts[-3:] if len(attempts) >= 3 else attempts
-
-        # Extract key terms from current approach (ignore common words)
-        stop_words = {
-            "with",
-            "using",
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "trying",
-        }
-        current_keywords = set(
-            word for word in current_approach.lower().split() if word not in stop_words
-        )
+        current_keywords = approach_keywords(current_approach)
 
         similar_count = 0
-        for attempt in recent_attempts:
-            attempt_keywords = set(
-                word
-                for word in attempt["approach"].lower().split()
-                if word not in stop_words
-            )
-
+        for attempt_keywords in recent_keywords:
             # Calculate Jaccard similarity (intersection over union)
             overlap = len(current_keywords & attempt_keywords)
             total = len(current_keywords | attempt_keywords)
@@ -445,8 +384,6 @@ class RecoveryManager:
             subtask_id: ID of the subtask
             reason: Why it's stuck
         """
-        history = self._load_attempt_history()
-
         stuck_entry = {
             "subtask_id": subtask_id,
             "reason": reason,
@@ -454,18 +391,8 @@ class RecoveryManager:
             "attempt_count": self.get_attempt_count(subtask_id),
         }
 
-        # Check if already in stuck list
-        existing = [
-            s for s in history["stuck_subtasks"] if s["subtask_id"] == subtask_id
-        ]
-        if not existing:
-            history["stuck_subtasks"].append(stuck_entry)
-
-        # Update subtask status
-        if subtask_id in history["subtasks"]:
-            history["subtasks"][subtask_id]["status"] = "stuck"
-
-        self._save_attempt_history(history)
+        # Added to the stuck list unless already there; status becomes "stuck"
+        self.attempt_log.mark_stuck(stuck_entry)
 
     def get_stuck_subtasks(self) -> list[dict]:
         """
@@ -474,8 +401,7 @@ class RecoveryManager:
         Returns:
             List of stuck subtask entries
         """
-        history = self._load_attempt_history()
-        return history.get("stuck_subtasks", [])
+        return self.attempt_log.stuck_subtasks()
 
     def get_subtask_history(self, subtask_id: str) -> dict:
         """
@@ -487,10 +413,7 @@ class RecoveryManager:
         Returns:
             Subtask history dict with attempts
         """
-        history = self._load_attempt_history()
-        return history["subtasks"].get(
-            subtask_id, {"attempts": [], "status": "pending"}
-        )
+        return self.attempt_log.subtask(subtask_id)
 
     def get_recovery_hints(self, subtask_id: str) -> list[str]:
         """
@@ -532,9 +455,7 @@ class RecoveryManager:
 
     def clear_stuck_subtasks(self) -> None:
         """Clear all stuck subtasks (for manual resolution)."""
-        history = self._load_attempt_history()
-        history["stuck_subtasks"] = []
-        self._save_attempt_history(history)
+        self.attempt_log.clear_stuck()
 
     def reset_subtask(self, subtask_id: str) -> None:
         """
@@ -543,18 +464,8 @@ class RecoveryManager:
         Args:
             subtask_id: ID of the subtask to reset
         """
-        history = self._load_attempt_history()
-
-        # Clear attempt history
-        if subtask_id in history["subtasks"]:
-            history["subtasks"][subtask_id] = {"attempts": [], "status": "pending"}
-
-        # Remove from stuck subtasks
-        history["stuck_subtasks"] = [
-            s for s in history["stuck_subtasks"] if s["subtask_id"] != subtask_id
-        ]
-
-        self._save_attempt_history(history)
+        # Clears its attempts and removes it from the stuck subtasks
+        self.attempt_log.reset_subtask(subtask_id)
 
 
 # Utility functions for integration with agent.py
@@ -7,11 +7,87 @@ reducing token usage. After each phase completes, key findings are
 summarized and passed as context to subsequent phases.
 """
 
+import asyncio
+import hashlib
+import json
 from pathlib import Path
+from typing import Any
 
 from core.auth import require_auth_token
+from core.file_utils import write_json_atomic
 from core.simple_client import create_simple_client
 
+# Summaries are cached in the spec directory so resumed or retried specs
+# don't re-summarize phases whose outputs haven't changed
+SUMMARY_CACHE_FILENAME = "phase_summaries.json"
+
+# Bump when the prompt or cache layout changes so old summaries are ignored
+SUMMARY_CACHE_VERSION = 1
+
+# Limit input size to avoid token overflow
+MAX_SUMMARY_INPUT_CHARS = 15000
+
+SUMMARIZER_SYSTEM_PROMPT = (
+    "You are a concise technical summarizer. Extract only the most "
+    "critical information from phase outputs. Use bullet points. "
+    "Focus on decisions, discoveries, and actionable insights."
+)
+
+
+def _build_summary_prompt(phase_name: str, phase_output: str, target_words: int) -> str:
+    """Build the summarization prompt for one phase."""
+    truncated_output = phase_output[:MAX_SUMMARY_INPUT_CHARS]
+    if len(phase_output) > MAX_SUMMARY_INPUT_CHARS:
+        truncated_output += "\n\n[... output truncated for summarization ...]"
+
+    return f"""Summarize the key findings from the "{phase_name}" phase in {target_words} words or less.
+
+Focus on extracting ONLY the most critical information that subsequent phases need:
+- Key decisions made and their rationale
+- Critical files, components, or patterns identified
+- Important constraints or requirements discovered
+- Actionable insights for implementation
+
+Be concise and use bullet points. Skip boilerplate and meta-commentary.
+
+## Phase Output:
+{truncated_output}
+
+## Summary:
+"""
+
+
+def _create_compaction_client(model: str):
+    """Create the single-turn client used for phase summarization."""
+    return create_simple_client(
+        agent_type="spec_compaction",
+        model=model,
+        system_prompt=SUMMARIZER_SYSTEM_PROMPT,
+    )
+
+
+async def _query_summary(client, prompt: str) -> str:
+    """Send a summarization prompt on a connected client and collect the text."""
+    await client.query(prompt)
+    response_text = ""
+    async for msg in client.receive_response():
+        msg_type = type(msg).__name__
+        if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+            for block in msg.content:
+                # Must check block type - only TextBlock has .text attribute
+                block_type = type(block).__name__
+                if block_type == "TextBlock" and hasattr(block, "text"):
+                    response_text += block.text
+    return response_text.strip()
+
+
+def _fallback_summary(phase_output: str, error: Exception) -> str:
+    """Truncated raw output used when summarization fails."""
+    fallback = phase_output[:2000]
+    if len(phase_output) > 2000:
+        fallback += "\n\n[... truncated ...]"
+    return f"[Summarization failed: {error}]\n\n{fallback}"
+
 
 async def summarize_phase_output(
     phase_name: str,
@@ -23,6 +99,7 @@ async def summarize_phase_output(
     Summarize phase output to a concise summary for subsequent phases.
 
     Uses Sonnet for cost efficiency since this is a simple summarization task.
+    Opens a dedicated client; use PhaseSummarizer to summarize in the background.
 
     Args:
         phase_name: Name of the completed phase (e.g., 'discovery', 'requirements')
@@ -36,58 +113,212 @@ async def summarize_phase_output(
     # Validate auth token
     require_auth_token()
 
-    # Limit input size to avoid token overflow
-    max_input_chars = 15000
-    truncated_output = phase_output[:max_input_chars]
-    if len(phase_output) > max_input_chars:
-        truncated_output += "\n\n[... output truncated for summarization ...]"
+    prompt = _build_summary_prompt(phase_name, phase_output, target_words)
+    client = _create_compaction_client(model)
 
-    prompt = f"""Summarize the key findings from the "{phase_name}" phase in {target_words} words or less.
+    try:
+        async with client:
+            return await _query_summary(client, prompt)
+    except Exception as e:
+        # Fallback: return truncated raw output on error
+        # This ensures we don't block the pipeline if summarization fails
+        return _fallback_summary(phase_output, e)
 
-Focus on extracting ONLY the most critical information that subsequent phases need:
-- Key decisions made and their rationale
-- Critical files, components, or patterns identified
-- Important constraints or requirements discovered
-- Actionable insights for implementation
 
-Be concise and use bullet points. Skip boilerplate and meta-commentary.
+def summary_cache_key(
+    phase_name: str, phase_output: str, model: str, target_words: int
+) -> str:
+    """
+    Hash everything a phase summary depends on.
 
-## Phase Output:
-{truncated_output}
+    Args:
+        phase_name: Name of the phase
+        phase_output: Gathered phase output (see gather_phase_outputs)
+        model: Model used for summarization
+        target_words: Target summary length
 
-## Summary:
-"""
+    Returns:
+        Hex digest identifying the summary
+    """
+    hasher = hashlib.sha256()
+    for part in (
+        str(SUMMARY_CACHE_VERSION),
+        phase_name,
+        model,
+        str(target_words),
+        phase_output,
+    ):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
 
-    client = create_simple_client(
-        agent_type="spec_compaction",
-        model=model,
-        system_prompt=(
-            "You are a concise technical summarizer. Extract only the most "
-            "critical information from phase outputs. Use bullet points. "
-            "Focus on decisions, discoveries, and actionable insights."
-        ),
-    )
 
+def _load_summary_cache(spec_dir: Path) -> dict[str, Any]:
+    """Load the per-phase summary cache, or an empty one if missing/corrupt."""
     try:
-        async with client:
-            await client.query(prompt)
-            response_text = ""
-            async for msg in client.receive_response():
-                msg_type = type(msg).__name__
-                if msg_type == "AssistantMessage" and hasattr(msg, "content"):
-                    for block in msg.content:
-                        # Must check block type - only TextBlock has .text attribute
-                        block_type = type(block).__name__
-                        if block_type == "TextBlock" and hasattr(block, "text"):
-                            response_text += block.text
-            return response_text.strip()
-    except Exception as e:
-        # Fallback: return truncated raw output on error
-        # This ensures we don't block the pipeline if summarization fails
-        fallback = phase_output[:2000]
-        if len(phase_output) > 2000:
-            fallback += "\n\n[... truncated ...]"
-        return f"[Summarization failed: {e}]\n\n{fallback}"
+        with open(spec_dir / SUMMARY_CACHE_FILENAME, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SUMMARY_CACHE_VERSION:
+        return {}
+    phases = data.get("phases")
+    return phases if isinstance(phases, dict) else {}
+
+
+def load_cached_summary(spec_dir: Path, phase_name: str, key: str) -> str | None:
+    """
+    Look up a cached phase summary.
+
+    Args:
+        spec_dir: Path to the spec directory
+        phase_name: Name of the phase
+        key: Cache key from summary_cache_key()
+
+    Returns:
+        The cached summary if it was produced from identical inputs, else None
+    """
+    entry = _load_summary_cache(spec_dir).get(phase_name)
+    if isinstance(entry, dict) and entry.get("key") == key:
+        summary = entry.get("summary")
+        return summary if isinstance(summary, str) and summary else None
+    return None
+
+
+def store_cached_summary(
+    spec_dir: Path, phase_name: str, key: str, summary: str
+) -> None:
+    """
+    Record a phase summary, replacing any older summary for the phase.
+
+    Args:
+        spec_dir: Path to the spec directory
+        phase_name: Name of the phase
+        key: Cache key from summary_cache_key()
+        summary: Summary text to cache
+    """
+    phases = _load_summary_cache(spec_dir)
+    phases[phase_name] = {"key": key, "summary": summary}
+    try:
+        write_json_atomic(
+            spec_dir / SUMMARY_CACHE_FILENAME,
+            {"version": SUMMARY_CACHE_VERSION, "phases": phases},
+        )
+    except OSError:
+        pass  # Caching is best-effort (e.g. the spec dir was renamed meanwhile)
+
+
+class PhaseSummarizer:
+    """
+    Summarizes phase outputs in the background, with a per-spec cache.
+
+    schedule() gathers a phase's outputs and returns immediately: cached
+    summaries are used as-is, anything else is summarized in an asyncio task
+    so the next phase can start while the summary is produced. collect()
+    waits for outstanding summaries just before they are needed. Each
+    summary gets its own client, so no phase's conversation carries over
+    into another phase's summary.
+    """
+
+    def __init__(self, model: str = "sonnet", target_words: int = 500):
+        """
+        Initialize the summarizer.
+
+        Args:
+            model: Model to use for summarization
+            target_words: Target summary length in words
+        """
+        self.model = model
+        self.target_words = target_words
+        self.cache_hits = 0
+        self.summarized = 0
+        self._order: list[str] = []  # Phases in the order they completed
+        self._summaries: dict[str, str] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        # Superseded tasks are cancelled; close() waits for them to unwind
+        self._superseded: list[asyncio.Task] = []
+
+    def schedule(self, spec_dir: Path, phase_name: str) -> None:
+        """
+        Start summarizing a completed phase without waiting for the result.
+
+        Must be called from within a running event loop.
+
+        Args:
+            spec_dir: Path to the spec directory
+            phase_name: Name of the completed phase
+        """
+        previous = self._tasks.pop(phase_name, None)
+        if previous is not None:
+            previous.cancel()
+            self._superseded.append(previous)
+        # Re-run phases move to the end, keeping summaries in completion order
+        self._summaries.pop(phase_name, None)
+        if phase_name in self._order:
+            self._order.remove(phase_name)
+
+        phase_output = gather_phase_outputs(spec_dir, phase_name)
+        if not phase_output:
+            return
+        self._order.append(phase_name)
+
+        key = summary_cache_key(phase_name, phase_output, self.model, self.target_words)
+        cached = load_cached_summary(spec_dir, phase_name, key)
+        if cached is not None:
+            self.cache_hits += 1
+            self._summaries[phase_name] = cached
+            return
+
+        self._tasks[phase_name] = asyncio.create_task(
+            self._summarize(spec_dir, phase_name, phase_output, key)
+        )
+
+    async def collect(self) -> dict[str, str]:
+        """
+        Wait for scheduled summaries and return all summaries so far.
+
+        Returns:
+            Dict mapping phase names to summaries, in the order phases completed
+        """
+        while self._tasks:
+            phase_name, task = next(iter(self._tasks.items()))
+            summary = await task
+            # The phase may have been re-scheduled while we waited
+            if self._tasks.get(phase_name) is task:
+                del self._tasks[phase_name]
+                if summary:
+                    self._summaries[phase_name] = summary
+
+        return {
+            phase_name: self._summaries[phase_name]
+            for phase_name in self._order
+            if phase_name in self._summaries
+        }
+
+    async def close(self) -> None:
+        """Wait for outstanding and superseded summaries to finish."""
+        await self.collect()
+        await asyncio.gather(*self._superseded, return_exceptions=True)
+        self._superseded.clear()
+
+    async def _summarize(
+        self, spec_dir: Path, phase_name: str, phase_output: str, key: str
+    ) -> str:
+        """Summarize one phase on a fresh client and cache the result."""
+        prompt = _build_summary_prompt(phase_name, phase_output, self.target_words)
+        try:
+            require_auth_token()
+            client = _create_compaction_client(self.model)
+            async with client:
+                summary = await _query_summary(client, prompt)
+        except Exception as e:
+            # Fallback: truncated raw output, not cached so a retry re-summarizes
+            return _fallback_summary(phase_output, e)
+
+        self.summarized += 1
+        if summary:
+            store_cached_summary(spec_dir, phase_name, key, summary)
+        return summary
 
 
 def format_phase_summaries(summaries: dict[str, str]) -> str:
@@ -10,13 +10,30 @@ Components:
 - orchestrator: Main SpecOrchestrator class
 """
 
+from typing import Any
+
 from init import init_auto_claude_dir
 
 from .models import get_specs_dir
-from .orchestrator import SpecOrchestrator
 
 __all__ = [
     "SpecOrchestrator",
     "get_specs_dir",
     "init_auto_claude_dir",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of SpecOrchestrator.
+
+    The orchestrator pulls in the agent runner, core.client and the SDK.
+    get_specs_dir() is needed on every CLI startup (cli.utils), which must
+    not pay for that; the orchestrator is imported on first access instead.
+    """
+    if name == "SpecOrchestrator":
+        from .orchestrator import SpecOrchestrator
+
+        # Cache in globals so subsequent accesses bypass __getattr__
+        globals()["SpecOrchestrator"] = SpecOrchestrator
+        return SpecOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
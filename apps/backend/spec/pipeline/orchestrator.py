@@ -31,11 +31,7 @@ from ui import (
 )
 
 from .. import complexity, phases, requirements
-from ..compaction import (
-    format_phase_summaries,
-    gather_phase_outputs,
-    summarize_phase_output,
-)
+from ..compaction import PhaseSummarizer, format_phase_summaries
 from ..validate_pkg.spec_validator import SpecValidator
 from .agent_runner import AgentRunner
 from .models import (
@@ -110,7 +106,10 @@ class SpecOrchestrator:
         self._agent_runner: AgentRunner | None = None
 
         # Phase summaries for conversation compaction
-        # Stores summaries from completed phases to provide context to subsequent phases
+        # Summarizes completed phases in the background (cached in the spec dir
+        # across resumes) to provide context to subsequent phases
+        # Use sonnet shorthand - will resolve via API Profile if configured
+        self._summarizer = PhaseSummarizer(model="sonnet", target_words=500)
         self._phase_summaries: dict[str, str] = {}
 
     def _get_agent_runner(self) -> AgentRunner:
@@ -149,7 +148,8 @@ class SpecOrchestrator:
         # Use user's configured thinking level for all spec phases
         thinking_budget = get_thinking_budget(self.thinking_level)
 
-        # Format prior phase summaries for context
+        # Format prior phase summaries for context (waits for any still running)
+        self._phase_summaries = await self._summarizer.collect()
         prior_summaries = format_phase_summaries(self._phase_summaries)
 
         return await runner.run_agent(
@@ -161,29 +161,16 @@ class SpecOrchestrator:
         )
 
     async def _store_phase_summary(self, phase_name: str) -> None:
-        """Summarize and store phase output for subsequent phases.
+        """Start summarizing phase output for subsequent phases.
+
+        The summary is produced in the background, overlapping the next phase;
+        _run_agent waits for it only when the next agent prompt is built.
 
         Args:
             phase_name: Name of the completed phase
         """
         try:
-            # Gather outputs from this phase
-            phase_output = gather_phase_outputs(self.spec_dir, phase_name)
-            if not phase_output:
-                return
-
-            # Summarize the output
-            # Use sonnet shorthand - will resolve via API Profile if configured
-            summary = await summarize_phase_output(
-                phase_name,
-                phase_output,
-                model="sonnet",
-                target_words=500,
-            )
-
-            if summary:
-                self._phase_summaries[phase_name] = summary
-
+            self._summarizer.schedule(self.spec_dir, phase_name)
         except Exception as e:
             # Don't fail the pipeline if summarization fails
             print_status(f"Phase summarization skipped: {e}", "warning")
@@ -191,8 +178,10 @@ class SpecOrchestrator:
     async def _ensure_fresh_project_index(self) -> None:
         """Ensure project_index.json is up-to-date before spec creation.
 
-        Uses smart caching: only regenerates if dependency files (package.json,
-        pyproject.toml, etc.) have been modified since the last index generation.
+        Uses smart caching: only regenerates if the project's fingerprint (git
+        object IDs of tracked files, stat data of untracked ones) no longer
+        matches the one recorded in the index, and then only re-analyzes
+        services whose input fingerprint changed.
         This ensures QA agents receive accurate project capability information
         for dynamic MCP tool injection.
         """
@@ -200,15 +189,13 @@ class SpecOrchestrator:
 
         if should_refresh_project_index(self.project_dir):
             if index_file.exists():
-                print_status(
-                    "Project dependencies changed, refreshing index...", "progress"
-                )
+                print_status("Project files changed, refreshing index...", "progress")
             else:
                 print_status("Generating project index...", "progress")
 
             try:
-                # Regenerate project index
-                analyze_project(self.project_dir, index_file)
+                # Regenerate project index, reusing unchanged services
+                analyze_project(self.project_dir, index_file, incremental=True)
                 print_status("Project index updated", "success")
             except Exception as e:
                 print_status(f"Project index refresh failed: {e}", "warning")
@@ -221,6 +208,22 @@ class SpecOrchestrator:
     async def run(self, interactive: bool = True, auto_approve: bool = False) -> bool:
         """Run the spec creation process with dynamic phase selection.
 
+        Args:
+            interactive: Whether to run in interactive mode for requirements gathering
+            auto_approve: Whether to skip human review checkpoint and auto-approve
+
+        Returns:
+            True if spec creation and review completed successfully, False otherwise
+        """
+        try:
+            return await self._run_phases(interactive, auto_approve)
+        finally:
+            # Let background summaries finish (they are cached for resumes)
+            await self._summarizer.close()
+
+    async def _run_phases(self, interactive: bool, auto_approve: bool) -> bool:
+        """Run all spec creation phases followed by the review checkpoint.
+
         Args:
             interactive: Whether to run in interactive mode for requirements gathering
             auto_approve: Whether to skip human review checkpoint and auto-approve
@@ -408,6 +411,9 @@ class SpecOrchestrator:
             LogPhase.PLANNING, success=True, message="Spec creation complete"
         )
 
+        # Don't leave summaries running while waiting on human review
+        await self._summarizer.close()
+
         # === HUMAN REVIEW CHECKPOINT ===
         return self._run_review_checkpoint(auto_approve)
 
@@ -0,0 +1,19 @@
+"""
+Backend Benchmarks
+==================
+
+Offline performance benchmarks for backend hot paths: the merge semantic
+analyzer, context code search, the bash security hook, the secret scanner
+and the project analysis detectors.
+
+Every benchmark runs against a deterministic synthetic repository (small,
+medium or large), needs no network access or API keys, and reports
+median/mean/stdev/p95 timings. Results can be saved as JSON and compared
+against a stored baseline to catch regressions:
+
+    python -m benchmarks run --size medium --output baseline.json
+    # ... make changes ...
+    python -m benchmarks run --size medium --baseline baseline.json
+
+Run from the repository root. See benchmarks/cli.py for all options.
+"""
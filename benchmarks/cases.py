@@ -0,0 +1,324 @@
+"""
+Benchmark Cases
+===============
+
+The backend hot paths the suite measures. Each case prepares a Workload
+from a SyntheticRepo; the backend modules are imported when a case is set
+up, so listing or filtering cases stays cheap. A case whose dependencies
+are not installed raises ImportError from its setup and is skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import os
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+
+from .harness import Workload
+from .synthetic_repo import SyntheticRepo
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "apps" / "backend"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A named benchmark and the function preparing its workload."""
+
+    name: str
+    description: str
+    setup: Callable[[SyntheticRepo], Workload]
+
+
+CASES: dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, description: str):
+    """Register a workload setup function as a benchmark case."""
+
+    def decorator(setup: Callable[[SyntheticRepo], Workload]):
+        CASES[name] = BenchmarkCase(name, description, setup)
+        return setup
+
+    return decorator
+
+
+def select_cases(patterns: list[str] | None = None) -> list[BenchmarkCase]:
+    """Cases whose name matches any of the glob patterns (all if none)."""
+    if not patterns:
+        return list(CASES.values())
+    return [
+        case
+        for name, case in CASES.items()
+        if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    ]
+
+
+@benchmark("merge.semantic_analyzer", "SemanticAnalyzer.analyze_diff per file pair")
+def _semantic_analyzer(repo: SyntheticRepo) -> Workload:
+    from merge.semantic_analyzer import SemanticAnalyzer
+
+    analyzer = SemanticAnalyzer()
+    pairs = repo.diff_pairs
+
+    def run():
+        for path, before, after in pairs:
+            analyzer.analyze_diff(path, before, after)
+
+    return Workload(run, items=len(pairs))
+
+
+@benchmark("context.code_search", "CodeSearcher.search_service over every service")
+def _code_search(repo: SyntheticRepo) -> Workload:
+    from context.search import CodeSearcher
+
+    searcher = CodeSearcher(repo.root)
+    keywords = repo.keywords[:3]
+
+    def run():
+        for service in repo.services:
+            searcher.search_service(service.path, service.name, keywords)
+
+    files = sum(
+        1 for service in repo.services for _ in searcher._iter_code_files(service.path)
+    )
+    return Workload(run, items=files)
+
+
+@benchmark("security.bash_hook", "bash_security_hook per command")
+def _bash_hook(repo: SyntheticRepo) -> Workload:
+    from security.constants import PROJECT_DIR_ENV_VAR
+    from security.hooks import bash_security_hook
+
+    project_dir = str(repo.services[0].path)
+    inputs = [
+        {"tool_name": "Bash", "tool_input": {"command": command}, "cwd": project_dir}
+        for command in repo.commands
+    ]
+    loop = asyncio.new_event_loop()
+    # The hook prefers the agent's project dir variable over the input's cwd
+    previous = os.environ.get(PROJECT_DIR_ENV_VAR)
+    os.environ[PROJECT_DIR_ENV_VAR] = project_dir
+
+    async def check_all():
+        for input_data in inputs:
+            await bash_security_hook(input_data)
+
+    def close():
+        loop.close()
+        if previous is None:
+            os.environ.pop(PROJECT_DIR_ENV_VAR, None)
+        else:
+            os.environ[PROJECT_DIR_ENV_VAR] = previous
+
+    return Workload(lambda: loop.run_until_complete(check_all()), len(inputs), close)
+
+
+@benchmark("security.scan_content", "scan_content over every file scan_files checks")
+def _scan_content(repo: SyntheticRepo) -> Workload:
+    from security.scan_secrets import scan_content, should_skip_file
+
+    # The files scan_files() would read: vendored code and docs are skipped
+    files = [
+        (relative, (repo.root / relative).read_text(encoding="utf-8"))
+        for relative in map(str, repo.files)
+        if not should_skip_file(relative, [])
+    ]
+
+    def run():
+        for path, content in files:
+            scan_content(content, path)
+
+    return Workload(run, items=len(files))
+
+
+@benchmark("analysis.route_detector", "RouteDetector.detect_all_routes per service")
+def _route_detector(repo: SyntheticRepo) -> Workload:
+    from analysis.analyzers.route_detector import RouteDetector
+
+    def run():
+        for service in repo.services:
+            RouteDetector(service.path).detect_all_routes()
+
+    return Workload(run, items=len(repo.services))
+
+
+@benchmark(
+    "analysis.database_detector", "DatabaseDetector.detect_all_models per service"
+)
+def _database_detector(repo: SyntheticRepo) -> Workload:
+    from analysis.analyzers.database_detector import DatabaseDetector
+
+    def run():
+        for service in repo.services:
+            DatabaseDetector(service.path).detect_all_models()
+
+    return Workload(run, items=len(repo.services))
+
+
+@benchmark("analysis.service_analyzer", "ServiceAnalyzer.analyze per service")
+def _service_analyzer(repo: SyntheticRepo) -> Workload:
+    from analysis.analyzers.service_analyzer import ServiceAnalyzer
+
+    def run():
+        for service in repo.services:
+            ServiceAnalyzer(service.path, service.name).analyze()
+
+    return Workload(run, items=len(repo.services))
+
+
+def _large_source_files(repo: SyntheticRepo) -> dict[str, list[str]]:
+    """
+    One large Python and one large TypeScript file made of every module of
+    that language, with the names of a few symbols spread through each.
+    """
+    directory = repo.root / ".bench-large-files"
+    directory.mkdir(exist_ok=True)
+    names = {}
+    for service_language, suffix in (("python", "py"), ("typescript", "ts")):
+        parts = [
+            (repo.root / relative).read_text(encoding="utf-8")
+            for relative in map(str, repo.files)
+            if relative.startswith("services/")
+            and relative.endswith(f".{suffix}")
+            and "node_modules" not in relative
+            and ".venv" not in relative
+        ]
+        path = directory / f"large.{suffix}"
+        path.write_text("\n\n".join(parts), encoding="utf-8")
+        pattern = r"^(?:async def|def|export function) (\w+)"
+        symbols = re.findall(pattern, path.read_text(encoding="utf-8"), re.M)
+        names[str(path.relative_to(repo.root))] = symbols[:: max(len(symbols) // 4, 1)]
+    return names
+
+
+def _excerpt_subtask(files: dict[str, list[str]]) -> dict:
+    wanted = [name for names in files.values() for name in names]
+    return {
+        "id": "subtask-1-1",
+        "description": "Update " + ", ".join(f"`{name}`" for name in wanted),
+        "files_to_modify": list(files),
+    }
+
+
+@benchmark("prompts.load_subtask_context", "load_subtask_context on large files")
+def _subtask_context(repo: SyntheticRepo) -> Workload:
+    from prompts_pkg.file_excerpts import clear_outline_cache
+    from prompts_pkg.prompt_generator import load_subtask_context
+
+    files = _large_source_files(repo)
+    subtask = _excerpt_subtask(files)
+    spec_dir = repo.root / ".auto-claude" / "specs" / "001-benchmark"
+    clear_outline_cache()
+
+    def run():
+        # Sessions and retries of the subtask find the outlines cached
+        load_subtask_context(spec_dir, repo.root, subtask)
+
+    return Workload(run, items=len(files), close=clear_outline_cache)
+
+
+@benchmark("prompts.file_outline", "Outline parsing of large Python/TypeScript files")
+def _file_outline(repo: SyntheticRepo) -> Workload:
+    from prompts_pkg.file_excerpts import clear_outline_cache, get_file_outline
+
+    paths = [repo.root / relative for relative in _large_source_files(repo)]
+
+    def run():
+        clear_outline_cache()
+        for path in paths:
+            get_file_outline(path)
+
+    return Workload(run, items=len(paths), close=clear_outline_cache)
+
+
+def _agent_session_messages(repo: SyntheticRepo) -> list[dict]:
+    """A recorded-looking coder session: text, tool calls and their results."""
+    from core.session_replay import TYPE_KEY
+
+    def block(kind: str, **fields) -> dict:
+        return {TYPE_KEY: kind, **fields}
+
+    tools = [
+        ("Read", {"file_path": "src/index.ts"}),
+        ("Edit", {"file_path": "src/index.ts", "old_string": "a", "new_string": "b"}),
+        ("Grep", {"pattern": "invoice", "path": "."}),
+    ]
+    messages = []
+    for i, command in enumerate(repo.commands[: len(repo.commands) // 4]):
+        name, tool_input = ("Bash", {"command": command}) if i % 2 else tools[i % 3]
+        messages.append(
+            block(
+                "AssistantMessage",
+                content=[
+                    block("TextBlock", text=f"Step {i}: running {name}.\n"),
+                    block("ToolUseBlock", id=f"tool-{i}", name=name, input=tool_input),
+                ],
+            )
+        )
+        messages.append(
+            block(
+                "UserMessage",
+                content=[
+                    block(
+                        "ToolResultBlock",
+                        tool_use_id=f"tool-{i}",
+                        content="ok\n" * 20,
+                        is_error=i % 7 == 0,
+                    )
+                ],
+            )
+        )
+    messages.append(block("ResultMessage", subtype="success", num_turns=len(messages)))
+    return messages
+
+
+@benchmark("agents.run_agent_session", "run_agent_session over a replayed session")
+def _agent_session(repo: SyntheticRepo) -> Workload:
+    from agents.session import run_agent_session
+    from core.session_replay import RecordedTurn, ReplayClient, SessionRecording
+    from security.constants import PROJECT_DIR_ENV_VAR
+    from security.hooks import bash_security_hook
+    from task_logger import clear_task_logger
+
+    project_dir = repo.services[0].path
+    spec_dir = repo.root / ".auto-claude" / "specs" / "001-benchmark"
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    messages = _agent_session_messages(repo)
+    recording = SessionRecording(
+        path=spec_dir / "session.jsonl",
+        agent_type="coder",
+        model=None,
+        turns=[RecordedTurn("Implement the subtask", 0.0, list(enumerate(messages)))],
+    )
+    hooks = {
+        "PreToolUse": [SimpleNamespace(matcher="Bash", hooks=[bash_security_hook])]
+    }
+    loop = asyncio.new_event_loop()
+    previous = os.environ.get(PROJECT_DIR_ENV_VAR)
+    os.environ[PROJECT_DIR_ENV_VAR] = str(project_dir)
+
+    def run():
+        # Every run logs one fresh session, not one appended to the last
+        clear_task_logger()
+        (spec_dir / "task_logs.json").unlink(missing_ok=True)
+        client = ReplayClient(recording, hooks=hooks, cwd=str(project_dir))
+        loop.run_until_complete(
+            run_agent_session(client, "Implement the subtask", spec_dir)
+        )
+
+    def close():
+        loop.close()
+        if previous is None:
+            os.environ.pop(PROJECT_DIR_ENV_VAR, None)
+        else:
+            os.environ[PROJECT_DIR_ENV_VAR] = previous
+
+    return Workload(run, items=len(messages), close=close)
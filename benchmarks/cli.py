@@ -0,0 +1,207 @@
+"""
+Benchmark Command Line
+======================
+
+    python -m benchmarks list
+    python -m benchmarks run [--size small|medium|large ...] [--only GLOB ...]
+                             [--warmup N] [--repeat N] [--seed N]
+                             [--output results.json] [--baseline baseline.json]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.15]
+
+`run` prints a table and optionally writes JSON results; given --baseline
+it also compares against it. `compare` compares two results files. Both
+exit with status 1 if any benchmark regressed by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+from .cases import CASES, select_cases
+from .harness import (
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    DEFAULT_WARMUP,
+    BenchmarkResult,
+    Comparison,
+    compare_results,
+    load_results,
+    time_workload,
+    write_results,
+)
+from .synthetic_repo import SIZES, generate_repo
+
+
+def run_benchmarks(
+    sizes: list[str],
+    patterns: list[str] | None = None,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = 0,
+    progress=print,
+) -> list[BenchmarkResult]:
+    """
+    Run the selected benchmark cases on freshly generated repositories.
+
+    Args:
+        sizes: Synthetic repository sizes to run on
+        patterns: Glob patterns selecting cases by name (all if empty)
+        warmup: Untimed calls per benchmark
+        repeat: Timed calls per benchmark
+        seed: Synthetic repository seed
+        progress: Called with one line per finished or skipped benchmark
+
+    Returns:
+        One BenchmarkResult per (case, size), skipped cases excluded
+    """
+    cases = select_cases(patterns)
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix=f"bench-{size}-") as tmp:
+            repo = generate_repo(Path(tmp) / "repo", size, seed)
+            for case in cases:
+                # Keep what the benchmarked code prints out of the report
+                with contextlib.redirect_stdout(io.StringIO()):
+                    try:
+                        workload = case.setup(repo)
+                    except ImportError as e:
+                        workload = None
+                        reason = f"{e.name or e} is not installed"
+                if workload is None:
+                    progress(f"{case.name}[{size}]".ljust(40) + f" skipped: {reason}")
+                    continue
+                with contextlib.redirect_stdout(io.StringIO()):
+                    try:
+                        stats = time_workload(workload, warmup, repeat)
+                    finally:
+                        if workload.close:
+                            workload.close()
+                result = BenchmarkResult(case.name, size, workload.items, stats)
+                results.append(result)
+                progress(_format_result(result))
+    return results
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    stats = result.stats
+    return (
+        f"{result.key:40} {stats.median_ms:10.2f} ms  "
+        f"±{stats.stdev_ms:7.2f}  p95 {stats.p95_ms:10.2f}  "
+        f"{result.items:6} items  {result.per_item_us:10.1f} us/item"
+    )
+
+
+def _report(comparisons: list[Comparison], threshold: float) -> bool:
+    """Print comparisons; returns True if any benchmark regressed."""
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    for comparison in comparisons:
+        baseline = (
+            f"{comparison.baseline_ms:10.2f}"
+            if comparison.baseline_ms is not None
+            else f"{'-':>10}"
+        )
+        current = (
+            f"{comparison.current_ms:10.2f}"
+            if comparison.current_ms is not None
+            else f"{'-':>10}"
+        )
+        ratio = f"{comparison.ratio:6.2f}x" if comparison.ratio is not None else ""
+        print(
+            f"  {comparison.status.upper():11} {comparison.key:40} "
+            f"{baseline} -> {current} ms {ratio}"
+        )
+    regressions = [c for c in comparisons if c.status == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed")
+    return bool(regressions)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Offline benchmarks for backend hot paths",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List benchmark cases and sizes")
+
+    run = commands.add_parser("run", help="Run benchmarks")
+    run.add_argument(
+        "--size",
+        action="append",
+        choices=list(SIZES),
+        help="Repository size to run on (repeatable, default: small)",
+    )
+    run.add_argument(
+        "--only",
+        action="append",
+        metavar="GLOB",
+        help="Run only cases matching this name pattern (repeatable)",
+    )
+    run.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--output", type=Path, help="Write results as JSON")
+    run.add_argument("--baseline", type=Path, help="Compare against this results file")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser("compare", help="Compare two results files")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    options = parser.parse_args(argv)
+
+    if options.command == "list":
+        for case in CASES.values():
+            print(f"{case.name:30} {case.description}")
+        print(f"\nSizes: {', '.join(SIZES)}")
+        return 0
+
+    try:
+        if options.command == "compare":
+            baseline = load_results(options.baseline).results
+            current = load_results(options.current).results
+            return int(
+                _report(
+                    compare_results(baseline, current, options.threshold),
+                    options.threshold,
+                )
+            )
+
+        baseline = load_results(options.baseline).results if options.baseline else None
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if not select_cases(options.only):
+        print(f"Error: no benchmark matches {options.only}", file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(
+        options.size or ["small"],
+        options.only,
+        options.warmup,
+        options.repeat,
+        options.seed,
+    )
+    if options.output:
+        write_results(
+            options.output,
+            results,
+            {"seed": options.seed, "warmup": options.warmup, "repeat": options.repeat},
+        )
+        print(f"\nResults written to {options.output}")
+    if baseline is not None:
+        return int(
+            _report(
+                compare_results(baseline, results, options.threshold),
+                options.threshold,
+            )
+        )
+    return 0
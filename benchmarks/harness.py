@@ -0,0 +1,266 @@
+"""
+Benchmark Harness
+=================
+
+Repeatable timing for benchmark workloads, statistical summaries, JSON
+result files and comparison against a stored baseline.
+
+A workload is timed like ``timeit`` does it: a few untimed warmup calls,
+then ``repeat`` timed calls with the garbage collector disabled. Results
+are summarized by their median (the figure comparisons use, as it is not
+skewed by the odd slow run), plus min/max, mean, standard deviation and
+95th percentile.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+RESULTS_SCHEMA_VERSION = 1
+
+DEFAULT_WARMUP = 2
+DEFAULT_REPEAT = 10
+
+# A benchmark whose median grows by more than this fraction is a regression
+DEFAULT_THRESHOLD = 0.15
+
+
+@dataclass
+class Workload:
+    """
+    A prepared benchmark: the callable to time and what one call processes.
+
+    Attributes:
+        run: Zero-argument callable doing one unit of benchmark work
+        items: Number of items (files, commands, diffs...) one call processes
+        close: Optional cleanup, called once timing is done
+    """
+
+    run: Callable[[], object]
+    items: int
+    close: Callable[[], None] | None = None
+
+
+@dataclass
+class TimingStats:
+    """Summary of the timed runs of one benchmark, in milliseconds."""
+
+    runs: int
+    min_ms: float
+    max_ms: float
+    mean_ms: float
+    median_ms: float
+    stdev_ms: float
+    p95_ms: float
+
+    @classmethod
+    def from_samples(cls, samples_ms: list[float]) -> TimingStats:
+        """Summarize a list of run times (at least one)."""
+        if not samples_ms:
+            raise ValueError("At least one sample is needed")
+        ordered = sorted(samples_ms)
+        if len(ordered) > 1:
+            stdev = statistics.stdev(ordered)
+            p95 = statistics.quantiles(ordered, n=20, method="inclusive")[-1]
+        else:
+            stdev, p95 = 0.0, ordered[0]
+        return cls(
+            runs=len(ordered),
+            min_ms=ordered[0],
+            max_ms=ordered[-1],
+            mean_ms=statistics.fmean(ordered),
+            median_ms=statistics.median(ordered),
+            stdev_ms=stdev,
+            p95_ms=p95,
+        )
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark on one synthetic repository size."""
+
+    name: str
+    size: str
+    items: int
+    stats: TimingStats
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+    @property
+    def per_item_us(self) -> float:
+        return self.stats.median_ms * 1000 / self.items if self.items else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "size": self.size,
+            "items": self.items,
+            "stats": {k: round(v, 4) for k, v in asdict(self.stats).items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BenchmarkResult:
+        return cls(
+            name=data["name"],
+            size=data["size"],
+            items=data["items"],
+            stats=TimingStats(**data["stats"]),
+        )
+
+
+@dataclass
+class Comparison:
+    """One benchmark's current median against its baseline median."""
+
+    key: str
+    status: str  # "ok", "regression", "improvement", "new" or "missing"
+    baseline_ms: float | None = None
+    current_ms: float | None = None
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return self.current_ms / self.baseline_ms
+
+
+@dataclass
+class ResultsFile:
+    """Contents of a benchmark results JSON file."""
+
+    results: list[BenchmarkResult]
+    metadata: dict = field(default_factory=dict)
+
+
+def time_workload(
+    workload: Workload,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+) -> TimingStats:
+    """
+    Time a workload.
+
+    Args:
+        workload: The prepared workload
+        warmup: Untimed calls made first (fill caches, compile regexes)
+        repeat: Timed calls
+
+    Returns:
+        TimingStats over the timed calls
+    """
+    for _ in range(warmup):
+        workload.run()
+
+    samples = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter_ns()
+            workload.run()
+            samples.append((time.perf_counter_ns() - start) / 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return TimingStats.from_samples(samples)
+
+
+def environment_metadata() -> dict:
+    """Describe the machine and interpreter the results were measured on."""
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "executable": sys.executable,
+    }
+
+
+def write_results(
+    path: Path, results: list[BenchmarkResult], metadata: dict | None = None
+) -> None:
+    """Write benchmark results (and run metadata) as JSON."""
+    data = {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "metadata": {**environment_metadata(), **(metadata or {})},
+        "results": [r.to_dict() for r in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> ResultsFile:
+    """
+    Load a results file written by write_results().
+
+    Raises:
+        ValueError: If the file is not a benchmark results file
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        results = [BenchmarkResult.from_dict(r) for r in data["results"]]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"{path} is not a benchmark results file: {e}")
+    if data.get("schema_version") != RESULTS_SCHEMA_VERSION:
+        raise ValueError(
+            f"{path} has schema version {data.get('schema_version')}, "
+            f"expected {RESULTS_SCHEMA_VERSION}"
+        )
+    return ResultsFile(results=results, metadata=data.get("metadata", {}))
+
+
+def compare_results(
+    baseline: list[BenchmarkResult],
+    current: list[BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """
+    Compare current results against a baseline by median time.
+
+    A benchmark is a regression when its median grew by more than
+    `threshold` (a fraction: 0.15 is 15%), and an improvement when it shrank
+    by more than that. Benchmarks only in the current run are "new", those
+    only in the baseline "missing"; neither counts as a regression.
+
+    Returns:
+        One Comparison per benchmark, in current-run order then missing ones
+    """
+    baseline_by_key = {r.key: r for r in baseline}
+    comparisons = []
+    for result in current:
+        base = baseline_by_key.pop(result.key, None)
+        if base is None:
+            comparisons.append(
+                Comparison(result.key, "new", current_ms=result.stats.median_ms)
+            )
+            continue
+
+        comparison = Comparison(
+            result.key,
+            "ok",
+            baseline_ms=base.stats.median_ms,
+            current_ms=result.stats.median_ms,
+        )
+        ratio = comparison.ratio
+        if ratio is not None and ratio > 1 + threshold:
+            comparison.status = "regression"
+        elif ratio is not None and ratio < 1 - threshold:
+            comparison.status = "improvement"
+        comparisons.append(comparison)
+
+    for key, base in baseline_by_key.items():
+        comparisons.append(Comparison(key, "missing", baseline_ms=base.stats.median_ms))
+    return comparisons
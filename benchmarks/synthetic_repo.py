@@ -0,0 +1,493 @@
+"""
+Synthetic Repositories
+======================
+
+Deterministic generators for the repositories the benchmarks run against.
+
+A synthetic repository is a monorepo of FastAPI and Express services with
+route modules, ORM models, plain service modules, .env files, vendored
+dependencies that scanners must skip, and a sprinkling of fake credentials
+for the secret scanner to find. The same (size, seed) always produces
+byte-identical files, so timings from different runs and machines measure
+the same work.
+
+Besides the files on disk, a SyntheticRepo carries the other benchmark
+inputs derived from it: before/after file pairs for the semantic analyzer,
+a corpus of bash commands for the security hook and search keywords.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class RepoSize:
+    """Shape of a synthetic repository."""
+
+    services: int
+    modules_per_service: int
+    functions_per_module: int
+    vendored_files: int  # Per service, under node_modules/ or .venv/
+    diff_pairs: int
+    commands: int
+
+
+SIZES: dict[str, RepoSize] = {
+    "small": RepoSize(
+        services=2,
+        modules_per_service=12,
+        functions_per_module=6,
+        vendored_files=10,
+        diff_pairs=10,
+        commands=60,
+    ),
+    "medium": RepoSize(
+        services=4,
+        modules_per_service=40,
+        functions_per_module=10,
+        vendored_files=60,
+        diff_pairs=40,
+        commands=240,
+    ),
+    "large": RepoSize(
+        services=8,
+        modules_per_service=100,
+        functions_per_module=14,
+        vendored_files=200,
+        diff_pairs=120,
+        commands=960,
+    ),
+}
+
+# Words the search benchmark looks for; modules mention a few of them
+KEYWORDS = ["invoice", "webhook", "session", "retry", "tenant", "checkout"]
+
+WORDS = [
+    "account",
+    "audit",
+    "batch",
+    "cache",
+    "config",
+    "event",
+    "export",
+    "invoice",
+    "ledger",
+    "order",
+    "payment",
+    "profile",
+    "report",
+    "retry",
+    "session",
+    "tenant",
+    "token",
+    "user",
+    "webhook",
+    "checkout",
+]
+
+# Commands an agent typically runs; a few are blocked by the security hook
+COMMANDS = [
+    "ls -la",
+    "git status",
+    "git diff --stat",
+    "git add -A && git commit -m 'Update handlers'",
+    "git log --oneline -20",
+    "cat package.json",
+    "grep -rn 'TODO' src | head -20",
+    "find . -name '*.py' | xargs wc -l",
+    "python -m pytest -q tests/",
+    "pip install -r requirements.txt",
+    "npm install",
+    "npm run test -- --watch=false",
+    "npm run build",
+    "node src/index.js",
+    "uvicorn main:app --port 8000",
+    "curl -s http://localhost:8000/health",
+    "pkill -f uvicorn",
+    "kill -9 12345",
+    "rm -rf build dist",
+    "rm -rf /",
+    "chmod +x scripts/deploy.sh",
+    "chmod 777 /etc/passwd",
+    "mkdir -p src/routes && touch src/routes/new.ts",
+    "cd services && ls",
+    "echo $PATH",
+    "sed -i 's/foo/bar/g' src/index.ts",
+    "docker compose up -d",
+    "psql -c 'select 1'",
+    "bash -c 'echo hello'",
+    "sudo apt-get install curl",
+    "export NODE_ENV=production && npm start",
+    "tail -n 50 server.log",
+]
+
+_SECRET_ALPHABET = string.ascii_letters + string.digits
+
+
+@dataclass
+class ServiceInfo:
+    """One generated service."""
+
+    name: str
+    path: Path
+    language: str  # "python" or "typescript"
+
+
+@dataclass
+class SyntheticRepo:
+    """A generated repository plus the benchmark inputs derived from it."""
+
+    root: Path
+    size: str
+    seed: int
+    services: list[ServiceInfo] = field(default_factory=list)
+    # (path relative to root, content before, content after)
+    diff_pairs: list[tuple[str, str, str]] = field(default_factory=list)
+    commands: list[str] = field(default_factory=list)
+    keywords: list[str] = field(default_factory=lambda: list(KEYWORDS))
+    # Every generated file relative to root, vendored ones included, sorted.
+    # Files the benchmarked code writes later (the security profile) are not.
+    files: list[Path] = field(default_factory=list)
+
+
+def generate_repo(root: Path, size: str = "small", seed: int = 0) -> SyntheticRepo:
+    """
+    Generate a synthetic repository.
+
+    Args:
+        root: Directory to create it in (created if needed; should be empty)
+        size: One of SIZES
+        seed: Random seed; the same size and seed give identical files
+
+    Returns:
+        SyntheticRepo describing the generated files
+
+    Raises:
+        ValueError: If size is unknown
+    """
+    if size not in SIZES:
+        raise ValueError(f"Unknown size {size!r}, expected one of {', '.join(SIZES)}")
+    shape = SIZES[size]
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    repo = SyntheticRepo(root=root, size=size, seed=seed)
+
+    _write(root / "README.md", "# Synthetic benchmark monorepo\n")
+    modules: list[tuple[str, str, str]] = []  # (relative path, content, language)
+    for index in range(shape.services):
+        language = "python" if index % 2 == 0 else "typescript"
+        suffix = "py" if language == "python" else "ts"
+        service = ServiceInfo(
+            name=f"svc-{index:02d}-{suffix}",
+            path=root / "services" / f"svc-{index:02d}-{suffix}",
+            language=language,
+        )
+        repo.services.append(service)
+        if language == "python":
+            modules += _python_service(rng, service, shape, port=8000 + index)
+        else:
+            modules += _typescript_service(rng, service, shape, port=3000 + index)
+
+    for relative, content, language in modules:
+        _write(root / relative, content)
+
+    for relative, before, language in rng.sample(
+        modules, min(shape.diff_pairs, len(modules))
+    ):
+        repo.diff_pairs.append((relative, before, _mutate(rng, before, language)))
+
+    repo.commands = [COMMANDS[i % len(COMMANDS)] for i in range(shape.commands)]
+    repo.files = sorted(p.relative_to(root) for p in root.rglob("*") if p.is_file())
+    return repo
+
+
+# =============================================================================
+# Services
+# =============================================================================
+
+
+def _python_service(
+    rng: random.Random, service: ServiceInfo, shape: RepoSize, port: int
+) -> list[tuple[str, str, str]]:
+    path = service.path
+    _write(path / "requirements.txt", "fastapi\nuvicorn\nsqlalchemy\npytest\n")
+    _write(
+        path / "main.py",
+        "import uvicorn\n"
+        "from fastapi import FastAPI\n\n"
+        "app = FastAPI()\n\n\n"
+        "@app.get('/health')\n"
+        "def health():\n"
+        "    return {'status': 'ok'}\n\n\n"
+        "if __name__ == '__main__':\n"
+        f"    uvicorn.run(app, host='0.0.0.0', port={port})\n",
+    )
+    _write(path / ".env", _env_file(rng, port))
+    _write(path / "tests" / "test_health.py", "def test_health():\n    assert True\n")
+    for i in range(shape.vendored_files):
+        _write(
+            path / ".venv" / "lib" / f"vendored_{i:03d}.py",
+            _python_module(rng, shape.functions_per_module, f"vendored{i}"),
+        )
+
+    modules = []
+    for i in range(shape.modules_per_service):
+        kind = ("routes", "models", "services")[i % 3]
+        name = f"{rng.choice(WORDS)}_{i:03d}"
+        if kind == "routes":
+            content = _fastapi_routes(rng, shape.functions_per_module, name)
+        elif kind == "models":
+            content = _sqlalchemy_models(rng, max(2, shape.functions_per_module // 3))
+        else:
+            content = _python_module(rng, shape.functions_per_module, name)
+        relative = Path("services") / service.name / "app" / kind / f"{name}.py"
+        modules.append((str(relative), content, "python"))
+    return modules
+
+
+def _typescript_service(
+    rng: random.Random, service: ServiceInfo, shape: RepoSize, port: int
+) -> list[tuple[str, str, str]]:
+    path = service.path
+    _write(
+        path / "package.json",
+        "{\n"
+        f'  "name": "{service.name}",\n'
+        '  "scripts": {"dev": "ts-node src/index.ts", "test": "jest"},\n'
+        '  "dependencies": {"express": "^4.19.0", "@prisma/client": "^5.0.0"},\n'
+        '  "devDependencies": {"jest": "^29.0.0", "typescript": "^5.4.0"}\n'
+        "}\n",
+    )
+    _write(
+        path / "src" / "index.ts",
+        "import express from 'express';\n\n"
+        "const app = express();\n"
+        f"app.listen({port}, () => console.log('listening'));\n",
+    )
+    _write(path / ".env", _env_file(rng, port))
+    _write(path / "prisma" / "schema.prisma", _prisma_schema(rng, shape))
+    for i in range(shape.vendored_files):
+        _write(
+            path / "node_modules" / f"pkg-{i:03d}" / "index.js",
+            _typescript_module(rng, shape.functions_per_module, f"vendored{i}"),
+        )
+
+    modules = []
+    for i in range(shape.modules_per_service):
+        name = f"{rng.choice(WORDS)}_{i:03d}"
+        if i % 2 == 0:
+            content = _express_routes(rng, shape.functions_per_module, name)
+            kind = "routes"
+        else:
+            content = _typescript_module(rng, shape.functions_per_module, name)
+            kind = "services"
+        relative = Path("services") / service.name / "src" / kind / f"{name}.ts"
+        modules.append((str(relative), content, "typescript"))
+    return modules
+
+
+# =============================================================================
+# File contents
+# =============================================================================
+
+
+def _env_file(rng: random.Random, port: int) -> str:
+    return (
+        f"PORT={port}\n"
+        "DEBUG=false\n"
+        f"DATABASE_URL=postgres://app:{_token(rng, 12)}@db:5432/app\n"
+        f"STRIPE_SECRET_KEY=sk_test_{_token(rng, 24)}\n"
+        "REDIS_URL=redis://localhost:6379/0\n"
+    )
+
+
+def _secret_line(rng: random.Random, indent: str = "") -> str:
+    """A fake credential, or an assignment that only looks like one."""
+    choice = rng.randrange(4)
+    if choice == 0:
+        return f'{indent}AWS_KEY = "AKIA{_token(rng, 16, string.ascii_uppercase)}"\n'
+    if choice == 1:
+        return f'{indent}api_key = "{_token(rng, 40)}"\n'
+    if choice == 2:
+        return f'{indent}api_key = os.environ.get("API_KEY", "")\n'
+    return f'{indent}password = "your-password-here"\n'
+
+
+def _python_function(rng: random.Random, name: str) -> str:
+    word = rng.choice(WORDS)
+    lines = [f"def {name}({word}, limit=10):\n"]
+    lines.append(f'    """Process {word} records for {rng.choice(KEYWORDS)}."""\n')
+    for _ in range(rng.randint(3, 8)):
+        var = rng.choice(WORDS)
+        lines.append(f"    {var}_count = len({word}) + {rng.randint(1, 99)}\n")
+    if rng.random() < 0.05:
+        lines.append(_secret_line(rng, "    "))
+    lines.append(f"    return {word}[:limit]\n")
+    return "".join(lines)
+
+
+def _python_module(rng: random.Random, functions: int, name: str) -> str:
+    parts = [f'"""{name} helpers."""\n\nimport json\nimport os\n\n']
+    for i in range(functions):
+        parts.append("\n" + _python_function(rng, f"{rng.choice(WORDS)}_{name}_{i}"))
+    return "".join(parts)
+
+
+def _fastapi_routes(rng: random.Random, functions: int, name: str) -> str:
+    parts = [
+        "from fastapi import APIRouter, Depends\n\n"
+        "from .auth import require_user\n\n"
+        "router = APIRouter()\n"
+    ]
+    for i in range(functions):
+        method = rng.choice(["get", "post", "put", "delete"])
+        auth = ", dependencies=[Depends(require_user)]" if rng.random() < 0.3 else ""
+        parts.append(
+            f'\n\n@router.{method}("/{name}/{i}/{{item_id}}"{auth})\n'
+            + _python_function(rng, f"{method}_{name}_{i}").replace(
+                "def ", "async def ", 1
+            )
+        )
+    return "".join(parts)
+
+
+def _sqlalchemy_models(rng: random.Random, models: int) -> str:
+    parts = [
+        "from sqlalchemy import Column, Integer, String\n"
+        "from sqlalchemy.orm import declarative_base\n\n"
+        "Base = declarative_base()\n"
+    ]
+    for _ in range(models):
+        word = rng.choice(WORDS)
+        cls = f"{word.title()}{rng.randint(100, 999)}"
+        parts.append(
+            f"\n\nclass {cls}(Base):\n"
+            f'    __tablename__ = "{cls.lower()}"\n\n'
+            "    id = Column(Integer, primary_key=True)\n"
+            f"    {word} = Column(String(255), nullable=False)\n"
+            f"    {rng.choice(WORDS)}_id = Column(Integer, index=True)\n"
+        )
+    return "".join(parts)
+
+
+def _typescript_function(rng: random.Random, name: str) -> str:
+    word = rng.choice(WORDS)
+    lines = [f"export function {name}({word}: string[], limit = 10): string[] {{\n"]
+    lines.append(f"  // Handles {word} for {rng.choice(KEYWORDS)}\n")
+    for _ in range(rng.randint(3, 8)):
+        lines.append(
+            f"  const {rng.choice(WORDS)}Count = {word}.length + {rng.randint(1, 99)};\n"
+        )
+    if rng.random() < 0.05:
+        lines.append(_secret_line(rng, "  ").replace("AWS_KEY =", "const awsKey ="))
+    lines.append(f"  return {word}.slice(0, limit);\n}}\n")
+    return "".join(lines)
+
+
+def _typescript_module(rng: random.Random, functions: int, name: str) -> str:
+    parts = [f"// {name} helpers\nimport {{ readFileSync }} from 'fs';\n"]
+    for i in range(functions):
+        parts.append(
+            "\n" + _typescript_function(rng, f"{rng.choice(WORDS)}{name.title()}{i}")
+        )
+    return "".join(parts)
+
+
+def _express_routes(rng: random.Random, functions: int, name: str) -> str:
+    parts = [
+        "import { Router } from 'express';\n\n"
+        "import { requireAuth } from '../auth';\n\n"
+        "const router = Router();\n"
+    ]
+    for i in range(functions):
+        method = rng.choice(["get", "post", "put", "delete"])
+        auth = "requireAuth, " if rng.random() < 0.3 else ""
+        parts.append(
+            f"\nrouter.{method}('/{name}/{i}/:id', {auth}async (req, res) => {{\n"
+            f"  res.json({{ {rng.choice(WORDS)}: req.params.id }});\n"
+            "});\n"
+        )
+    parts.append("\nexport default router;\n")
+    return "".join(parts)
+
+
+def _prisma_schema(rng: random.Random, shape: RepoSize) -> str:
+    parts = [
+        'datasource db {\n  provider = "postgresql"\n  url = env("DATABASE_URL")\n}\n'
+    ]
+    for i in range(max(2, shape.modules_per_service // 4)):
+        word = rng.choice(WORDS)
+        parts.append(
+            f"\nmodel {word.title()}{i} {{\n"
+            "  id        Int      @id @default(autoincrement())\n"
+            f"  {word}    String\n"
+            "  createdAt DateTime @default(now())\n"
+            "}\n"
+        )
+    return "".join(parts)
+
+
+# =============================================================================
+# Diffs
+# =============================================================================
+
+
+def _mutate(rng: random.Random, content: str, language: str) -> str:
+    """An edited version of a module: functions added, changed and removed."""
+    lines = content.splitlines(keepends=True)
+    starts = [
+        i
+        for i, line in enumerate(lines)
+        if line.startswith(("def ", "async def ", "export function "))
+    ]
+    edits = rng.randint(1, 4)
+    for _ in range(edits):
+        action = rng.randrange(4)
+        if action == 0 and starts:
+            # Change a statement inside a function
+            target = rng.choice(starts) + 2
+            if target < len(lines):
+                lines[target] = lines[target].replace("+", "*", 1)
+        elif action == 1 and len(starts) > 1:
+            # Remove a function (up to the next one)
+            position = rng.randrange(len(starts) - 1)
+            del lines[starts[position] : starts[position + 1]]
+            starts = starts[:position] + [
+                s - (starts[position + 1] - starts[position])
+                for s in starts[position + 1 :]
+            ]
+        elif action == 2:
+            lines.insert(
+                1,
+                "import re\n" if language == "python" else "import path from 'path';\n",
+            )
+            starts = [s + 1 for s in starts]
+        else:
+            name = f"added_{rng.randint(0, 9999)}"
+            lines.append(
+                "\n"
+                + (
+                    _python_function(rng, name)
+                    if language == "python"
+                    else _typescript_function(rng, name)
+                )
+            )
+    return "".join(lines)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _token(rng: random.Random, length: int, alphabet: str = _SECRET_ALPHABET) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
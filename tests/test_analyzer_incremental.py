@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental project_index.json regeneration.
+
+Covers per-service input fingerprints and the reuse of unchanged service
+sections by ProjectAnalyzer / analyze_project(incremental=True).
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from analysis.analyzers import ProjectAnalyzer, analyze_project
+from analysis.analyzers.incremental import (
+    FINGERPRINT_KEY,
+    compute_service_fingerprint,
+)
+from analysis.analyzers.service_analyzer import ServiceAnalyzer
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+@pytest.fixture
+def monorepo(temp_dir: Path) -> Path:
+    """A two-service monorepo: a Python API and a React web app."""
+    _write(temp_dir / "api" / "requirements.txt", "fastapi\nuvicorn\n")
+    _write(
+        temp_dir / "api" / "main.py",
+        "from fastapi import FastAPI\napp = FastAPI()\n",
+    )
+    _write(
+        temp_dir / "web" / "package.json",
+        json.dumps({"name": "web", "dependencies": {"react": "^18.0.0"}}),
+    )
+    _write(temp_dir / "web" / "src" / "index.js", "console.log('hi')\n")
+    return temp_dir
+
+
+@pytest.fixture
+def analyze_calls(monkeypatch) -> list[str]:
+    """Record the name of every service that ServiceAnalyzer actually analyzes."""
+    calls: list[str] = []
+    original = ServiceAnalyzer.analyze
+
+    def counting_analyze(self):
+        calls.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(ServiceAnalyzer, "analyze", counting_analyze)
+    return calls
+
+
+class TestServiceFingerprint:
+    """Tests for compute_service_fingerprint."""
+
+    def test_stable_when_unchanged(self, monorepo: Path):
+        first = compute_service_fingerprint(monorepo / "api")
+        second = compute_service_fingerprint(monorepo / "api")
+        assert first == second
+        assert first["file_count"] == 2
+
+    def test_changes_when_file_modified(self, monorepo: Path):
+        before = compute_service_fingerprint(monorepo / "api")
+        target = monorepo / "api" / "main.py"
+        target.write_text("from fastapi import FastAPI\napp = FastAPI(debug=True)\n")
+        _bump_mtime(target)
+        assert compute_service_fingerprint(monorepo / "api") != before
+
+    def test_changes_when_file_added(self, monorepo: Path):
+        before = compute_service_fingerprint(monorepo / "api")
+        _write(monorepo / "api" / "routes.py", "")
+        assert compute_service_fingerprint(monorepo / "api") != before
+
+    def test_ignores_skip_dirs(self, monorepo: Path):
+        before = compute_service_fingerprint(monorepo / "web")
+        _write(monorepo / "web" / "node_modules" / "react" / "index.js", "x")
+        _write(monorepo / "web" / ".cache" / "blob", "x")
+        assert compute_service_fingerprint(monorepo / "web") == before
+
+
+class TestIncrementalAnalysis:
+    """Tests for reusing unchanged services from a previous index."""
+
+    def test_full_analysis_records_fingerprints(self, monorepo: Path):
+        index = ProjectAnalyzer(monorepo).analyze()
+        assert set(index["services"]) == {"api", "web"}
+        for service in index["services"].values():
+            assert service[FINGERPRINT_KEY]["digest"]
+
+    def test_unchanged_services_are_reused(self, monorepo: Path, analyze_calls):
+        previous = ProjectAnalyzer(monorepo).analyze()
+        analyze_calls.clear()
+
+        analyzer = ProjectAnalyzer(monorepo, previous_index=previous)
+        index = analyzer.analyze()
+
+        assert analyze_calls == []
+        assert sorted(analyzer.reused_services) == ["api", "web"]
+        assert index["services"] == previous["services"]
+
+    def test_only_changed_service_is_reanalyzed(self, monorepo: Path, analyze_calls):
+        previous = ProjectAnalyzer(monorepo).analyze()
+        analyze_calls.clear()
+
+        requirements = monorepo / "api" / "requirements.txt"
+        requirements.write_text("flask\n")
+        _bump_mtime(requirements)
+
+        analyzer = ProjectAnalyzer(monorepo, previous_index=previous)
+        index = analyzer.analyze()
+
+        assert analyze_calls == ["api"]
+        assert analyzer.reused_services == ["web"]
+        assert index["services"]["api"]["framework"] == "Flask"
+        assert index["services"]["web"] == previous["services"]["web"]
+
+    def test_removed_service_is_dropped(self, monorepo: Path):
+        # Keep the project a monorepo once only one service directory remains
+        _write(monorepo / "pnpm-workspace.yaml", "packages: []\n")
+        previous = ProjectAnalyzer(monorepo).analyze()
+        for path in sorted((monorepo / "web").rglob("*"), reverse=True):
+            path.unlink() if path.is_file() else path.rmdir()
+        (monorepo / "web").rmdir()
+
+        index = ProjectAnalyzer(monorepo, previous_index=previous).analyze()
+        assert set(index["services"]) == {"api"}
+
+    def test_moved_project_is_reanalyzed(self, monorepo: Path, analyze_calls):
+        previous = ProjectAnalyzer(monorepo).analyze()
+        previous["services"]["api"]["path"] = "/somewhere/else/api"
+        analyze_calls.clear()
+
+        ProjectAnalyzer(monorepo, previous_index=previous).analyze()
+        assert analyze_calls == ["api"]
+
+    def test_consumes_is_recomputed_for_reused_services(self, monorepo: Path):
+        previous = ProjectAnalyzer(monorepo).analyze()
+        previous["services"]["web"]["consumes"] = ["stale.api"]
+
+        index = ProjectAnalyzer(monorepo, previous_index=previous).analyze()
+        assert "stale.api" not in index["services"]["web"].get("consumes", [])
+
+
+class TestAnalyzeProjectIncremental:
+    """Tests for analyze_project(incremental=True) against an on-disk index."""
+
+    def test_reuses_existing_output_file(self, monorepo: Path, analyze_calls):
+        output = monorepo / ".auto-claude" / "project_index.json"
+        analyze_project(monorepo, output)
+        analyze_calls.clear()
+
+        analyze_project(monorepo, output, incremental=True)
+        assert analyze_calls == []
+
+    def test_corrupt_output_file_falls_back_to_full_analysis(
+        self, monorepo: Path, analyze_calls
+    ):
+        output = monorepo / ".auto-claude" / "project_index.json"
+        _write(output, "{not json")
+
+        results = analyze_project(monorepo, output, incremental=True)
+        assert sorted(analyze_calls) == ["api", "web"]
+        assert json.loads(output.read_text()) == results
+
+    def test_non_incremental_ignores_existing_output(
+        self, monorepo: Path, analyze_calls
+    ):
+        output = monorepo / ".auto-claude" / "project_index.json"
+        analyze_project(monorepo, output)
+        analyze_calls.clear()
+
+        analyze_project(monorepo, output)
+        assert sorted(analyze_calls) == ["api", "web"]
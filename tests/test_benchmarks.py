@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline benchmark suite (benchmarks/).
+
+Covers the timing statistics, baseline comparison, results files, the
+synthetic repository generator's determinism and a single quick run of
+every benchmark case on the small repository.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from benchmarks.cases import CASES, select_cases
+from benchmarks.cli import main
+from benchmarks.harness import (
+    BenchmarkResult,
+    TimingStats,
+    Workload,
+    compare_results,
+    load_results,
+    time_workload,
+    write_results,
+)
+from benchmarks.synthetic_repo import generate_repo
+
+
+def _result(name: str, median_ms: float, size: str = "small") -> BenchmarkResult:
+    return BenchmarkResult(name, size, 10, TimingStats.from_samples([median_ms]))
+
+
+def _contents(root: Path) -> dict[str, str]:
+    return {
+        str(p.relative_to(root)): p.read_text(encoding="utf-8")
+        for p in root.rglob("*")
+        if p.is_file()
+    }
+
+
+def test_timing_stats():
+    stats = TimingStats.from_samples([4.0, 1.0, 3.0, 2.0, 10.0])
+
+    assert stats.runs == 5
+    assert (stats.min_ms, stats.max_ms, stats.median_ms) == (1.0, 10.0, 3.0)
+    assert stats.mean_ms == 4.0
+    assert stats.stdev_ms == pytest.approx(3.5355, abs=1e-4)
+    assert 4.0 < stats.p95_ms <= 10.0
+    assert TimingStats.from_samples([2.5]).p95_ms == 2.5
+    with pytest.raises(ValueError):
+        TimingStats.from_samples([])
+
+
+def test_time_workload_warms_up_before_timing():
+    calls = []
+    stats = time_workload(
+        Workload(lambda: calls.append(1), items=1), warmup=3, repeat=4
+    )
+
+    assert len(calls) == 7
+    assert stats.runs == 4
+
+
+def test_compare_results():
+    baseline = [
+        _result("steady", 10.0),
+        _result("slower", 10.0),
+        _result("faster", 10.0),
+        _result("removed", 10.0),
+    ]
+    current = [
+        _result("steady", 11.0),
+        _result("slower", 12.0),
+        _result("faster", 5.0),
+        _result("added", 1.0),
+    ]
+
+    statuses = {c.key: c.status for c in compare_results(baseline, current, 0.15)}
+
+    assert statuses == {
+        "steady[small]": "ok",
+        "slower[small]": "regression",
+        "faster[small]": "improvement",
+        "added[small]": "new",
+        "removed[small]": "missing",
+    }
+    # The same benchmark on another size is a different benchmark
+    other_size = compare_results([_result("a", 1.0)], [_result("a", 5.0, "large")])
+    assert [c.status for c in other_size] == ["new", "missing"]
+
+
+def test_results_file_round_trip(tmp_path: Path):
+    path = tmp_path / "results" / "run.json"
+    write_results(path, [_result("a", 1.5)], {"seed": 3})
+
+    loaded = load_results(path)
+
+    assert [r.to_dict() for r in loaded.results] == [_result("a", 1.5).to_dict()]
+    assert loaded.metadata["seed"] == 3
+    assert "python" in loaded.metadata
+
+    path.write_text(json.dumps({"results": "nope"}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_results(path)
+
+
+def test_synthetic_repo_is_deterministic(tmp_path: Path):
+    first = generate_repo(tmp_path / "a", "small", seed=1)
+    second = generate_repo(tmp_path / "b", "small", seed=1)
+    other = generate_repo(tmp_path / "c", "small", seed=2)
+
+    assert _contents(first.root) == _contents(second.root)
+    assert first.diff_pairs == second.diff_pairs
+    assert _contents(first.root) != _contents(other.root)
+    assert all(before != after for _, before, after in first.diff_pairs)
+    assert len(first.files) == len(_contents(first.root))
+
+    with pytest.raises(ValueError):
+        generate_repo(tmp_path / "d", "huge")
+
+
+def test_every_case_runs_on_small_repo(tmp_path: Path):
+    repo = generate_repo(tmp_path / "repo", "small")
+    project_dir_before = os.environ.get("AUTO_CLAUDE_PROJECT_DIR")
+
+    for case in select_cases():
+        workload = case.setup(repo)
+        try:
+            workload.run()
+        finally:
+            if workload.close:
+                workload.close()
+        assert workload.items > 0, case.name
+
+    assert os.environ.get("AUTO_CLAUDE_PROJECT_DIR") == project_dir_before
+    assert [c.name for c in select_cases(["security.*"])] == [
+        "security.bash_hook",
+        "security.scan_content",
+    ]
+
+
+def test_cli_run_and_compare(tmp_path: Path, capsys):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    args = ["run", "--only", "merge.*", "--warmup", "0", "--repeat", "2"]
+
+    assert main([*args, "--output", str(baseline)]) == 0
+    main([*args, "--output", str(current), "--baseline", str(baseline)])
+    assert "Comparison against baseline" in capsys.readouterr().out
+
+    # Make the baseline look much faster than the current run
+    data = json.loads(baseline.read_text(encoding="utf-8"))
+    for result in data["results"]:
+        result["stats"]["median_ms"] = 1e-6
+    baseline.write_text(json.dumps(data), encoding="utf-8")
+
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert main(["compare", str(tmp_path / "missing.json"), str(current)]) == 2
+    assert set(CASES) >= {"merge.semantic_analyzer", "security.scan_content"}
@@ -135,3 +135,103 @@ class TestClientTokenValidation:
 
             # Verify validation was called with the token
             mock_validate.assert_called_once_with(valid_token)
+
+
+class TestProjectIndexCache:
+    """Tests for the fingerprint-invalidated project index cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty project index cache."""
+        from core.client import invalidate_project_cache
+
+        invalidate_project_cache()
+        yield
+        invalidate_project_cache()
+
+    def _write_index(self, project_dir, index, mtime_offset_ns=0):
+        import json
+
+        index_file = project_dir / ".auto-claude" / "project_index.json"
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        index_file.write_text(json.dumps(index))
+        if mtime_offset_ns:
+            stat = index_file.stat()
+            os.utime(
+                index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset_ns)
+            )
+
+    def test_hit_returns_shared_read_only_data(self, tmp_path):
+        """A cache hit returns the same frozen objects without copying."""
+        from core.client import _get_cached_project_data, get_project_cache_stats
+
+        self._write_index(
+            tmp_path, {"services": {"web": {"dependencies": ["electron"]}}}
+        )
+        before = get_project_cache_stats()
+
+        index1, caps1 = _get_cached_project_data(tmp_path)
+        index2, caps2 = _get_cached_project_data(tmp_path)
+
+        assert index1 is index2
+        assert caps1 is caps2
+        assert caps1["is_electron"] is True
+        assert index1["services"]["web"]["dependencies"] == ("electron",)
+        with pytest.raises(TypeError):
+            index1["services"]["new"] = {}
+        with pytest.raises(TypeError):
+            caps1["is_electron"] = False
+
+        stats = get_project_cache_stats()
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["misses"] - before["misses"] == 1
+
+    def test_regenerated_index_invalidates_entry(self, tmp_path):
+        """Changing project_index.json is picked up on the next call."""
+        from core.client import _get_cached_project_data, get_project_cache_stats
+
+        self._write_index(tmp_path, {"services": {}})
+        before = get_project_cache_stats()
+        _, caps1 = _get_cached_project_data(tmp_path)
+        assert caps1["is_electron"] is False
+
+        self._write_index(
+            tmp_path,
+            {"services": {"web": {"dependencies": ["electron"]}}},
+            mtime_offset_ns=2_000_000_000,
+        )
+        _, caps2 = _get_cached_project_data(tmp_path)
+
+        assert caps2["is_electron"] is True
+        after = get_project_cache_stats()
+        assert after["invalidations"] - before["invalidations"] == 1
+
+    def test_unchanged_index_is_never_reloaded(self, tmp_path, monkeypatch):
+        """Without a fingerprint change the index is loaded exactly once."""
+        import core.client as client_module
+
+        self._write_index(tmp_path, {"services": {}})
+        calls = []
+        original = client_module.load_project_index
+
+        def counting_load(project_dir):
+            calls.append(project_dir)
+            return original(project_dir)
+
+        monkeypatch.setattr(client_module, "load_project_index", counting_load)
+
+        for _ in range(5):
+            client_module._get_cached_project_data(tmp_path)
+
+        assert len(calls) == 1
+
+    def test_missing_index_is_cached_until_created(self, tmp_path):
+        """A missing index is cached as empty and reloaded once it appears."""
+        from core.client import _get_cached_project_data
+
+        index1, _ = _get_cached_project_data(tmp_path)
+        assert dict(index1) == {}
+
+        self._write_index(tmp_path, {"project_type": "monorepo"})
+        index2, _ = _get_cached_project_data(tmp_path)
+        assert index2["project_type"] == "monorepo"
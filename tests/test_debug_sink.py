@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the buffered debug log sink.
+
+Covers that no line is lost on shutdown (close(), interpreter exit and an
+unhandled exception), size-based rotation, ANSI stripping, and a throughput
+comparison with the previous open-per-line writer.
+"""
+
+import re
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from core.debug import debug, debug_error
+from core.debug_sink import DebugLogSink, close_debug_sinks, get_debug_sink
+
+BACKEND_DIR = Path(__file__).parent.parent / "apps" / "backend"
+
+
+@pytest.fixture(autouse=True)
+def _close_sinks():
+    yield
+    close_debug_sinks()
+
+
+def _lines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+class TestNoLostLines:
+    def test_close_writes_everything_from_many_threads(self, temp_dir: Path):
+        log_file = temp_dir / "logs" / "debug.log"
+        sink = DebugLogSink(log_file, queue_size=16)
+
+        def writer(n):
+            for i in range(2000):
+                sink.write(f"thread {n} line {i}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sink.close()
+
+        lines = _lines(log_file)
+        assert len(lines) == 8000
+        for n in range(4):
+            ours = [line for line in lines if line.startswith(f"thread {n} ")]
+            assert ours == [f"thread {n} line {i}" for i in range(2000)]
+
+    def test_write_after_close_is_not_lost(self, temp_dir: Path):
+        sink = DebugLogSink(temp_dir / "debug.log")
+        sink.write("before")
+        sink.close()
+
+        sink.write("after")
+
+        assert _lines(temp_dir / "debug.log") == ["before", "after"]
+
+    @pytest.mark.parametrize("ending", ["", "raise RuntimeError('crash')"])
+    def test_lines_are_written_at_interpreter_exit(self, temp_dir: Path, ending):
+        log_file = temp_dir / "debug.log"
+        script = (
+            "import sys\n"
+            f"sys.path.insert(0, {str(BACKEND_DIR)!r})\n"
+            "from core.debug_sink import get_debug_sink\n"
+            f"sink = get_debug_sink({str(log_file)!r})\n"
+            "for i in range(5000):\n"
+            "    sink.write(f'line {i}')\n"
+            f"{ending}\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+
+        assert ("RuntimeError" in result.stderr) == bool(ending)
+        assert _lines(log_file) == [f"line {i}" for i in range(5000)]
+
+    def test_debug_error_is_on_disk_immediately(self, temp_dir: Path, monkeypatch):
+        log_file = temp_dir / "debug.log"
+        monkeypatch.setenv("DEBUG", "true")
+        monkeypatch.setenv("DEBUG_LOG_FILE", str(log_file))
+
+        debug("test", "first")
+        debug_error("test", "went wrong", detail="x")
+
+        text = log_file.read_text(encoding="utf-8")
+        assert "first" in text
+        assert "went wrong" in text
+        assert "\033[" not in text
+
+
+class TestRotation:
+    def test_rotates_at_max_bytes(self, temp_dir: Path):
+        log_file = temp_dir / "debug.log"
+        sink = DebugLogSink(log_file, max_bytes=100, backup_count=2)
+
+        for i in range(30):
+            sink.write(f"line {i:02d}")  # 8 bytes with the newline
+        sink.close()
+
+        assert sink.rotations == 2
+        assert _lines(Path(f"{log_file}.2")) == [f"line {i:02d}" for i in range(12)]
+        assert _lines(Path(f"{log_file}.1")) == [f"line {i:02d}" for i in range(12, 24)]
+        assert _lines(log_file) == [f"line {i:02d}" for i in range(24, 30)]
+
+    def test_oldest_backup_is_dropped(self, temp_dir: Path):
+        log_file = temp_dir / "debug.log"
+        sink = DebugLogSink(log_file, max_bytes=16, backup_count=1)
+
+        for i in range(6):
+            sink.write(f"line {i}")  # 7 bytes with the newline
+        sink.close()
+
+        assert not Path(f"{log_file}.2").exists()
+        assert _lines(Path(f"{log_file}.1")) == ["line 2", "line 3"]
+        assert _lines(log_file) == ["line 4", "line 5"]
+
+
+def test_sinks_are_shared_per_file(temp_dir: Path):
+    assert get_debug_sink(temp_dir / "a.log") is get_debug_sink(temp_dir / "a.log")
+    assert get_debug_sink(temp_dir / "a.log") is not get_debug_sink(temp_dir / "b.log")
+
+
+def _previous_write_log(log_file: Path, message: str) -> None:
+    """The open-per-line writer the sink replaced."""
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    clean_message = re.sub(r"\033\[[0-9;]*m", "", message)
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write(clean_message + "\n")
+
+
+@pytest.mark.slow
+def test_benchmark_lines_per_second(temp_dir: Path):
+    """Debug lines per second: background sink vs. open-per-line."""
+    count = 20_000
+    message = "\033[90m[12:00:00.000]\033[0m \033[36m[DEBUG]\033[0m tool call"
+
+    previous_file = temp_dir / "previous.log"
+    start = time.perf_counter()
+    for _ in range(count):
+        _previous_write_log(previous_file, message)
+    previous_s = time.perf_counter() - start
+
+    sink_file = temp_dir / "sink.log"
+    sink = DebugLogSink(sink_file)
+    start = time.perf_counter()
+    for _ in range(count):
+        sink.write(message)
+    caller_s = time.perf_counter() - start
+    sink.close()
+    total_s = time.perf_counter() - start
+
+    print(
+        f"\nDebug log, {count:,} lines: open-per-line {count / previous_s:,.0f} "
+        f"lines/s; sink {count / caller_s:,.0f} lines/s for the caller, "
+        f"{count / total_s:,.0f} lines/s written"
+    )
+    assert len(_lines(sink_file)) == count
+    assert sink_file.read_bytes() == previous_file.read_bytes()
+    assert total_s < previous_s
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Tests for the subtask file excerpt engine (prompts_pkg/file_excerpts.py).
+
+Covers Python and TypeScript outlines, the outline cache, token budget
+adherence and symbol-focused excerpts through load_subtask_context().
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from prompts_pkg.file_excerpts import (
+    clear_outline_cache,
+    estimate_tokens,
+    excerpt_file,
+    excerpt_outline,
+    get_file_outline,
+    outline_source,
+    referenced_symbols,
+)
+from prompts_pkg.prompt_generator import load_subtask_context
+
+PYTHON_SOURCE = '''\
+"""Module docstring."""
+
+from __future__ import annotations
+
+import os
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+LIMIT = 10
+
+
+# Leading comment
+@decorator
+@other(arg=1)
+def first(a, b):
+    return a + b
+
+
+class Store(Base):
+    """A store."""
+
+    items: list = []
+
+    def load(self):
+        return [
+            1,
+        ]
+
+    @property
+    async def size(self):
+        return len(self.items)
+
+    class Inner:
+        pass
+
+
+async def last():
+    pass
+'''
+
+TYPESCRIPT_SOURCE = """\
+// Header comment
+import { a } from './a';
+import {
+  b,
+  c,
+} from './b';
+
+/**
+ * Doc comment
+ */
+@Injectable()
+export class Service extends Base {
+  private count = 0;
+
+  constructor(private readonly api: Api) {
+    super();
+  }
+
+  async load(id: string): Promise<void> {
+    const label = `item ${id} {`;
+    if (label) { return; }
+  }
+
+  static get value(): number {
+    return 1; // }
+  }
+}
+
+export interface Props {
+  name: string;
+}
+
+export type Mode =
+  | 'a'
+  | 'b';
+
+export const handler = async (req: Request) => {
+  return { ok: '}' };
+};
+
+export const LIMIT = 10;
+
+export default function App() {
+  return null;
+}
+
+enum Color { Red, Green }
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_outline_cache()
+    yield
+    clear_outline_cache()
+
+
+def _shape(outline):
+    return [
+        (s.kind, s.name, s.start, s.end, [(c.name, c.start, c.end) for c in s.children])
+        for s in outline.symbols
+    ]
+
+
+def _large_python(functions: int = 300) -> str:
+    parts = ['"""Large module."""\n\nimport json\nimport os\n']
+    for i in range(functions):
+        parts.append(
+            f"\n\ndef handler_{i}(request, limit=10):\n"
+            f'    """Handle request {i}."""\n'
+            + "".join(f"    value_{j} = request.get('k{j}') or {j}\n" for j in range(8))
+            + "    return json.dumps(request)[:limit]\n"
+        )
+    return "".join(parts)
+
+
+def _large_typescript(functions: int = 300) -> str:
+    parts = ["import { readFileSync } from 'fs';\n"]
+    for i in range(functions):
+        parts.append(
+            f"\nexport function handler{i}(request: string[], limit = 10): string[] {{\n"
+            + "".join(f"  const value{j} = request.length + {j};\n" for j in range(8))
+            + "  return request.slice(0, limit);\n}\n"
+        )
+    return "".join(parts)
+
+
+def test_python_outline():
+    outline = outline_source(Path("store.py"), PYTHON_SOURCE)
+
+    assert outline.language == "python"
+    assert outline.header_end == 9
+    assert _shape(outline) == [
+        ("variable", "LIMIT", 11, 11, []),
+        ("function", "first", 14, 18, []),
+        ("class", "Store", 21, 36, [("load", 26, 29), ("size", 31, 33)]),
+        ("function", "last", 39, 40, []),
+    ]
+
+
+def test_python_outline_of_unparsable_file():
+    source = PYTHON_SOURCE.replace("return a + b", "return a +")
+
+    outline = outline_source(Path("store.py"), source)
+
+    names = [(s.name, s.start, s.end) for s in outline.symbols]
+    assert names == [("first", 14, 18), ("Store", 21, 36), ("last", 39, 40)]
+
+
+def test_typescript_outline():
+    outline = outline_source(Path("service.tsx"), TYPESCRIPT_SOURCE)
+
+    assert outline.language == "script"
+    assert outline.header_end == 6
+    assert _shape(outline) == [
+        (
+            "class",
+            "Service",
+            8,
+            27,
+            [("constructor", 15, 17), ("load", 19, 22), ("value", 24, 26)],
+        ),
+        ("interface", "Props", 29, 31, []),
+        ("type", "Mode", 33, 35, []),
+        ("function", "handler", 37, 39, []),
+        ("variable", "LIMIT", 41, 41, []),
+        ("function", "App", 43, 45, []),
+        ("enum", "Color", 47, 47, []),
+    ]
+
+
+def test_outline_cache_follows_file_changes(tmp_path: Path):
+    path = tmp_path / "module.py"
+    path.write_text("def a():\n    pass\n", encoding="utf-8")
+
+    first = get_file_outline(path)
+    assert get_file_outline(path) is first
+
+    path.write_text("def a():\n    pass\n\n\ndef b():\n    pass\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [s.name for s in get_file_outline(path).symbols] == ["a", "b"]
+
+
+def test_referenced_symbols():
+    explicit, plain = referenced_symbols(
+        {
+            "description": "Fix `Store.load` and call get_user() from UserService",
+            "verification": {"command": "pytest tests/test_store.py"},
+        }
+    )
+
+    assert {"Store", "load", "get_user", "UserService", "test_store"} <= explicit
+    assert {"Fix", "call", "from"} <= plain
+    assert not explicit & plain
+
+
+@pytest.mark.parametrize("suffix", [".py", ".ts", ".md"])
+@pytest.mark.parametrize("max_tokens", [40, 200, 1000, 3000])
+def test_excerpts_stay_within_budget(suffix: str, max_tokens: int):
+    source = _large_typescript() if suffix == ".ts" else _large_python()
+    outline = outline_source(Path(f"large{suffix}"), source)
+    wanted = ["handler_150", "handler150", "handler_7", "handler299"]
+
+    for symbols in ([], wanted):
+        text = excerpt_outline(outline, symbols, max_tokens=max_tokens)
+        assert estimate_tokens(text) <= max_tokens
+    assert len(excerpt_outline(outline, max_lines=30).split("\n")) <= 30
+
+
+def test_excerpt_focuses_on_referenced_symbols():
+    outline = outline_source(Path("large.py"), _large_python())
+
+    text = excerpt_outline(outline, ["handler_250"], ["value"], max_tokens=800)
+
+    assert "import json" in text
+    assert "def handler_250(" in text
+    assert "def handler_249(" not in text
+    assert "... (lines" in text
+    # The outline of what was left out points at the other handlers
+    assert "function handler_0" in text
+
+
+def test_excerpt_keeps_class_signature_and_methods():
+    body = "".join(f"    def method_{i}(self):\n        return {i}\n\n" for i in range(200))
+    source = f"import os\n\n\nclass Big:\n    \"\"\"Doc.\"\"\"\n\n{body}"
+    outline = outline_source(Path("big.py"), source)
+
+    text = excerpt_outline(outline, ["method_120"], max_tokens=300)
+
+    assert 'class Big:\n    """Doc."""' in text
+    assert "def method_120(self):\n        return 120" in text
+    assert "def method_0(" not in text
+
+
+def test_small_files_are_included_whole(tmp_path: Path):
+    path = tmp_path / "service.ts"
+    path.write_text(TYPESCRIPT_SOURCE, encoding="utf-8")
+
+    assert excerpt_file(path, ["load"], max_tokens=2000) == TYPESCRIPT_SOURCE
+
+
+def test_load_subtask_context_excerpts_large_files(tmp_path: Path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "handlers.py").write_text(_large_python(), encoding="utf-8")
+    (tmp_path / "app" / "client.ts").write_text(_large_typescript(), encoding="utf-8")
+    (tmp_path / "app" / "small.py").write_text("X = 1\n", encoding="utf-8")
+    subtask = {
+        "id": "subtask-1",
+        "description": "Add retries to `handler_280` and handler280()",
+        "files_to_modify": ["app/handlers.py", "app/client.ts", "app/missing.py"],
+        "patterns_from": ["app/small.py"],
+    }
+
+    context = load_subtask_context(tmp_path, tmp_path, subtask, max_file_tokens=1000)
+
+    assert context["patterns"] == {"app/small.py": "X = 1\n"}
+    assert set(context["files_to_modify"]) == {"app/handlers.py", "app/client.ts"}
+    assert "def handler_280(" in context["files_to_modify"]["app/handlers.py"]
+    assert "function handler280(" in context["files_to_modify"]["app/client.ts"]
+    for text in context["files_to_modify"].values():
+        assert estimate_tokens(text) <= 1000
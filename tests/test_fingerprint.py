@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for core.fingerprint project fingerprinting.
+
+Covers git-object-ID identities for tracked files, stat fallbacks for
+untracked/modified files and non-git directories, and the consumers that
+share the fingerprint: the security profile hash and project index freshness.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from analysis.analyzers import analyze_project
+from core.fingerprint import ProjectFingerprinter, stat_token
+from project.analyzer import ProjectAnalyzer
+from prompts_pkg.project_context import should_refresh_project_index
+
+
+def _touch_later(path: Path) -> None:
+    """Move a file's mtime forward without changing its content."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+def _commit_all(repo: Path, message: str = "update") -> None:
+    subprocess.run(["git", "add", "-A"], cwd=repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, capture_output=True, check=True
+    )
+
+
+class TestGitFingerprints:
+    """Fingerprints inside a git repository."""
+
+    def test_tracked_file_uses_object_id(self, temp_git_repo: Path):
+        fingerprinter = ProjectFingerprinter(temp_git_repo)
+        assert fingerprinter.source == "git"
+        assert fingerprinter.token("README.md").startswith("git:")
+
+    def test_touching_tracked_file_does_not_change_fingerprint(
+        self, temp_git_repo: Path
+    ):
+        (temp_git_repo / "package.json").write_text('{"name": "app"}')
+        _commit_all(temp_git_repo)
+        before = ProjectFingerprinter(temp_git_repo).fingerprint(["package.json"])
+
+        _touch_later(temp_git_repo / "package.json")
+        # Refresh the index stat cache the way any git status call would
+        subprocess.run(
+            ["git", "update-index", "--refresh"], cwd=temp_git_repo, capture_output=True
+        )
+
+        after = ProjectFingerprinter(temp_git_repo).fingerprint(["package.json"])
+        assert after == before
+
+    def test_modified_tracked_file_changes_fingerprint(self, temp_git_repo: Path):
+        before = ProjectFingerprinter(temp_git_repo).fingerprint_tree()
+
+        (temp_git_repo / "README.md").write_text("# Changed\n")
+        fingerprinter = ProjectFingerprinter(temp_git_repo)
+
+        assert fingerprinter.token("README.md").startswith("stat:")
+        assert fingerprinter.fingerprint_tree() != before
+
+    def test_untracked_file_uses_stat_and_ignored_file_is_excluded(
+        self, temp_git_repo: Path
+    ):
+        (temp_git_repo / ".gitignore").write_text("ignored.log\n")
+        _commit_all(temp_git_repo)
+        (temp_git_repo / "new.py").write_text("x = 1\n")
+        (temp_git_repo / "ignored.log").write_text("noise\n")
+
+        fingerprinter = ProjectFingerprinter(temp_git_repo)
+        files = fingerprinter.list_files()
+
+        assert "new.py" in files
+        assert "ignored.log" not in files
+        assert fingerprinter.token("new.py").startswith("stat:")
+
+    def test_list_files_respects_subdir_and_skip_dirs(self, temp_git_repo: Path):
+        (temp_git_repo / "apps" / "web").mkdir(parents=True)
+        (temp_git_repo / "apps" / "web" / "index.ts").write_text("")
+        (temp_git_repo / "apps" / "web" / "node_modules").mkdir()
+        (temp_git_repo / "apps" / "web" / "node_modules" / "dep.js").write_text("")
+        (temp_git_repo / "apps" / "webby.ts").write_text("")
+
+        fingerprinter = ProjectFingerprinter(temp_git_repo)
+        assert fingerprinter.list_files("apps/web") == ["apps/web/index.ts"]
+
+
+class TestStatFallback:
+    """Fingerprints outside a git repository."""
+
+    def test_non_git_directory_uses_stat(self, temp_dir: Path):
+        (temp_dir / "main.py").write_text("print('hi')\n")
+        fingerprinter = ProjectFingerprinter(temp_dir)
+
+        assert fingerprinter.source == "stat"
+        assert fingerprinter.token("main.py") == stat_token(temp_dir / "main.py")
+        assert fingerprinter.token("missing.py") is None
+
+    def test_missing_files_are_skipped(self, temp_dir: Path):
+        (temp_dir / "a.txt").write_text("a")
+        fingerprint = ProjectFingerprinter(temp_dir).fingerprint(["a.txt", "b.txt"])
+        assert fingerprint.file_count == 1
+
+
+class TestSecurityProfileHash:
+    """ProjectAnalyzer.compute_project_hash uses the shared fingerprint."""
+
+    def test_hash_stable_across_mtime_only_changes(self, temp_git_repo: Path):
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        _commit_all(temp_git_repo)
+        before = ProjectAnalyzer(temp_git_repo).compute_project_hash()
+
+        _touch_later(temp_git_repo / "requirements.txt")
+        subprocess.run(
+            ["git", "update-index", "--refresh"], cwd=temp_git_repo, capture_output=True
+        )
+
+        assert ProjectAnalyzer(temp_git_repo).compute_project_hash() == before
+
+    def test_hash_changes_when_config_changes(self, temp_git_repo: Path):
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        _commit_all(temp_git_repo)
+        before = ProjectAnalyzer(temp_git_repo).compute_project_hash()
+
+        (temp_git_repo / "requirements.txt").write_text("flask\ndjango\n")
+
+        assert ProjectAnalyzer(temp_git_repo).compute_project_hash() != before
+
+    def test_hash_ignores_profile_file(self, temp_dir: Path):
+        (temp_dir / "app.py").write_text("")
+        before = ProjectAnalyzer(temp_dir).compute_project_hash()
+
+        (temp_dir / ProjectAnalyzer.PROFILE_FILENAME).write_text("{}")
+
+        assert ProjectAnalyzer(temp_dir).compute_project_hash() == before
+
+
+class TestProjectIndexFreshness:
+    """should_refresh_project_index compares recorded fingerprints."""
+
+    def _index_file(self, project: Path) -> Path:
+        return project / ".auto-claude" / "project_index.json"
+
+    def test_fresh_after_generation(self, temp_git_repo: Path):
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        analyze_project(temp_git_repo, self._index_file(temp_git_repo))
+
+        assert should_refresh_project_index(temp_git_repo) is False
+
+    def test_fresh_after_source_change(self, temp_git_repo: Path):
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        analyze_project(temp_git_repo, self._index_file(temp_git_repo))
+
+        (temp_git_repo / "app.py").write_text("from flask import Flask\n")
+
+        assert should_refresh_project_index(temp_git_repo) is False
+
+    def test_stale_after_manifest_or_config_change(self, temp_git_repo: Path):
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        analyze_project(temp_git_repo, self._index_file(temp_git_repo))
+
+        (temp_git_repo / "requirements.txt").write_text("flask\nsqlalchemy\n")
+        assert should_refresh_project_index(temp_git_repo) is True
+
+        analyze_project(temp_git_repo, self._index_file(temp_git_repo))
+        (temp_git_repo / "web").mkdir()
+        (temp_git_repo / "web" / "vite.config.ts").write_text("export default {}\n")
+        assert should_refresh_project_index(temp_git_repo) is True
+
+    def test_legacy_index_falls_back_to_mtime_check(self, temp_dir: Path):
+        index_file = self._index_file(temp_dir)
+        index_file.parent.mkdir(parents=True)
+        index_file.write_text(json.dumps({"services": {}}))
+
+        assert should_refresh_project_index(temp_dir) is False
+
+        (temp_dir / "package.json").write_text("{}")
+        _touch_later(temp_dir / "package.json")
+
+        assert should_refresh_project_index(temp_dir) is True
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Tests for LearningTracker's incremental accuracy aggregates.
+
+Random streams of predictions and outcomes (loaded history plus live
+record_prediction/record_outcome calls) are checked against a full scan of
+every outcome - the way get_accuracy() and detect_patterns() used to work -
+and a benchmark compares both on 100,000 outcomes.
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from learning import (
+    AccuracyStats,
+    LearningTracker,
+    OutcomeType,
+    PredictionType,
+    ReviewOutcome,
+)
+from state_store import StateStore, close_state_stores
+
+REPOS = ["owner/a", "owner/b", "owner/c"]
+FILE_TYPES = ["py", "ts", "md", "go"]
+CATEGORIES = ["security", "bug", "style"]
+SIZES = ["small", "medium", "large"]
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _close_stores():
+    yield
+    close_state_stores()
+
+
+def _scan_accuracy(outcomes, repo=None, since=None, prediction_type=None):
+    """Reference: the previous full-scan get_accuracy()."""
+    stats = AccuracyStats()
+    merge_times = []
+    for outcome in outcomes:
+        if repo and outcome.repo != repo:
+            continue
+        if since and outcome.created_at < since:
+            continue
+        if prediction_type and outcome.prediction != prediction_type:
+            continue
+        stats.total_predictions += 1
+        by_type = stats.by_type.setdefault(
+            outcome.prediction.value, {"total": 0, "correct": 0, "incorrect": 0}
+        )
+        by_type["total"] += 1
+        if outcome.is_complete:
+            if outcome.was_correct is True:
+                stats.correct_predictions += 1
+                by_type["correct"] += 1
+            elif outcome.was_correct is False:
+                stats.incorrect_predictions += 1
+                by_type["incorrect"] += 1
+            if outcome.actual_outcome == OutcomeType.MERGED and outcome.time_to_outcome:
+                merge_times.append(outcome.time_to_outcome.total_seconds())
+        else:
+            stats.pending_outcomes += 1
+    if merge_times:
+        stats.avg_time_to_merge = timedelta(seconds=sum(merge_times) / len(merge_times))
+    return stats
+
+
+def _scan_patterns(outcomes, min_sample_size):
+    """Reference: the previous full-scan detect_patterns(), as comparable tuples."""
+    counts = {}
+    for outcome in outcomes:
+        if outcome.was_correct is None:
+            continue
+        keys = [("file_type", k) for k in outcome.file_types]
+        keys += [("category", k) for k in outcome.categories]
+        keys.append(("change_size", outcome.change_size))
+        for key in keys:
+            correct, total = counts.get(key, (0, 0))
+            counts[key] = (correct + outcome.was_correct, total + 1)
+    return sorted(
+        (f"{kind}_{key}", total, correct / total)
+        for (kind, key), (correct, total) in counts.items()
+        if total >= min_sample_size
+    )
+
+
+def _assert_same(actual: AccuracyStats, expected: AccuracyStats) -> None:
+    assert actual.total_predictions == expected.total_predictions
+    assert actual.correct_predictions == expected.correct_predictions
+    assert actual.incorrect_predictions == expected.incorrect_predictions
+    assert actual.pending_outcomes == expected.pending_outcomes
+    assert actual.by_type == expected.by_type
+    if expected.avg_time_to_merge is None:
+        assert actual.avg_time_to_merge is None
+    else:
+        assert actual.avg_time_to_merge.total_seconds() == pytest.approx(
+            expected.avg_time_to_merge.total_seconds()
+        )
+
+
+def _random_outcome(rng: random.Random, review_id: str) -> ReviewOutcome:
+    outcome = ReviewOutcome(
+        review_id=review_id,
+        repo=rng.choice(REPOS),
+        pr_number=rng.randint(1, 500),
+        prediction=rng.choice(list(PredictionType)),
+        findings_count=rng.randint(0, 5),
+        high_severity_count=0,
+        created_at=NOW - timedelta(days=rng.uniform(0, 60)),
+        file_types=rng.sample(FILE_TYPES, rng.randint(0, 2)),
+        change_size=rng.choice(SIZES),
+        categories=rng.sample(CATEGORIES, rng.randint(0, 2)),
+    )
+    if rng.random() < 0.6:
+        outcome.actual_outcome = rng.choice(list(OutcomeType))
+        if rng.random() < 0.7:
+            outcome.time_to_outcome = timedelta(hours=rng.uniform(0, 72))
+    return outcome
+
+
+def _seed_store(state_dir: Path, outcomes: list[ReviewOutcome]) -> None:
+    store = StateStore(state_dir)
+    with store.transaction() as conn:
+        for outcome in outcomes:
+            store._upsert_outcome(conn, outcome.to_dict())
+    store.close()
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_aggregates_match_full_scan(tmp_path: Path, seed: int):
+    rng = random.Random(seed)
+    _seed_store(tmp_path, [_random_outcome(rng, f"h{i}") for i in range(150)])
+    tracker = LearningTracker(tmp_path)
+
+    for i in range(80):
+        if rng.random() < 0.5:
+            tracker.record_prediction(
+                rng.choice(REPOS),
+                f"live{i}",
+                rng.choice(list(PredictionType)),
+                file_types=rng.sample(FILE_TYPES, rng.randint(0, 2)),
+                change_size=rng.choice(SIZES),
+                categories=rng.sample(CATEGORIES, rng.randint(0, 2)),
+            )
+        else:
+            # Outcomes may be recorded again, overwriting the earlier one
+            review_id = rng.choice(list(tracker._outcomes))
+            tracker.record_outcome(
+                tracker._outcomes[review_id].repo,
+                review_id,
+                rng.choice(list(OutcomeType)),
+                time_to_outcome=timedelta(hours=rng.uniform(0, 72))
+                if rng.random() < 0.7
+                else None,
+            )
+
+    outcomes = list(tracker._outcomes.values())
+    filters = [(None, None, None)] + [
+        (
+            rng.choice([None, *REPOS]),
+            rng.choice([None, NOW - timedelta(days=rng.uniform(0, 70))]),
+            rng.choice([None, *PredictionType]),
+        )
+        for _ in range(25)
+    ]
+    for repo, since, prediction_type in filters:
+        _assert_same(
+            tracker.get_accuracy(repo, since, prediction_type),
+            _scan_accuracy(outcomes, repo, since, prediction_type),
+        )
+
+    for min_sample_size in (1, 5, 20):
+        patterns = sorted(
+            (p.pattern_id, p.sample_size, p.accuracy)
+            for p in tracker.detect_patterns(min_sample_size)
+        )
+        assert patterns == _scan_patterns(outcomes, min_sample_size)
+
+    # The aggregates rebuilt from the store agree with the live ones
+    reloaded = LearningTracker(tmp_path)
+    _assert_same(reloaded.get_accuracy(), tracker.get_accuracy())
+
+
+def test_dashboard_data(tmp_path: Path):
+    tracker = LearningTracker(tmp_path)
+    tracker.record_prediction("owner/a", "r1", PredictionType.REVIEW_APPROVE)
+    tracker.record_prediction("owner/a", "r2", PredictionType.REVIEW_APPROVE)
+    tracker.record_outcome(
+        "owner/a", "r1", OutcomeType.MERGED, time_to_outcome=timedelta(hours=2)
+    )
+
+    data = tracker.get_dashboard_data("owner/a")
+
+    assert data["pending_count"] == 1
+    assert data["last_week"]["correct_predictions"] == 1
+    assert data["all_time"]["avg_time_to_merge"] == 7200
+    assert [o["review_id"] for o in data["recent_outcomes"]] == ["r2", "r1"]
+
+
+@pytest.mark.slow
+def test_benchmark_100k_outcomes(tmp_path: Path):
+    """Dashboard-style queries: running aggregates vs. scanning every outcome."""
+    rng = random.Random(0)
+    _seed_store(tmp_path, [_random_outcome(rng, f"h{i}") for i in range(100_000)])
+    start = time.perf_counter()
+    tracker = LearningTracker(tmp_path)
+    load_s = time.perf_counter() - start
+    outcomes = list(tracker._outcomes.values())
+    week_ago = NOW - timedelta(days=7)
+    queries = [(None, None, None), ("owner/a", None, None), ("owner/b", week_ago, None)]
+
+    start = time.perf_counter()
+    for repo, since, prediction_type in queries:
+        expected = _scan_accuracy(outcomes, repo, since, prediction_type)
+    _scan_patterns(outcomes, 20)
+    scan_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for repo, since, prediction_type in queries:
+        actual = tracker.get_accuracy(repo, since, prediction_type)
+    tracker.detect_patterns(20)
+    aggregate_s = time.perf_counter() - start
+
+    print(
+        f"\nLearning dashboard queries, 100,000 outcomes: full scan "
+        f"{scan_s * 1000:.1f}ms, aggregates {aggregate_s * 1000:.1f}ms "
+        f"(load {load_s:.2f}s)"
+    )
+    _assert_same(actual, expected)
+    assert aggregate_s * 10 < scan_s
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub runner's SQLite state store.
+
+Covers row-level upserts for each table, the one-shot import of the JSON
+state files, persistence through the trackers that use the store, and a
+contention benchmark with several writer processes against the previous
+lock-and-rewrite JSON files.
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from bot_detection import BotDetectionState
+from learning import LearningTracker, OutcomeType, PredictionType
+from models import PRReviewResult
+from state_store import STATE_DB_FILENAME, StateStore, close_state_stores
+from trust import TrustManager, TrustState
+
+
+@pytest.fixture(autouse=True)
+def _close_stores():
+    yield
+    close_state_stores()
+
+
+@pytest.fixture
+def state_dir(tmp_path: Path) -> Path:
+    return tmp_path / "github"
+
+
+def _outcome(review_id: str, repo: str = "owner/repo", **extra) -> dict:
+    return {
+        "review_id": review_id,
+        "repo": repo,
+        "pr_number": 1,
+        "prediction": "approve",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "actual_outcome": None,
+        **extra,
+    }
+
+
+class TestUpserts:
+    def test_outcome_upsert_replaces_one_row(self, state_dir: Path):
+        store = StateStore(state_dir)
+        store.upsert_outcome(_outcome("r1"))
+        store.upsert_outcome(_outcome("r2", repo="other/repo"))
+
+        store.upsert_outcome(_outcome("r1", actual_outcome="merged"))
+
+        assert [o["review_id"] for o in store.get_outcomes()] == ["r1", "r2"]
+        assert store.get_outcomes("owner/repo")[0]["actual_outcome"] == "merged"
+        assert [o["review_id"] for o in store.get_outcomes("other/repo")] == ["r2"]
+
+    def test_trust_state(self, state_dir: Path):
+        store = StateStore(state_dir)
+        assert store.get_trust_state("owner/repo") is None
+
+        store.upsert_trust_state("owner/repo", {"repo": "owner/repo", "level": 1})
+        store.upsert_trust_state("owner/repo", {"repo": "owner/repo", "level": 2})
+
+        assert store.get_trust_state("owner/repo") == {
+            "repo": "owner/repo",
+            "level": 2,
+        }
+        assert len(store.get_trust_states()) == 1
+
+    def test_reviewed_commits_merge_per_pr(self, state_dir: Path):
+        store = StateStore(state_dir)
+        other = StateStore(state_dir)  # Another runner on the same state dir
+
+        store.add_reviewed_commit("42", "aaa", "2026-01-01T00:00:00")
+        assert other.add_reviewed_commit("42", "bbb", "2026-01-02T00:00:00") == [
+            "aaa",
+            "bbb",
+        ]
+        store.add_reviewed_commit("42", "aaa", "2026-01-03T00:00:00")
+        store.add_reviewed_commit("7", "ccc", "2026-01-03T00:00:00")
+        store.delete_bot_prs(["7"])
+
+        assert store.get_bot_state() == {
+            "reviewed_commits": {"42": ["aaa", "bbb"]},
+            "last_review_times": {"42": "2026-01-03T00:00:00"},
+        }
+        other.close()
+
+    def test_review_records(self, state_dir: Path):
+        store = StateStore(state_dir)
+        record = {
+            "pr_number": 5,
+            "repo": "owner/repo",
+            "overall_status": "approve",
+            "findings": [{"id": "f1"}, {"id": "f2"}],
+            "reviewed_at": "2026-01-01T00:00:00",
+        }
+
+        store.upsert_review_record(record)
+        store.upsert_review_record({**record, "overall_status": "request_changes"})
+
+        assert store.get_review_record(5)["overall_status"] == "request_changes"
+        assert store.get_review_record(6) is None
+        assert store.get_review_index() == [
+            {
+                "pr_number": 5,
+                "repo": "owner/repo",
+                "overall_status": "request_changes",
+                "findings_count": 2,
+                "reviewed_at": "2026-01-01T00:00:00",
+            }
+        ]
+
+    def test_failed_transaction_rolls_back(self, state_dir: Path):
+        store = StateStore(state_dir)
+
+        with pytest.raises(RuntimeError):
+            with store.transaction() as conn:
+                store._upsert_outcome(conn, _outcome("r1"))
+                raise RuntimeError("abort")
+
+        assert store.get_outcomes() == []
+
+    def test_database_is_owner_only(self, state_dir: Path):
+        StateStore(state_dir)
+
+        assert (state_dir / STATE_DB_FILENAME).stat().st_mode & 0o777 == 0o600
+
+
+class TestJsonImport:
+    def _write_json_state(self, state_dir: Path) -> None:
+        (state_dir / "learning").mkdir(parents=True)
+        (state_dir / "learning" / "owner_repo_outcomes.json").write_text(
+            json.dumps({"outcomes": [_outcome("r1"), _outcome("r2"), {"bad": 1}]})
+        )
+        (state_dir / "learning" / "broken_outcomes.json").write_text("{not json")
+        (state_dir / "trust").mkdir()
+        (state_dir / "trust" / "owner_repo.json").write_text(
+            json.dumps(TrustState(repo="owner/repo").to_dict())
+        )
+        (state_dir / "bot_detection_state.json").write_text(
+            json.dumps(
+                {
+                    "reviewed_commits": {"42": ["aaa"]},
+                    "last_review_times": {"42": "2026-01-01T00:00:00"},
+                }
+            )
+        )
+        (state_dir / "pr").mkdir()
+        (state_dir / "pr" / "review_42.json").write_text(
+            json.dumps({"pr_number": 42, "repo": "owner/repo", "findings": []})
+        )
+
+    def test_existing_json_is_imported_once(self, state_dir: Path):
+        self._write_json_state(state_dir)
+
+        store = StateStore(state_dir)
+
+        assert [o["review_id"] for o in store.get_outcomes()] == ["r1", "r2"]
+        assert store.get_trust_state("owner/repo")["repo"] == "owner/repo"
+        assert store.get_bot_state()["reviewed_commits"] == {"42": ["aaa"]}
+        assert store.get_review_record(42)["repo"] == "owner/repo"
+        # The JSON files are left in place
+        assert (state_dir / "bot_detection_state.json").exists()
+
+        # Later changes to the JSON files are not re-imported on open
+        (state_dir / "bot_detection_state.json").write_text(
+            json.dumps({"reviewed_commits": {"1": ["zzz"]}})
+        )
+        store.close()
+        reopened = StateStore(state_dir)
+        assert reopened.get_bot_state()["reviewed_commits"] == {"42": ["aaa"]}
+
+    def test_explicit_reimport(self, state_dir: Path):
+        store = StateStore(state_dir)
+        self._write_json_state(state_dir)
+
+        counts = store.import_json_state()
+
+        assert counts == {
+            "outcomes": 2,
+            "trust_state": 1,
+            "bot_detection": 1,
+            "reviews": 1,
+        }
+
+
+class TestTrackers:
+    def test_learning_outcomes_persist(self, state_dir: Path):
+        tracker = LearningTracker(state_dir)
+        tracker.record_prediction("owner/repo", "r1", PredictionType.REVIEW_APPROVE)
+        tracker.record_prediction("owner/repo", "r2", PredictionType.REVIEW_APPROVE)
+        tracker.record_outcome(
+            "owner/repo", "r1", OutcomeType.MERGED, time_to_outcome=timedelta(hours=1)
+        )
+
+        reloaded = LearningTracker(state_dir)
+
+        assert [o.review_id for o in reloaded.get_pending_outcomes()] == ["r2"]
+        assert reloaded.get_recent_outcomes("owner/repo", limit=5)
+
+    def test_trust_state_persists(self, state_dir: Path):
+        trust = TrustManager(state_dir)
+        trust.record_action("owner/repo", "review", correct=True)
+
+        reloaded = TrustManager(state_dir)
+
+        assert reloaded.get_state("owner/repo").metrics.total_actions == 1
+        assert [s.repo for s in reloaded.get_all_states()] == ["owner/repo"]
+
+    def test_bot_detection_state_round_trip(self, state_dir: Path):
+        state = BotDetectionState(
+            reviewed_commits={"1": ["a"], "2": ["b", "c"]},
+            last_review_times={"1": "2026-01-01T00:00:00"},
+        )
+        state.save(state_dir)
+        BotDetectionState(reviewed_commits={"2": ["c"]}).save(state_dir)
+
+        assert BotDetectionState.load(state_dir).to_dict() == {
+            "reviewed_commits": {"2": ["c"]},
+            "last_review_times": {},
+        }
+
+    def test_pr_review_save_indexes_the_review(self, state_dir: Path):
+        result = PRReviewResult(
+            pr_number=9, repo="owner/repo", success=True, overall_status="approve"
+        )
+
+        asyncio.run(result.save(state_dir))
+
+        # The review file the desktop app reads is still written
+        assert PRReviewResult.load(state_dir, 9).overall_status == "approve"
+        store = StateStore(state_dir)
+        assert [r["pr_number"] for r in store.get_review_index()] == [9]
+
+
+_JSON_WRITER = """
+import json, sys
+sys.path.insert(0, {github_dir!r})
+from file_lock import FileLock, atomic_write
+path, writer, count = sys.argv[1], sys.argv[2], int(sys.argv[3])
+for i in range(count):
+    # The previous LearningTracker._save_outcomes: rewrite the whole file
+    with FileLock(path, timeout=120.0):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["outcomes"].append({{"review_id": f"{{writer}}-{{i}}", "repo": "o/r"}})
+        with atomic_write(path) as f:
+            json.dump(data, f, indent=2)
+"""
+
+_DB_WRITER = """
+import sys
+sys.path.insert(0, {github_dir!r})
+from state_store import StateStore
+state_dir, writer, count = sys.argv[1], sys.argv[2], int(sys.argv[3])
+store = StateStore(state_dir)
+for i in range(count):
+    store.upsert_outcome({{"review_id": f"{{writer}}-{{i}}", "repo": "o/r"}})
+"""
+
+
+def _run_writers(script: str, target: Path, writers: int, count: int) -> float:
+    script = script.format(github_dir=str(_github_dir))
+    start = time.perf_counter()
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, str(target), str(n), str(count)]
+        )
+        for n in range(writers)
+    ]
+    for proc in procs:
+        assert proc.wait(timeout=300) == 0
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+def test_benchmark_writer_contention(tmp_path: Path):
+    """Outcome writes from several processes: SQLite rows vs. locked JSON."""
+    writers, count, existing = 4, 150, 1000
+    seed = [_outcome(f"seed-{i}") for i in range(existing)]
+
+    json_file = tmp_path / "owner_repo_outcomes.json"
+    json_file.write_text(json.dumps({"outcomes": seed}))
+    json_s = _run_writers(_JSON_WRITER, json_file, writers, count)
+
+    db_dir = tmp_path / "db"
+    store = StateStore(db_dir)
+    with store.transaction() as conn:
+        for item in seed:
+            store._upsert_outcome(conn, item)
+    db_s = _run_writers(_DB_WRITER, db_dir, writers, count)
+
+    total = writers * count
+    # FileLock unlinks its .lock file on release, so two writers can both
+    # hold "the" lock and one rewrite can drop the other's record
+    json_lost = existing + total - len(json.loads(json_file.read_text())["outcomes"])
+    print(
+        f"\nState writes, {writers} processes x {count} on {existing:,} records: "
+        f"locked JSON {total / json_s:,.0f} writes/s ({json_lost} lost), "
+        f"SQLite {total / db_s:,.0f} writes/s"
+    )
+    assert len(store.get_outcomes()) == existing + total
+    assert db_s < json_s
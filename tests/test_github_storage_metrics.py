@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the storage ledger behind StorageMetricsCalculator.
+
+Random sequences of file creates, rewrites and deletes - some reported
+through note_written()/note_deleted(), some not - are checked against a
+full recomputation of the state tree, the way calculate() used to work.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from state_store import close_state_stores
+from storage_metrics import StorageMetrics, StorageMetricsCalculator
+
+DIRS = ["pr", "issues", "autofix", "audit", "archive", "archive/pr", "learning", ""]
+NAMES = ["review_1.json", "review_2.json", "index.json", "a.log", "notes.txt"]
+
+
+@pytest.fixture(autouse=True)
+def _close_stores():
+    yield
+    close_state_stores()
+
+
+def _directory_size(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _json_files(path: Path) -> int:
+    return len(list(path.rglob("*.json"))) if path.exists() else 0
+
+
+def _full_recompute(state_dir: Path) -> StorageMetrics:
+    """Reference: the previous rglob-everything calculate()."""
+    metrics = StorageMetrics(
+        pr_reviews_bytes=_directory_size(state_dir / "pr"),
+        issues_bytes=_directory_size(state_dir / "issues"),
+        autofix_bytes=_directory_size(state_dir / "autofix"),
+        audit_logs_bytes=_directory_size(state_dir / "audit"),
+        archive_bytes=_directory_size(state_dir / "archive"),
+        total_bytes=_directory_size(state_dir),
+        record_count=sum(
+            _json_files(state_dir / d) for d in ["pr", "issues", "autofix"]
+        ),
+        archive_count=_json_files(state_dir / "archive"),
+    )
+    counted = (
+        metrics.pr_reviews_bytes
+        + metrics.issues_bytes
+        + metrics.autofix_bytes
+        + metrics.audit_logs_bytes
+        + metrics.archive_bytes
+    )
+    metrics.other_bytes = max(0, metrics.total_bytes - counted)
+    return metrics
+
+
+def _random_changes(
+    rng: random.Random, state_dir: Path, calculator, steps: int, note: float
+) -> None:
+    """Create, rewrite and delete files; report a `note` fraction of them."""
+    for _ in range(steps):
+        path = state_dir / rng.choice(DIRS) / f"{rng.randint(0, 5)}_{rng.choice(NAMES)}"
+        reported = rng.random() < note
+        if path.exists() and rng.random() < 0.4:
+            path.unlink()
+            if reported:
+                calculator.note_deleted(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x" * rng.randint(0, 3000))
+            if reported:
+                calculator.note_written(path)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_ledger_matches_full_recompute(tmp_path: Path, seed: int):
+    rng = random.Random(seed)
+    state_dir = tmp_path / "github"
+    state_dir.mkdir()
+    calculator = StorageMetricsCalculator(state_dir)
+
+    for _ in range(5):
+        _random_changes(rng, state_dir, calculator, steps=40, note=0.5)
+
+        assert calculator.calculate() == _full_recompute(state_dir)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_reported_changes_need_no_reconcile(tmp_path: Path, seed: int):
+    rng = random.Random(seed)
+    state_dir = tmp_path / "github"
+    state_dir.mkdir()
+    calculator = StorageMetricsCalculator(state_dir)
+    calculator.calculate()
+
+    _random_changes(rng, state_dir, calculator, steps=60, note=1.0)
+
+    assert calculator.calculate(reconcile=False) == _full_recompute(state_dir)
+    assert calculator.reconcile() == 0
+
+
+def test_reconcile_only_touches_changed_files(tmp_path: Path):
+    state_dir = tmp_path / "github"
+    (state_dir / "pr").mkdir(parents=True)
+    for i in range(20):
+        (state_dir / "pr" / f"review_{i}.json").write_text("{}")
+    calculator = StorageMetricsCalculator(state_dir)
+
+    assert calculator.reconcile() == 20
+    assert calculator.reconcile() == 0
+
+    (state_dir / "pr" / "review_3.json").write_text('{"changed": true}')
+    (state_dir / "pr" / "review_4.json").unlink()
+    assert calculator.reconcile() == 2
+    assert calculator.calculate().record_count == 19
+
+
+def test_ledger_persists_across_calculators(tmp_path: Path):
+    state_dir = tmp_path / "github"
+    (state_dir / "issues").mkdir(parents=True)
+    (state_dir / "issues" / "issue_1.json").write_text("{}")
+    StorageMetricsCalculator(state_dir).calculate()
+    close_state_stores()
+
+    assert StorageMetricsCalculator(state_dir).reconcile() == 0
+
+
+def test_missing_state_dir(tmp_path: Path):
+    calculator = StorageMetricsCalculator(tmp_path / "missing")
+
+    assert calculator.calculate() == StorageMetrics()
+    assert not (tmp_path / "missing").exists()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk Graphiti embedding cache.
+
+Uses a counting fake embedder in place of a provider, and checks cache hits
+across processes (new cache instances), LRU eviction by size, invalidation
+per (provider, model, dimension), and the hit ratio in memory statistics.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from integrations.graphiti.config import GraphitiConfig
+from integrations.graphiti.providers_pkg.embedding_cache import (
+    CachingEmbedder,
+    EmbeddingCache,
+    embedding_namespace,
+    get_embedding_cache,
+    invalidate_embedding_cache,
+    wrap_embedder_with_cache,
+)
+from integrations.graphiti.queries_pkg.client import GraphitiClient
+from integrations.graphiti.queries_pkg.graphiti import GraphitiMemory
+
+
+class CountingEmbedder:
+    """Deterministic fake embedder that counts the texts it embeds."""
+
+    def __init__(self, dim: int = 8):
+        self.dim = dim
+        self.embedded: list[str] = []
+        self.config = "fake-config"
+
+    def _vector(self, text: str) -> list[float]:
+        return [float((len(text) + i) % 7) for i in range(self.dim)]
+
+    async def create(self, input_data):
+        text = input_data[0] if isinstance(input_data, list) else input_data
+        self.embedded.append(text)
+        return self._vector(text)
+
+    async def create_batch(self, input_data_list):
+        self.embedded.extend(input_data_list)
+        return [self._vector(text) for text in input_data_list]
+
+
+@pytest.fixture
+def cache(temp_dir: Path) -> EmbeddingCache:
+    return EmbeddingCache(temp_dir / "embedding_cache", max_bytes=1024 * 1024)
+
+
+def _embedder(cache: EmbeddingCache, namespace: str = "openai-test-8"):
+    fake = CountingEmbedder()
+    return fake, CachingEmbedder(fake, cache, namespace)
+
+
+class TestCachingEmbedder:
+    def test_repeated_text_is_embedded_once(self, cache):
+        fake, embedder = _embedder(cache)
+
+        first = asyncio.run(embedder.create(["Close DB connections"]))
+        second = asyncio.run(embedder.create("Close DB connections"))
+
+        assert first == second
+        assert fake.embedded == ["Close DB connections"]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_batch_only_embeds_misses(self, cache):
+        fake, embedder = _embedder(cache)
+        asyncio.run(embedder.create("b"))
+        fake.embedded.clear()
+
+        vectors = asyncio.run(embedder.create_batch(["a", "b", "c"]))
+
+        assert fake.embedded == ["a", "c"]
+        assert vectors == [fake._vector(t) for t in ["a", "b", "c"]]
+
+    def test_token_input_is_not_cached(self, cache):
+        fake, embedder = _embedder(cache)
+        for _ in range(2):
+            asyncio.run(embedder.create([[1, 2, 3]]))
+
+        assert len(fake.embedded) == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_cache_survives_restart(self, cache, temp_dir: Path):
+        _, embedder = _embedder(cache)
+        asyncio.run(embedder.create("persisted"))
+
+        reopened = EmbeddingCache(cache.root, max_bytes=cache.max_bytes)
+        fake, embedder = _embedder(reopened)
+        asyncio.run(embedder.create("persisted"))
+
+        assert fake.embedded == []
+        assert reopened.stats()["entries"] == 1
+
+    def test_hit_returns_exactly_the_missed_vector(self, cache):
+        # Not representable in float32: a lossy cache would round these
+        vector = [0.1, 1 / 3, 1e-300, -2.5e10]
+        cache.put("openai-test-4", "text", vector)
+
+        assert cache.get("openai-test-4", "text") == vector
+
+    def test_unknown_attributes_delegate(self, cache):
+        fake, embedder = _embedder(cache)
+        assert embedder.config == "fake-config"
+
+
+class TestEviction:
+    def test_lru_entries_evicted_over_limit(self, temp_dir: Path):
+        entry_bytes = 8 * 8
+        cache = EmbeddingCache(temp_dir / "cache", max_bytes=entry_bytes * 3)
+        fake, embedder = _embedder(cache)
+
+        for text in ["a", "b", "c"]:
+            asyncio.run(embedder.create(text))
+        asyncio.run(embedder.create("a"))  # "a" is now most recently used
+        asyncio.run(embedder.create("d"))  # Over the limit: evict to 90%
+
+        assert cache.total_bytes <= entry_bytes * 3
+        assert cache.evictions == 2
+        fake.embedded.clear()
+        asyncio.run(embedder.create("a"))
+        asyncio.run(embedder.create("b"))
+        assert fake.embedded == ["b"]
+
+    def test_size_accounting_matches_disk(self, cache):
+        _, embedder = _embedder(cache)
+        for text in ["x", "y", "x"]:
+            asyncio.run(embedder.create(text))
+
+        on_disk = sum(p.stat().st_size for p in cache.root.rglob("*.f64"))
+        assert cache.total_bytes == on_disk == 2 * 8 * 8
+
+    def test_legacy_float32_entries_are_removed(self, cache):
+        legacy = cache.root / "openai-test-8" / "ab" / "abc.f32"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(bytes(32))
+
+        assert cache.stats()["entries"] == 0
+        assert not legacy.exists()
+
+
+class TestInvalidation:
+    def test_namespace_depends_on_model_and_dimension(self):
+        small = GraphitiConfig(embedder_provider="openai")
+        ollama = GraphitiConfig(
+            embedder_provider="ollama",
+            ollama_embedding_model="nomic-embed-text:latest",
+            ollama_embedding_dim=768,
+        )
+
+        assert embedding_namespace(small) == "openai-text-embedding-3-small-1536"
+        assert embedding_namespace(ollama) == "ollama-nomic-embed-text_latest-768"
+
+    def test_invalidate_clears_only_that_namespace(self, temp_dir: Path):
+        old = GraphitiConfig(embedder_provider="openai", db_path=str(temp_dir))
+        new = GraphitiConfig(embedder_provider="voyage", db_path=str(temp_dir))
+        old_fake = CountingEmbedder()
+        old_embedder = wrap_embedder_with_cache(old_fake, old)
+        new_fake = CountingEmbedder()
+        new_embedder = wrap_embedder_with_cache(new_fake, new)
+        asyncio.run(old_embedder.create("text"))
+        asyncio.run(new_embedder.create("text"))
+
+        invalidate_embedding_cache(old)
+        asyncio.run(old_embedder.create("text"))
+        asyncio.run(new_embedder.create("text"))
+
+        assert old_fake.embedded == ["text", "text"]
+        assert new_fake.embedded == ["text"]
+
+    def test_disabled_cache_returns_plain_embedder(self, temp_dir: Path):
+        config = GraphitiConfig(db_path=str(temp_dir), embedding_cache_mb=0)
+        fake = CountingEmbedder()
+
+        assert get_embedding_cache(config) is None
+        assert wrap_embedder_with_cache(fake, config) is fake
+
+
+class TestMemoryStatistics:
+    def test_status_summary_reports_hit_ratio(self, cache, temp_dir: Path):
+        _, embedder = _embedder(cache)
+        for text in ["q1", "q1", "q1", "q2"]:
+            asyncio.run(embedder.create(text))
+
+        client = GraphitiClient(GraphitiConfig())
+        client._embedder = embedder
+        memory = GraphitiMemory(temp_dir, temp_dir)
+        memory._client = client
+
+        stats = memory.get_status_summary()["embedding_cache"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["hit_ratio"] == 0.5
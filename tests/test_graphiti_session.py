@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Tests for the Graphiti session manager.
+
+Covers the write-behind queue (size and time flushes, draining on shutdown),
+sharing one client across specs, and the synchronous memory helpers that now
+queue their Graphiti writes. The Graphiti backend is replaced by an
+in-memory fake so no database or provider is needed.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+import memory.graphiti_session as graphiti_session
+import memory.patterns as patterns
+from memory.graphiti_session import GraphitiSessionManager
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeMemory:
+    """Records episodes the way GraphitiMemory would write them."""
+
+    def __init__(self, spec_dir: Path, client: FakeClient, write_delay: float = 0.0):
+        self.spec_dir = spec_dir
+        self.client = client
+        self.write_delay = write_delay
+        self.episodes: list[tuple[str, object]] = []
+        self.closed = False
+
+    async def _save(self, kind: str, payload) -> bool:
+        if self.write_delay:
+            await asyncio.sleep(self.write_delay)
+        if payload == "explode":
+            raise RuntimeError("write failed")
+        self.episodes.append((kind, payload))
+        return True
+
+    async def save_gotcha(self, gotcha: str) -> bool:
+        return await self._save("gotcha", gotcha)
+
+    async def save_pattern(self, pattern: str) -> bool:
+        return await self._save("pattern", pattern)
+
+    async def save_session_insights(self, session_num: int, insights: dict) -> bool:
+        return await self._save("session", session_num)
+
+    async def save_codebase_discoveries(self, discoveries: dict) -> bool:
+        return await self._save("discoveries", discoveries)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBackend:
+    """Factories for the manager, recording what was opened."""
+
+    def __init__(self, open_delay: float = 0.0, write_delay: float = 0.0):
+        self.open_delay = open_delay
+        self.write_delay = write_delay
+        self.clients: list[FakeClient] = []
+        self.memories: dict[Path, FakeMemory] = {}
+
+    def create_client(self) -> FakeClient:
+        client = FakeClient()
+        self.clients.append(client)
+        return client
+
+    async def open_memory(self, spec_dir: Path, project_dir: Path, client):
+        if self.open_delay:
+            await asyncio.sleep(self.open_delay)
+        memory = FakeMemory(spec_dir, client, self.write_delay)
+        self.memories[spec_dir] = memory
+        return memory
+
+    def manager(self, **kwargs) -> GraphitiSessionManager:
+        return GraphitiSessionManager(
+            memory_factory=self.open_memory,
+            client_factory=self.create_client,
+            **kwargs,
+        )
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+@pytest.fixture
+def spec_dir(temp_dir: Path) -> Path:
+    path = temp_dir / ".auto-claude" / "specs" / "001-test"
+    path.mkdir(parents=True)
+    return path
+
+
+class TestWriteBehindQueue:
+    def test_submit_does_not_wait_for_write(self, backend, spec_dir):
+        manager = backend.manager(flush_interval=60)
+        try:
+            manager.submit(spec_dir, "save_gotcha", "close db handles")
+            assert manager.episodes_written == 0
+
+            manager.flush()
+            assert backend.memories[spec_dir].episodes == [
+                ("gotcha", "close db handles")
+            ]
+        finally:
+            manager.shutdown()
+
+    def test_flushes_when_batch_is_full(self, backend, spec_dir):
+        manager = backend.manager(max_batch=3, flush_interval=60)
+        try:
+            for i in range(3):
+                manager.submit(spec_dir, "save_pattern", f"pattern {i}")
+
+            assert _wait_for(lambda: manager.episodes_written == 3)
+            assert manager.batches_flushed == 1
+        finally:
+            manager.shutdown()
+
+    def test_flushes_after_interval(self, backend, spec_dir):
+        manager = backend.manager(max_batch=100, flush_interval=0.05)
+        try:
+            manager.submit(spec_dir, "save_gotcha", "one")
+            assert _wait_for(lambda: manager.episodes_written == 1)
+        finally:
+            manager.shutdown()
+
+    def test_writes_keep_submission_order(self, backend, spec_dir):
+        manager = backend.manager(max_batch=4, flush_interval=60)
+        try:
+            for i in range(10):
+                manager.submit(spec_dir, "save_gotcha", f"g{i}")
+            manager.flush()
+        finally:
+            manager.shutdown()
+
+        assert [p for _, p in backend.memories[spec_dir].episodes] == [
+            f"g{i}" for i in range(10)
+        ]
+
+    def test_shutdown_drains_and_closes(self, backend, spec_dir):
+        manager = backend.manager(flush_interval=60)
+        for i in range(5):
+            manager.submit(spec_dir, "save_gotcha", f"g{i}")
+
+        manager.shutdown()
+
+        memory = backend.memories[spec_dir]
+        assert len(memory.episodes) == 5
+        assert memory.closed
+        assert backend.clients[0].closed
+        assert not manager.running
+
+    def test_failed_write_is_counted_not_raised(self, backend, spec_dir):
+        manager = backend.manager(flush_interval=60)
+        try:
+            manager.submit(spec_dir, "save_gotcha", "explode")
+            manager.submit(spec_dir, "save_gotcha", "fine")
+            manager.flush()
+        finally:
+            manager.shutdown()
+
+        assert manager.episodes_failed == 1
+        assert manager.episodes_written == 1
+
+
+class TestSharedClient:
+    def test_one_client_for_all_specs(self, backend, temp_dir: Path):
+        manager = backend.manager(flush_interval=60)
+        spec_a = temp_dir / "specs" / "001-a"
+        spec_b = temp_dir / "specs" / "002-b"
+        try:
+            for _ in range(3):
+                manager.submit(spec_a, "save_gotcha", "a")
+                manager.submit(spec_b, "save_gotcha", "b")
+            manager.flush()
+        finally:
+            manager.shutdown()
+
+        assert len(backend.clients) == 1
+        assert set(backend.memories) == {spec_a, spec_b}
+        assert all(m.client is backend.clients[0] for m in backend.memories.values())
+
+    def test_unavailable_backend_is_not_retried_per_write(self, spec_dir):
+        opens = []
+
+        async def unavailable(spec_dir, project_dir, client):
+            opens.append(spec_dir)
+            return None
+
+        manager = GraphitiSessionManager(
+            memory_factory=unavailable, client_factory=FakeClient, flush_interval=60
+        )
+        try:
+            for _ in range(3):
+                manager.submit(spec_dir, "save_gotcha", "x")
+            manager.flush()
+        finally:
+            manager.shutdown()
+
+        assert opens == [spec_dir]
+        assert manager.episodes_failed == 3
+
+    def test_failed_open_is_retried_after_backoff(
+        self, backend, spec_dir, monkeypatch
+    ):
+        monkeypatch.setattr(graphiti_session, "OPEN_RETRY_INITIAL", 0.05)
+        opens = []
+
+        async def flaky(spec_dir, project_dir, client):
+            opens.append(spec_dir)
+            if len(opens) == 1:
+                raise ConnectionError("database not ready")
+            return await backend.open_memory(spec_dir, project_dir, client)
+
+        manager = GraphitiSessionManager(
+            memory_factory=flaky, client_factory=FakeClient, flush_interval=60
+        )
+        try:
+            manager.submit(spec_dir, "save_gotcha", "lost")
+            manager.flush()
+            time.sleep(0.1)
+            manager.submit(spec_dir, "save_gotcha", "kept")
+            manager.flush()
+        finally:
+            manager.shutdown()
+
+        assert opens == [spec_dir, spec_dir]
+        assert backend.memories[spec_dir].episodes == [("gotcha", "kept")]
+        assert manager.episodes_failed == 1
+
+
+class TestMemoryHelpers:
+    def test_append_gotcha_queues_graphiti_write(
+        self, backend, spec_dir, monkeypatch
+    ):
+        manager = backend.manager(flush_interval=60)
+        monkeypatch.setattr(graphiti_session, "_manager", manager)
+        monkeypatch.setattr(patterns, "is_graphiti_memory_enabled", lambda: True)
+        try:
+            patterns.append_gotcha(spec_dir, "Close DB connections")
+            patterns.append_gotcha(spec_dir, "Close DB connections")  # Duplicate
+            patterns.append_pattern(spec_dir, "Use dataclasses")
+            manager.flush()
+        finally:
+            manager.shutdown()
+
+        assert backend.memories[spec_dir].episodes == [
+            ("gotcha", "Close DB connections"),
+            ("pattern", "Use dataclasses"),
+        ]
+        assert patterns.load_gotchas(spec_dir) == ["Close DB connections"]
+
+
+@pytest.mark.slow
+def test_benchmark_episodes_per_second(spec_dir):
+    """Episodes/sec: shared session vs open-write-close per episode.
+
+    The fake backend charges a fixed cost for opening the database (5ms) and
+    for each write (0.5ms) to stand in for the embedded graph database.
+    """
+    episodes = 40
+    backend = FakeBackend(open_delay=0.005, write_delay=0.0005)
+
+    # Previous pattern: open, write and close with asyncio.run() per step
+    start = time.perf_counter()
+    for i in range(episodes):
+        memory = asyncio.run(
+            backend.open_memory(spec_dir, spec_dir.parent, backend.create_client())
+        )
+        asyncio.run(memory.save_gotcha(f"g{i}"))
+        asyncio.run(memory.close())
+    per_write_rate = episodes / (time.perf_counter() - start)
+
+    manager = backend.manager(flush_interval=60)
+    start = time.perf_counter()
+    for i in range(episodes):
+        manager.submit(spec_dir, "save_gotcha", f"g{i}")
+    manager.flush()
+    session_rate = episodes / (time.perf_counter() - start)
+    manager.shutdown()
+
+    print(
+        f"\nGraphiti writes: session {session_rate:.0f} episodes/s, "
+        f"per-write connection {per_write_rate:.0f} episodes/s"
+    )
+    assert manager.episodes_written == episodes
+    assert session_rate > per_write_rate
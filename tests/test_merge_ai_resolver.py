@@ -13,6 +13,8 @@ Covers:
 - can_resolve filtering logic
 """
 
+import threading
+import time
 from datetime import datetime
 
 import pytest
@@ -26,6 +28,8 @@ from merge import (
     MergeStrategy,
     MergeDecision,
 )
+from merge.ai_resolver import AIResolver, ResolutionCache, conflict_cache_key
+from merge.ai_resolver.prompts import PROMPT_VERSION
 
 
 class TestAIResolverBasics:
@@ -247,3 +251,219 @@ class TestAIMergeRetryMechanism:
         assert "OURS" in prompt
         assert "THEIRS" in prompt
         assert "BASE" in prompt or "common ancestor" in prompt
+
+
+# =============================================================================
+# CACHING AND CONCURRENCY
+# =============================================================================
+
+
+class FakeAI:
+    """AI function that echoes a code block and records concurrency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.seen: list[tuple[str, str]] = []  # (file, location) per call
+        self._lock = threading.Lock()
+
+    def __call__(self, system: str, user: str) -> str:
+        lines = user.splitlines()
+        file_line = next(line for line in lines if line.startswith("File:"))
+        location_line = next(line for line in lines if line.startswith("Location:"))
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.seen.append((file_line[6:], location_line[10:]))
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return f"```python\n# merged {file_line}\n```"
+
+
+def _conflict_with_snapshot(
+    file_path: str, location: str = "function:main", code: str = "x = 1"
+) -> tuple[ConflictRegion, TaskSnapshot]:
+    snapshot = TaskSnapshot(
+        task_id=f"task-{file_path}",
+        task_intent="Change main",
+        started_at=datetime.now(),
+        semantic_changes=[
+            SemanticChange(
+                change_type=ChangeType.MODIFY_FUNCTION,
+                target="main",
+                location=location,
+                line_start=1,
+                line_end=1,
+                content_after=code,
+            ),
+        ],
+    )
+    conflict = ConflictRegion(
+        file_path=file_path,
+        location=location,
+        tasks_involved=[snapshot.task_id],
+        change_types=[ChangeType.MODIFY_FUNCTION],
+        severity=ConflictSeverity.MEDIUM,
+        can_auto_merge=False,
+        merge_strategy=MergeStrategy.AI_REQUIRED,
+    )
+    return conflict, snapshot
+
+
+class TestResolutionCache:
+    """Repeated conflicts are answered from the content-addressed cache."""
+
+    def test_identical_conflict_hits_cache(self):
+        ai = FakeAI()
+        resolver = AIResolver(ai_call_fn=ai, cache=ResolutionCache())
+        conflict, snapshot = _conflict_with_snapshot("a.py")
+
+        first = resolver.resolve_conflict(conflict, "def main(): pass", [snapshot])
+        second = resolver.resolve_conflict(conflict, "def main(): pass", [snapshot])
+
+        assert ai.calls == 1
+        assert second.decision == MergeDecision.AI_MERGED
+        assert second.merged_content == first.merged_content
+        assert second.ai_calls_made == 0
+        assert resolver.stats["cache_hits"] == 1
+
+    def test_cache_shared_across_tasks_and_resolvers(self):
+        ai = FakeAI()
+        cache = ResolutionCache()
+        # Same code written by a different task, with trailing-whitespace noise
+        conflict_a, snapshot_a = _conflict_with_snapshot("a.py", code="x = 1")
+        conflict_b, snapshot_b = _conflict_with_snapshot("a.py", code="x = 1   \r\n")
+
+        AIResolver(ai_call_fn=ai, cache=cache).resolve_conflict(
+            conflict_a, "def main(): pass", [snapshot_a]
+        )
+        AIResolver(ai_call_fn=ai, cache=cache).resolve_conflict(
+            conflict_b, "def main(): pass\n", [snapshot_b]
+        )
+
+        assert ai.calls == 1
+        assert cache.hits == 1
+
+    def test_different_content_or_prompt_version_misses(self):
+        resolver = AIResolver()
+        conflict, snapshot = _conflict_with_snapshot("a.py", code="x = 1")
+        other, other_snapshot = _conflict_with_snapshot("a.py", code="x = 2")
+        context = resolver.build_context(conflict, "base", [snapshot])
+        other_context = resolver.build_context(other, "base", [other_snapshot])
+
+        assert conflict_cache_key([context]) != conflict_cache_key([other_context])
+        assert conflict_cache_key([context]) != conflict_cache_key(
+            [context], prompt_version=PROMPT_VERSION + 1
+        )
+
+    def test_unparseable_response_is_not_cached(self):
+        calls = []
+
+        def no_code(system: str, user: str) -> str:
+            calls.append(user)
+            return ""
+
+        cache = ResolutionCache()
+        resolver = AIResolver(ai_call_fn=no_code, cache=cache)
+        conflict, snapshot = _conflict_with_snapshot("a.py")
+
+        for _ in range(2):
+            result = resolver.resolve_conflict(conflict, "base", [snapshot])
+            assert result.decision == MergeDecision.NEEDS_HUMAN_REVIEW
+
+        assert len(calls) == 2
+        assert len(cache) == 0
+        # Failed resolutions don't leave their per-key locks behind
+        assert cache._key_locks == {}
+
+    def test_cache_is_bounded(self):
+        cache = ResolutionCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+
+    def test_concurrent_identical_conflicts_call_ai_once(self):
+        ai = FakeAI(delay=0.05)
+        resolver = AIResolver(ai_call_fn=ai, cache=ResolutionCache(), max_concurrency=4)
+        pairs = [_conflict_with_snapshot("a.py") for _ in range(4)]
+        # Same conflict content in four different files
+        conflicts = []
+        for i, (conflict, _) in enumerate(pairs):
+            conflict.file_path = f"file{i}.py"
+            conflicts.append(conflict)
+
+        results = resolver.resolve_multiple_conflicts(
+            conflicts, {"function:main": "base"}, [pairs[0][1]], batch=False
+        )
+
+        assert ai.calls == 1
+        assert all(r.decision == MergeDecision.AI_MERGED for r in results)
+        assert resolver.cache._key_locks == {}
+
+
+class TestConcurrentResolution:
+    """Files resolve in parallel; output order and per-file order are stable."""
+
+    def _conflicts(self, files: list[str]):
+        pairs = [
+            _conflict_with_snapshot(path, location=f"function:f{i}", code=f"v = {i}")
+            for i, path in enumerate(files)
+        ]
+        conflicts = [conflict for conflict, _ in pairs]
+        snapshots = [snapshot for _, snapshot in pairs]
+        return conflicts, snapshots
+
+    def test_concurrency_is_bounded(self):
+        ai = FakeAI(delay=0.05)
+        resolver = AIResolver(ai_call_fn=ai, max_concurrency=2)
+        conflicts, snapshots = self._conflicts([f"f{i}.py" for i in range(6)])
+
+        resolver.resolve_multiple_conflicts(conflicts, {}, snapshots, batch=False)
+
+        assert ai.calls == 6
+        assert ai.max_in_flight == 2
+
+    def test_results_keep_input_order(self):
+        ai = FakeAI(delay=0.01)
+        resolver = AIResolver(ai_call_fn=ai, max_concurrency=4)
+        files = ["b.py", "a.py", "b.py", "c.py", "a.py"]
+        conflicts, snapshots = self._conflicts(files)
+
+        results = resolver.resolve_multiple_conflicts(
+            conflicts, {}, snapshots, batch=False
+        )
+
+        assert [r.file_path for r in results] == files
+        assert [r.conflicts_resolved[0].location for r in results] == [
+            c.location for c in conflicts
+        ]
+
+    def test_conflicts_in_one_file_resolve_in_order(self):
+        ai = FakeAI(delay=0.01)
+        resolver = AIResolver(ai_call_fn=ai, max_concurrency=4)
+        files = ["a.py", "b.py", "a.py", "b.py", "a.py"]
+        conflicts, snapshots = self._conflicts(files)
+
+        resolver.resolve_multiple_conflicts(conflicts, {}, snapshots, batch=False)
+
+        # One worker per file: a file's conflicts are sent in input order
+        # and never overlap with each other
+        a_locations = [loc for path, loc in ai.seen if path == "a.py"]
+        assert a_locations == ["function:f0", "function:f2", "function:f4"]
+        assert ai.max_in_flight <= 2
+
+    def test_batch_mode_returns_one_result_per_file_in_order(self):
+        ai = FakeAI()
+        resolver = AIResolver(ai_call_fn=ai, max_concurrency=4)
+        conflicts, snapshots = self._conflicts(["b.py", "a.py", "b.py"])
+
+        results = resolver.resolve_multiple_conflicts(conflicts, {}, snapshots)
+
+        assert [r.file_path for r in results] == ["b.py", "a.py"]
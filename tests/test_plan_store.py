@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Tests for the implementation plan store.
+
+Covers re-parsing only when the file changes (including same-size rewrites
+within one mtime tick), the id and status indexes, atomic write-through,
+and the progress readers that now share one parsed plan.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import core.plan_store as plan_store_module
+from core.plan_store import PlanStore, clear_plan_stores, get_plan_store
+from progress import (
+    count_subtasks,
+    count_subtasks_detailed,
+    get_current_phase,
+    get_next_subtask,
+    get_plan_summary,
+    is_build_complete,
+    print_progress_summary,
+)
+
+
+def _make_plan(phases: int, subtasks_per_phase: int) -> dict:
+    return {
+        "feature": "Benchmark",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "id": f"phase-{p}",
+                "phase": p,
+                "name": f"Phase {p}",
+                "depends_on": [f"phase-{p - 1}"] if p > 1 else [],
+                "subtasks": [
+                    {
+                        "id": f"subtask-{p}-{s}",
+                        "description": f"Implement part {s} of phase {p}",
+                        "status": "pending",
+                        "files_to_modify": [f"src/module_{p}_{s}.py"],
+                    }
+                    for s in range(1, subtasks_per_phase + 1)
+                ],
+            }
+            for p in range(1, phases + 1)
+        ],
+    }
+
+
+def _write_plan(spec_dir: Path, plan: dict) -> Path:
+    plan_file = spec_dir / "implementation_plan.json"
+    plan_file.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    return plan_file
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stores():
+    clear_plan_stores()
+    yield
+    clear_plan_stores()
+
+
+@pytest.fixture
+def plan_dir(spec_dir: Path) -> Path:
+    _write_plan(spec_dir, _make_plan(phases=2, subtasks_per_phase=2))
+    return spec_dir
+
+
+class TestCaching:
+    def test_unchanged_file_is_parsed_once(self, plan_dir: Path):
+        store = get_plan_store(plan_dir)
+
+        assert store.load() is store.load()
+        assert count_subtasks(plan_dir) == (0, 4)
+        assert get_next_subtask(plan_dir)["id"] == "subtask-1-1"
+        assert store.parses == 1
+
+    def test_external_rewrite_is_picked_up(self, plan_dir: Path):
+        store = get_plan_store(plan_dir)
+        store.load()
+
+        plan = _make_plan(phases=2, subtasks_per_phase=2)
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        _write_plan(plan_dir, plan)
+
+        assert count_subtasks(plan_dir) == (1, 4)
+        assert store.parses == 2
+
+    def test_same_size_rewrite_in_same_tick_is_detected(self, plan_dir: Path):
+        plan_file = plan_dir / "implementation_plan.json"
+        store = get_plan_store(plan_dir)
+        store.load()
+        stat = plan_file.stat()
+
+        # Same length, same mtime, same inode: only the bytes differ
+        text = plan_file.read_text(encoding="utf-8")
+        plan_file.write_text(text.replace("Phase 1", "Phase X"), encoding="utf-8")
+        os.utime(plan_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert store.load()["phases"][0]["name"] == "Phase X"
+
+    def test_settled_entry_skips_byte_check(self, plan_dir: Path, monkeypatch):
+        monkeypatch.setattr(plan_store_module, "RACY_WINDOW_NS", 0)
+        store = get_plan_store(plan_dir)
+        store.load()
+        monkeypatch.setattr(
+            store, "_raw_unchanged", lambda: pytest.fail("byte check on settled entry")
+        )
+
+        store.load()
+        assert store.parses == 1
+
+    def test_missing_and_corrupt_plans(self, spec_dir: Path):
+        assert get_plan_store(spec_dir).load() is None
+        assert count_subtasks(spec_dir) == (0, 0)
+
+        (spec_dir / "implementation_plan.json").write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            get_plan_store(spec_dir).load()
+        assert count_subtasks_detailed(spec_dir)["total"] == 0
+        assert get_next_subtask(spec_dir) is None
+        assert get_plan_summary(spec_dir)["total_subtasks"] == 0
+
+    def test_stores_are_shared_per_plan_file(self, plan_dir: Path):
+        assert get_plan_store(plan_dir) is get_plan_store(plan_dir / ".." / plan_dir.name)
+
+
+class TestIndexes:
+    def test_lookup_by_id_returns_copies(self, plan_dir: Path):
+        store = get_plan_store(plan_dir)
+
+        subtask = store.get_subtask("subtask-2-1")
+        subtask["files_to_modify"].append("mutated.py")
+
+        assert store.get_subtask("subtask-2-1")["files_to_modify"] == [
+            "src/module_2_1.py"
+        ]
+        assert store.get_phase_for_subtask("subtask-2-1")["id"] == "phase-2"
+        assert store.get_subtask("missing") is None
+
+    def test_status_index_follows_updates(self, plan_dir: Path):
+        store = get_plan_store(plan_dir)
+
+        def complete(plan):
+            plan["phases"][0]["subtasks"][0]["status"] = "completed"
+            plan["phases"][0]["subtasks"][1]["status"] = "mystery"
+            return True
+
+        store.update(complete)
+
+        assert store.status_counts() == {"completed": 1, "mystery": 1, "pending": 2}
+        assert [s["id"] for s in store.subtasks_with_status("completed")] == [
+            "subtask-1-1"
+        ]
+        assert count_subtasks_detailed(plan_dir) == {
+            "completed": 1,
+            "in_progress": 0,
+            "pending": 3,
+            "failed": 0,
+            "total": 4,
+        }
+
+
+class TestWriteThrough:
+    def test_update_writes_atomically_without_reparse(self, plan_dir: Path):
+        store = get_plan_store(plan_dir)
+        store.load()
+
+        def start(plan):
+            plan["phases"][0]["subtasks"][0]["status"] = "in_progress"
+            return True
+
+        assert store.update(start)
+
+        on_disk = json.loads((plan_dir / "implementation_plan.json").read_text())
+        assert on_disk["phases"][0]["subtasks"][0]["status"] == "in_progress"
+        assert store.get_subtask("subtask-1-1")["status"] == "in_progress"
+        assert store.parses == 1
+        assert not list(plan_dir.glob(".implementation_plan.json.tmp.*"))
+
+    def test_declined_update_does_not_write(self, plan_dir: Path):
+        plan_file = plan_dir / "implementation_plan.json"
+        before = plan_file.stat().st_mtime_ns
+
+        assert not get_plan_store(plan_dir).update(lambda plan: False)
+        assert plan_file.stat().st_mtime_ns == before
+
+    def test_failed_update_drops_half_modified_model(self, plan_dir: Path):
+        store = get_plan_store(plan_dir)
+
+        def broken(plan):
+            plan["phases"][0]["name"] = "half-done"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            store.update(broken)
+
+        assert store.load()["phases"][0]["name"] == "Phase 1"
+
+    def test_update_without_plan_raises(self, spec_dir: Path):
+        with pytest.raises(FileNotFoundError):
+            PlanStore(spec_dir / "implementation_plan.json").update(lambda p: True)
+
+    def test_readers_do_not_leak_shared_state(self, plan_dir: Path):
+        next_subtask = get_next_subtask(plan_dir)
+        next_subtask["files_to_modify"].clear()
+
+        assert get_next_subtask(plan_dir)["files_to_modify"] == ["src/module_1_1.py"]
+        assert get_current_phase(plan_dir)["id"] == "phase-1"
+
+
+def _coder_iteration(spec_dir: Path) -> None:
+    """The plan reads and writes of one coder loop iteration."""
+    store = get_plan_store(spec_dir)
+    next_subtask = get_next_subtask(spec_dir)
+    subtask_id = next_subtask["id"]
+    get_current_phase(spec_dir)
+    store.get_phase_for_subtask(subtask_id)
+
+    def set_status(status):
+        def mutate(plan):
+            store_subtask = next(
+                s
+                for phase in plan["phases"]
+                for s in phase["subtasks"]
+                if s["id"] == subtask_id
+            )
+            store_subtask["status"] = status
+            return True
+
+        return mutate
+
+    # The agent marks the subtask in progress, then completed (tool calls)
+    store.update(set_status("in_progress"))
+    store.update(set_status("completed"))
+
+    # post_session_processing
+    store.load()
+    store.get_subtask(subtask_id)
+    count_subtasks_detailed(spec_dir)
+    is_build_complete(spec_dir)
+    print_progress_summary(spec_dir)
+
+
+@pytest.mark.slow
+def test_benchmark_parses_per_coder_iteration(spec_dir: Path, monkeypatch, capsys):
+    """Plan parses per coder iteration with a 1,000-subtask plan."""
+    iterations = 10
+
+    def run() -> tuple[float, float]:
+        clear_plan_stores()
+        _write_plan(spec_dir, _make_plan(phases=10, subtasks_per_phase=100))
+        store = get_plan_store(spec_dir)
+        store.load()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            _coder_iteration(spec_dir)
+        elapsed = time.perf_counter() - start
+        return (store.parses - 1) / iterations, elapsed / iterations * 1000
+
+    cached_parses, cached_ms = run()
+
+    # Previous behaviour: every reader re-opened and parsed the file
+    with monkeypatch.context() as m:
+        m.setattr(PlanStore, "_is_racy", lambda self: True)
+        m.setattr(PlanStore, "_raw_unchanged", lambda self: False)
+        uncached_parses, uncached_ms = run()
+
+    capsys.readouterr()
+    with capsys.disabled():
+        print(
+            f"\nPlan store, 1,000 subtasks: {cached_parses:.1f} parses "
+            f"({cached_ms:.1f} ms) per coder iteration vs "
+            f"{uncached_parses:.1f} parses ({uncached_ms:.1f} ms) re-reading"
+        )
+
+    assert cached_parses == 0
+    assert uncached_parses >= 5
@@ -315,3 +315,257 @@ def test_get_worktree_info(temp_git_repo):
 
     # Cleanup
     manager.cleanup_all_worktrees()
+
+
+# =============================================================================
+# Worktree pool
+# =============================================================================
+
+
+def _commit_file(repo_dir: Path, name: str, content: str) -> str:
+    (repo_dir / name).write_text(content)
+    subprocess.run(["git", "add", name], cwd=repo_dir, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", f"Add {name}"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+    )
+    subprocess.run(
+        ["git", "push", "origin", "main"], cwd=repo_dir, check=True, capture_output=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def pool_size(monkeypatch):
+    def set_size(size: int) -> None:
+        monkeypatch.setenv("PR_WORKTREE_POOL_SIZE", str(size))
+
+    set_size(2)
+    return set_size
+
+
+def test_released_worktree_is_recycled_clean(temp_git_repo, pool_size):
+    """A released pool worktree is reused at the new commit without leftovers."""
+    repo_dir, first_sha = temp_git_repo
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+
+    wt1 = manager.acquire_worktree(first_sha, pr_number=1)
+    (wt1 / "scratch.txt").write_text("left behind by a review")
+    (wt1 / "test.txt").write_text("modified by a review")
+    manager.release_worktree(wt1)
+    assert wt1.exists()
+
+    second_sha = _commit_file(repo_dir, "feature.txt", "feature")
+    wt2 = manager.acquire_worktree(second_sha, pr_number=2)
+
+    assert wt2 == wt1
+    assert (wt2 / "feature.txt").read_text() == "feature"
+    assert (wt2 / "test.txt").read_text() == "initial content"
+    assert not (wt2 / "scratch.txt").exists()
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=wt2, capture_output=True, text=True
+    ).stdout.strip()
+    assert head == second_sha
+
+    manager.release_worktree(wt2)
+    manager.cleanup_all_worktrees()
+
+
+def test_busy_pool_falls_back_to_unpooled_worktree(temp_git_repo, pool_size):
+    """When every slot is in use, acquire creates a regular PR worktree."""
+    repo_dir, commit_sha = temp_git_repo
+    pool_size(1)
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+
+    pooled = manager.acquire_worktree(commit_sha, pr_number=10)
+    unpooled = manager.acquire_worktree(commit_sha, pr_number=11)
+
+    assert pooled.parent == manager.pool_dir
+    assert "pr-11" in unpooled.name
+
+    manager.release_worktree(unpooled)
+    assert not unpooled.exists()
+    manager.release_worktree(pooled)
+    assert pooled.exists()
+
+    manager.cleanup_all_worktrees()
+    assert not pooled.exists()
+
+
+def test_stale_slot_lock_is_taken_over(temp_git_repo, pool_size):
+    """A lock left by a dead process doesn't keep the slot busy forever."""
+    repo_dir, commit_sha = temp_git_repo
+    pool_size(1)
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    manager.pool_dir.mkdir(parents=True)
+    # PIDs are well below this on every platform we run on
+    (manager.pool_dir / "slot-0.lock").write_text("999999999")
+
+    worktree = manager.acquire_worktree(commit_sha, pr_number=5)
+
+    assert worktree == manager.pool_dir / "slot-0"
+    manager.release_worktree(worktree)
+    manager.cleanup_all_worktrees()
+
+
+def test_cleanup_policies_leave_pool_alone(temp_git_repo, pool_size, monkeypatch):
+    """Age/count cleanup doesn't treat the pool directory as a PR worktree."""
+    repo_dir, commit_sha = temp_git_repo
+    monkeypatch.setenv("PR_WORKTREE_MAX_AGE_DAYS", "0")
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+
+    assert manager.warm_pool(commit_sha) == 2
+    old_time = time.time() - (2 * 86400)
+    os.utime(manager.pool_dir, (old_time, old_time))
+
+    stats = manager.cleanup_worktrees()
+
+    assert stats["total"] == 0
+    assert (manager.pool_dir / "slot-0").exists()
+    assert (manager.pool_dir / "slot-1").exists()
+    manager.cleanup_all_worktrees()
+
+
+def test_concurrent_fetches_are_coalesced(temp_git_repo, monkeypatch):
+    """Refs requested while a fetch runs share the next single fetch."""
+    import threading
+
+    repo_dir, _ = temp_git_repo
+    coalescer = pr_worktree_module._FetchCoalescer(repo_dir)
+    calls = []
+    first_fetch_started = threading.Event()
+    release_first_fetch = threading.Event()
+
+    def fake_git_fetch(refs):
+        calls.append(list(refs))
+        if len(calls) == 1:
+            first_fetch_started.set()
+            release_first_fetch.wait(5)
+        return True
+
+    monkeypatch.setattr(coalescer, "_git_fetch", fake_git_fetch)
+
+    results = {}
+
+    def fetch(ref):
+        results[ref] = coalescer.fetch(ref)
+
+    leader = threading.Thread(target=fetch, args=("a" * 40,))
+    leader.start()
+    assert first_fetch_started.wait(5)
+
+    followers = [
+        threading.Thread(target=fetch, args=(ref * 40,)) for ref in ("b", "c", "d")
+    ]
+    for thread in followers:
+        thread.start()
+    # Let the followers queue up behind the running fetch
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        batch = coalescer._next_batch
+        if batch is not None and len(batch.refs) == 3:
+            break
+        time.sleep(0.01)
+    release_first_fetch.set()
+
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == [["a" * 40], ["b" * 40, "c" * 40, "d" * 40]]
+    assert all(results.values()) and len(results) == 4
+
+
+def test_failed_batch_fetch_retries_refs_individually(temp_git_repo, monkeypatch):
+    """One unreachable ref (fork PR) doesn't fail the other refs in its batch."""
+    repo_dir, _ = temp_git_repo
+    coalescer = pr_worktree_module._FetchCoalescer(repo_dir)
+    monkeypatch.setattr(
+        coalescer, "_git_fetch", lambda refs: "bad" not in refs
+    )
+
+    assert coalescer._run_fetch(["bad", "good"]) == {"good"}
+
+
+def test_fetch_survives_git_errors(temp_git_repo, monkeypatch):
+    """A fetch that raises doesn't leave later fetches waiting on it forever."""
+    import threading
+
+    repo_dir, _ = temp_git_repo
+    coalescer = pr_worktree_module._FetchCoalescer(repo_dir)
+
+    def missing_git(*args, **kwargs):
+        raise FileNotFoundError("git")
+
+    monkeypatch.setattr(pr_worktree_module.subprocess, "run", missing_git)
+    assert coalescer.fetch("abc") is False
+
+    # An unexpected error still fails only the caller that led the fetch
+    calls = []
+
+    def failing_run_fetch(refs):
+        calls.append(refs)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return set(refs)
+
+    monkeypatch.setattr(coalescer, "_run_fetch", failing_run_fetch)
+    with pytest.raises(RuntimeError):
+        coalescer.fetch("def")
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(coalescer.fetch("ghi")))
+    thread.start()
+    thread.join(5)
+
+    assert results == [True]
+    assert coalescer._fetching is False
+
+
+@pytest.mark.slow
+def test_benchmark_pooled_vs_unpooled_acquire(temp_git_repo, pool_size):
+    """Time to a ready worktree: warm pool vs. fresh `git worktree add`."""
+    repo_dir, _ = temp_git_repo
+    # Synthetic project large enough for checkout cost to show
+    for i in range(40):
+        package = repo_dir / f"pkg{i}"
+        package.mkdir()
+        for j in range(25):
+            (package / f"mod{j}.py").write_text(f"VALUE = {i * 100 + j}\n" * 20)
+    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True, capture_output=True)
+    head = _commit_file(repo_dir, "bench.txt", "bench")
+
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    rounds = 5
+
+    unpooled = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        path = manager.create_worktree(head, pr_number=100 + i, auto_cleanup=False)
+        unpooled.append(time.perf_counter() - start)
+        manager.remove_worktree(path)
+
+    pool_size(1)
+    manager.warm_pool(head)
+    pooled = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        path = manager.acquire_worktree(head, pr_number=200 + i)
+        pooled.append(time.perf_counter() - start)
+        manager.release_worktree(path)
+
+    unpooled_ms = sorted(unpooled)[rounds // 2] * 1000
+    pooled_ms = sorted(pooled)[rounds // 2] * 1000
+    print(
+        f"\nworktree acquire (median of {rounds}, 1000 files): "
+        f"unpooled {unpooled_ms:.1f}ms, pooled {pooled_ms:.1f}ms"
+    )
+    manager.cleanup_all_worktrees()
+    assert pooled_ms < unpooled_ms
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Tests for indexed recurring-issue detection.
+
+The index may only prune comparisons, never change results, so the main
+check is a randomized property test: on random issue sets (with many
+near-duplicates around the similarity threshold) the indexed
+has_recurring_issues() and get_recurring_issue_summary() must agree
+exactly with the previous compare-every-pair implementations below.
+"""
+
+import random
+import string
+import time
+from difflib import SequenceMatcher
+
+import pytest
+
+from qa.issue_index import IssueKeyIndex
+from qa.report import (
+    ISSUE_SIMILARITY_THRESHOLD,
+    RECURRING_ISSUE_THRESHOLD,
+    _issue_similarity,
+    _normalize_issue_key,
+    get_recurring_issue_summary,
+    has_recurring_issues,
+)
+
+# =============================================================================
+# Reference (quadratic) implementations
+# =============================================================================
+
+
+def reference_has_recurring_issues(current_issues, history, threshold=3):
+    historical_issues = []
+    for record in history:
+        historical_issues.extend(record.get("issues", []))
+    if not historical_issues:
+        return False, []
+    recurring = []
+    for current in current_issues:
+        occurrence_count = 1
+        for historical in historical_issues:
+            if _issue_similarity(current, historical) >= ISSUE_SIMILARITY_THRESHOLD:
+                occurrence_count += 1
+        if occurrence_count >= threshold:
+            recurring.append({**current, "occurrence_count": occurrence_count})
+    return len(recurring) > 0, recurring
+
+
+def reference_groups(history):
+    issue_groups = {}
+    for record in history:
+        for issue in record.get("issues", []):
+            key = _normalize_issue_key(issue)
+            for existing_key in issue_groups:
+                if (
+                    SequenceMatcher(None, key, existing_key).ratio()
+                    >= ISSUE_SIMILARITY_THRESHOLD
+                ):
+                    issue_groups[existing_key].append(issue)
+                    break
+            else:
+                issue_groups[key] = [issue]
+    return issue_groups
+
+
+# =============================================================================
+# Random issue generation
+# =============================================================================
+
+WORDS = [
+    "missing",
+    "null",
+    "check",
+    "in",
+    "handler",
+    "unused",
+    "import",
+    "test",
+    "fails",
+    "type",
+    "error",
+    "timeout",
+    "auth",
+    "token",
+    "validation",
+]
+FILES = ["src/api.py", "src/auth.py", "web/app.tsx", "", "lib/very/long/path/x.py"]
+
+
+def _mutate(text: str, rng: random.Random) -> str:
+    chars = list(text)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.random()
+        pos = rng.randint(0, len(chars))
+        if op < 0.4 and chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice(string.ascii_lowercase)
+        elif op < 0.7:
+            chars.insert(pos, rng.choice(string.ascii_lowercase + " "))
+        elif chars:
+            del chars[min(pos, len(chars) - 1)]
+    return "".join(chars)
+
+
+def _random_issue(rng: random.Random, bases: list[dict]) -> dict:
+    if bases and rng.random() < 0.7:
+        base = rng.choice(bases)
+        issue = dict(base)
+        issue["title"] = _mutate(base["title"], rng)
+        if rng.random() < 0.2:
+            issue["line"] = rng.randint(1, 30)
+        return issue
+    words = rng.choices(WORDS, k=rng.randint(1, 40 if rng.random() < 0.1 else 6))
+    issue = {
+        "title": rng.choice(["", "Error: ", "Bug: "]) + " ".join(words),
+        "file": rng.choice(FILES),
+        "line": rng.choice([None, rng.randint(1, 30)]),
+    }
+    bases.append(issue)
+    return issue
+
+
+def _random_history(rng: random.Random) -> tuple[list[dict], list[dict]]:
+    bases: list[dict] = []
+    history = [
+        {
+            "iteration": i,
+            "status": "rejected",
+            "issues": [_random_issue(rng, bases) for _ in range(rng.randint(0, 8))],
+        }
+        for i in range(rng.randint(0, 8))
+    ]
+    current = [_random_issue(rng, bases) for _ in range(rng.randint(0, 8))]
+    return history, current
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_reference_on_random_issue_sets(seed):
+    rng = random.Random(seed)
+    history, current = _random_history(rng)
+
+    for threshold in (2, RECURRING_ISSUE_THRESHOLD):
+        assert has_recurring_issues(
+            current, history, threshold
+        ) == reference_has_recurring_issues(current, history, threshold)
+
+    groups = reference_groups(history)
+    summary = get_recurring_issue_summary(history)
+    assert summary["unique_issues"] == len(groups)
+    expected_common = sorted(groups.items(), key=lambda x: len(x[1]), reverse=True)
+    assert [c["occurrences"] for c in summary.get("most_common", [])] == [
+        len(issues) for _, issues in expected_common[:5]
+    ]
+    assert [c["title"] for c in summary.get("most_common", [])] == [
+        issues[0].get("title", key) for key, issues in expected_common[:5]
+    ]
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.7, 0.8, 0.95, 1.0])
+def test_index_finds_every_match_at_any_threshold(threshold):
+    rng = random.Random(7)
+    bases: list[dict] = []
+    keys = [_normalize_issue_key(_random_issue(rng, bases)) for _ in range(120)]
+    index = IssueKeyIndex(threshold)
+    for key in keys[:80]:
+        index.add(key)
+
+    for key in keys[80:]:
+        expected = [
+            key_id
+            for key_id, other in enumerate(index.keys)
+            if SequenceMatcher(None, key, other).ratio() >= threshold
+        ]
+        assert list(index.matches(key)) == expected
+
+
+def test_index_prunes_dissimilar_keys():
+    index = IssueKeyIndex(ISSUE_SIMILARITY_THRESHOLD)
+    for i in range(50):
+        index.add(f"unrelated problem number {i} in module {i}|src/m{i}.py|{i}")
+    index.add("missing null check in handler|src/api.py|")
+
+    assert index.candidates("missing null check in handlr|src/api.py|") == [50]
+
+
+@pytest.mark.slow
+def test_benchmark_recurring_issue_detection():
+    """has_recurring_issues: indexed vs compare-every-pair on a long QA loop."""
+    rng = random.Random(0)
+    bases: list[dict] = []
+    history = [
+        {"issues": [_random_issue(rng, bases) for _ in range(25)]} for _ in range(20)
+    ]
+    current = [_random_issue(rng, bases) for _ in range(25)]
+
+    start = time.perf_counter()
+    expected = reference_has_recurring_issues(current, history)
+    reference_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = has_recurring_issues(current, history)
+    indexed_s = time.perf_counter() - start
+
+    print(
+        f"\nRecurring issues (500 historical x 25 current): indexed "
+        f"{indexed_s * 1000:.0f} ms, pairwise {reference_s * 1000:.0f} ms"
+    )
+    assert result == expected
+    assert indexed_s < reference_s
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel subtask scheduler.
+
+The agent session is stubbed with one that sleeps for a fixed time, so the
+tests check the dependency graph built from the plan, the order subtasks
+start in, the concurrency cap and the wall-clock speedup over running one
+subtask at a time. Per-subtask worktrees are checked against a real git
+repository.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+import agents.scheduler as scheduler
+from agents.scheduler import DagScheduler, SubtaskGraph, SubtaskWorktreeManager
+from core.git_executable import run_git
+from core.plan_store import PLAN_FILENAME, clear_plan_stores
+
+
+def _phase(phase_id, subtasks, depends_on=(), parallel_safe=True, statuses=None):
+    statuses = statuses or {}
+    return {
+        "id": phase_id,
+        "name": phase_id.title(),
+        "depends_on": list(depends_on),
+        "parallel_safe": parallel_safe,
+        "subtasks": [
+            {"id": s, "description": f"Do {s}", "status": statuses.get(s, "pending")}
+            for s in subtasks
+        ],
+    }
+
+
+def _diamond_plan() -> dict:
+    """backend -> (worker, frontend) -> integration, with a long worker chain."""
+    return {
+        "phases": [
+            _phase("backend", ["b1", "b2"]),
+            _phase("worker", ["w1", "w2", "w3"], ["backend"], parallel_safe=False),
+            _phase("frontend", ["f1", "f2"], ["backend"]),
+            _phase("integration", ["i1"], ["worker", "frontend"]),
+        ]
+    }
+
+
+class SleepingSession:
+    """Stub agent session: sleeps, records concurrency, fails on request."""
+
+    def __init__(self, seconds: float = 0.05, fail: set[str] = frozenset()):
+        self.seconds = seconds
+        self.fail = fail
+        self.running: set[str] = set()
+        self.max_running = 0
+        self.finished: list[str] = []
+
+    async def __call__(self, node) -> bool:
+        self.running.add(node.id)
+        self.max_running = max(self.max_running, len(self.running))
+        await asyncio.sleep(self.seconds)
+        self.running.discard(node.id)
+        self.finished.append(node.id)
+        return node.id not in self.fail
+
+
+def _run(graph, session, max_parallel):
+    return asyncio.run(DagScheduler(graph, session, max_parallel).run())
+
+
+class TestGraph:
+    def test_phase_dependencies_and_sequential_phases(self):
+        graph = SubtaskGraph.from_plan(_diamond_plan())
+
+        assert graph.nodes["b1"].depends_on == set()
+        assert graph.nodes["w1"].depends_on == {"b1", "b2"}
+        assert graph.nodes["w2"].depends_on == {"b1", "b2", "w1"}
+        assert graph.nodes["f2"].depends_on == {"b1", "b2"}
+        assert graph.nodes["i1"].depends_on == {"w1", "w2", "w3", "f1", "f2"}
+
+    def test_critical_path(self):
+        graph = SubtaskGraph.from_plan(_diamond_plan())
+
+        assert graph.critical_path() == ["b1", "w1", "w2", "w3", "i1"]
+
+    def test_completed_subtasks_satisfy_dependencies(self):
+        plan = _diamond_plan()
+        plan["phases"][0] = _phase(
+            "backend", ["b1", "b2"], statuses={"b1": "completed", "b2": "completed"}
+        )
+
+        graph = SubtaskGraph.from_plan(plan)
+
+        assert "b1" not in graph.nodes
+        assert graph.nodes["w1"].depends_on == set()
+
+    def test_unsatisfiable_phases_are_blocked(self):
+        plan = {
+            "phases": [
+                _phase("a", ["a1"], statuses={"a1": "failed"}),
+                _phase("b", ["b1"], ["a"]),
+                _phase("c", ["c1"], ["b"]),
+                _phase("d", ["d1"], ["missing"]),
+                _phase("e", ["e1"], ["f"]),
+                _phase("f", ["f1"], ["e"]),
+            ]
+        }
+
+        graph = SubtaskGraph.from_plan(plan)
+
+        assert list(graph.nodes) == []
+        assert graph.blocked == ["b1", "c1", "d1", "e1", "f1"]
+
+    def test_phase_order_in_file_does_not_matter(self):
+        plan = _diamond_plan()
+        plan["phases"].reverse()
+
+        graph = SubtaskGraph.from_plan(plan)
+
+        assert graph.critical_path() == ["b1", "w1", "w2", "w3", "i1"]
+
+
+class TestScheduling:
+    def test_dependencies_finish_before_dependents_start(self):
+        graph = SubtaskGraph.from_plan(_diamond_plan())
+        session = SleepingSession()
+
+        report = _run(graph, session, max_parallel=4)
+
+        assert sorted(report.completed) == sorted(graph.nodes)
+        for node in graph.nodes.values():
+            for dep in node.depends_on:
+                assert session.finished.index(dep) < session.finished.index(node.id)
+                assert report.started.index(dep) < report.started.index(node.id)
+
+    def test_longest_chain_starts_first(self):
+        graph = SubtaskGraph.from_plan(_diamond_plan())
+
+        report = _run(graph, SleepingSession(), max_parallel=2)
+
+        # After the backend, the worker chain (3 long) beats the frontend
+        assert report.started[:3] == ["b1", "b2", "w1"]
+        assert report.critical_path == ["b1", "w1", "w2", "w3", "i1"]
+
+    @pytest.mark.parametrize("max_parallel", [1, 2, 3])
+    def test_concurrency_cap(self, max_parallel):
+        plan = {"phases": [_phase("wide", [f"s{i}" for i in range(8)])]}
+        session = SleepingSession()
+
+        report = _run(SubtaskGraph.from_plan(plan), session, max_parallel)
+
+        assert session.max_running == max_parallel
+        assert report.max_running == max_parallel
+
+    def test_failure_skips_only_dependents(self):
+        graph = SubtaskGraph.from_plan(_diamond_plan())
+        session = SleepingSession(fail={"w2"})
+
+        report = _run(graph, session, max_parallel=4)
+
+        assert report.failed == ["w2"]
+        assert report.skipped == ["w3", "i1"]
+        assert sorted(report.completed) == ["b1", "b2", "f1", "f2", "w1"]
+
+    def test_exception_counts_as_failure(self):
+        plan = {"phases": [_phase("a", ["a1", "a2"])]}
+
+        async def session(node):
+            if node.id == "a1":
+                raise RuntimeError("session crashed")
+            return True
+
+        report = _run(SubtaskGraph.from_plan(plan), session, max_parallel=2)
+
+        assert report.failed == ["a1"]
+        assert report.completed == ["a2"]
+
+    def test_invalid_max_parallel(self):
+        with pytest.raises(ValueError):
+            DagScheduler(SubtaskGraph(), SleepingSession(), max_parallel=0)
+
+    def test_wall_clock_speedup(self):
+        graph = SubtaskGraph.from_plan(_diamond_plan())
+        seconds = 0.1
+
+        sequential = _run(graph, SleepingSession(seconds), max_parallel=1)
+        parallel = _run(graph, SleepingSession(seconds), max_parallel=4)
+
+        # 8 subtasks one at a time vs. the 5-long critical path, with the
+        # frontend running alongside the worker chain
+        assert sequential.elapsed_seconds >= 8 * seconds
+        assert parallel.elapsed_seconds < 6 * seconds
+        print(
+            f"\nScheduler (8 subtasks, {seconds}s each): "
+            f"{sequential.elapsed_seconds:.2f}s sequential, "
+            f"{parallel.elapsed_seconds:.2f}s with 4 workers "
+            f"(critical path {len(parallel.critical_path)})"
+        )
+
+
+class TestSubtaskWorktrees:
+    def test_subtask_branches_fork_from_build_branch_and_merge_back(
+        self, temp_git_repo: Path
+    ):
+        run_git(["checkout", "-b", "auto-claude/001-feature"], cwd=temp_git_repo)
+        worktrees = SubtaskWorktreeManager(temp_git_repo, "001-feature")
+        assert worktrees.base_branch == "auto-claude/001-feature"
+
+        name = worktrees.name_for("subtask 1/1")
+        assert name == "001-feature--subtask-1-1"
+        info = worktrees.create_worktree(name)
+        (info.path / "feature.txt").write_text("done\n")
+        assert worktrees.commit_in_worktree(name, "Add feature")
+
+        assert worktrees.merge_worktree(name, delete_after=True)
+        assert (temp_git_repo / "feature.txt").read_text() == "done\n"
+        assert not info.path.exists()
+        branches = run_git(["branch", "--list", info.branch], cwd=temp_git_repo)
+        assert branches.stdout.strip() == ""
+
+    def test_leftover_worktree_is_recreated_from_current_tip(self, temp_git_repo: Path):
+        worktrees = SubtaskWorktreeManager(temp_git_repo, "001-feature")
+        name = worktrees.name_for("subtask-1")
+        worktrees.create_worktree(name)
+
+        (temp_git_repo / "later.txt").write_text("later\n")
+        run_git(["add", "."], cwd=temp_git_repo)
+        run_git(["commit", "-m", "Later"], cwd=temp_git_repo)
+
+        info = worktrees.create_worktree(name)
+        assert (info.path / "later.txt").exists()
+
+
+class TestParallelSessions:
+    """run_parallel_subtasks numbers its sessions and honours the limit."""
+
+    def _run(self, repo: Path, monkeypatch, **kwargs) -> tuple[int, list]:
+        spec_dir = repo / ".auto-claude" / "specs" / "001-feature"
+        spec_dir.mkdir(parents=True)
+        plan = {"phases": [_phase("build", ["s1", "s2", "s3", "s4"])]}
+        (spec_dir / PLAN_FILENAME).write_text(json.dumps(plan))
+        clear_plan_stores()
+
+        started = []
+
+        async def fake_session(node, worktree_path, *, session_num, **_):
+            started.append((node.id, session_num))
+            return False
+
+        monkeypatch.setattr(scheduler, "_run_subtask_session", fake_session)
+        sessions_run = asyncio.run(
+            scheduler.run_parallel_subtasks(
+                repo, spec_dir, "sonnet", recovery_manager=None, **kwargs
+            )
+        )
+        clear_plan_stores()
+        return sessions_run, started
+
+    def test_sessions_continue_from_first_session(
+        self, temp_git_repo: Path, monkeypatch
+    ):
+        sessions_run, started = self._run(
+            temp_git_repo, monkeypatch, max_parallel=2, first_session=3
+        )
+
+        assert sessions_run == 4
+        assert sorted(num for _, num in started) == [3, 4, 5, 6]
+
+    def test_stops_starting_sessions_at_limit(self, temp_git_repo: Path, monkeypatch):
+        sessions_run, started = self._run(
+            temp_git_repo, monkeypatch, max_parallel=2, first_session=5, max_sessions=2
+        )
+
+        assert sessions_run == 2
+        assert sorted(num for _, num in started) == [5, 6]
@@ -114,3 +114,113 @@ def test_cache_invalidation_on_file_deletion(mock_project_dir, mock_profile_path
     # 4. Call again - should handle deletion gracefully and fallback to fresh analysis
     profile2 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" not in profile2.get_all_allowed_commands()
+
+
+def test_cache_keeps_profiles_for_multiple_projects(tmp_path, monkeypatch):
+    import security.profile as profile_module
+
+    reset_profile_cache()
+    calls = []
+    original = profile_module.get_or_create_profile
+
+    def counting(project_dir, spec_dir=None):
+        calls.append(project_dir)
+        return original(project_dir, spec_dir)
+
+    monkeypatch.setattr(profile_module, "get_or_create_profile", counting)
+
+    projects = [tmp_path / name for name in ("a", "b", "c")]
+    for project in projects:
+        project.mkdir()
+
+    first = [get_security_profile(project) for project in projects]
+    second = [get_security_profile(project) for project in projects]
+
+    # Alternating between projects must not re-analyze either of them
+    assert len(calls) == 3
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_cache_is_bounded(tmp_path, monkeypatch):
+    import security.profile as profile_module
+
+    reset_profile_cache()
+    monkeypatch.setattr(profile_module, "MAX_CACHED_PROFILES", 2)
+
+    projects = [tmp_path / name for name in ("a", "b", "c")]
+    for project in projects:
+        project.mkdir()
+        get_security_profile(project)
+
+    cached_dirs = {key[0] for key in profile_module._profile_cache}
+    assert cached_dirs == {projects[1].resolve(), projects[2].resolve()}
+
+
+def test_spec_dir_profile_change_invalidates_cache(mock_project_dir, tmp_path):
+    reset_profile_cache()
+    spec_dir = tmp_path / "spec"
+    spec_dir.mkdir()
+    current_hash = get_dir_hash(mock_project_dir)
+    spec_profile = spec_dir / ".auto-claude-security.json"
+    spec_profile.write_text(create_valid_profile_json(["unique_cmd_A"], current_hash))
+
+    profile1 = get_security_profile(mock_project_dir, spec_dir)
+    assert "unique_cmd_A" in profile1.get_all_allowed_commands()
+
+    spec_profile.write_text(create_valid_profile_json(["unique_cmd_Bee"], current_hash))
+
+    profile2 = get_security_profile(mock_project_dir, spec_dir)
+    assert "unique_cmd_Bee" in profile2.get_all_allowed_commands()
+
+
+def test_worktrees_share_inherited_profile(tmp_path):
+    reset_profile_cache()
+    parent = tmp_path / "parent"
+    parent.mkdir()
+    (parent / ".auto-claude-security.json").write_text(
+        create_valid_profile_json(["unique_cmd_A"])
+    )
+    worktrees = [parent / ".worktrees" / name for name in ("wt1", "wt2")]
+    for worktree in worktrees:
+        worktree.mkdir(parents=True)
+        data = json.loads(create_valid_profile_json(["unique_cmd_A"]))
+        data["inherited_from"] = str(parent.resolve())
+        (worktree / ".auto-claude-security.json").write_text(json.dumps(data))
+
+    profiles = [get_security_profile(worktree) for worktree in worktrees]
+
+    assert profiles[0] is profiles[1]
+    assert "unique_cmd_A" in profiles[0].get_all_allowed_commands()
+
+
+def test_concurrent_first_lookup_analyzes_once(mock_project_dir, monkeypatch):
+    import threading
+
+    import security.profile as profile_module
+
+    reset_profile_cache()
+    calls = []
+    original = profile_module.get_or_create_profile
+
+    def slow_counting(project_dir, spec_dir=None):
+        calls.append(project_dir)
+        time.sleep(0.05)
+        return original(project_dir, spec_dir)
+
+    monkeypatch.setattr(profile_module, "get_or_create_profile", slow_counting)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(get_security_profile(mock_project_dir))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
@@ -7,10 +7,16 @@ Tests cover:
 - Monorepo service discovery
 - Service configuration
 - Orchestration results
+- Dependency-ordered startup and concurrent health checks
+- Environment leases
 """
 
 import json
+import random
+import shlex
+import socket
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -20,6 +26,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
 
 from services.orchestrator import (
+    EnvironmentLease,
     ServiceConfig,
     OrchestrationResult,
     ServiceOrchestrator,
@@ -188,6 +195,37 @@ services:
 
         assert orchestrator.is_multi_service() is True
 
+    def test_parse_depends_on_and_build_context(self, temp_dir):
+        """Test parsing depends_on in list and mapping form."""
+        pytest.importorskip("yaml")
+        compose = temp_dir / "docker-compose.yml"
+        compose.write_text("""
+services:
+  db:
+    image: postgres
+  cache:
+    image: redis
+  api:
+    build: ./api
+    depends_on: [db]
+  web:
+    build:
+      context: ./web
+    depends_on:
+      api:
+        condition: service_healthy
+      cache:
+        condition: service_started
+""")
+
+        services = {s.name: s for s in ServiceOrchestrator(temp_dir).get_services()}
+
+        assert services["api"].depends_on == ["db"]
+        assert services["api"].path == "./api"
+        assert services["web"].depends_on == ["api", "cache"]
+        assert services["web"].path == "./web"
+        assert services["db"].depends_on == []
+
 
 # =============================================================================
 # MONOREPO DETECTION
@@ -477,3 +515,253 @@ class TestEdgeCases:
         assert api is not None
         assert api.path == "services/api"
         assert api.type == "local"
+
+
+# =============================================================================
+# STARTUP AND HEALTH CHECKS
+# =============================================================================
+
+# Stand-in service: an HTTP server whose /health answers 503 until a delay has
+# passed. It records its start time so tests can check the start order.
+STAND_IN_SERVER = """
+import http.server, pathlib, sys, time
+
+port, delay, marker = int(sys.argv[1]), float(sys.argv[2]), sys.argv[3]
+started = time.time()
+pathlib.Path(marker).write_text(repr(started))
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200 if time.time() - started >= delay else 503)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+http.server.HTTPServer(("localhost", port), Handler).serve_forever()
+"""
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def _stand_in(temp_dir, name, delay, depends_on=None):
+    """Configure a stand-in HTTP service that becomes healthy after delay."""
+    script = temp_dir / "stand_in_server.py"
+    if not script.exists():
+        script.write_text(STAND_IN_SERVER)
+    service_dir = temp_dir / name
+    service_dir.mkdir(exist_ok=True)
+    port = _free_port()
+    return ServiceConfig(
+        name=name,
+        path=name,
+        port=port,
+        type="local",
+        health_check_url=f"http://localhost:{port}/health",
+        startup_command=(
+            f"{shlex.quote(sys.executable)} {shlex.quote(str(script))} "
+            f"{port} {delay} {shlex.quote(str(service_dir / 'started'))}"
+        ),
+        startup_timeout=30,
+        depends_on=depends_on or [],
+    )
+
+
+def _started_at(temp_dir, name):
+    return float((temp_dir / name / "started").read_text())
+
+
+class TestStartOrder:
+    """Tests for dependency-ordered startup."""
+
+    def test_start_order_waves(self, temp_dir):
+        """Test services are grouped into waves after their dependencies."""
+        orchestrator = ServiceOrchestrator(
+            temp_dir,
+            services=[
+                ServiceConfig(name="web", depends_on=["api", "cache"]),
+                ServiceConfig(name="api", depends_on=["db", "external"]),
+                ServiceConfig(name="db"),
+                ServiceConfig(name="cache"),
+            ],
+        )
+
+        waves = [[s.name for s in wave] for wave in orchestrator.start_order()]
+
+        assert waves == [["db", "cache"], ["api"], ["web"]]
+
+    def test_start_order_cycle(self, temp_dir):
+        """Test a dependency cycle is reported."""
+        orchestrator = ServiceOrchestrator(
+            temp_dir,
+            services=[
+                ServiceConfig(name="a", depends_on=["b"]),
+                ServiceConfig(name="b", depends_on=["a"]),
+                ServiceConfig(name="c"),
+            ],
+        )
+
+        with pytest.raises(ValueError, match="a, b"):
+            orchestrator.start_order()
+        result = orchestrator.start_services(timeout=5)
+        assert result.success is False
+        assert "cycle" in result.errors[0]
+
+
+class TestHealthChecks:
+    """Tests for starting stand-in services and waiting on their health."""
+
+    def test_health_checks_run_concurrently(self, temp_dir):
+        """Test independent services are waited on at the same time."""
+        rng = random.Random(7)
+        delays = [rng.uniform(1.0, 1.5) for _ in range(4)]
+        services = [
+            _stand_in(temp_dir, f"svc{i}", delay) for i, delay in enumerate(delays)
+        ]
+        orchestrator = ServiceOrchestrator(temp_dir, services=services)
+
+        start = time.monotonic()
+        try:
+            result = orchestrator.start_services(timeout=30)
+            elapsed = time.monotonic() - start
+
+            assert result.success is True, result.errors
+            assert sorted(result.services_started) == [s.name for s in services]
+            assert all(orchestrator.check_health().values())
+        finally:
+            orchestrator.stop_services()
+
+        # Waiting one service at a time would take the sum of the delays
+        assert elapsed < sum(delays) - 1.0
+
+    def test_dependencies_start_after_healthy(self, temp_dir):
+        """Test a service starts only once its dependency is healthy."""
+        rng = random.Random(11)
+        db_delay = rng.uniform(0.5, 1.0)
+        services = [
+            _stand_in(temp_dir, "api", rng.uniform(0.1, 0.3), depends_on=["db"]),
+            _stand_in(temp_dir, "db", db_delay),
+        ]
+        orchestrator = ServiceOrchestrator(temp_dir, services=services)
+
+        try:
+            result = orchestrator.start_services(timeout=30)
+        finally:
+            orchestrator.stop_services()
+
+        assert result.success is True, result.errors
+        assert result.services_started == ["db", "api"]
+        assert _started_at(temp_dir, "api") >= _started_at(temp_dir, "db") + db_delay
+
+    def test_exited_service_fails_fast(self, temp_dir):
+        """Test a service whose process exits fails without waiting it out."""
+        services = [
+            ServiceConfig(
+                name="broken",
+                port=_free_port(),
+                type="local",
+                startup_command=f"{shlex.quote(sys.executable)} -c 'raise SystemExit(1)'",
+            ),
+            _stand_in(temp_dir, "web", 0.0, depends_on=["broken"]),
+        ]
+        orchestrator = ServiceOrchestrator(temp_dir, services=services)
+
+        start = time.monotonic()
+        try:
+            result = orchestrator.start_services(timeout=60)
+        finally:
+            orchestrator.stop_services()
+
+        assert time.monotonic() - start < 10
+        assert result.success is False
+        assert result.services_failed == ["broken", "web"]
+        assert not (temp_dir / "web" / "started").exists()
+
+
+# =============================================================================
+# ENVIRONMENT LEASE
+# =============================================================================
+
+
+class TestEnvironmentLease:
+    """Tests for reusing running services across acquisitions."""
+
+    def test_lease_reuses_healthy_services(self, temp_dir):
+        """Test repeated acquisitions keep the same processes running."""
+        rng = random.Random(3)
+        services = [
+            _stand_in(temp_dir, "api", rng.uniform(0.1, 0.4), depends_on=["db"]),
+            _stand_in(temp_dir, "db", rng.uniform(0.1, 0.4)),
+        ]
+
+        with EnvironmentLease(temp_dir, timeout=30, services=services) as lease:
+            first = lease.acquire()
+            processes = dict(lease.orchestrator._processes)
+            second = lease.acquire()
+            third = lease.acquire()
+
+            assert first.success is True and first.reused is False
+            assert second.reused is True and third.reused is True
+            assert second.services_started == ["db", "api"]
+            assert lease.starts == 1
+            assert lease.orchestrator._processes == processes
+
+        # Released on exit
+        assert all(proc.poll() is not None for proc in processes.values())
+
+    def test_lease_restarts_when_inputs_change(self, temp_dir):
+        """Test changing an input file restarts the environment."""
+        services = [_stand_in(temp_dir, "api", 0.1)]
+
+        with EnvironmentLease(temp_dir, timeout=30, services=services) as lease:
+            lease.acquire()
+            old = lease.orchestrator._processes["api"]
+
+            (temp_dir / "api" / "requirements.txt").write_text("requests\n")
+            result = lease.acquire()
+
+            assert result.success is True and result.reused is False
+            assert lease.starts == 2
+            assert old.poll() is not None
+            assert lease.orchestrator._processes["api"] is not old
+
+    def test_lease_restarts_unhealthy_services(self, temp_dir):
+        """Test a service that died is started again."""
+        services = [_stand_in(temp_dir, "api", 0.1)]
+
+        with EnvironmentLease(temp_dir, timeout=30, services=services) as lease:
+            lease.acquire()
+            lease.orchestrator._processes["api"].kill()
+            lease.orchestrator._processes["api"].wait()
+
+            result = lease.acquire()
+
+            assert result.success is True and result.reused is False
+            assert lease.starts == 2
+
+    def test_fingerprint_follows_compose_file(self, temp_dir):
+        """Test the fingerprint covers the compose file and its inputs."""
+        pytest.importorskip("yaml")
+        compose = temp_dir / "docker-compose.yml"
+        compose.write_text("services:\n  api:\n    build: ./api\n")
+        (temp_dir / "api").mkdir()
+        (temp_dir / "api" / "Dockerfile").write_text("FROM python:3.12\n")
+
+        def fingerprint():
+            return ServiceOrchestrator(temp_dir).environment_fingerprint()
+
+        initial = fingerprint()
+        assert fingerprint() == initial
+
+        compose.write_text("services:\n  api:\n    build: ./api\n  db: {}\n")
+        changed = fingerprint()
+        assert changed != initial
+
+        (temp_dir / "api" / "Dockerfile").write_text("FROM python:3.13\n")
+        assert fingerprint() != changed
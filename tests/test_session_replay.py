@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Tests for SDK session recording and replay (core/session_replay.py).
+
+A fake SDK client streams dataclass messages shaped like the SDK's; its
+sessions are recorded, replayed, and finally driven through
+create_client() and run_agent_session() without credentials or network.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from core import session_replay
+from core.session_replay import (
+    RECORD_DIR_ENV_VAR,
+    REPLAY_DIR_ENV_VAR,
+    REPLAY_SPEED_ENV_VAR,
+    ReplayClient,
+    ReplayError,
+    ReplaySource,
+    SessionRecording,
+    decode_message,
+    encode_message,
+    maybe_record,
+    reset_replay_sources,
+)
+
+
+@dataclass
+class TextBlock:
+    text: str
+
+
+@dataclass
+class ToolUseBlock:
+    id: str
+    name: str
+    input: dict[str, Any]
+
+
+@dataclass
+class ToolResultBlock:
+    tool_use_id: str
+    content: Any = None
+    is_error: bool | None = None
+
+
+@dataclass
+class AssistantMessage:
+    content: list
+    model: str = "claude-test"
+
+
+@dataclass
+class UserMessage:
+    content: list
+
+
+@dataclass
+class ResultMessage:
+    subtype: str
+    num_turns: int
+    usage: dict = field(default_factory=dict)
+
+
+SESSION = [
+    AssistantMessage([TextBlock("Listing files. ")]),
+    AssistantMessage([ToolUseBlock("tool-1", "Bash", {"command": "ls -la"})]),
+    UserMessage([ToolResultBlock("tool-1", "README.md\n", False)]),
+    AssistantMessage([TextBlock("Done.")]),
+    ResultMessage("success", 3, {"input_tokens": 10, "output_tokens": 4}),
+]
+
+
+class FakeSDKClient:
+    """Streams SESSION for every query, `gap` seconds between messages."""
+
+    def __init__(self, gap: float = 0.0):
+        self.gap = gap
+        self.prompts = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def query(self, prompt):
+        self.prompts.append(prompt)
+
+    async def receive_response(self):
+        for message in SESSION:
+            await asyncio.sleep(self.gap)
+            yield message
+
+
+@pytest.fixture(autouse=True)
+def _isolated_env(monkeypatch):
+    for name in (RECORD_DIR_ENV_VAR, REPLAY_DIR_ENV_VAR, REPLAY_SPEED_ENV_VAR):
+        monkeypatch.delenv(name, raising=False)
+    reset_replay_sources()
+    yield
+    reset_replay_sources()
+
+
+def _record(directory: Path, agent_type: str, prompts: list[str], gap: float = 0.0):
+    """Record one session of the fake client; returns the recording's path."""
+
+    async def session():
+        client = maybe_record(FakeSDKClient(gap), agent_type, "claude-test")
+        async with client:
+            for prompt in prompts:
+                await client.query(prompt)
+                async for _ in client.receive_response():
+                    pass
+        return client.recorder.path
+
+    return asyncio.run(session())
+
+
+async def _collect(client, prompt="go"):
+    await client.query(prompt)
+    return [message async for message in client.receive_response()]
+
+
+def test_encode_decode_round_trip():
+    encoded = json.loads(json.dumps(encode_message(SESSION)))
+    decoded = decode_message(encoded)
+
+    assert [type(m).__name__ for m in decoded] == [type(m).__name__ for m in SESSION]
+    assert decoded[1].content[0].input == {"command": "ls -la"}
+    assert decoded[2].content[0].is_error is False
+    assert decoded[4].usage["output_tokens"] == 4
+    # Stand-ins encode back to the same data
+    assert encode_message(decoded) == encoded
+
+
+def test_record_then_replay(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(RECORD_DIR_ENV_VAR, str(tmp_path))
+    path = _record(tmp_path, "coder", ["first", "second"])
+
+    recording = SessionRecording.load(path)
+    assert (recording.agent_type, recording.model) == ("coder", "claude-test")
+    assert [turn.prompt for turn in recording.turns] == ["first", "second"]
+
+    client = ReplayClient(recording)
+
+    async def replay():
+        return [await _collect(client), await _collect(client)]
+
+    first, second = asyncio.run(replay())
+    assert encode_message(first) == encode_message(SESSION)
+    assert encode_message(second) == encode_message(SESSION)
+    assert client.stats["messages"] == 2 * len(SESSION)
+    with pytest.raises(ReplayError):
+        asyncio.run(client.query("third"))
+
+
+def test_recording_is_off_by_default():
+    client = FakeSDKClient()
+
+    assert maybe_record(client, "coder") is client
+
+
+@pytest.mark.parametrize("speed", [1.0, 4.0, 0.0])
+def test_replay_timing(tmp_path: Path, monkeypatch, speed: float):
+    monkeypatch.setenv(RECORD_DIR_ENV_VAR, str(tmp_path))
+    recording = SessionRecording.load(_record(tmp_path, "coder", ["go"], gap=0.02))
+    gaps = []
+
+    async def fake_sleep(seconds):
+        gaps.append(seconds)
+
+    monkeypatch.setattr(session_replay.asyncio, "sleep", fake_sleep)
+    asyncio.run(_collect(ReplayClient(recording, speed=speed)))
+
+    if speed == 0:
+        assert gaps == []
+    else:
+        assert len(gaps) == len(SESSION)
+        assert sum(gaps) == pytest.approx(0.02 * len(SESSION) / speed, rel=0.5)
+
+
+def test_replay_runs_pre_tool_use_hooks(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(RECORD_DIR_ENV_VAR, str(tmp_path))
+    recording = SessionRecording.load(_record(tmp_path, "coder", ["go"]))
+    calls = []
+
+    async def block_everything(input_data, tool_use_id, context):
+        calls.append((input_data["tool_name"], input_data["tool_input"], tool_use_id))
+        return {"decision": "block", "reason": "test"}
+
+    hooks = {
+        "PreToolUse": [
+            SimpleNamespace(matcher="Bash", hooks=[block_everything]),
+            SimpleNamespace(matcher="Edit|Write", hooks=[block_everything]),
+        ]
+    }
+    client = ReplayClient(recording, hooks=hooks, cwd=str(tmp_path))
+    asyncio.run(_collect(client))
+
+    assert calls == [("Bash", {"command": "ls -la"}, "tool-1")]
+    assert client.stats["hook_blocks"] == 1
+
+
+def test_replay_source_hands_out_recordings_per_agent_type(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(RECORD_DIR_ENV_VAR, str(tmp_path))
+    planner = _record(tmp_path, "planner", ["plan"])
+    coder_1 = _record(tmp_path, "coder", ["code 1"])
+    coder_2 = _record(tmp_path, "coder", ["code 2"])
+
+    source = ReplaySource(tmp_path)
+
+    assert source.next_recording("coder").path == coder_1
+    assert source.next_recording("planner").path == planner
+    assert source.next_recording("coder").path == coder_2
+    assert source.remaining() == {}
+    with pytest.raises(ReplayError):
+        source.next_recording("coder")
+
+
+def test_replayed_session_through_create_client(tmp_path: Path, monkeypatch):
+    """create_client() replays without credentials; the session runs offline."""
+    from agents.session import run_agent_session
+    from core.client import create_client
+
+    recordings = tmp_path / "recordings"
+    monkeypatch.setenv(RECORD_DIR_ENV_VAR, str(recordings))
+    _record(recordings, "coder", ["Implement subtask 1.1"])
+    monkeypatch.delenv(RECORD_DIR_ENV_VAR)
+
+    project_dir = tmp_path / "project"
+    spec_dir = project_dir / ".auto-claude" / "specs" / "001-replay"
+    spec_dir.mkdir(parents=True)
+    monkeypatch.setenv(REPLAY_DIR_ENV_VAR, str(recordings))
+    monkeypatch.delenv("CLAUDE_CODE_OAUTH_TOKEN", raising=False)
+    monkeypatch.setattr("core.auth.get_token_from_keychain", lambda: None)
+    # conftest replaces the SDK with mocks; HookMatcher just has to keep its fields
+    monkeypatch.setattr("core.client.HookMatcher", SimpleNamespace)
+
+    client = create_client(project_dir, spec_dir, "claude-test", "coder")
+    assert isinstance(client, ReplayClient)
+
+    async def run():
+        async with client:
+            return await run_agent_session(client, "Implement subtask 1.1", spec_dir)
+
+    status, response = asyncio.run(run())
+
+    assert status != "error"
+    assert response == "Listing files. Done."
+    # The real bash security hook checked the replayed command
+    assert client.stats["hook_calls"] == 1
+    with pytest.raises(ReplayError):
+        create_client(project_dir, spec_dir, "claude-test", "coder")
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Tests for session telemetry (core/telemetry.py).
+
+A replayed session is driven through run_agent_session() with a traced
+hook; the OTLP/JSON trace file it leaves behind is then checked span by
+span and summarized through the --trace-summary command.
+"""
+
+import asyncio
+import contextvars
+import json
+from pathlib import Path
+
+import pytest
+
+from core.session_replay import TYPE_KEY, RecordedTurn, ReplayClient, SessionRecording
+from core.telemetry import (
+    CWD_ATTR,
+    INPUT_TOKENS_ATTR,
+    KIND_ATTR,
+    OUTPUT_TOKENS_ATTR,
+    PHASE_ATTR,
+    TELEMETRY_ENV_VAR,
+    TOOL_NAME_ATTR,
+    TRACE_FILENAME,
+    SpanKind,
+    current_span,
+    get_tracer,
+    load_spans,
+    percentile,
+    reset_tracers,
+    summarize_latencies,
+    summarize_tokens,
+    traced_hook,
+    traced_post_session,
+)
+
+
+def _block(kind: str, **fields) -> dict:
+    return {TYPE_KEY: kind, **fields}
+
+
+MESSAGES = [
+    _block(
+        "AssistantMessage",
+        model="claude-test",
+        content=[
+            _block("TextBlock", text="Checking. "),
+            _block("ToolUseBlock", id="t1", name="Bash", input={"command": "ls"}),
+            _block("ToolUseBlock", id="t2", name="Read", input={"file_path": "a.py"}),
+        ],
+    ),
+    _block("UserMessage", content=[_block("ToolResultBlock", tool_use_id="t1")]),
+    _block(
+        "UserMessage",
+        content=[_block("ToolResultBlock", tool_use_id="t2", content="no such file", is_error=True)],
+    ),
+    _block("AssistantMessage", model="claude-test", content=[_block("TextBlock", text="Done.")]),
+    _block(
+        "ResultMessage",
+        subtype="success",
+        num_turns=2,
+        usage={"input_tokens": 120, "output_tokens": 30},
+        total_cost_usd=0.25,
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tracers(monkeypatch):
+    monkeypatch.delenv(TELEMETRY_ENV_VAR, raising=False)
+    reset_tracers()
+    yield
+    reset_tracers()
+
+
+def _run_session(spec_dir: Path) -> None:
+    from agents.session import run_agent_session
+    from task_logger import LogPhase
+
+    async def allow(input_data, tool_use_id=None, context=None):
+        await asyncio.sleep(0)
+        return {}
+
+    recording = SessionRecording(
+        path=spec_dir / "session.jsonl",
+        agent_type="coder",
+        model="claude-test",
+        turns=[RecordedTurn("go", 0.0, list(enumerate(MESSAGES)))],
+    )
+    hooks = {
+        "PreToolUse": [
+            type("Matcher", (), {"matcher": "Bash", "hooks": [traced_hook(allow)]})()
+        ]
+    }
+    client = ReplayClient(recording, hooks=hooks, cwd=str(spec_dir))
+    asyncio.run(run_agent_session(client, "go", spec_dir, phase=LogPhase.CODING))
+
+
+def _lines(spec_dir: Path) -> list[dict]:
+    text = (spec_dir / TRACE_FILENAME).read_text(encoding="utf-8")
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_session_trace_spans(tmp_path: Path):
+    _run_session(tmp_path)
+
+    spans = {span.name: span for span in load_spans(tmp_path / TRACE_FILENAME)}
+
+    session = spans["session coding"]
+    assert session.kind == SpanKind.SESSION
+    assert session.attributes[INPUT_TOKENS_ATTR] == 120
+    assert session.attributes[OUTPUT_TOKENS_ATTR] == 30
+    assert session.attributes["auto_claude.tool_count"] == 2
+    assert session.error is None
+
+    bash, read = spans["tool Bash"], spans["tool Read"]
+    assert (bash.error, read.error) == (None, "no such file")
+    assert read.attributes[TOOL_NAME_ATTR] == "Read"
+    assert {s.trace_id for s in spans.values()} == {session.trace_id}
+    assert all(s.phase == "coding" for s in spans.values())
+    # The prompt and the tool results each waited on the model
+    assert [s.kind for s in load_spans(tmp_path / TRACE_FILENAME)].count("model") == 2
+    assert spans["hook allow"].attributes[TOOL_NAME_ATTR] == "Bash"
+
+
+def test_session_records_client_cwd(tmp_path: Path):
+    _run_session(tmp_path)
+
+    spans = {span.name: span for span in load_spans(tmp_path / TRACE_FILENAME)}
+    assert spans["session coding"].attributes[CWD_ATTR] == str(tmp_path.resolve())
+
+
+def test_hook_outside_session_context_finds_session_by_cwd(tmp_path: Path):
+    """Concurrent sessions: SDK-run hooks attach to the session in their cwd."""
+    tracer = get_tracer(tmp_path)
+
+    def start_session(name, cwd):
+        # Each session runs in its own task, so in its own context
+        return contextvars.Context().run(
+            tracer.start_span, name, SpanKind.SESSION, activate=True, cwd=cwd
+        )
+
+    first = start_session("session a", tmp_path / "a")
+    second = start_session("session b", tmp_path / "b")
+    parents = {}
+
+    @traced_hook
+    async def check(input_data, tool_use_id=None, context=None):
+        span = current_span()
+        parents[input_data.get("cwd")] = span.parent if span else None
+        return {}
+
+    def run_hook(cwd):
+        # A fresh context, like the SDK's own tasks
+        hook_input = {"tool_name": "Bash", "cwd": cwd}
+        contextvars.Context().run(asyncio.run, check(hook_input, "t1"))
+
+    try:
+        run_hook(str(tmp_path / "a"))
+        run_hook(str(tmp_path / "b"))
+        run_hook(str(tmp_path / "elsewhere"))
+    finally:
+        second.end()
+        first.end()
+
+    assert parents[str(tmp_path / "a")] is first
+    assert parents[str(tmp_path / "b")] is second
+    # Ambiguous with two sessions running: the hook runs untraced
+    assert parents[str(tmp_path / "elsewhere")] is None
+
+
+def test_trace_file_is_otlp_json(tmp_path: Path):
+    _run_session(tmp_path)
+    _run_session(tmp_path)
+
+    lines = _lines(tmp_path)
+
+    # Appended: one traces line and one metrics line per session
+    assert [next(iter(line)) for line in lines] == [
+        "resourceSpans",
+        "resourceMetrics",
+    ] * 2
+    resource_spans = lines[0]["resourceSpans"][0]
+    resource = {a["key"]: a["value"] for a in resource_spans["resource"]["attributes"]}
+    assert resource["service.name"] == {"stringValue": "auto-claude"}
+    spans = resource_spans["scopeSpans"][0]["spans"]
+    by_name = {span["name"]: span for span in spans}
+    session_id = by_name["session coding"]["spanId"]
+    assert "parentSpanId" not in by_name["session coding"]
+    assert by_name["tool Bash"]["parentSpanId"] == session_id
+    # Replay runs hooks before handing out the tool use, as the SDK does
+    hook = by_name["hook allow"]
+    assert hook["parentSpanId"] == session_id
+    assert {"key": "gen_ai.tool.call.id", "value": {"stringValue": "t1"}} in hook[
+        "attributes"
+    ]
+    assert by_name["tool Read"]["status"]["code"] == 2
+    assert all(len(span["traceId"]) == 32 and len(span["spanId"]) == 16 for span in spans)
+
+    metrics = lines[1]["resourceMetrics"][0]["scopeMetrics"][0]["metrics"]
+    histogram = next(m for m in metrics if m["name"] == "auto_claude.tool.duration")
+    points = histogram["histogram"]["dataPoints"]
+    assert len(points) == 2
+    for point in points:
+        assert len(point["bucketCounts"]) == len(point["explicitBounds"]) + 1
+        assert sum(map(int, point["bucketCounts"])) == int(point["count"]) == 1
+    tokens = next(m for m in metrics if m["name"] == "auto_claude.session.tokens")
+    assert {p["asInt"] for p in tokens["sum"]["dataPoints"]} == {"120", "30"}
+
+
+def test_telemetry_can_be_turned_off(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(TELEMETRY_ENV_VAR, "0")
+
+    _run_session(tmp_path)
+
+    assert not (tmp_path / TRACE_FILENAME).exists()
+
+
+def test_post_session_steps_are_children(tmp_path: Path):
+    @traced_post_session
+    async def process(spec_dir, fail=False):
+        tracer = get_tracer(spec_dir)
+        with tracer.span("load_plan", SpanKind.POST_SESSION):
+            pass
+        await tracer.run(asyncio.sleep(0), "save_memory", SpanKind.POST_SESSION)
+        if fail:
+            raise ValueError("boom")
+        return True
+
+    assert asyncio.run(process(tmp_path)) is True
+    with pytest.raises(ValueError):
+        asyncio.run(process(spec_dir=tmp_path, fail=True))
+
+    records = load_spans(tmp_path / TRACE_FILENAME)
+    roots = [r for r in records if r.name == "process"]
+    assert len(roots) == 2
+    assert [r.error for r in roots] == [None, "ValueError: boom"]
+    steps = [r for r in records if r.name in ("load_plan", "save_memory")]
+    assert {r.trace_id for r in steps} == {r.trace_id for r in roots}
+    assert all(r.kind == SpanKind.POST_SESSION for r in records)
+
+
+def test_summaries(tmp_path: Path):
+    for _ in range(3):
+        _run_session(tmp_path)
+    records = load_spans(tmp_path / TRACE_FILENAME)
+
+    rows = {(row.kind, row.name, row.phase): row for row in summarize_latencies(records)}
+    assert rows[("tool", "Bash", "coding")].count == 3
+    assert rows[("tool", "Read", "coding")].errors == 3
+    assert rows[("hook", "allow (Bash)", "coding")].count == 3
+    assert summarize_latencies(records)[0].kind == SpanKind.SESSION
+    assert summarize_tokens(records)["coding"][INPUT_TOKENS_ATTR] == 360
+
+
+def test_trace_summary_command(tmp_path: Path, capsys):
+    pytest.importorskip("dotenv")
+    from cli.telemetry_commands import handle_trace_summary_command
+
+    handle_trace_summary_command(tmp_path)
+    assert "No session traces" in capsys.readouterr().out
+
+    for _ in range(3):
+        _run_session(tmp_path)
+    capsys.readouterr()
+    handle_trace_summary_command(tmp_path)
+    out = capsys.readouterr().out
+    assert "Bash" in out and "Token usage by phase" in out and "360" in out
+
+
+def test_load_spans_skips_unreadable_lines(tmp_path: Path):
+    path = tmp_path / TRACE_FILENAME
+    assert load_spans(path) == []
+
+    tracer = get_tracer(tmp_path)
+    with tracer.span("step", SpanKind.POST_SESSION, {PHASE_ATTR: "coding"}):
+        pass
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"resourceSpans": [{"scopeSpans": [{"spans": [{"na')
+
+    records = load_spans(path)
+
+    assert [(r.name, r.attributes[KIND_ATTR]) for r in records] == [
+        ("step", SpanKind.POST_SESSION)
+    ]
+
+
+def test_percentile():
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 0.5) == pytest.approx(50.5)
+    assert percentile(values, 0.99) == pytest.approx(99.01)
+    assert percentile([7.0], 0.95) == 7.0
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for spec phase compaction.
+
+Covers the per-spec summary cache, background summarization with
+PhaseSummarizer, and a fresh compaction client for every summary.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+import spec.compaction as compaction
+from spec.compaction import (
+    SUMMARY_CACHE_FILENAME,
+    PhaseSummarizer,
+    load_cached_summary,
+    summary_cache_key,
+)
+
+
+class TextBlock:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class AssistantMessage:
+    def __init__(self, text: str):
+        self.content = [TextBlock(text)]
+
+
+class FakeClient:
+    """Stand-in for ClaudeSDKClient that answers each query with a canned summary."""
+
+    def __init__(self, gate: asyncio.Event | None = None, fail: bool = False):
+        self.gate = gate
+        self.fail = fail
+        self.prompts: list[str] = []
+        self.entered = 0
+        self.exited = 0
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        self.exited += 1
+
+    async def query(self, prompt: str):
+        if self.fail:
+            raise RuntimeError("boom")
+        self.prompts.append(prompt)
+
+    async def receive_response(self):
+        if self.gate is not None:
+            await self.gate.wait()
+        yield AssistantMessage(f"summary #{len(self.prompts)}")
+
+
+@pytest.fixture
+def clients(monkeypatch) -> list[FakeClient]:
+    """Record every compaction client the module creates."""
+    created: list[FakeClient] = []
+
+    def factory(model):
+        client = FakeClient()
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(compaction, "_create_compaction_client", factory)
+    monkeypatch.setattr(compaction, "require_auth_token", lambda: "token")
+    return created
+
+
+@pytest.fixture
+def phase_spec_dir(temp_dir: Path) -> Path:
+    (temp_dir / "requirements.json").write_text(json.dumps({"task": "add login"}))
+    (temp_dir / "spec.md").write_text("# Spec\n\nAdd a login page.\n")
+    return temp_dir
+
+
+def _summarize(spec_dir: Path, *phases: str, summarizer=None) -> dict[str, str]:
+    summarizer = summarizer or PhaseSummarizer()
+
+    async def run():
+        for phase in phases:
+            summarizer.schedule(spec_dir, phase)
+        summaries = await summarizer.collect()
+        await summarizer.close()
+        return summaries
+
+    return asyncio.run(run())
+
+
+class TestSummaryCache:
+    """Summaries are reused while the phase outputs and model are unchanged."""
+
+    def test_resume_reuses_cached_summary(self, phase_spec_dir: Path, clients):
+        first = _summarize(phase_spec_dir, "requirements")
+        assert (phase_spec_dir / SUMMARY_CACHE_FILENAME).exists()
+
+        resumed = PhaseSummarizer()
+        second = _summarize(phase_spec_dir, "requirements", summarizer=resumed)
+
+        assert second == first
+        assert resumed.cache_hits == 1
+        assert resumed.summarized == 0
+        assert len(clients) == 1
+
+    def test_changed_output_is_resummarized(self, phase_spec_dir: Path, clients):
+        _summarize(phase_spec_dir, "requirements")
+        (phase_spec_dir / "requirements.json").write_text('{"task": "add logout"}')
+
+        summarizer = PhaseSummarizer()
+        _summarize(phase_spec_dir, "requirements", summarizer=summarizer)
+
+        assert summarizer.cache_hits == 0
+        assert summarizer.summarized == 1
+
+    def test_key_includes_model(self):
+        assert summary_cache_key("spec", "out", "sonnet", 500) != summary_cache_key(
+            "spec", "out", "haiku", 500
+        )
+
+    def test_corrupt_cache_is_ignored(self, phase_spec_dir: Path):
+        (phase_spec_dir / SUMMARY_CACHE_FILENAME).write_text("{not json")
+        assert load_cached_summary(phase_spec_dir, "requirements", "key") is None
+
+
+class TestPhaseSummarizer:
+    """Background summarization, one client per summary."""
+
+    def test_each_phase_gets_a_fresh_client(self, phase_spec_dir: Path, clients):
+        summaries = _summarize(phase_spec_dir, "requirements", "spec_writing")
+
+        assert list(summaries) == ["requirements", "spec_writing"]
+        assert len(clients) == 2
+        # No phase's conversation carries over into the next summary
+        assert [len(client.prompts) for client in clients] == [1, 1]
+        assert all(client.exited == 1 for client in clients)
+
+    def test_schedule_does_not_wait_for_summary(
+        self, phase_spec_dir: Path, monkeypatch
+    ):
+        monkeypatch.setattr(compaction, "require_auth_token", lambda: "token")
+
+        async def run():
+            gate = asyncio.Event()
+            monkeypatch.setattr(
+                compaction, "_create_compaction_client", lambda model: FakeClient(gate)
+            )
+            summarizer = PhaseSummarizer()
+            summarizer.schedule(phase_spec_dir, "requirements")
+            await asyncio.sleep(0)
+            # The next phase would run here while the summary is pending
+            assert summarizer.summarized == 0
+
+            gate.set()
+            summaries = await summarizer.collect()
+            await summarizer.close()
+            return summaries
+
+        assert "requirements" in asyncio.run(run())
+
+    def test_failure_falls_back_and_is_not_cached(
+        self, phase_spec_dir: Path, monkeypatch
+    ):
+        monkeypatch.setattr(compaction, "require_auth_token", lambda: "token")
+        monkeypatch.setattr(
+            compaction, "_create_compaction_client", lambda model: FakeClient(fail=True)
+        )
+
+        summaries = _summarize(phase_spec_dir, "requirements")
+
+        assert summaries["requirements"].startswith("[Summarization failed: boom]")
+        assert not (phase_spec_dir / SUMMARY_CACHE_FILENAME).exists()
+
+    def test_phase_without_outputs_is_skipped(self, phase_spec_dir: Path, clients):
+        assert _summarize(phase_spec_dir, "validation") == {}
+        assert clients == []
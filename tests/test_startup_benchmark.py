@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the CLI startup benchmark (apps/backend/scripts/startup_benchmark.py).
+
+The -X importtime parser and budget options are tested directly. The full
+benchmark runs run.py in subprocesses, so it needs the CLI's real
+dependencies and is skipped where they are not installed.
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent.parent / "apps" / "backend"
+
+_spec = importlib.util.spec_from_file_location(
+    "startup_benchmark", BACKEND_DIR / "scripts" / "startup_benchmark.py"
+)
+startup_benchmark = importlib.util.module_from_spec(_spec)
+sys.modules["startup_benchmark"] = startup_benchmark
+_spec.loader.exec_module(startup_benchmark)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        300 |     cli.utils
+Some other stderr output
+import time:        50 |        350 |   cli.main
+import time:         5 |        355 | cli
+"""
+
+
+def test_parse_importtime():
+    records = startup_benchmark.parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ("_io", 120, 120, 1),
+        ("cli.utils", 80, 300, 2),
+        ("cli.main", 50, 350, 1),
+        ("cli", 5, 355, 0),
+    ]
+
+
+def test_budgets():
+    budgets = startup_benchmark.parse_budgets(300, ["list=150"])
+
+    assert budgets["list"] == 150
+    assert budgets["help"] == 300
+    with pytest.raises(ValueError):
+        startup_benchmark.parse_budgets(300, ["unknown=1"])
+    with pytest.raises(ValueError):
+        startup_benchmark.parse_budgets(300, ["list"])
+
+
+def _cli_dependencies_installed() -> bool:
+    # Checked in a subprocess: conftest replaces claude_agent_sdk in this one
+    result = subprocess.run(
+        [sys.executable, "-c", "import dotenv, claude_agent_sdk"],
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not _cli_dependencies_installed(), reason="CLI dependencies not installed"
+)
+def test_light_subcommands_skip_agent_imports(tmp_path: Path):
+    """--help, --list and --merge-preview never import the agent stack."""
+    report = tmp_path / "startup.json"
+
+    # Generous time budget: only the import checks have to pass here
+    exit_code = startup_benchmark.main(
+        [
+            "--budget-ms",
+            "100000",
+            "--runs",
+            "1",
+            "--only",
+            "help",
+            "--only",
+            "list",
+            "--only",
+            "merge-preview",
+            "--json",
+            str(report),
+        ]
+    )
+
+    results = json.loads(report.read_text())
+    assert [r["forbidden_imported"] for r in results] == [[], [], []]
+    assert exit_code == 0
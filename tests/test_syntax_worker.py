@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for merged-file syntax validation.
+
+Covers the persistent esbuild worker (batching, restart after a crash,
+fallback when esbuild isn't installed) and in-process Python/JSON checks.
+The worker runs under real Node against a stand-in esbuild package, so no
+network install is needed.
+"""
+
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+import core.workspace.git_utils as git_utils
+from core.workspace import syntax_worker
+from core.workspace.git_utils import validate_merged_syntax
+from core.workspace.syntax_worker import find_esbuild_package, get_syntax_worker
+
+requires_node = pytest.mark.skipif(
+    shutil.which("node") is None, reason="node is not installed"
+)
+
+# Stand-in for esbuild's transform API: content containing "SYNTAX_ERROR"
+# fails the way esbuild reports errors.
+FAKE_ESBUILD_INDEX = """
+exports.transformSync = (content, options) => {
+  const index = content.indexOf("SYNTAX_ERROR");
+  if (index >= 0) {
+    const line = content.slice(0, index).split("\\n").length;
+    const error = new Error("Transform failed");
+    error.errors = [{ text: "Unexpected token", location: { line, column: 0 } }];
+    throw error;
+  }
+  return { code: content };
+};
+"""
+
+# Stand-in for the esbuild CLI used by the per-file fallback
+FAKE_ESBUILD_CLI = """#!/usr/bin/env node
+const content = require("fs").readFileSync(process.argv[2], "utf8");
+if (content.includes("SYNTAX_ERROR")) {
+  process.stderr.write("ERROR: Unexpected token\\n");
+  process.exit(1);
+}
+"""
+
+
+@pytest.fixture
+def esbuild_project(temp_dir: Path) -> Path:
+    """A project with a fake esbuild package and CLI in node_modules."""
+    package = temp_dir / "node_modules" / "esbuild"
+    package.mkdir(parents=True)
+    (package / "package.json").write_text('{"name": "esbuild", "main": "index.js"}')
+    (package / "index.js").write_text(FAKE_ESBUILD_INDEX)
+
+    cli = temp_dir / "node_modules" / ".bin" / "esbuild"
+    cli.parent.mkdir()
+    cli.write_text(FAKE_ESBUILD_CLI)
+    cli.chmod(0o755)
+    return temp_dir
+
+
+@pytest.fixture(autouse=True)
+def _fresh_workers():
+    syntax_worker.shutdown_syntax_workers()
+    yield
+    syntax_worker.shutdown_syntax_workers()
+
+
+@pytest.fixture
+def subprocess_runs(monkeypatch) -> list[list[str]]:
+    """Record per-file subprocesses started by the CLI fallback."""
+    calls: list[list[str]] = []
+    original = git_utils.subprocess.run
+
+    def counting_run(args, *a, **kw):
+        calls.append(list(args))
+        return original(args, *a, **kw)
+
+    monkeypatch.setattr(git_utils.subprocess, "run", counting_run)
+    return calls
+
+
+class TestFindEsbuildPackage:
+    def test_npm_layout(self, esbuild_project: Path):
+        assert find_esbuild_package(esbuild_project) == (
+            esbuild_project / "node_modules" / "esbuild"
+        )
+
+    def test_pnpm_layout(self, temp_dir: Path):
+        package = (
+            (temp_dir / "node_modules" / ".pnpm" / "esbuild@0.20.0")
+            / "node_modules"
+            / "esbuild"
+        )
+        package.mkdir(parents=True)
+        (package / "package.json").write_text("{}")
+
+        assert find_esbuild_package(temp_dir) == package
+
+    def test_missing(self, temp_dir: Path):
+        assert find_esbuild_package(temp_dir / "project") is None
+
+
+@requires_node
+class TestSyntaxWorker:
+    def test_batch_reports_errors_in_order(
+        self, esbuild_project: Path, subprocess_runs
+    ):
+        results = get_syntax_worker(esbuild_project).validate_batch(
+            [
+                ("src/a.ts", "const a: number = 1;\n"),
+                ("src/b.tsx", "const b = 1;\nSYNTAX_ERROR\n"),
+                ("src/c.js", "export const c = 3;\n"),
+            ]
+        )
+
+        assert results[0] == (True, "")
+        assert results[1][0] is False
+        assert "Unexpected token (line 2" in results[1][1]
+        assert results[2] == (True, "")
+        assert subprocess_runs == []
+
+    def test_worker_is_reused(self, esbuild_project: Path):
+        first = get_syntax_worker(esbuild_project)
+        validate_merged_syntax("a.ts", "const a = 1;", esbuild_project)
+        validate_merged_syntax("b.ts", "const b = 2;", esbuild_project)
+
+        assert get_syntax_worker(esbuild_project) is first
+
+    def test_dead_worker_is_restarted(self, esbuild_project: Path):
+        first = get_syntax_worker(esbuild_project)
+        first._process.kill()
+        first._process.wait()
+
+        second = get_syntax_worker(esbuild_project)
+
+        assert second is not first
+        assert second.alive
+        assert validate_merged_syntax("a.ts", "SYNTAX_ERROR", esbuild_project)[0] is (
+            False
+        )
+
+    def test_failed_batch_falls_back_to_cli(
+        self, esbuild_project: Path, subprocess_runs, monkeypatch
+    ):
+        # A batch that times out or loses the process returns None
+        monkeypatch.setattr(
+            syntax_worker.SyntaxValidationWorker,
+            "validate_batch",
+            lambda self, files: None,
+        )
+
+        results = [
+            validate_merged_syntax(path, content, esbuild_project)
+            for path, content in [("a.ts", "const a = 1;"), ("b.ts", "SYNTAX_ERROR")]
+        ]
+
+        assert [ok for ok, _ in results] == [True, False]
+        assert len(subprocess_runs) == 2
+
+
+class TestInProcessValidation:
+    def test_without_esbuild_package_uses_cli(self, temp_dir: Path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            git_utils,
+            "_validate_js_with_esbuild_cli",
+            lambda file_path, content, project_dir: (
+                calls.append(file_path) or (True, "")
+            ),
+        )
+
+        assert validate_merged_syntax("a.ts", "const a = 1;", temp_dir) == (True, "")
+        assert calls == ["a.ts"]
+
+    def test_python_and_json_need_no_subprocess(self, temp_dir: Path, subprocess_runs):
+        results = [
+            validate_merged_syntax(path, content, temp_dir)
+            for path, content in [
+                ("ok.py", "x = 1\n"),
+                ("bad.py", "def f(:\n"),
+                ("ok.json", '{"a": 1}'),
+                ("bad.json", "{"),
+                ("notes.md", "# anything"),
+            ]
+        ]
+
+        assert [ok for ok, _ in results] == [True, False, True, False, True]
+        assert results[1][1].startswith("Python syntax error")
+        assert results[3][1].startswith("JSON error")
+        assert subprocess_runs == []
+
+
+@pytest.mark.slow
+@requires_node
+def test_benchmark_files_per_second(esbuild_project: Path):
+    """Compare files/sec: persistent worker vs per-file CLI vs in-process Python."""
+    count = 20
+    js_files = [(f"src/f{i}.ts", f"export const v{i} = {i};\n") for i in range(count)]
+    py_files = [(f"f{i}.py", f"v{i} = {i}\n") for i in range(count)]
+
+    def rate(validate) -> float:
+        start = time.perf_counter()
+        results = validate()
+        elapsed = time.perf_counter() - start
+        assert all(ok for ok, _ in results)
+        return count / elapsed
+
+    get_syntax_worker(esbuild_project)  # Startup is paid once per process
+    def validate_each(files):
+        return [validate_merged_syntax(path, text, esbuild_project) for path, text in files]
+
+    worker_rate = rate(lambda: validate_each(js_files))
+    cli_rate = rate(
+        lambda: [
+            git_utils._validate_js_with_esbuild_cli(path, content, esbuild_project)
+            for path, content in js_files
+        ]
+    )
+    python_rate = rate(lambda: validate_each(py_files))
+
+    print(
+        f"\nsyntax validation: worker {worker_rate:.0f} files/s, "
+        f"per-file CLI {cli_rate:.0f} files/s, Python {python_rate:.0f} files/s"
+    )
+    assert worker_rate > cli_rate
+
+
+@requires_node
+def test_cli_fallback_reports_errors(esbuild_project: Path):
+    ok, error = git_utils._validate_js_with_esbuild_cli(
+        "a.ts", "SYNTAX_ERROR", esbuild_project
+    )
+
+    assert ok is False
+    assert "Unexpected token" in error
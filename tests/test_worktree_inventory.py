@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched worktree inventory.
+
+Covers parity with the per-worktree statistics, the constant number of git
+invocations behind list_all_worktrees(), and cache invalidation on new commits.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+import core.git_executable as git_executable
+from core.worktree_inventory import (
+    WorktreeInventory,
+    clear_inventory_cache,
+    parse_worktree_list,
+)
+from worktree import WorktreeManager
+
+
+def _commit(path: Path, name: str, content: str) -> None:
+    (path / name).write_text(content)
+    subprocess.run(["git", "add", name], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", f"Add {name}"], cwd=path, capture_output=True, check=True
+    )
+
+
+@pytest.fixture
+def git_calls(monkeypatch) -> list[list[str]]:
+    """Record every subprocess started through run_git."""
+    calls: list[list[str]] = []
+    original = git_executable.subprocess.run
+
+    def counting_run(args, *a, **kw):
+        calls.append(list(args))
+        return original(args, *a, **kw)
+
+    monkeypatch.setattr(git_executable.subprocess, "run", counting_run)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_inventory_cache()
+    yield
+    clear_inventory_cache()
+
+
+def _make_specs(manager: WorktreeManager, count: int, commits: int = 1) -> None:
+    for i in range(count):
+        info = manager.create_worktree(f"spec-{i}")
+        for j in range(commits if i % 2 == 0 else 0):
+            _commit(info.path, f"file-{j}.txt", "line\n" * (i + j + 1))
+
+
+class TestParseWorktreeList:
+    def test_branch_and_detached_entries(self):
+        output = (
+            "worktree /repo\nHEAD " + "a" * 40 + "\nbranch refs/heads/main\n\n"
+            "worktree /repo/wt\nHEAD " + "b" * 40 + "\ndetached\n\n"
+        )
+        records = parse_worktree_list(output)
+
+        assert [r.branch for r in records] == ["main", None]
+        assert records[1].path == Path("/repo/wt")
+        assert records[1].head == "b" * 40
+
+
+class TestInventoryParity:
+    """The inventory reports the same numbers as the per-worktree queries."""
+
+    def test_matches_per_worktree_stats(self, temp_git_repo: Path):
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        _make_specs(manager, 4, commits=2)
+        # Move the base branch on so merge bases differ from the base tip
+        _commit(temp_git_repo, "base-change.txt", "base\n")
+
+        listed = {info.spec_name: info for info in manager.list_all_worktrees()}
+
+        assert sorted(listed) == [f"spec-{i}" for i in range(4)]
+        for name, info in listed.items():
+            expected = manager._get_worktree_stats(name)
+            for key in ("commit_count", "files_changed", "additions", "deletions"):
+                assert getattr(info, key) == expected[key], (name, key)
+            assert info.last_commit_date == expected["last_commit_date"]
+            assert info.branch == f"auto-claude/{name}"
+
+        assert listed["spec-0"].commit_count == 2
+        assert listed["spec-1"].commit_count == 0
+
+    def test_detached_worktree_uses_expected_branch(self, temp_git_repo: Path):
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        info = manager.create_worktree("detached-spec")
+        subprocess.run(
+            ["git", "checkout", "--detach"], cwd=info.path, capture_output=True
+        )
+
+        (listed,) = manager.list_all_worktrees()
+        assert listed.branch == "auto-claude/detached-spec"
+
+    def test_unregistered_directory_is_omitted(self, temp_git_repo: Path):
+        stray = temp_git_repo / "not-a-worktree"
+        stray.mkdir()
+        inventory = WorktreeInventory(temp_git_repo, "main")
+        assert inventory.collect([stray]) == {}
+
+
+class TestInventoryCaching:
+    def test_unchanged_repo_costs_two_git_calls(
+        self, temp_git_repo: Path, git_calls
+    ):
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        _make_specs(manager, 3)
+        manager.list_all_worktrees()
+
+        git_calls.clear()
+        manager.list_all_worktrees()
+
+        assert len(git_calls) == 2
+
+    def test_new_commit_invalidates_stats(self, temp_git_repo: Path):
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        info = manager.create_worktree("spec-a")
+        (before,) = manager.list_all_worktrees()
+
+        _commit(info.path, "new.txt", "one\ntwo\n")
+        (after,) = manager.list_all_worktrees()
+
+        assert before.commit_count == 0
+        assert after.commit_count == 1
+        assert after.additions == 2
+
+
+@pytest.mark.slow
+def test_benchmark_inventory_with_50_worktrees(temp_git_repo: Path, git_calls):
+    """Git invocations stay fixed from 5 to 50 worktrees; report wall time."""
+    manager = WorktreeManager(temp_git_repo)
+    manager.setup()
+
+    _make_specs(manager, 5)
+    git_calls.clear()
+    manager.list_all_worktrees()
+    calls_for_5 = len(git_calls)
+
+    for i in range(5, 50):
+        info = manager.create_worktree(f"spec-{i}")
+        if i % 2 == 0:
+            _commit(info.path, "file.txt", "line\n" * i)
+    clear_inventory_cache()
+
+    git_calls.clear()
+    start = time.perf_counter()
+    worktrees = manager.list_all_worktrees()
+    cold_ms = (time.perf_counter() - start) * 1000
+    calls_for_50 = len(git_calls)
+
+    git_calls.clear()
+    start = time.perf_counter()
+    manager.list_all_worktrees()
+    warm_ms = (time.perf_counter() - start) * 1000
+    warm_calls = len(git_calls)
+
+    git_calls.clear()
+    start = time.perf_counter()
+    for info in worktrees:
+        manager.get_worktree_info(info.spec_name)
+    per_worktree_ms = (time.perf_counter() - start) * 1000
+    per_worktree_calls = len(git_calls)
+
+    print(
+        f"\n50 worktrees: inventory cold {cold_ms:.0f}ms/{calls_for_50} calls, "
+        f"warm {warm_ms:.0f}ms/{warm_calls} calls; "
+        f"per-worktree {per_worktree_ms:.0f}ms/{per_worktree_calls} calls"
+    )
+    assert len(worktrees) == 50
+    assert calls_for_50 == calls_for_5
+    assert warm_calls == 2